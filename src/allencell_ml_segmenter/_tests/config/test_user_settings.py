@@ -1,6 +1,14 @@
 from allencell_ml_segmenter._tests.fakes.fake_qsettings import FakeQSettings
 
 from allencell_ml_segmenter.config.user_settings import UserSettings
+from allencell_ml_segmenter.core.image_data_extractor.image_data_cache import (
+    DEFAULT_MAX_BYTES,
+)
+from allencell_ml_segmenter.curation.curation_model import (
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_PREFETCH_BUDGET_BYTES,
+    DEFAULT_PREFETCH_DEPTH,
+)
 
 
 def test_set_get_user_experiments_path():
@@ -13,3 +21,51 @@ def test_set_get_user_experiments_path():
 
     # Assert
     assert str(userSettings.get_user_experiments_path()) == "foo"
+
+
+def test_set_get_image_cache_max_bytes():
+    # Arrange
+    settings = FakeQSettings()
+    userSettings = UserSettings(settings=settings)
+
+    # Act
+    userSettings.set_image_cache_max_bytes(1024)
+
+    # Assert
+    assert userSettings.get_image_cache_max_bytes() == 1024
+
+
+def test_get_image_cache_max_bytes_default():
+    # Arrange
+    userSettings = UserSettings(settings=FakeQSettings())
+
+    # Act / Assert
+    assert userSettings.get_image_cache_max_bytes() == DEFAULT_MAX_BYTES
+
+
+def test_set_get_curation_prefetch_settings():
+    # Arrange
+    userSettings = UserSettings(settings=FakeQSettings())
+
+    # Act
+    userSettings.set_curation_prefetch_depth(5)
+    userSettings.set_curation_prefetch_budget_bytes(1024)
+    userSettings.set_curation_history_size(3)
+
+    # Assert
+    assert userSettings.get_curation_prefetch_depth() == 5
+    assert userSettings.get_curation_prefetch_budget_bytes() == 1024
+    assert userSettings.get_curation_history_size() == 3
+
+
+def test_get_curation_prefetch_settings_default():
+    # Arrange
+    userSettings = UserSettings(settings=FakeQSettings())
+
+    # Act / Assert
+    assert userSettings.get_curation_prefetch_depth() == DEFAULT_PREFETCH_DEPTH
+    assert (
+        userSettings.get_curation_prefetch_budget_bytes()
+        == DEFAULT_PREFETCH_BUDGET_BYTES
+    )
+    assert userSettings.get_curation_history_size() == DEFAULT_HISTORY_SIZE
@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import dask.array as da
+import numpy as np
+import tifffile
+
+import allencell_ml_segmenter
+from allencell_ml_segmenter.core.image_data_extractor import (
+    AICSImageDataExtractor,
+    IImageDataExtractor,
+    ImageData,
+    ImageDataCache,
+)
+from allencell_ml_segmenter.core.image_data_extractor.aics_image_data_extractor import (
+    decode_image_data,
+)
+from allencell_ml_segmenter.core.task_executor import ProcessPoolTaskExecutor
+
+IMG_PATH: Path = (
+    Path(allencell_ml_segmenter.__file__).parent
+    / "_tests"
+    / "test_files"
+    / "images"
+    / "test_3_channels.tiff"
+)
+
+
+def test_extract_lazy_matches_eager() -> None:
+    # Arrange
+    extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance()
+
+    # Act
+    eager: ImageData = extractor.extract_image_data(IMG_PATH, channel=2)
+    lazy: ImageData = extractor.extract_image_data(
+        IMG_PATH, channel=2, lazy=True
+    )
+
+    # Assert
+    assert isinstance(lazy.np_data, da.Array)
+    assert (lazy.dim_x, lazy.dim_y, lazy.dim_z, lazy.channels) == (
+        eager.dim_x,
+        eager.dim_y,
+        eager.dim_z,
+        eager.channels,
+    )
+    assert np.array_equal(
+        lazy.np_data.compute(), eager.np_data, equal_nan=True
+    )
+
+
+def test_extract_lazy_seg_relabels_per_chunk(tmp_path: Path) -> None:
+    # Arrange
+    seg: np.ndarray = np.zeros((3, 4, 4), dtype=np.uint16)
+    seg[0, 1, 1] = 7
+    seg[2, 3, 3] = 300
+    seg_path: Path = tmp_path / "seg.tiff"
+    tifffile.imwrite(seg_path, seg, imagej=True, metadata={"axes": "ZYX"})
+    extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance()
+
+    # Act
+    lazy: ImageData = extractor.extract_image_data(seg_path, seg=2, lazy=True)
+
+    # Assert
+    assert lazy.np_data.numblocks[0] == 3
+    computed: np.ndarray = lazy.np_data.compute()
+    assert np.array_equal(computed, np.where(seg > 0, 2, 0))
+
+
+def test_extract_lazy_is_not_cached() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache.global_instance()
+    cache.clear()
+    extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance()
+
+    # Act
+    extractor.extract_image_data(IMG_PATH, channel=1, lazy=True)
+
+    # Assert
+    assert cache.get_stats().num_entries == 0
+
+
+def test_extract_without_cache_is_not_kept() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache.global_instance()
+    cache.clear()
+    extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance()
+
+    # Act
+    img_data: ImageData = extractor.extract_image_data(
+        IMG_PATH, channel=1, cache=False
+    )
+
+    # Assert
+    assert img_data.np_data is not None
+    assert cache.get_stats().num_entries == 0
+
+
+def test_extract_decodes_in_worker_process_and_caches_here() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache.global_instance()
+    cache.clear()
+    extractor: AICSImageDataExtractor = (
+        AICSImageDataExtractor.global_instance()
+    )
+    expected: np.ndarray = decode_image_data(IMG_PATH, 0, None).np_data
+    executor: ProcessPoolTaskExecutor = ProcessPoolTaskExecutor(max_workers=1)
+    extractor.set_decode_executor(executor)
+
+    # Act
+    try:
+        img_data: ImageData = extractor.extract_image_data(IMG_PATH)
+    finally:
+        extractor.set_decode_executor(None)
+        executor.shutdown()
+
+    # Assert
+    assert np.array_equal(img_data.np_data, expected, equal_nan=True)
+    assert cache.get_stats().num_entries == 1
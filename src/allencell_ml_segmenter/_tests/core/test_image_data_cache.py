@@ -0,0 +1,142 @@
+from pathlib import Path
+
+import numpy as np
+
+import allencell_ml_segmenter
+from allencell_ml_segmenter.core.image_data_extractor import (
+    AICSImageDataExtractor,
+    ImageData,
+    ImageDataCache,
+    ImageDataCacheStats,
+)
+
+IMG_PATH: Path = (
+    Path(allencell_ml_segmenter.__file__).parent
+    / "_tests"
+    / "test_files"
+    / "images"
+    / "test_3_channels.tiff"
+)
+
+
+def _img_data(nbytes: int, path: Path = Path("fake")) -> ImageData:
+    return ImageData(1, 1, 1, 1, np.zeros(nbytes, dtype=np.uint8), path)
+
+
+def test_get_miss_then_hit() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache(max_bytes=100)
+    key = ("a", 0, 0, 0, None)
+    data: ImageData = _img_data(10)
+
+    # Act
+    miss = cache.get(key)
+    cache.put(key, data)
+    hit = cache.get(key)
+
+    # Assert
+    assert miss is None
+    assert hit is data
+    stats: ImageDataCacheStats = cache.get_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.num_entries == 1
+    assert stats.size_bytes == 10
+
+
+def test_put_makes_array_read_only() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache(max_bytes=100)
+    data: ImageData = _img_data(10)
+
+    # Act
+    cache.put(("a", 0, 0, 0, None), data)
+
+    # Assert
+    assert not data.np_data.flags.writeable
+
+
+def test_evicts_least_recently_used() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache(max_bytes=30)
+    key_a = ("a", 0, 0, 0, None)
+    key_b = ("b", 0, 0, 0, None)
+    key_c = ("c", 0, 0, 0, None)
+    cache.put(key_a, _img_data(10))
+    cache.put(key_b, _img_data(10))
+    cache.put(key_c, _img_data(10))
+    # touch a so that b becomes the least recently used entry
+    cache.get(key_a)
+
+    # Act
+    cache.put(("d", 0, 0, 0, None), _img_data(10))
+
+    # Assert
+    assert cache.get(key_b) is None
+    assert cache.get(key_a) is not None
+    assert cache.get(key_c) is not None
+    assert cache.get_stats().evictions == 1
+    assert cache.get_size_bytes() == 30
+
+
+def test_does_not_cache_entries_larger_than_budget() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache(max_bytes=5)
+    key = ("a", 0, 0, 0, None)
+
+    # Act
+    cache.put(key, _img_data(10))
+
+    # Assert
+    assert cache.get(key) is None
+    assert cache.get_size_bytes() == 0
+
+
+def test_set_max_bytes_evicts() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache(max_bytes=100)
+    cache.put(("a", 0, 0, 0, None), _img_data(40))
+    cache.put(("b", 0, 0, 0, None), _img_data(40))
+
+    # Act
+    cache.set_max_bytes(50)
+
+    # Assert
+    assert cache.get_stats().num_entries == 1
+    assert cache.get_size_bytes() == 40
+
+
+def test_make_key_changes_with_file_contents(tmp_path: Path) -> None:
+    # Arrange
+    img: Path = tmp_path / "img.tiff"
+    img.write_bytes(b"abc")
+    key_before = ImageDataCache.make_key(img, channel=1, seg=2)
+
+    # Act
+    img.write_bytes(b"abcdef")
+    key_after = ImageDataCache.make_key(img, channel=1, seg=2)
+
+    # Assert
+    assert key_before is not None
+    assert key_before != key_after
+    assert ImageDataCache.make_key(tmp_path / "missing.tiff") is None
+
+
+def test_extractor_reuses_cached_decode() -> None:
+    # Arrange
+    cache: ImageDataCache = ImageDataCache.global_instance()
+    cache.clear()
+    extractor = AICSImageDataExtractor.global_instance()
+    hits_before: int = cache.get_stats().hits
+
+    # Act
+    first: ImageData = extractor.extract_image_data(IMG_PATH, channel=1)
+    second: ImageData = extractor.extract_image_data(
+        IMG_PATH, channel=1, dims=False
+    )
+
+    # Assert
+    assert cache.get_stats().hits == hits_before + 1
+    assert second.np_data is first.np_data
+    assert second.dim_x is None
+    assert first.dim_x is not None
@@ -0,0 +1,191 @@
+import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+import allencell_ml_segmenter
+from allencell_ml_segmenter.core.image_metadata_index import (
+    ImageMetadataIndex,
+    ImageMetadata,
+    read_image_metadata,
+)
+
+IMG_PATH: Path = (
+    Path(allencell_ml_segmenter.__file__).parent
+    / "_tests"
+    / "test_files"
+    / "images"
+    / "test_3_channels.tiff"
+)
+
+
+class CountingReader:
+    """
+    Fake metadata reader that records which paths it was asked to read.
+    """
+
+    def __init__(self) -> None:
+        self.read_paths: List[Path] = []
+
+    def __call__(self, img_path: Path) -> ImageMetadata:
+        self.read_paths.append(img_path)
+        stat = img_path.stat()
+        return ImageMetadata(
+            4,
+            5,
+            6,
+            2,
+            1,
+            "uint8",
+            [1.0, 0.5, 0.5],
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+
+
+def _make_images(dir: Path, n: int) -> List[Path]:
+    dir.mkdir(parents=True, exist_ok=True)
+    paths: List[Path] = []
+    for i in range(n):
+        path: Path = dir / f"img_{i}.tiff"
+        path.write_bytes(b"x" * (i + 1))
+        paths.append(path)
+    return paths
+
+
+def test_read_image_metadata() -> None:
+    # Act
+    metadata: ImageMetadata = read_image_metadata(IMG_PATH)
+
+    # Assert
+    assert metadata.channels == 3
+    assert metadata.timepoints == 1
+    assert metadata.size == IMG_PATH.stat().st_size
+
+
+def test_get_metadata_reads_once(tmp_path: Path) -> None:
+    # Arrange
+    img: Path = _make_images(tmp_path, 1)[0]
+    reader: CountingReader = CountingReader()
+    index: ImageMetadataIndex = ImageMetadataIndex(read_metadata=reader)
+
+    # Act
+    first: ImageMetadata = index.get_metadata(img)
+    second: ImageMetadata = index.get_metadata(img)
+
+    # Assert
+    assert first == second
+    assert len(reader.read_paths) == 1
+
+
+def test_index_persists_to_file(tmp_path: Path) -> None:
+    # Arrange
+    img: Path = _make_images(tmp_path, 1)[0]
+    index_path: Path = tmp_path / "cache" / "index.json"
+    first: ImageMetadataIndex = ImageMetadataIndex(
+        index_path, read_metadata=CountingReader()
+    )
+    first.get_metadata(img)
+    first.flush()
+    reader: CountingReader = CountingReader()
+
+    # Act
+    # a fresh index (e.g. a new napari session) should use the saved entries
+    metadata: ImageMetadata = ImageMetadataIndex(
+        index_path, read_metadata=reader
+    ).get_metadata(img)
+
+    # Assert
+    assert index_path.exists()
+    assert metadata.channels == 2
+    assert len(reader.read_paths) == 0
+
+
+def test_flushes_are_batched(tmp_path: Path) -> None:
+    # Arrange
+    imgs: List[Path] = _make_images(tmp_path / "images", 3)
+    index_path: Path = tmp_path / "index.json"
+    index: ImageMetadataIndex = ImageMetadataIndex(
+        index_path, read_metadata=CountingReader(), flush_delay=0.2
+    )
+
+    # Act
+    for img in imgs:
+        index.get_metadata(img)
+    written_early: bool = index_path.exists()
+    for _ in range(500):
+        if index_path.exists():
+            break
+        threading.Event().wait(0.01)
+
+    # Assert
+    assert not written_early
+    assert len(json.loads(index_path.read_text())["entries"]) == 3
+    # the image directory is left untouched
+    assert sorted(p.name for p in (tmp_path / "images").iterdir()) == [
+        img.name for img in imgs
+    ]
+
+
+def test_set_index_path_saves_entries_read_before(tmp_path: Path) -> None:
+    # Arrange
+    img: Path = _make_images(tmp_path, 1)[0]
+    index: ImageMetadataIndex = ImageMetadataIndex(
+        read_metadata=CountingReader()
+    )
+    index.get_metadata(img)
+    index_path: Path = tmp_path / "index.json"
+
+    # Act
+    index.set_index_path(index_path)
+    index.flush()
+
+    # Assert
+    assert str(img.resolve()) in json.loads(index_path.read_text())["entries"]
+
+
+def test_modified_image_is_reread(tmp_path: Path) -> None:
+    # Arrange
+    img: Path = _make_images(tmp_path, 1)[0]
+    reader: CountingReader = CountingReader()
+    index: ImageMetadataIndex = ImageMetadataIndex(read_metadata=reader)
+    index.get_metadata(img)
+
+    # Act
+    img.write_bytes(b"a different image")
+    metadata: ImageMetadata = index.get_metadata(img)
+
+    # Assert
+    assert len(reader.read_paths) == 2
+    assert metadata.size == img.stat().st_size
+
+
+def test_get_metadata_shares_concurrent_reads(tmp_path: Path) -> None:
+    # Arrange
+    img_path: Path = _make_images(tmp_path, 1)[0]
+    reader: CountingReader = CountingReader()
+    release: threading.Event = threading.Event()
+
+    def slow_reader(path: Path) -> ImageMetadata:
+        release.wait(5)
+        return reader(path)
+
+    index: ImageMetadataIndex = ImageMetadataIndex(read_metadata=slow_reader)
+    pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2)
+    futures: List[Future] = [
+        pool.submit(index.get_metadata, img_path) for _ in range(2)
+    ]
+    for _ in range(500):
+        if index.get_read_stats().requests == 2:
+            break
+        threading.Event().wait(0.01)
+
+    # Act
+    release.set()
+
+    # Assert
+    assert futures[0].result(5) == futures[1].result(5)
+    assert len(reader.read_paths) == 1
+    assert index.get_read_stats().coalesced == 1
+    pool.shutdown()
@@ -0,0 +1,146 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    CoalescingImageDataExtractor,
+    IImageDataExtractor,
+    ImageData,
+)
+from allencell_ml_segmenter.core.request_coalescer import (
+    RequestCoalescer,
+    RequestCoalescerStats,
+)
+
+
+class BlockingFn:
+    """
+    Callable that blocks until released, counting how many times it was called.
+    """
+
+    def __init__(self, result: object = 5) -> None:
+        self.calls: int = 0
+        self.started: threading.Event = threading.Event()
+        self.release: threading.Event = threading.Event()
+        self._result: object = result
+
+    def __call__(self) -> object:
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        if isinstance(self._result, Exception):
+            raise self._result
+        return self._result
+
+
+def _wait_for_coalesced(coalescer: RequestCoalescer, n: int) -> None:
+    for _ in range(500):
+        if coalescer.get_stats().coalesced == n:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("requests were not coalesced")
+
+
+def test_concurrent_requests_share_one_execution() -> None:
+    # Arrange
+    coalescer: RequestCoalescer = RequestCoalescer()
+    fn: BlockingFn = BlockingFn()
+    pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=3)
+    leader: Future = pool.submit(coalescer.run, "key", fn)
+    fn.started.wait(5)
+    followers: List[Future] = [
+        pool.submit(coalescer.run, "key", fn) for _ in range(2)
+    ]
+    _wait_for_coalesced(coalescer, 2)
+
+    # Act
+    fn.release.set()
+
+    # Assert
+    assert [f.result(5) for f in [leader, *followers]] == [5, 5, 5]
+    assert fn.calls == 1
+    stats: RequestCoalescerStats = coalescer.get_stats()
+    assert stats.requests == 3
+    assert stats.executions == 1
+    assert stats.coalesced == 2
+    assert stats.in_flight == 0
+    pool.shutdown()
+
+
+def test_exception_is_raised_for_every_request() -> None:
+    # Arrange
+    coalescer: RequestCoalescer = RequestCoalescer()
+    fn: BlockingFn = BlockingFn(ValueError("decode failed"))
+    pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=2)
+    leader: Future = pool.submit(coalescer.run, "key", fn)
+    fn.started.wait(5)
+    follower: Future = pool.submit(coalescer.run, "key", fn)
+    _wait_for_coalesced(coalescer, 1)
+
+    # Act
+    fn.release.set()
+
+    # Assert
+    for future in (leader, follower):
+        with pytest.raises(ValueError):
+            future.result(5)
+    pool.shutdown()
+
+
+def test_finished_requests_are_not_reused() -> None:
+    # Arrange
+    coalescer: RequestCoalescer = RequestCoalescer()
+    fn: Mock = Mock(side_effect=[1, 2])
+
+    # Act
+    first: int = coalescer.run("key", fn)
+    second: int = coalescer.run("key", fn)
+
+    # Assert
+    assert (first, second) == (1, 2)
+    assert coalescer.get_stats().coalesced == 0
+
+
+def test_extractor_coalesces_identical_requests_only() -> None:
+    # Arrange
+    img_data: ImageData = ImageData(1, 2, 3, 4, np.zeros((2, 2)), Path("a"))
+    release: threading.Event = threading.Event()
+
+    def slow_extract(*args: object, **kwargs: object) -> ImageData:
+        release.wait(5)
+        return img_data
+
+    inner: Mock = Mock(spec=IImageDataExtractor)
+    inner.extract_image_data.side_effect = slow_extract
+    extractor: CoalescingImageDataExtractor = CoalescingImageDataExtractor(
+        inner
+    )
+    pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=3)
+    same_1: Future = pool.submit(extractor.extract_image_data, Path("a"))
+    same_2: Future = pool.submit(extractor.extract_image_data, Path("a"))
+    other_channel: Future = pool.submit(
+        extractor.extract_image_data, Path("a"), channel=1
+    )
+    for _ in range(500):
+        if extractor.get_stats().requests == 3:
+            break
+        threading.Event().wait(0.01)
+
+    # Act
+    release.set()
+
+    # Assert
+    results: List[ImageData] = [
+        f.result(5) for f in (same_1, same_2, other_channel)
+    ]
+    assert inner.extract_image_data.call_count == 2
+    assert extractor.get_stats().coalesced == 1
+    # each caller gets its own ImageData sharing the extracted array
+    assert results[0] is not results[1]
+    assert results[0].np_data is results[1].np_data
+    pool.shutdown()
@@ -0,0 +1,234 @@
+import threading
+from functools import partial
+from pathlib import Path
+from typing import Iterator, List
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from pytestqt.qtbot import QtBot
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    FakeImageDataExtractor,
+    ImageData,
+)
+
+from allencell_ml_segmenter.core.task_executor import (
+    ITaskExecutor,
+    NapariThreadTaskExecutor,
+    PooledTaskExecutor,
+    PooledTaskExecutorStats,
+    ProcessPoolTaskExecutor,
+    SynchroTaskExecutor,
+    TaskHandle,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+)
+
+
+def test_synchro_exec_returns_done_handle() -> None:
+    # Arrange
+    executor: ITaskExecutor = SynchroTaskExecutor.global_instance()
+    on_return: Mock = Mock()
+
+    # Act
+    handle: TaskHandle = executor.exec(
+        lambda: 5, on_return=on_return, group="synchro"
+    )
+
+    # Assert
+    on_return.assert_called_once_with(5)
+    assert handle.is_done()
+    assert not handle.is_cancelled()
+    assert handle.get_group() == "synchro"
+
+
+def test_cancel_after_done_has_no_effect() -> None:
+    # Arrange
+    handle: TaskHandle = SynchroTaskExecutor.global_instance().exec(
+        lambda: None
+    )
+
+    # Act
+    handle.cancel()
+
+    # Assert
+    assert not handle.is_cancelled()
+
+
+def test_napari_exec_runs_task(qtbot: QtBot) -> None:
+    # Arrange
+    executor: ITaskExecutor = NapariThreadTaskExecutor.global_instance()
+    on_return: Mock = Mock()
+
+    # Act
+    handle: TaskHandle = executor.exec(lambda: 5, on_return=on_return)
+    qtbot.waitUntil(handle.is_done, timeout=5000)
+
+    # Assert
+    on_return.assert_called_once_with(5)
+
+
+def test_napari_cancel_skips_task_and_callbacks(qtbot: QtBot) -> None:
+    # Arrange
+    executor: ITaskExecutor = NapariThreadTaskExecutor.global_instance()
+    release: threading.Event = threading.Event()
+    on_return: Mock = Mock()
+    on_finish: Mock = Mock()
+    # still running when the group is cancelled
+    blocking: TaskHandle = executor.exec(
+        lambda: release.wait(5), group="test_napari_cancel"
+    )
+
+    # Act
+    handle: TaskHandle = executor.exec(
+        lambda: 5,
+        on_return=on_return,
+        on_finish=on_finish,
+        group="test_napari_cancel",
+    )
+    executor.cancel_group("test_napari_cancel")
+    release.set()
+    qtbot.waitUntil(
+        lambda: blocking.is_done() and handle.is_done(), timeout=5000
+    )
+
+    # Assert
+    assert handle.is_cancelled()
+    assert blocking.is_cancelled()
+    on_return.assert_not_called()
+    on_finish.assert_not_called()
+
+
+def test_pooled_callbacks_run_on_main_thread(qtbot: QtBot) -> None:
+    # Arrange
+    executor: PooledTaskExecutor = PooledTaskExecutor(max_workers=2)
+    task_threads: List[threading.Thread] = []
+    callback_threads: List[threading.Thread] = []
+
+    def task() -> int:
+        task_threads.append(threading.current_thread())
+        return 5
+
+    # Act
+    handle: TaskHandle = executor.exec(
+        task,
+        on_return=lambda _: callback_threads.append(
+            threading.current_thread()
+        ),
+    )
+    qtbot.waitUntil(handle.is_done, timeout=5000)
+
+    # Assert
+    assert task_threads[0] is not threading.main_thread()
+    assert callback_threads == [threading.main_thread()]
+    stats: PooledTaskExecutorStats = executor.get_stats()
+    assert stats.completed_tasks == 1
+    assert len(stats.recent_wall_times) == 1
+
+
+def test_pooled_runs_queued_tasks_by_priority(qtbot: QtBot) -> None:
+    # Arrange
+    executor: PooledTaskExecutor = PooledTaskExecutor(max_workers=1)
+    release: threading.Event = threading.Event()
+    order: List[str] = []
+    # occupies the only worker so that the rest of the tasks queue up
+    executor.exec(lambda: release.wait(5))
+    qtbot.waitUntil(lambda: executor.get_stats().active_tasks == 1)
+    executor.exec(lambda: order.append("low_1"), priority=PRIORITY_LOW)
+    executor.exec(lambda: order.append("normal"))
+    executor.exec(lambda: order.append("low_2"), priority=PRIORITY_LOW)
+    last: TaskHandle = executor.exec(
+        lambda: order.append("high"), priority=PRIORITY_HIGH
+    )
+    qtbot.waitUntil(lambda: executor.get_stats().queue_depth == 4)
+
+    # Act
+    release.set()
+    qtbot.waitUntil(lambda: executor.get_stats().completed_tasks == 5)
+
+    # Assert
+    assert order == ["high", "normal", "low_1", "low_2"]
+    qtbot.waitUntil(last.is_done, timeout=5000)
+
+
+def test_pooled_respects_max_workers(qtbot: QtBot) -> None:
+    # Arrange
+    executor: PooledTaskExecutor = PooledTaskExecutor(max_workers=2)
+    release: threading.Event = threading.Event()
+
+    # Act
+    for _ in range(5):
+        executor.exec(lambda: release.wait(5))
+    qtbot.waitUntil(lambda: executor.get_stats().active_tasks == 2)
+
+    # Assert
+    assert executor.get_stats().queue_depth == 3
+    release.set()
+    qtbot.waitUntil(lambda: executor.get_stats().completed_tasks == 5)
+
+
+def test_pooled_cancelled_task_is_skipped(qtbot: QtBot) -> None:
+    # Arrange
+    executor: PooledTaskExecutor = PooledTaskExecutor(max_workers=1)
+    release: threading.Event = threading.Event()
+    task: Mock = Mock()
+    executor.exec(lambda: release.wait(5))
+    handle: TaskHandle = executor.exec(task, group="test_pooled_cancel")
+
+    # Act
+    executor.cancel_group("test_pooled_cancel")
+    release.set()
+    qtbot.waitUntil(handle.is_done, timeout=5000)
+
+    # Assert
+    task.assert_not_called()
+    assert executor.get_stats().cancelled_tasks == 1
+
+
+@pytest.fixture(scope="module")
+def process_executor() -> Iterator[ProcessPoolTaskExecutor]:
+    executor: ProcessPoolTaskExecutor = ProcessPoolTaskExecutor(max_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_process_pool_run_returns_result(
+    process_executor: ProcessPoolTaskExecutor,
+) -> None:
+    # Act
+    result: np.ndarray = process_executor.run(
+        partial(np.full, (2, 3), 5, dtype=np.uint8)
+    )
+
+    # Assert
+    assert result.dtype == np.uint8
+    np.testing.assert_array_equal(result, np.full((2, 3), 5))
+
+
+def test_process_pool_run_returns_image_data(
+    process_executor: ProcessPoolTaskExecutor,
+) -> None:
+    # Arrange
+    extractor: FakeImageDataExtractor = (
+        FakeImageDataExtractor.global_instance()
+    )
+
+    # Act
+    # bound methods of extractors can be sent to worker processes
+    result: ImageData = process_executor.run(
+        partial(extractor.extract_image_data, Path("img.tiff"))
+    )
+
+    # Assert
+    assert result.path == Path("img.tiff")
+    assert result.dim_x == 1
+    np.testing.assert_array_equal(result.np_data, np.zeros((5, 5)))
+
+
+def test_process_pool_run_raises_task_errors(
+    process_executor: ProcessPoolTaskExecutor,
+) -> None:
+    # Act / Assert
+    with pytest.raises(ValueError):
+        process_executor.run(partial(int, "not a number"))
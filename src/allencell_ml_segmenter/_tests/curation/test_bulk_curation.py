@@ -0,0 +1,191 @@
+import csv
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import tifffile
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    AICSImageDataExtractor,
+)
+from allencell_ml_segmenter.curation.bulk_curation import (
+    BaseImageRule,
+    BulkCurator,
+    CurationRules,
+    SegmentationStats,
+    apply_curation_rules,
+    compute_segmentation_stats,
+)
+from allencell_ml_segmenter.curation.bulk_curation_cli import main
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+)
+
+RAW: Path = Path("raw.tiff")
+SEG1: Path = Path("seg1.tiff")
+SEG2: Path = Path("seg2.tiff")
+
+
+def _write_dataset(tmp_path: Path, num_images: int) -> None:
+    # image i has i + 1 foreground rows in seg1 and 2 in seg2
+    for name in ["raw", "seg1", "seg2"]:
+        (tmp_path / name).mkdir()
+    for i in range(num_images):
+        raw: np.ndarray = np.zeros((2, 8, 8), dtype=np.uint8)
+        seg1: np.ndarray = np.zeros((2, 8, 8), dtype=np.uint8)
+        seg1[:, : i + 1] = 1
+        seg2: np.ndarray = np.zeros((2, 8, 8), dtype=np.uint8)
+        seg2[:, :2] = 1
+        for name, img in [("raw", raw), ("seg1", seg1), ("seg2", seg2)]:
+            tifffile.imwrite(
+                tmp_path / name / f"img{i}.tiff",
+                img,
+                imagej=True,
+                metadata={"axes": "ZYX"},
+            )
+
+
+def test_apply_curation_rules_chooses_base_by_foreground() -> None:
+    # Arrange
+    stats: SegmentationStats = SegmentationStats(
+        0.1, 0.3, AgreementScore(0.5, 0, 0)
+    )
+    rules: CurationRules = CurationRules(
+        min_foreground_fraction=0.2,
+        base_image_rule=BaseImageRule.MORE_FOREGROUND,
+    )
+
+    # Act
+    record: CurationRecord = apply_curation_rules(
+        RAW, SEG1, SEG2, stats, rules
+    )
+
+    # Assert
+    assert record.base_image == "seg2"
+    # seg1 alone would have been below the minimum
+    assert record.to_use
+
+
+def test_apply_curation_rules_leaves_out_disagreeing_images() -> None:
+    # Arrange
+    stats: SegmentationStats = SegmentationStats(
+        0.3, 0.3, AgreementScore(0.5, 0, 0)
+    )
+    rules: CurationRules = CurationRules(min_agreement=0.8)
+
+    # Act
+    record: CurationRecord = apply_curation_rules(
+        RAW, SEG1, SEG2, stats, rules
+    )
+
+    # Assert
+    assert record.base_image == "seg1"
+    assert not record.to_use
+
+
+def test_apply_curation_rules_without_stats() -> None:
+    # Act
+    record: CurationRecord = apply_curation_rules(
+        RAW, SEG1, None, None, CurationRules()
+    )
+
+    # Assert
+    assert not record.to_use
+
+
+def test_compute_segmentation_stats(tmp_path: Path) -> None:
+    # Arrange
+    _write_dataset(tmp_path, 4)
+
+    # Act
+    stats: SegmentationStats = compute_segmentation_stats(
+        AICSImageDataExtractor.global_instance(),
+        tmp_path / "seg1" / "img3.tiff",
+        tmp_path / "seg2" / "img3.tiff",
+        0,
+        0,
+    )
+
+    # Assert
+    assert stats.seg1_foreground_fraction == 0.5
+    assert stats.seg2_foreground_fraction == 0.25
+    assert stats.agreement is not None
+    assert np.isclose(stats.agreement.dice, 2 * 32 / (64 + 32))
+
+
+def test_bulk_curator_curates_paired_images(tmp_path: Path) -> None:
+    # Arrange
+    _write_dataset(tmp_path, 4)
+    # not in seg1 or seg2, so not paired
+    (tmp_path / "raw" / "extra.tiff").touch()
+    curator: BulkCurator = BulkCurator(
+        CurationRules(min_foreground_fraction=0.3), max_workers=1
+    )
+
+    # Act
+    records: List[CurationRecord] = curator.curate(
+        tmp_path / "raw", tmp_path / "seg1", tmp_path / "seg2"
+    )
+
+    # Assert
+    assert [r.raw_file.name for r in records] == [
+        f"img{i}.tiff" for i in range(4)
+    ]
+    assert [r.seg2.name for r in records if r.seg2] == [
+        f"img{i}.tiff" for i in range(4)
+    ]
+    # 1/8, 2/8, 3/8 and 4/8 of seg1 is foreground
+    assert [r.to_use for r in records] == [False, False, True, True]
+
+
+def test_cli_writes_csvs(tmp_path: Path) -> None:
+    # Arrange
+    _write_dataset(tmp_path, 5)
+    out_dir: Path = tmp_path / "out"
+
+    # Act
+    exit_code: int = main(
+        [
+            str(tmp_path / "raw"),
+            str(tmp_path / "seg1"),
+            str(out_dir),
+            "--seg2-dir",
+            str(tmp_path / "seg2"),
+            "--base-image",
+            "seg2",
+            "--workers",
+            "1",
+        ]
+    )
+
+    # Assert
+    assert exit_code == 0
+    rows: List[dict] = []
+    for csv_name in ["train.csv", "test.csv"]:
+        with open(out_dir / csv_name) as f:
+            rows.extend(csv.DictReader(f))
+    assert len(rows) == 5
+    assert all(row["base_image"] == "seg2" for row in rows)
+
+
+def test_cli_fails_with_too_few_images(tmp_path: Path) -> None:
+    # Arrange
+    _write_dataset(tmp_path, 5)
+
+    # Act
+    exit_code: int = main(
+        [
+            str(tmp_path / "raw"),
+            str(tmp_path / "seg1"),
+            str(tmp_path / "out"),
+            "--min-foreground-fraction",
+            "0.9",
+            "--workers",
+            "1",
+        ]
+    )
+
+    # Assert
+    assert exit_code == 1
+    assert not (tmp_path / "out").exists()
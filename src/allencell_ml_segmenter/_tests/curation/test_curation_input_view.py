@@ -4,9 +4,14 @@ from typing import List
 from pathlib import Path
 
 import pytest
-from qtpy.QtWidgets import QComboBox, QFileDialog
+from qtpy.QtWidgets import QComboBox, QDialog, QFileDialog
 from pytestqt.qtbot import QtBot
 
+from allencell_ml_segmenter.core.dialog_box import DialogBox
+from allencell_ml_segmenter.curation.curation_journal import (
+    CurationJournal,
+    JOURNAL_NAME,
+)
 from allencell_ml_segmenter.curation.input_view import CurationInputView
 from allencell_ml_segmenter.curation.curation_model import (
     CurationModel,
@@ -17,6 +22,7 @@ from allencell_ml_segmenter._tests.fakes.fake_experiments_model import (
     FakeExperimentsModel,
 )
 from allencell_ml_segmenter.main.main_model import MainModel
+from allencell_ml_segmenter.utils.file_writer import FileWriter
 
 
 @dataclass
@@ -211,6 +217,36 @@ class TestsWithStubbedFileDialog:
         # we expect the start button to work since we have all selected
         assert test_env.model.get_current_view() == CurationView.MAIN_VIEW
 
+    def test_start_warns_about_unmatched_files(
+        self, qtbot: QtBot, test_env: TestEnvironment
+    ) -> None:
+        # Arrange
+        test_env.view.raw_directory_select.button.click()
+        test_env.model.set_channel_count(ImageType.RAW, 5)
+        test_env.model.set_image_directory_paths(
+            ImageType.RAW, MOCK_DIR_PATHS + [Path("raw_only")]
+        )
+        test_env.view.raw_image_channel_combo.setCurrentIndex(1)
+
+        test_env.view.seg1_directory_select.button.click()
+        test_env.model.set_channel_count(ImageType.SEG1, 5)
+        test_env.model.set_image_directory_paths(
+            ImageType.SEG1, MOCK_DIR_PATHS
+        )
+        test_env.view.seg1_image_channel_combo.setCurrentIndex(2)
+
+        # Act
+        with patch(
+            "allencell_ml_segmenter.curation.input_view.show_warning"
+        ) as show_warning:
+            test_env.view.start_btn.click()
+
+        # Assert
+        assert test_env.model.get_current_view() == CurationView.MAIN_VIEW
+        show_warning.assert_called_once()
+        assert "1 raw" in show_warning.call_args[0][0]
+        assert "raw_only" in show_warning.call_args[0][0]
+
 
 ### View + Model Integration Tests ------------------------------------------------------------------------
 
@@ -259,3 +295,149 @@ def test_seg2_channel_selected(
     assert test_env.model.get_selected_channel(ImageType.SEG2) == 1
     combo_box.setCurrentIndex(2)
     assert test_env.model.get_selected_channel(ImageType.SEG2) == 2
+
+
+RAW_DIR: Path = Path("raw")
+SEG1_DIR: Path = Path("seg1")
+
+
+def _select_inputs(model: CurationModel) -> None:
+    model.set_image_directory(ImageType.RAW, RAW_DIR)
+    model.set_image_directory_paths(
+        ImageType.RAW, [RAW_DIR / path for path in MOCK_DIR_PATHS]
+    )
+    model.set_selected_channel(ImageType.RAW, 0)
+    model.set_image_directory(ImageType.SEG1, SEG1_DIR)
+    model.set_image_directory_paths(
+        ImageType.SEG1, [SEG1_DIR / path for path in MOCK_DIR_PATHS]
+    )
+    model.set_selected_channel(ImageType.SEG1, 0)
+
+
+def _write_journal(
+    journal_path: Path, raw_dir: Path = RAW_DIR, finished: bool = False
+) -> None:
+    journal: CurationJournal = CurationJournal(
+        journal_path, FileWriter.global_instance()
+    )
+    journal.start_session(
+        [raw_dir / path for path in MOCK_DIR_PATHS],
+        [SEG1_DIR / path for path in MOCK_DIR_PATHS],
+        None,
+        {ImageType.RAW: 0, ImageType.SEG1: 0, ImageType.SEG2: None},
+    )
+    journal.move_cursor(1)
+    if finished:
+        journal.finish()
+    journal.close()
+
+
+def test_start_resumes_journaled_session(
+    qtbot: QtBot,
+    test_env: TestEnvironment,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    _write_journal(journal_path)
+    _select_inputs(test_env.model)
+    monkeypatch.setattr(
+        test_env.model, "get_journal_path", lambda: journal_path
+    )
+    monkeypatch.setattr(
+        DialogBox, "exec", lambda *args: QDialog.DialogCode.Accepted
+    )
+
+    # Act
+    test_env.view.start_btn.click()
+
+    # Assert
+    assert test_env.model.get_current_view() == CurationView.MAIN_VIEW
+    assert test_env.model.get_curr_image_index() == 1
+    assert test_env.model.get_image_directory_paths(ImageType.RAW) == [
+        RAW_DIR / path for path in MOCK_DIR_PATHS
+    ]
+
+
+def test_start_declining_resume_starts_new_session(
+    qtbot: QtBot,
+    test_env: TestEnvironment,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    _write_journal(journal_path)
+    _select_inputs(test_env.model)
+    monkeypatch.setattr(
+        test_env.model, "get_journal_path", lambda: journal_path
+    )
+    monkeypatch.setattr(
+        DialogBox, "exec", lambda *args: QDialog.DialogCode.Rejected
+    )
+
+    # Act
+    test_env.view.start_btn.click()
+
+    # Assert
+    assert test_env.model.get_current_view() == CurationView.MAIN_VIEW
+    assert test_env.model.get_curr_image_index() == 0
+
+
+def test_start_checks_inputs_before_offering_resume(
+    qtbot: QtBot,
+    test_env: TestEnvironment,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    _write_journal(journal_path)
+    monkeypatch.setattr(
+        test_env.model, "get_journal_path", lambda: journal_path
+    )
+    exec_dialog: Mock = Mock(return_value=QDialog.DialogCode.Accepted)
+    monkeypatch.setattr(DialogBox, "exec", exec_dialog)
+
+    # Act
+    with patch(
+        "allencell_ml_segmenter.curation.input_view.show_info"
+    ) as show_info:
+        test_env.view.start_btn.click()
+
+    # Assert
+    # no inputs are selected, so neither session starts
+    show_info.assert_called_once()
+    exec_dialog.assert_not_called()
+    assert test_env.model.get_current_view() == CurationView.INPUT_VIEW
+
+
+@pytest.mark.parametrize(
+    "raw_dir, finished", [(RAW_DIR, True), (Path("other_raw"), False)]
+)
+def test_start_does_not_offer_finished_or_other_sessions(
+    qtbot: QtBot,
+    test_env: TestEnvironment,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    raw_dir: Path,
+    finished: bool,
+) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    _write_journal(journal_path, raw_dir, finished)
+    _select_inputs(test_env.model)
+    monkeypatch.setattr(
+        test_env.model, "get_journal_path", lambda: journal_path
+    )
+    exec_dialog: Mock = Mock(return_value=QDialog.DialogCode.Accepted)
+    monkeypatch.setattr(DialogBox, "exec", exec_dialog)
+
+    # Act
+    test_env.view.start_btn.click()
+
+    # Assert
+    exec_dialog.assert_not_called()
+    assert test_env.model.get_current_view() == CurationView.MAIN_VIEW
+    assert test_env.model.get_curr_image_index() == 0
@@ -0,0 +1,175 @@
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.curation_journal import (
+    CurationJournal,
+    CurationSession,
+    JOURNAL_NAME,
+)
+from allencell_ml_segmenter.main.main_model import ImageType
+from allencell_ml_segmenter.utils.file_writer import (
+    FakeFileWriter,
+    FileWriter,
+)
+
+RAW_PATHS: List[Path] = [Path(f"raw_{i}.tiff") for i in range(3)]
+SEG1_PATHS: List[Path] = [Path(f"seg1_{i}.tiff") for i in range(3)]
+CHANNELS = {ImageType.RAW: 1, ImageType.SEG1: 0, ImageType.SEG2: None}
+
+
+def _shapes_mask() -> np.ndarray:
+    # masks from shapes layers are object arrays of polygon vertices
+    return np.asarray(
+        [np.zeros((4, 2)), np.ones((3, 2)), np.ones((5, 2))], dtype=object
+    )
+
+
+def _record(
+    idx: int, to_use: bool, mask: Optional[np.ndarray] = None
+) -> CurationRecord:
+    return CurationRecord(
+        RAW_PATHS[idx], SEG1_PATHS[idx], None, mask, None, "seg1", to_use
+    )
+
+
+def _start(journal: CurationJournal) -> None:
+    journal.start_session(RAW_PATHS, SEG1_PATHS, None, CHANNELS)
+
+
+def test_load_restores_recorded_session(tmp_path: Path) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    journal: CurationJournal = CurationJournal(
+        journal_path, FileWriter.global_instance()
+    )
+    mask: np.ndarray = _shapes_mask()
+    _start(journal)
+    journal.move_cursor(0)
+    journal.record(0, _record(0, True, mask))
+    journal.move_cursor(1)
+    journal.record(1, _record(1, False))
+    journal.move_cursor(2)
+    journal.wait()
+
+    # Act
+    session: Optional[CurationSession] = CurationJournal.load(journal_path)
+
+    # Assert
+    assert session is not None
+    assert session.raw_paths == RAW_PATHS
+    assert session.seg1_paths == SEG1_PATHS
+    assert session.seg2_paths is None
+    assert session.channels == CHANNELS
+    assert session.cursor == 2
+    assert session.visited == {0, 1}
+    assert session.records[0].to_use
+    assert not session.records[1].to_use
+    assert session.records[1].excluding_mask is None
+    loaded_mask: Optional[np.ndarray] = session.records[0].excluding_mask
+    assert loaded_mask is not None
+    assert len(loaded_mask) == len(mask)
+    for loaded, expected in zip(loaded_mask, mask):
+        np.testing.assert_array_equal(loaded, expected)
+
+
+def test_unchanged_records_and_masks_are_not_rewritten() -> None:
+    # Arrange
+    writer: FakeFileWriter = FakeFileWriter()
+    journal_path: Path = Path("journal") / JOURNAL_NAME
+    journal: CurationJournal = CurationJournal(journal_path, writer)
+    mask: np.ndarray = _shapes_mask()
+    _start(journal)
+
+    # Act
+    journal.record(0, _record(0, True, mask))
+    # same decision, and an identical mask in a new array
+    journal.record(0, _record(0, True, _shapes_mask()))
+    journal.record(1, _record(1, True, _shapes_mask()))
+    journal.record(0, _record(0, False, mask))
+    journal.wait()
+
+    # Assert
+    # header, record 0, record 1, changed record 0
+    assert len(writer.lines_state[journal_path]) == 4
+    assert len(writer.np_save_state) == 1
+
+
+def test_load_ignores_partially_written_last_line(tmp_path: Path) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    journal: CurationJournal = CurationJournal(
+        journal_path, FileWriter.global_instance()
+    )
+    _start(journal)
+    journal.record(0, _record(0, True))
+    journal.wait()
+    with open(journal_path, "a") as fa:
+        fa.write('{"type": "record", "ind')
+
+    # Act
+    session: Optional[CurationSession] = CurationJournal.load(journal_path)
+
+    # Assert
+    assert session is not None
+    assert session.visited == {0}
+    assert session.records[0].to_use
+
+
+def test_load_without_journal(tmp_path: Path) -> None:
+    # Act / Assert
+    assert CurationJournal.load(tmp_path / JOURNAL_NAME) is None
+
+
+def test_load_replays_reorder(tmp_path: Path) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    journal: CurationJournal = CurationJournal(
+        journal_path, FileWriter.global_instance()
+    )
+    _start(journal)
+    journal.move_cursor(0)
+    journal.reorder([1, 2], [2, 1])
+    journal.move_cursor(1)
+    journal.record(1, _record(2, False))
+    journal.move_cursor(2)
+    journal.wait()
+
+    # Act
+    session: Optional[CurationSession] = CurationJournal.load(journal_path)
+
+    # Assert
+    assert session is not None
+    assert session.records.get_raw_paths() == [
+        RAW_PATHS[0],
+        RAW_PATHS[2],
+        RAW_PATHS[1],
+    ]
+    assert session.visited == {1}
+    assert not session.records[1].to_use
+    # the header is not rewritten on reorder
+    with open(journal_path) as fr:
+        assert sum('"type": "session"' in line for line in fr) == 1
+
+
+def test_load_marks_finished_session(tmp_path: Path) -> None:
+    # Arrange
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    journal: CurationJournal = CurationJournal(
+        journal_path, FileWriter.global_instance()
+    )
+    _start(journal)
+    journal.move_cursor(2)
+    journal.wait()
+    unfinished: Optional[CurationSession] = CurationJournal.load(journal_path)
+    journal.finish()
+    journal.close()
+
+    # Act
+    finished: Optional[CurationSession] = CurationJournal.load(journal_path)
+
+    # Assert
+    assert unfinished is not None and not unfinished.finished
+    assert finished is not None and finished.finished
@@ -6,6 +6,8 @@ from allencell_ml_segmenter.curation.main_view import (
     CurationMainView,
     MERGING_MASK_LAYER_NAME,
     EXCLUDING_MASK_LAYER_NAME,
+    DISAGREEMENT_LAYER_NAME,
+    MERGE_PREVIEW_LAYER_NAME,
 )
 from allencell_ml_segmenter._tests.fakes.fake_viewer import FakeViewer
 from allencell_ml_segmenter.main.i_viewer import IViewer
@@ -742,6 +744,96 @@ def test_curation_record_on_next(
     assert record.base_image == merging_base
 
 
+def test_previous_image_restores_curation_record(
+    qtbot: QtBot,
+    test_environment_first_images_ready: TestEnvironment,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    # Arrange
+    save_prompt: Mock = Mock(return_value=QDialog.DialogCode.Accepted)
+    monkeypatch.setattr(DialogBox, "exec", save_prompt)
+    env: TestEnvironment = test_environment_first_images_ready
+    # polygons of different sizes, as drawn in a shapes layer
+    excluding_mask: np.ndarray = np.empty(2, dtype=object)
+    excluding_mask[0] = np.asarray([[0, 0], [0, 5], [5, 5]])
+    excluding_mask[1] = np.asarray([[1, 1], [1, 4], [4, 4], [4, 1]])
+    env.view.excluding_create_button.click()
+    env.viewer.modify_shapes(EXCLUDING_MASK_LAYER_NAME, excluding_mask)
+    env.view.excluding_save_button.click()
+    env.view.merging_base_combo.setCurrentIndex(1)
+    env.view.next_button.click()
+    env.model.set_next_image_data(ImageType.RAW, FAKE_IMG_DATA[2])
+    env.model.set_next_image_data(ImageType.SEG1, FAKE_IMG_DATA[2])
+    env.model.set_next_image_data(ImageType.SEG2, FAKE_IMG_DATA[2])
+    env.view.no_radio.click()
+
+    # Act
+    env.view.previous_button.click()
+
+    # Assert
+    assert env.view.progress_bar.value() == 1
+    assert env.view.go_to_spinbox.value() == 1
+    assert not env.view.previous_button.isEnabled()
+    assert env.view.next_button.isEnabled()
+    assert env.viewer.contains_layer(f"[raw] {IMG_DIR_FILES[0].name}")
+    assert env.view.yes_radio.isChecked()
+    assert env.view.merging_base_combo.currentText() == "seg2"
+    assert env.viewer.get_shapes(EXCLUDING_MASK_LAYER_NAME) is not None
+    assert env.view.excluding_mask_status.text() == "Excluding mask saved"
+    assert env.view.excluding_delete_button.isEnabled()
+
+    # Act
+    env.view.next_button.click()
+
+    # Assert
+    # the restored mask is unchanged, so there is nothing to save
+    save_prompt.assert_not_called()
+    assert env.view.no_radio.isChecked()
+    assert env.view.merging_base_combo.currentText() == "seg1"
+    assert not env.view.excluding_create_button.isEnabled()
+    assert not env.model.get_curation_record()[1].to_use
+    assert env.model.get_curation_record()[0].base_image == "seg2"
+
+
+def test_go_to_image_shows_it_once_loaded(
+    qtbot: QtBot, test_environment_first_images_ready: TestEnvironment
+) -> None:
+    # Arrange
+    env: TestEnvironment = test_environment_first_images_ready
+    env.view.go_to_spinbox.setValue(4)
+
+    # Act
+    env.view.go_to_button.click()
+
+    # Assert
+    assert env.view.progress_bar.value() == 4
+    assert not env.viewer.contains_layer(f"[raw] {IMG_DIR_FILES[0].name}")
+    assert not env.view.yes_radio.isEnabled()
+    assert not env.view.excluding_create_button.isEnabled()
+    assert not env.view.next_button.isEnabled()
+    assert not env.view.previous_button.isEnabled()
+
+    # Act
+    for img_type in [ImageType.RAW, ImageType.SEG1, ImageType.SEG2]:
+        env.model.set_image_data(3, img_type, FAKE_IMG_DATA[3])
+
+    # Assert
+    assert env.viewer.contains_layer(f"[raw] {IMG_DIR_FILES[3].name}")
+    assert env.view.yes_radio.isChecked()
+    assert env.view.yes_radio.isEnabled()
+    assert env.view.excluding_create_button.isEnabled()
+    assert env.view.merging_base_combo.currentText() == "seg1"
+    assert not env.view.next_button.isEnabled()
+
+    # Act
+    for img_type in [ImageType.RAW, ImageType.SEG1, ImageType.SEG2]:
+        env.model.set_image_data(4, img_type, FAKE_IMG_DATA[4])
+
+    # Assert
+    assert env.view.next_button.isEnabled()
+    assert env.view.previous_button.isEnabled()
+
+
 def test_merg_viewer_unsaved_model_saved_yes_to_prompt(
     qtbot: QtBot,
     test_environment_first_images_ready: TestEnvironment,
@@ -1064,3 +1156,81 @@ def test_exclud_viewer_unsaved_not_to_use(
     # Assert
     record: CurationRecord = env.model.get_curation_record()[0]
     assert record.excluding_mask is None
+
+
+def test_disagreement_layer_follows_checkbox(
+    qtbot: QtBot, test_environment_first_images_ready: TestEnvironment
+) -> None:
+    # Arrange
+    env: TestEnvironment = test_environment_first_images_ready
+    assert env.view.disagreement_checkbox.isVisibleTo(env.view)
+    labels: np.ndarray = np.zeros([28, 28, 28], dtype=np.uint8)
+
+    # Act
+    env.view.disagreement_checkbox.setChecked(True)
+
+    # Assert
+    # not computed yet
+    assert not env.viewer.contains_layer(DISAGREEMENT_LAYER_NAME)
+
+    # Act
+    env.model.set_disagreement_data(0, FAKE_IMG_DATA[0].path, labels)
+
+    # Assert
+    assert env.viewer.contains_layer(DISAGREEMENT_LAYER_NAME)
+
+    # Act
+    env.view.disagreement_checkbox.setChecked(False)
+
+    # Assert
+    assert not env.viewer.contains_layer(DISAGREEMENT_LAYER_NAME)
+
+
+def test_disagreement_checkbox_hidden_without_seg2(
+    qtbot: QtBot, test_environment_without_seg2: TestEnvironment
+) -> None:
+    # Arrange
+    env: TestEnvironment = test_environment_without_seg2
+
+    # Act
+    env.model.set_curr_image_data(ImageType.RAW, FAKE_IMG_DATA[0])
+    env.model.set_curr_image_data(ImageType.SEG1, FAKE_IMG_DATA[0])
+    env.model.set_next_image_data(ImageType.RAW, FAKE_IMG_DATA[1])
+    env.model.set_next_image_data(ImageType.SEG1, FAKE_IMG_DATA[1])
+
+    # Assert
+    assert not env.view.disagreement_checkbox.isVisibleTo(env.view)
+
+
+def test_merge_preview_layer_is_reused(
+    qtbot: QtBot, test_environment_first_images_ready: TestEnvironment
+) -> None:
+    # Arrange
+    env: TestEnvironment = test_environment_first_images_ready
+    env.view.merging_create_button.click()
+    polygons: np.ndarray = np.asarray(
+        [np.asarray([[0, 0], [0, 5], [5, 5]])], dtype=object
+    )
+
+    # Act
+    env.viewer.modify_shapes(MERGING_MASK_LAYER_NAME, polygons)
+
+    # Assert
+    assert env.model.get_merging_mask_draft() is polygons
+
+    # Act
+    first: np.ndarray = np.zeros([28, 28, 28], dtype=np.uint8)
+    env.model.set_merge_preview(0, first)
+    second: np.ndarray = np.ones([28, 28, 28], dtype=np.uint8)
+    env.model.set_merge_preview(0, second)
+
+    # Assert
+    assert env.viewer.contains_layer(MERGE_PREVIEW_LAYER_NAME)
+    assert env.viewer.labels_data[MERGE_PREVIEW_LAYER_NAME] is second
+
+    # Act
+    env.view.merging_delete_button.click()
+
+    # Assert
+    assert env.model.get_merging_mask_draft() is None
+    assert not env.viewer.contains_layer(MERGE_PREVIEW_LAYER_NAME)
@@ -1,11 +1,14 @@
 import pytest
 from pathlib import Path
 from unittest.mock import Mock
+from typing import List
+import dask.array as da
 import numpy as np
 
 from allencell_ml_segmenter.curation.curation_model import (
     CurationModel,
     CurationView,
+    ImageSlotState,
     ImageType,
 )
 from allencell_ml_segmenter._tests.fakes.fake_experiments_model import (
@@ -13,9 +16,11 @@ from allencell_ml_segmenter._tests.fakes.fake_experiments_model import (
 )
 from allencell_ml_segmenter.main.main_model import MainModel
 from allencell_ml_segmenter.core.image_data_extractor import ImageData
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+)
 import numpy as np
 
-
 FAKE_IMAGE_DATA: ImageData = ImageData(
     28, 28, 28, 1, np.zeros((28, 28, 28)), Path("fake")
 )
@@ -355,6 +360,184 @@ def test_next_image(curation_model_main_view: CurationModel) -> None:
         curation_model_main_view.next_image()
 
 
+def _load_slot(model: CurationModel, img_idx: int) -> None:
+    model.set_image_data(img_idx, ImageType.RAW, FAKE_IMAGE_DATA)
+    model.set_image_data(img_idx, ImageType.SEG1, FAKE_IMAGE_DATA)
+    model.set_image_data(img_idx, ImageType.SEG2, FAKE_IMAGE_DATA)
+
+
+def test_get_slots_to_load(curation_model_main_view: CurationModel) -> None:
+    # Arrange
+    curation_model_main_view.set_prefetch_depth(2)
+
+    # Act
+    curation_model_main_view.start_loading_images()
+
+    # Assert
+    # only the current and next images until the size of an image is known
+    assert curation_model_main_view.get_slots_to_load() == [0, 1]
+
+    # Act
+    curation_model_main_view.start_loading_slot(0)
+    curation_model_main_view.start_loading_slot(1)
+    _load_slot(curation_model_main_view, 0)
+
+    # Assert
+    assert curation_model_main_view.get_slots_to_load() == [2]
+    assert curation_model_main_view.get_slot_state(0) == ImageSlotState.READY
+    assert curation_model_main_view.get_slot_state(1) == ImageSlotState.LOADING
+    assert (
+        curation_model_main_view.get_slot_state(2) == ImageSlotState.NOT_LOADED
+    )
+
+
+def test_get_slots_to_load_respects_budget(
+    curation_model_main_view: CurationModel,
+) -> None:
+    # Arrange
+    curation_model_main_view.set_prefetch_depth(2)
+    curation_model_main_view.start_loading_images()
+    _load_slot(curation_model_main_view, 0)
+    _load_slot(curation_model_main_view, 1)
+
+    # Act
+    curation_model_main_view.set_prefetch_budget_bytes(
+        2 * 3 * FAKE_IMAGE_DATA.np_data.nbytes
+    )
+
+    # Assert
+    # two images are already loaded, so a third would exceed the budget
+    assert curation_model_main_view.get_slots_to_load() == []
+
+
+def test_get_slots_to_load_ignores_unread_lazy_images(
+    curation_model_main_view: CurationModel,
+) -> None:
+    # Arrange
+    lazy_data: ImageData = ImageData(
+        28, 28, 28, 1, da.zeros((28, 28, 28)), Path("fake")
+    )
+    curation_model_main_view.set_prefetch_depth(2)
+    curation_model_main_view.start_loading_images()
+    curation_model_main_view.set_image_data(0, ImageType.RAW, lazy_data)
+    curation_model_main_view.set_image_data(0, ImageType.SEG1, lazy_data)
+    curation_model_main_view.set_image_data(0, ImageType.SEG2, lazy_data)
+    _load_slot(curation_model_main_view, 1)
+
+    # Act
+    curation_model_main_view.set_prefetch_budget_bytes(
+        2 * 3 * FAKE_IMAGE_DATA.np_data.nbytes
+    )
+
+    # Assert
+    # the lazy image has not been read into memory, so a third image fits
+    assert curation_model_main_view.get_slots_to_load() == [2]
+
+
+def test_next_image_with_prefetched_images(
+    curation_model_main_view: CurationModel,
+) -> None:
+    # Arrange
+    img_loading_finished_slot: Mock = Mock()
+    slot_ready_slot: Mock = Mock()
+    curation_model_main_view.set_prefetch_depth(2)
+    curation_model_main_view.start_loading_images()
+    curation_model_main_view.image_loading_finished.connect(
+        img_loading_finished_slot
+    )
+    curation_model_main_view.image_slot_ready.connect(slot_ready_slot)
+    curation_model_main_view.set_history_size(0)
+    _load_slot(curation_model_main_view, 0)
+    _load_slot(curation_model_main_view, 1)
+    _load_slot(curation_model_main_view, 2)
+    img_loading_finished_slot.reset_mock()
+
+    # Act
+    curation_model_main_view.next_image()
+
+    # Assert
+    # image 2 was already prefetched, so loading finishes immediately
+    img_loading_finished_slot.assert_called_once()
+    assert [call.args[0] for call in slot_ready_slot.call_args_list] == [
+        0,
+        1,
+        2,
+    ]
+    assert (
+        curation_model_main_view.get_slot_state(0) == ImageSlotState.NOT_LOADED
+    )
+    assert not curation_model_main_view.is_waiting_for_images()
+
+
+def test_set_image_data_outside_window_is_dropped(
+    curation_model_main_view: CurationModel,
+) -> None:
+    # Arrange
+    curation_model_main_view.set_prefetch_depth(1)
+    curation_model_main_view.start_loading_images()
+
+    # Act
+    curation_model_main_view.set_image_data(2, ImageType.RAW, FAKE_IMAGE_DATA)
+
+    # Assert
+    assert (
+        curation_model_main_view.get_slot_state(2) == ImageSlotState.NOT_LOADED
+    )
+
+
+def test_previous_image_keeps_history(
+    curation_model_loading_started: CurationModel,
+) -> None:
+    # Arrange
+    model: CurationModel = curation_model_loading_started
+    model.set_use_image(False)
+    model.next_image()
+    cursor_moved_slot: Mock = Mock()
+    img_loading_finished_slot: Mock = Mock()
+    model.cursor_moved.connect(cursor_moved_slot)
+    model.image_loading_finished.connect(img_loading_finished_slot)
+
+    # Act
+    model.previous_image()
+
+    # Assert
+    assert model.get_curr_image_index() == 0
+    cursor_moved_slot.assert_called_once()
+    # image 0 was kept as a recently viewed image, so nothing needs to load
+    img_loading_finished_slot.assert_called_once()
+    assert model.get_curr_image_data(ImageType.RAW) is not None
+    # revisiting an image keeps the user's selection
+    assert not model.get_use_image()
+    assert not model.has_previous_image()
+    with pytest.raises(RuntimeError):
+        model.previous_image()
+
+
+def test_go_to(curation_model_loading_started: CurationModel) -> None:
+    # Arrange
+    model: CurationModel = curation_model_loading_started
+    model.set_history_size(0)
+
+    # Act
+    model.go_to(2)
+
+    # Assert
+    assert model.get_curr_image_index() == 2
+    assert model.is_waiting_for_curr_images()
+    assert model.get_slot_state(0) == ImageSlotState.NOT_LOADED
+    assert model.get_slot_state(1) == ImageSlotState.NOT_LOADED
+    assert model.get_slots_to_load() == [2]
+    assert model.get_use_image()
+    with pytest.raises(ValueError):
+        model.go_to(3)
+
+
+def test_set_prefetch_depth_invalid(curation_model: CurationModel) -> None:
+    # Act / Assert
+    with pytest.raises(ValueError):
+        curation_model.set_prefetch_depth(0)
+
+
 # TODO: if we end up needing to change back from main to input view, add tests for that
 # here
 
@@ -454,3 +637,141 @@ def test_save_curation_record_to_disk(
 
     # Assert
     save_requested_slot.assert_called_once()
+
+
+def test_set_current_view_pairs_images_by_stem(
+    curation_model: CurationModel,
+) -> None:
+    # Arrange
+    curation_model.set_image_directory_paths(
+        ImageType.RAW, [Path("a.tiff"), Path("b.tiff"), Path("c.tiff")]
+    )
+    # seg1 is missing b and has an extra d
+    curation_model.set_image_directory_paths(
+        ImageType.SEG1, [Path("a.tiff"), Path("c.tiff"), Path("d.tiff")]
+    )
+
+    # Act
+    curation_model.set_current_view(CurationView.MAIN_VIEW)
+
+    # Assert
+    records = curation_model.get_curation_record()
+    assert [(r.raw_file.name, r.seg1.name) for r in records] == [
+        ("a.tiff", "a.tiff"),
+        ("c.tiff", "c.tiff"),
+    ]
+    assert curation_model.get_image_directory_paths(ImageType.RAW) == [
+        Path("a.tiff"),
+        Path("c.tiff"),
+    ]
+    assert curation_model.get_unmatched_paths() == {
+        ImageType.RAW: [Path("b.tiff")],
+        ImageType.SEG1: [Path("d.tiff")],
+    }
+
+
+def test_set_current_view_uses_stem_normalizer(
+    curation_model: CurationModel,
+) -> None:
+    # Arrange
+    curation_model.set_image_directory_paths(
+        ImageType.RAW, [Path("b.tiff"), Path("a.tiff")]
+    )
+    curation_model.set_image_directory_paths(
+        ImageType.SEG1, [Path("a_seg.tiff"), Path("b_seg.tiff")]
+    )
+    curation_model.set_stem_normalizer(
+        lambda name: name.split(".")[0].removesuffix("_seg")
+    )
+
+    # Act
+    curation_model.set_current_view(CurationView.MAIN_VIEW)
+
+    # Assert
+    records = curation_model.get_curation_record()
+    assert [(r.raw_file.name, r.seg1.name) for r in records] == [
+        ("b.tiff", "b_seg.tiff"),
+        ("a.tiff", "a_seg.tiff"),
+    ]
+
+
+def test_reorder_by_disagreement(curation_model: CurationModel) -> None:
+    # Arrange
+    raw: List[Path] = [Path(f"r{i}") for i in range(7)]
+    seg1: List[Path] = [Path(f"s1_{i}") for i in range(7)]
+    seg2: List[Path] = [Path(f"s2_{i}") for i in range(7)]
+    curation_model.set_image_directory_paths(ImageType.RAW, raw)
+    curation_model.set_image_directory_paths(ImageType.SEG1, seg1)
+    curation_model.set_image_directory_paths(ImageType.SEG2, seg2)
+    curation_model.set_current_view(CurationView.MAIN_VIEW)
+    curation_model.start_loading_images()
+    for img_type in [ImageType.RAW, ImageType.SEG1, ImageType.SEG2]:
+        curation_model.set_curr_image_data(img_type, FAKE_IMAGE_DATA)
+        curation_model.set_next_image_data(img_type, FAKE_IMAGE_DATA)
+    curation_model.next_image()
+    for img_type in [ImageType.RAW, ImageType.SEG1, ImageType.SEG2]:
+        curation_model.set_next_image_data(img_type, FAKE_IMAGE_DATA)
+    curation_model.start_loading_slot(3)
+    # r0 and r1 have been visited, r2 is next, r3 is loading and r6 is not
+    # scored
+    for i, dice in [(0, 0.0), (1, 0.1), (2, 0.0), (3, 0.0), (4, 0.9)]:
+        curation_model.set_agreement_score(raw[i], AgreementScore(dice, 0, 0))
+    curation_model.set_agreement_score(raw[5], AgreementScore(0.2, 0, 0))
+    reordered_slot: Mock = Mock()
+    curation_model.queue_reordered.connect(reordered_slot)
+
+    # Act
+    curation_model.reorder_by_disagreement()
+
+    # Assert
+    reordered_slot.assert_called_once_with([4, 5, 6], [5, 4, 6])
+    records = curation_model.get_curation_record()
+    assert [r.raw_file.name for r in records] == [
+        "r0",
+        "r1",
+        "r2",
+        "r3",
+        "r5",
+        "r4",
+        "r6",
+    ]
+    assert curation_model.get_image_directory_paths(ImageType.SEG2) == [
+        r.seg2 for r in records
+    ]
+    assert [r.seg1.name for r in records][4:] == ["s1_5", "s1_4", "s1_6"]
+    assert curation_model.get_agreement_score(4) == AgreementScore(0.2, 0, 0)
+    assert curation_model.get_agreement_score(6) is None
+    # the next image is still loaded, so the cursor can move to it
+    assert not curation_model.is_waiting_for_next_images()
+    # the lists passed in are not modified
+    assert raw == [Path(f"r{i}") for i in range(7)]
+
+
+def test_set_disagreement_data(
+    curation_model_loading_started: CurationModel,
+) -> None:
+    # Arrange
+    labels: np.ndarray = np.ones((28, 28, 28), dtype=np.uint8)
+    ready_slot: Mock = Mock()
+    curation_model_loading_started.disagreement_ready.connect(ready_slot)
+
+    # Act
+    # computed from data that is not loaded at index 0
+    curation_model_loading_started.set_disagreement_data(
+        0, Path("other"), labels
+    )
+
+    # Assert
+    ready_slot.assert_not_called()
+    assert curation_model_loading_started.get_curr_disagreement_data() is None
+
+    # Act
+    curation_model_loading_started.set_disagreement_data(
+        0, FAKE_IMAGE_DATA.path, labels
+    )
+
+    # Assert
+    ready_slot.assert_called_once_with(0)
+    assert (
+        curation_model_loading_started.get_curr_disagreement_data() is labels
+    )
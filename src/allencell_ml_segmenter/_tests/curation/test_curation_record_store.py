@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.curation_record_store import (
+    CurationRecordStore,
+)
+
+
+def _make_store(num_images: int, seg2: bool = True) -> CurationRecordStore:
+    return CurationRecordStore(
+        [Path(f"raw_{i}") for i in range(num_images)],
+        [Path(f"seg1_{i}") for i in range(num_images)],
+        [Path(f"seg2_{i}") for i in range(num_images)] if seg2 else None,
+    )
+
+
+def test_new_store_has_default_records() -> None:
+    # Act
+    store: CurationRecordStore = _make_store(3, seg2=False)
+
+    # Assert
+    assert len(store) == 3
+    assert store[1] == CurationRecord(
+        Path("raw_1"), Path("seg1_1"), None, None, None, "seg1", False
+    )
+    assert store.get_num_to_use() == 0
+    assert store.get_visited_indices() == set()
+
+
+def test_store_rejects_paths_of_different_lengths() -> None:
+    # Act / Assert
+    with pytest.raises(ValueError):
+        CurationRecordStore([Path("raw")], [])
+
+
+def test_counters_follow_use_and_visits() -> None:
+    # Arrange
+    store: CurationRecordStore = _make_store(5)
+
+    # Act
+    assert store.mark_visited(0)
+    assert store.mark_visited(1)
+    assert not store.mark_visited(1)
+    store.set_to_use(0, True)
+    store.set_to_use(0, True)
+    store.set_to_use(3, True)
+
+    # Assert
+    assert store.get_num_to_use() == 2
+    # only image 1 is visited and not used
+    assert store.get_num_visited_not_used() == 1
+
+    # Act
+    store.set_to_use(0, False)
+    store.mark_visited(3)
+
+    # Assert
+    assert store.get_num_to_use() == 1
+    assert store.get_num_visited_not_used() == 2
+    assert store.get_visited_indices() == {0, 1, 3}
+
+
+def test_masks_are_held_by_reference() -> None:
+    # Arrange
+    store: CurationRecordStore = _make_store(2)
+    mask: np.ndarray = np.zeros((4, 2))
+
+    # Act
+    store.set_excluding_mask(1, mask)
+    store.set_merging_mask(1, mask)
+    store.set_base_image(1, "seg2")
+
+    # Assert
+    record: CurationRecord = store[1]
+    assert record.excluding_mask is mask
+    assert record.merging_mask is mask
+    assert record.base_image == "seg2"
+    assert store[0].excluding_mask is None
+
+    # Act
+    store.set_merging_mask(1, None)
+
+    # Assert
+    assert store.get_merging_mask(1) is None
+
+
+def test_reorder_moves_every_column() -> None:
+    # Arrange
+    store: CurationRecordStore = _make_store(4)
+    raw_before: List[Path] = store.get_raw_paths()
+    mask: np.ndarray = np.ones((3, 2))
+    store.set_to_use(3, True)
+    store.set_excluding_mask(3, mask)
+    store.set_base_image(3, "seg2")
+
+    # Act
+    store.reorder([1, 2, 3], [3, 1, 2])
+
+    # Assert
+    assert [r.raw_file.name for r in store] == [
+        "raw_0",
+        "raw_3",
+        "raw_1",
+        "raw_2",
+    ]
+    assert [p.name for p in store.get_seg2_paths()] == [
+        "seg2_0",
+        "seg2_3",
+        "seg2_1",
+        "seg2_2",
+    ]
+    assert store[1].to_use
+    assert store[1].excluding_mask is mask
+    assert store[1].base_image == "seg2"
+    assert store.get_excluding_mask(3) is None
+    assert store.get_num_to_use() == 1
+    # lists returned before the reorder are unchanged
+    assert [p.name for p in raw_before] == [f"raw_{i}" for i in range(4)]
+
+
+def test_from_records_round_trip() -> None:
+    # Arrange
+    mask: np.ndarray = np.ones((3, 2))
+    records: List[CurationRecord] = [
+        CurationRecord(Path("r0"), Path("s0"), None, mask, None, "seg1", True),
+        CurationRecord(Path("r1"), Path("s1"), None, None, mask, None, False),
+    ]
+
+    # Act
+    store: CurationRecordStore = CurationRecordStore.from_records(
+        records, visited=[1]
+    )
+
+    # Assert
+    assert list(store) == records
+    assert store.get_seg2_paths() is None
+    assert store.get_num_to_use() == 1
+    assert store.get_num_visited_not_used() == 1
@@ -1,6 +1,11 @@
+import json
 from pathlib import Path
 from dataclasses import dataclass
+from typing import List, Optional
+from unittest.mock import Mock
 
+import dask.array as da
+import numpy as np
 import pytest
 from pytestqt.qtbot import QtBot
 
@@ -8,21 +13,36 @@ from allencell_ml_segmenter.curation.curation_model import (
     CurationModel,
     ImageType,
     CurationView,
+    ImageSlotState,
 )
 from allencell_ml_segmenter.curation.curation_service import (
     CurationService,
 )
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+)
+from allencell_ml_segmenter.curation.curation_journal import (
+    CurationJournal,
+    JOURNAL_NAME,
+)
 from allencell_ml_segmenter.core.image_data_extractor import (
     FakeImageDataExtractor,
 )
 from allencell_ml_segmenter._tests.fakes.fake_experiments_model import (
     FakeExperimentsModel,
 )
-from allencell_ml_segmenter.utils.file_writer import FakeFileWriter
+from allencell_ml_segmenter.core.task_executor import (
+    ITaskExecutor,
+    PRIORITY_HIGH,
+)
+from allencell_ml_segmenter.utils.file_writer import (
+    FakeFileWriter,
+    FileWriter,
+)
 import allencell_ml_segmenter
 from allencell_ml_segmenter.main.main_model import MainModel
 
-
 FAKE_CHANNEL_SELECTION_PATH: Path = Path("channel_sel")
 
 IMG_DIR_PATH = (
@@ -92,11 +112,19 @@ def test_service_reacts_to_set_raw_dir(
     # Act
     with qtbot.waitSignal(test_env.model.channel_count_set):
         test_env.model.set_image_directory(ImageType.RAW, IMG_DIR_PATH)
+    # channels are known from the first file found, paths once the scan is done
+    qtbot.waitUntil(
+        lambda: test_env.model.get_image_directory_paths(ImageType.RAW)
+        is not None
+    )
 
     # Assert
     # we expect that when the raw directory is set, CurationService will extract the paths
     # and the number of channels from that directory
     assert test_env.model.get_channel_count(ImageType.RAW) is not None
+    assert test_env.model.get_image_file_count(ImageType.RAW) == len(
+        IMG_DIR_FILES
+    )
     for file in test_env.model.get_image_directory_paths(ImageType.RAW):
         assert file in IMG_DIR_FILES
 
@@ -112,6 +140,11 @@ def test_service_reacts_to_set_seg1_dir(
     # Act
     with qtbot.waitSignal(test_env.model.channel_count_set):
         test_env.model.set_image_directory(ImageType.SEG1, IMG_DIR_PATH)
+    # channels are known from the first file found, paths once the scan is done
+    qtbot.waitUntil(
+        lambda: test_env.model.get_image_directory_paths(ImageType.SEG1)
+        is not None
+    )
 
     # Assert
     assert test_env.model.get_channel_count(ImageType.SEG1) is not None
@@ -130,6 +163,11 @@ def test_service_reacts_to_set_seg2_dir(
     # Act
     with qtbot.waitSignal(test_env.model.channel_count_set):
         test_env.model.set_image_directory(ImageType.SEG2, IMG_DIR_PATH)
+    # channels are known from the first file found, paths once the scan is done
+    qtbot.waitUntil(
+        lambda: test_env.model.get_image_directory_paths(ImageType.SEG2)
+        is not None
+    )
 
     # Assert
     assert test_env.model.get_channel_count(ImageType.SEG2) is not None
@@ -157,6 +195,116 @@ def test_service_reacts_to_cursor_moved(
     assert test_env.model.get_curr_image_data(ImageType.SEG2) is not None
 
 
+def test_service_reads_large_images_lazily(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    test_env: TestEnvironment = test_env_main_view
+    # Arrange
+    test_env.model.set_lazy_loading_min_bytes(0)
+
+    # Act
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.start_loading_images()
+
+    # Assert
+    assert isinstance(
+        test_env.model.get_curr_image_data(ImageType.RAW).np_data, da.Array
+    )
+
+
+def test_service_prefetches_images(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    test_env: TestEnvironment = test_env_main_view
+    # Arrange
+    test_env.model.set_prefetch_depth(3)
+
+    # Act
+    with qtbot.waitSignal(
+        test_env.model.image_slot_ready,
+        check_params_cb=lambda img_idx: img_idx == 3,
+    ):
+        test_env.model.start_loading_images()
+
+    # Assert
+    for img_idx in range(4):
+        assert test_env.model.get_slot_state(img_idx) == ImageSlotState.READY
+    assert test_env.model.get_slot_state(4) == ImageSlotState.NOT_LOADED
+
+
+def test_service_loads_image_after_go_to(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    test_env: TestEnvironment = test_env_main_view
+    # Arrange
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.start_loading_images()
+
+    # Act
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.go_to(4)
+
+    # Assert
+    assert test_env.model.get_curr_image_index() == 4
+    assert test_env.model.get_curr_image_data(ImageType.RAW) is not None
+    assert test_env.model.get_slot_state(0) == ImageSlotState.NOT_LOADED
+
+
+def test_service_cancels_dropped_images() -> None:
+    # Arrange
+    model: CurationModel = CurationModel(FakeExperimentsModel(), MainModel())
+    model.set_image_directory_paths(ImageType.RAW, IMG_DIR_FILES)
+    model.set_image_directory_paths(ImageType.SEG1, IMG_DIR_FILES)
+    model.set_selected_channel(ImageType.RAW, 0)
+    model.set_selected_channel(ImageType.SEG1, 0)
+    model.set_current_view(CurationView.MAIN_VIEW)
+    # executor that never finishes its tasks, so images stay loading
+    executor: Mock = Mock(spec=ITaskExecutor)
+    CurationService(
+        model,
+        FakeExperimentsModel(),
+        img_data_extractor=FakeImageDataExtractor.global_instance(),
+        task_executor=executor,
+        file_writer=FakeFileWriter(),
+    )
+    model.set_prefetch_depth(1)
+    model.start_loading_images()
+    executor.cancel_group.reset_mock()
+
+    # Act
+    model.go_to(4)
+
+    # Assert
+    # images 0 and 1 are no longer near the cursor, so their decodes are cancelled
+    cancelled: set[str] = {
+        call.args[0] for call in executor.cancel_group.call_args_list
+    }
+    assert cancelled == {"curation_image_0", "curation_image_1"}
+    # the image jumped to is requested with top priority
+    assert executor.exec.call_args.kwargs["priority"] == PRIORITY_HIGH
+    assert executor.exec.call_args.kwargs["group"] == "curation_image_4"
+
+
+def test_service_ranks_history_below_prefetch(
+    test_env_main_view: TestEnvironment,
+) -> None:
+    # Arrange
+    test_env: TestEnvironment = test_env_main_view
+    test_env.model.set_prefetch_depth(2)
+
+    # Act
+    priorities: List[int] = [
+        test_env.service._get_image_priority(img_idx, 4)
+        for img_idx in [4, 5, 6, 3, 2]
+    ]
+
+    # Assert
+    # current image, then upcoming images by distance, then history
+    assert priorities[0] == PRIORITY_HIGH
+    assert priorities == sorted(priorities, reverse=True)
+    assert len(set(priorities)) == len(priorities)
+
+
 def test_service_reacts_to_save_csv(
     qtbot: QtBot, test_env_main_view: TestEnvironment
 ) -> None:
@@ -183,3 +331,217 @@ def test_service_reacts_to_save_csv(
 
     # Assert
     assert len(test_env.file_writer.csv_state) > 0
+
+
+def test_service_journals_records_as_cursor_moves(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    test_env: TestEnvironment = test_env_main_view
+    journal_path: Path = test_env.model.get_journal_path()
+
+    # Act
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.start_loading_images()
+    test_env.model.set_use_image(False)
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.next_image()
+    qtbot.waitUntil(
+        lambda: len(test_env.file_writer.lines_state.get(journal_path, []))
+        == 4
+    )
+    lines: List[str] = test_env.file_writer.lines_state[journal_path]
+
+    # Assert
+    # session header, cursor at 0, decision for image 0, cursor at 1
+    assert [json.loads(line)["type"] for line in lines] == [
+        "session",
+        "cursor",
+        "record",
+        "cursor",
+    ]
+    assert json.loads(lines[2])["index"] == 0
+    assert not json.loads(lines[2])["to_use"]
+
+
+def test_service_resumes_from_journal(
+    qtbot: QtBot,
+    test_env_input_view: TestEnvironment,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    test_env: TestEnvironment = test_env_input_view
+    journal_path: Path = tmp_path / JOURNAL_NAME
+    journal: CurationJournal = CurationJournal(
+        journal_path, FileWriter.global_instance()
+    )
+    channels = {ImageType.RAW: 0, ImageType.SEG1: 0, ImageType.SEG2: None}
+    journal.start_session(IMG_DIR_FILES, IMG_DIR_FILES, None, channels)
+    journal.record(
+        0,
+        CurationRecord(
+            IMG_DIR_FILES[0], IMG_DIR_FILES[0], None, None, None, "seg1", False
+        ),
+    )
+    journal.move_cursor(1)
+    journal.close()
+    monkeypatch.setattr(
+        test_env.model, "get_journal_path", lambda: journal_path
+    )
+    session: Optional[CurationSession] = CurationJournal.load(journal_path)
+
+    # Act
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.resume_session(session)
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.next_image()
+    qtbot.waitUntil(
+        lambda: len(test_env.file_writer.lines_state.get(journal_path, []))
+        == 2
+    )
+    lines: List[str] = test_env.file_writer.lines_state[journal_path]
+
+    # Assert
+    # the journal is continued rather than replaced: the decision for image 1
+    # and the new cursor are appended, with no new session header
+    assert [json.loads(line)["type"] for line in lines] == [
+        "record",
+        "cursor",
+    ]
+    assert test_env.model.get_current_view() == CurationView.MAIN_VIEW
+    assert test_env.model.get_curr_image_index() == 2
+    assert test_env.model.get_image_directory_paths(ImageType.RAW) == (
+        IMG_DIR_FILES
+    )
+    assert test_env.model.get_use_image()
+    assert not test_env.model.get_curation_record()[0].to_use
+    assert test_env.model.get_curr_image_data(ImageType.RAW) is not None
+
+
+def test_service_finishes_journal_at_end_of_session(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    # Arrange
+    test_env: TestEnvironment = test_env_main_view
+    journal_path: Path = test_env.model.get_journal_path()
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.start_loading_images()
+
+    # Act
+    test_env.model.stop_loading_images()
+
+    # Assert
+    # the journal is closed, so every entry has been written
+    lines: List[str] = test_env.file_writer.lines_state[journal_path]
+    assert [json.loads(line)["type"] for line in lines][-2:] == [
+        "record",
+        "finished",
+    ]
+    assert test_env.service._journal is None
+
+
+def test_service_orders_images_by_disagreement(
+    qtbot: QtBot,
+    test_env_main_view: TestEnvironment,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    test_env: TestEnvironment = test_env_main_view
+    test_env.model.set_order_by_disagreement(True)
+    # only the current and next images are loaded, and so kept in place
+    test_env.model.set_prefetch_depth(1)
+
+    def fake_score(
+        extractor: FakeImageDataExtractor,
+        seg1_path: Path,
+        seg2_path: Path,
+        seg1_channel: int,
+        seg2_channel: int,
+    ) -> AgreementScore:
+        # t5 agrees the least, t1 the most
+        return AgreementScore(1 / int(seg1_path.stem[1:]), 0, 0)
+
+    monkeypatch.setattr(
+        allencell_ml_segmenter.curation.curation_service,
+        "score_segmentation_agreement",
+        fake_score,
+    )
+
+    # Act
+    with qtbot.waitSignal(test_env.model.queue_reordered, timeout=5000):
+        test_env.model.start_loading_images()
+
+    # Assert
+    raw_paths: List[Path] = test_env.model.get_image_directory_paths(
+        ImageType.RAW
+    )
+    # the first image was visited when the session started and the second is
+    # loaded for next_image, so they stay first
+    assert raw_paths[:2] == IMG_DIR_FILES[:2]
+    assert [p.name for p in raw_paths[2:]] == sorted(
+        (p.name for p in IMG_DIR_FILES[2:]), reverse=True
+    )
+    assert test_env.model.get_image_directory_paths(ImageType.SEG2) == (
+        raw_paths
+    )
+    # the reorder is appended to the journal rather than rewriting it
+    journal_path: Path = test_env.model.get_journal_path()
+    qtbot.waitUntil(
+        lambda: any(
+            json.loads(line)["type"] == "reorder"
+            for line in test_env.file_writer.lines_state.get(journal_path, [])
+        )
+    )
+    assert [
+        json.loads(line)["type"]
+        for line in test_env.file_writer.lines_state[journal_path]
+    ].count("session") == 1
+
+
+def test_service_computes_disagreement_of_loaded_images(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    # Arrange
+    test_env: TestEnvironment = test_env_main_view
+
+    # Act
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.start_loading_images()
+    qtbot.waitUntil(
+        lambda: test_env.model.get_curr_disagreement_data() is not None
+    )
+
+    # Assert
+    # the fake extractor returns zeros for both segmentations
+    assert not test_env.model.get_curr_disagreement_data().any()
+
+
+def test_service_previews_merging_mask_draft(
+    qtbot: QtBot, test_env_main_view: TestEnvironment
+) -> None:
+    # Arrange
+    test_env: TestEnvironment = test_env_main_view
+    with qtbot.waitSignal(test_env.model.image_loading_finished):
+        test_env.model.start_loading_images()
+    polygons: np.ndarray = np.asarray(
+        [np.asarray([[0, 0], [0, 5], [5, 5]])], dtype=object
+    )
+
+    # Act
+    with qtbot.waitSignal(test_env.model.merge_preview_updated):
+        test_env.model.set_merging_mask_draft(polygons)
+
+    # Assert
+    preview: Optional[np.ndarray] = test_env.model.get_merge_preview()
+    assert preview is not None
+    assert (
+        preview.shape
+        == test_env.model.get_curr_image_data(ImageType.SEG1).np_data.shape
+    )
+
+    # Act
+    with qtbot.waitSignal(test_env.model.merge_preview_updated):
+        test_env.model.set_merging_mask_draft(None)
+
+    # Assert
+    assert test_env.model.get_merge_preview() is None
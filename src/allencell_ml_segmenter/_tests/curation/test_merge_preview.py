@@ -0,0 +1,128 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pytest
+
+from allencell_ml_segmenter.curation.merge_preview import (
+    MergePreview,
+    rasterize_polygons,
+)
+
+SHAPE: Tuple[int, int, int] = (3, 32, 40)
+
+
+def _square(y: float, x: float, size: float, z: float = 1) -> np.ndarray:
+    # vertices as drawn on a Z slice of a 3D image
+    return np.asarray(
+        [
+            [z, y, x],
+            [z, y, x + size],
+            [z, y + size, x + size],
+            [z, y + size, x],
+        ]
+    )
+
+
+def _expected(
+    base: np.ndarray, other: np.ndarray, polygons: List[np.ndarray]
+) -> np.ndarray:
+    mask: np.ndarray = rasterize_polygons(polygons, base.shape[-2:])
+    return np.where(mask, other, base)
+
+
+@pytest.fixture
+def segmentations() -> Tuple[np.ndarray, np.ndarray]:
+    rng: np.random.Generator = np.random.default_rng(0)
+    return (
+        rng.integers(0, 2, SHAPE, dtype=np.uint8),
+        rng.integers(0, 2, SHAPE, dtype=np.uint8) * 2,
+    )
+
+
+def test_update_composites_polygons_on_every_slice(
+    segmentations: Tuple[np.ndarray, np.ndarray],
+) -> None:
+    # Arrange
+    base, other = segmentations
+    preview: MergePreview = MergePreview(base, other)
+    polygons: List[np.ndarray] = [_square(2, 3, 10), _square(20, 25, 8)]
+
+    # Act
+    box: Optional[Tuple[int, int, int, int]] = preview.update(polygons)
+
+    # Assert
+    assert box == (2, 29, 3, 34)
+    np.testing.assert_array_equal(
+        preview.get_labels(), _expected(base, other, polygons)
+    )
+    # the segmentations are not modified
+    assert not np.shares_memory(preview.get_labels(), base)
+
+
+def test_incremental_updates_match_full_composite(
+    segmentations: Tuple[np.ndarray, np.ndarray],
+) -> None:
+    # Arrange
+    base, other = segmentations
+    preview: MergePreview = MergePreview(base, other)
+    first: np.ndarray = _square(2, 3, 10)
+    second: np.ndarray = _square(8, 9, 10)
+    preview.update([first, second])
+
+    # Act
+    moved: np.ndarray = _square(15, 20, 6)
+    box: Optional[Tuple[int, int, int, int]] = preview.update([first, moved])
+
+    # Assert
+    # only the moved polygon's old and new areas are recomposited
+    assert box == (8, 22, 9, 27)
+    np.testing.assert_array_equal(
+        preview.get_labels(), _expected(base, other, [first, moved])
+    )
+
+    # Act
+    preview.update([moved])
+
+    # Assert
+    np.testing.assert_array_equal(
+        preview.get_labels(), _expected(base, other, [moved])
+    )
+
+
+def test_update_without_changes_does_nothing(
+    segmentations: Tuple[np.ndarray, np.ndarray],
+) -> None:
+    # Arrange
+    base, other = segmentations
+    preview: MergePreview = MergePreview(base, other)
+    polygons: List[np.ndarray] = [_square(2, 3, 10)]
+    preview.update(polygons)
+
+    # Act / Assert
+    assert preview.update([p.copy() for p in polygons]) is None
+    # outside the image
+    assert preview.update(polygons + [_square(100, 100, 5)]) is None
+
+
+def test_preview_rejects_segmentations_of_different_shapes() -> None:
+    # Act / Assert
+    with pytest.raises(ValueError):
+        MergePreview(np.zeros((2, 4, 4)), np.zeros((2, 4, 5)))
+
+
+def test_rasterize_polygons_uses_yx_of_each_polygon() -> None:
+    # Arrange
+    # square covering rows 2-5 and columns 2-5, drawn on Z slice 1
+    square: np.ndarray = np.asarray(
+        [[1, 2, 2], [1, 2, 5], [1, 5, 5], [1, 5, 2]], dtype=float
+    )
+    other: np.ndarray = np.asarray([[6, 6], [6, 7], [7, 7], [7, 6]])
+
+    # Act
+    mask: np.ndarray = rasterize_polygons([square, other], (8, 8))
+
+    # Assert
+    expected: np.ndarray = np.zeros((8, 8), dtype=bool)
+    expected[2:6, 2:6] = True
+    expected[6:8, 6:8] = True
+    assert np.array_equal(mask, expected)
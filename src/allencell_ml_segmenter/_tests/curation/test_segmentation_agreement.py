@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+    compute_agreement,
+)
+
+
+def test_compute_agreement_identical() -> None:
+    # Arrange
+    seg: np.ndarray = np.zeros((2, 6, 6), dtype=np.uint8)
+    seg[0, 1:3, 1:3] = 1
+    seg[1, 4:6, 4:6] = 3
+
+    # Act
+    score: AgreementScore = compute_agreement(seg, seg.copy())
+
+    # Assert
+    assert score == AgreementScore(1.0, 0, 0)
+
+
+def test_compute_agreement_differing() -> None:
+    # Arrange
+    seg1: np.ndarray = np.zeros((6, 6), dtype=np.uint8)
+    seg1[0:2, 0:4] = 1  # 8 voxels, 1 object
+    seg2: np.ndarray = np.zeros((6, 6), dtype=np.uint16)
+    seg2[0:2, 0:2] = 1  # 4 voxels overlapping seg1
+    seg2[4:6, 4:6] = 7  # 4 voxels, second object
+
+    # Act
+    score: AgreementScore = compute_agreement(seg1, seg2)
+
+    # Assert
+    assert score.dice == pytest.approx(2 * 4 / (8 + 8))
+    assert score.voxel_count_delta == 0
+    assert score.object_count_delta == 1
+
+
+def test_compute_agreement_empty_segmentations_agree() -> None:
+    # Act
+    score: AgreementScore = compute_agreement(
+        np.zeros((3, 3)), np.zeros((3, 3))
+    )
+
+    # Assert
+    assert score.dice == 1.0
+
+
+def test_compute_agreement_shape_mismatch() -> None:
+    # Act / Assert
+    with pytest.raises(ValueError):
+        compute_agreement(np.zeros((3, 3)), np.zeros((3, 4)))
+
+
+def test_sort_key_puts_worst_first() -> None:
+    # Arrange
+    scores = [
+        AgreementScore(0.9, 10, 0),
+        AgreementScore(0.5, 0, 0),
+        AgreementScore(0.9, 10, 3),
+    ]
+
+    # Act
+    ordered = sorted(scores, key=AgreementScore.sort_key)
+
+    # Assert
+    assert ordered == [scores[1], scores[2], scores[0]]
@@ -64,5 +64,8 @@ class FakeExperimentsModel(IExperimentsModel):
     def get_cache_dir(self) -> Path:
         return Path()
 
+    def get_shared_cache_dir(self) -> Path:
+        return Path()
+
     def get_channel_selection_path(self) -> Optional[Path]:
         return self._chan_sel_path
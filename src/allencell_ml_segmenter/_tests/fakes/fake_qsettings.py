@@ -5,8 +5,8 @@ class FakeQSettings(QSettings):
     def __init__(self):
         self.keys = {}
 
-    def value(self, key):
-        return self.keys[key]
+    def value(self, key, defaultValue=None):
+        return self.keys.get(key, defaultValue)
 
     def setValue(self, key, value):
         self.keys[key] = value
@@ -1,6 +1,14 @@
 from pathlib import Path
 from allencell_ml_segmenter.config.i_user_settings import IUserSettings
 from qtpy.QtWidgets import QWidget
+from allencell_ml_segmenter.core.image_data_extractor.image_data_cache import (
+    DEFAULT_MAX_BYTES,
+)
+from allencell_ml_segmenter.curation.curation_model import (
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_PREFETCH_BUDGET_BYTES,
+    DEFAULT_PREFETCH_DEPTH,
+)
 
 
 class FakeUserSettings(IUserSettings):
@@ -10,11 +18,21 @@ class FakeUserSettings(IUserSettings):
         user_experiments_path=None,
         init_prompt_response: Path = None,
         change_prompt_response: Path = None,
+        image_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        curation_prefetch_depth: int = DEFAULT_PREFETCH_DEPTH,
+        curation_prefetch_budget_bytes: int = DEFAULT_PREFETCH_BUDGET_BYTES,
+        curation_history_size: int = DEFAULT_HISTORY_SIZE,
     ):
         self.cyto_dl_home_path = cyto_dl_home_path
         self.user_experiments_path = user_experiments_path
         self.prompt_response: Path = init_prompt_response
         self.change_prompt_response: Path = change_prompt_response
+        self.image_cache_max_bytes: int = image_cache_max_bytes
+        self.curation_prefetch_depth: int = curation_prefetch_depth
+        self.curation_prefetch_budget_bytes: int = (
+            curation_prefetch_budget_bytes
+        )
+        self.curation_history_size: int = curation_history_size
 
     def get_cyto_dl_home_path(self) -> Path:
         return self.cyto_dl_home_path
@@ -28,6 +46,30 @@ class FakeUserSettings(IUserSettings):
     def set_user_experiments_path(self, path: str):
         self.user_experiments_path = path
 
+    def get_image_cache_max_bytes(self) -> int:
+        return self.image_cache_max_bytes
+
+    def set_image_cache_max_bytes(self, max_bytes: int) -> None:
+        self.image_cache_max_bytes = max_bytes
+
+    def get_curation_prefetch_depth(self) -> int:
+        return self.curation_prefetch_depth
+
+    def set_curation_prefetch_depth(self, depth: int) -> None:
+        self.curation_prefetch_depth = depth
+
+    def get_curation_prefetch_budget_bytes(self) -> int:
+        return self.curation_prefetch_budget_bytes
+
+    def set_curation_prefetch_budget_bytes(self, budget: int) -> None:
+        self.curation_prefetch_budget_bytes = budget
+
+    def get_curation_history_size(self) -> int:
+        return self.curation_history_size
+
+    def set_curation_history_size(self, size: int) -> None:
+        self.curation_history_size = size
+
     def prompt_for_user_experiments_home(self, parent: QWidget):
         if self.prompt_response:
             self.set_user_experiments_path(Path(self.prompt_response))
@@ -24,6 +24,9 @@ class FakeViewer(IViewer):
         self._shapes_layers: Dict[str, ShapesLayer] = {}
         self._labels_layers: Dict[str, LabelsLayer] = {}
         self._on_layers_change_fns: List[Callable] = []
+        self._on_shapes_change_fns: Dict[str, List[Callable]] = {}
+        # {labels layer name: data last set with set_labels_data}
+        self.labels_data: Dict[str, np.ndarray] = {}
 
     def add_image(self, image: np.ndarray, name: str):
         self._image_layers[name] = ImageLayer(name, None)
@@ -37,10 +40,17 @@ class FakeViewer(IViewer):
     def get_all_images(self) -> List[ImageLayer]:
         return [v for k, v in self._image_layers.items()]
 
-    def add_shapes(self, name: str, face_color: str, mode: str) -> None:
+    def add_shapes(
+        self,
+        name: str,
+        face_color: str,
+        mode: str,
+        data: Optional[np.ndarray] = None,
+    ) -> None:
         self._shapes_layers[name] = ShapesLayer(
-            name, np.asarray([[1, 2], [3, 4]])
+            name, np.asarray([[1, 2], [3, 4]]) if data is None else data
         )
+        self._on_shapes_change_fns.pop(name, None)
         self._on_layers_change()
 
     def get_shapes(self, name: str) -> Optional[ShapesLayer]:
@@ -55,11 +65,19 @@ class FakeViewer(IViewer):
     def modify_shapes(self, name: str, new_shapes: np.ndarray) -> None:
         if name in self._shapes_layers:
             self._shapes_layers[name] = ShapesLayer(name, new_shapes)
+            for fn in self._on_shapes_change_fns.get(name, []):
+                fn()
 
     def add_labels(self, data: np.ndarray, name: str) -> None:
         self._labels_layers[name] = LabelsLayer(name)
         self._on_layers_change()
 
+    def set_labels_data(self, name: str, data: np.ndarray) -> bool:
+        if name not in self._labels_layers:
+            return False
+        self.labels_data[name] = data
+        return True
+
     def get_labels(self, name: str) -> Optional[LabelsLayer]:
         if name in self._labels_layers:
             return self._labels_layers[name]
@@ -71,6 +89,7 @@ class FakeViewer(IViewer):
     def clear_layers(self) -> None:
         self._image_layers = {}
         self._shapes_layers = {}
+        self._on_shapes_change_fns = {}
 
     def remove_layer(self, name: str) -> bool:
         removed: bool = False
@@ -79,6 +98,10 @@ class FakeViewer(IViewer):
             removed = True
         if name in self._shapes_layers:
             del self._shapes_layers[name]
+            self._on_shapes_change_fns.pop(name, None)
+            removed = True
+        if name in self._labels_layers:
+            del self._labels_layers[name]
             removed = True
         if removed:
             self._on_layers_change()
@@ -100,6 +123,14 @@ class FakeViewer(IViewer):
     ) -> None:
         self._on_layers_change_fns.append(function)
 
+    def subscribe_shapes_change_event(
+        self, name: str, function: Callable[[], None]
+    ) -> bool:
+        if name not in self._shapes_layers:
+            return False
+        self._on_shapes_change_fns.setdefault(name, []).append(function)
+        return True
+
     def _on_layers_change(self):
         for fn in self._on_layers_change_fns:
             fn(FakeNapariEvent())
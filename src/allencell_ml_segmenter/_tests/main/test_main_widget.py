@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Set
+from typing import Iterator, Set
 
 import pytest
 from pytestqt.qtbot import QtBot
@@ -10,6 +10,7 @@ from allencell_ml_segmenter._tests.fakes.fake_viewer import FakeViewer
 from allencell_ml_segmenter.config.i_user_settings import IUserSettings
 
 from allencell_ml_segmenter.core.aics_widget import AicsWidget
+from allencell_ml_segmenter.core.image_metadata_index import ImageMetadataIndex
 from allencell_ml_segmenter.main.main_widget import MainWidget
 from unittest.mock import Mock
 import napari
@@ -22,7 +23,7 @@ import napari
 
 
 @pytest.fixture
-def main_widget(qtbot: QtBot) -> MainWidget:
+def main_widget(qtbot: QtBot, tmp_path: Path) -> Iterator[MainWidget]:
     """
     Returns a MainWidget instance for testing.
     """
@@ -30,9 +31,11 @@ def main_widget(qtbot: QtBot) -> MainWidget:
         user_experiments_path=Path("fake_home")
     )
     settings.set_cyto_dl_home_path(Path())
-    settings.set_user_experiments_path(Path())
+    # the main widget saves the global metadata index in the experiments home
+    settings.set_user_experiments_path(tmp_path)
     main_widget: MainWidget = MainWidget(viewer=Mock(), settings=settings)
-    return main_widget
+    yield main_widget
+    ImageMetadataIndex.global_instance().set_index_path(None)
 
 
 def test_tabs_react_to_new_model_event(
@@ -1,5 +1,6 @@
 from pathlib import Path
 import pytest
+from unittest.mock import Mock
 from pytestqt.qtbot import QtBot
 
 from allencell_ml_segmenter._tests.fakes.fake_user_settings import (
@@ -71,3 +72,23 @@ def test_service_reacts_to_image_dir_set(
         ]
     ):
         training_model.set_images_directory(img_dir)
+
+
+def test_cancel_training_stops_running_process(
+    training_model: TrainingModel,
+    experiments_model: ExperimentsModel,
+) -> None:
+    # Arrange
+    service: TrainingService = TrainingService(
+        training_model,
+        experiments_model,
+        img_data_extractor=FakeImageDataExtractor.global_instance(),
+    )
+    training_process: Mock = Mock()
+    service._training_process = training_process
+
+    # Act
+    training_model.cancel_training()
+
+    # Assert
+    training_process.request_stop.assert_called_once()
@@ -0,0 +1,187 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+from allencell_ml_segmenter.training.cache_dir_event_handler import (
+    CacheDirEventHandler,
+)
+from allencell_ml_segmenter.training.cache_warmup import (
+    _find_unshared_indices,
+    find_uncached_indices,
+    get_cache_warmup_workers,
+    is_cached_dataset,
+    list_cached_files,
+    warm_cache,
+)
+from allencell_ml_segmenter.training.shared_cache import SharedCache
+from allencell_ml_segmenter.utils.hardware_profile import HardwareInfo
+
+GIB: int = 1024**3
+
+
+def _hash(item: Any) -> bytes:
+    return hashlib.md5(pickle.dumps(item)).hexdigest().encode("utf-8")
+
+
+class FakeCachedDataset:
+    """
+    Has the attributes of a monai PersistentDataset that name its cache files.
+    """
+
+    def __init__(self, data: List[Dict[str, str]], cache_dir: Path) -> None:
+        self.data: List[Dict[str, str]] = data
+        self.cache_dir: Path = cache_dir
+        self.hash_func = _hash
+        self.transform_hash: str = "abc"
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def cache(self, idx: int) -> None:
+        key: str = _hash(self.data[idx]).decode("utf-8")
+        (self.cache_dir / f"{key}{self.transform_hash}.pt").touch()
+
+
+def test_find_uncached_indices_skips_cached_items(tmp_path: Path) -> None:
+    # Arrange
+    dataset: FakeCachedDataset = FakeCachedDataset(
+        [{"raw": f"img{i}.tiff"} for i in range(4)], tmp_path
+    )
+    dataset.cache(1)
+    dataset.cache(3)
+
+    # Act
+    uncached: List[int] = find_uncached_indices(dataset)
+
+    # Assert
+    assert uncached == [0, 2]
+    assert len(list_cached_files(tmp_path)) == 2
+
+
+def test_is_cached_dataset(tmp_path: Path) -> None:
+    # Act / Assert
+    assert is_cached_dataset(FakeCachedDataset([], tmp_path))
+    assert not is_cached_dataset([1, 2, 3])
+
+
+def test_list_cached_files_without_cache_dir(tmp_path: Path) -> None:
+    # Act / Assert
+    assert list_cached_files(tmp_path / "missing") == set()
+
+
+def test_get_cache_warmup_workers() -> None:
+    # Act / Assert
+    assert (
+        get_cache_warmup_workers(
+            HardwareInfo(64, None, 256 * GIB, False, "Linux")
+        )
+        == 62
+    )
+    # limited by memory
+    assert (
+        get_cache_warmup_workers(
+            HardwareInfo(64, None, 8 * GIB, False, "Linux")
+        )
+        == 3
+    )
+    assert (
+        get_cache_warmup_workers(HardwareInfo(1, None, GIB, False, "Linux"))
+        == 1
+    )
+
+
+def test_cache_dir_event_handler_counts_from_existing_files() -> None:
+    # Arrange
+    callback_mock: Mock = Mock()
+    handler: CacheDirEventHandler = CacheDirEventHandler(
+        callback_mock, ["a.pt", "b.pt"]
+    )
+
+    # Act
+    handler.on_created(Mock(src_path="cache/c.pt"))
+    handler.on_created(Mock(src_path="cache/c.tmp"))
+    # replaced by a link to the shared cache
+    handler.on_created(Mock(src_path="cache/a.pt"))
+    handler.on_created(Mock(src_path="cache/c.pt"))
+
+    # Assert
+    callback_mock.assert_called_once_with(3)
+
+
+def test_warm_cache_links_items_from_shared_cache(tmp_path: Path) -> None:
+    # Arrange
+    shared_cache: SharedCache = SharedCache(tmp_path / "shared")
+    images_dir: Path = tmp_path / "images"
+    images_dir.mkdir()
+    (images_dir / "img0.tiff").write_bytes(b"0")
+    (images_dir / "img1.tiff").write_bytes(b"1")
+    first: FakeCachedDataset = FakeCachedDataset(
+        [{"raw": str(images_dir / f"img{i}.tiff")} for i in range(2)],
+        tmp_path / "exp1",
+    )
+    first.cache_dir.mkdir()
+    for idx, item in enumerate(first.data):
+        first.cache(idx)
+        shared_cache.add(
+            shared_cache.get_key(item, first.transform_hash),
+            first.cache_dir / f"{_hash(item).decode('utf-8')}abc.pt",
+        )
+    # same images, copied elsewhere for another experiment
+    copy_dir: Path = tmp_path / "copy"
+    copy_dir.mkdir()
+    (copy_dir / "img0.tiff").write_bytes(b"0")
+    (copy_dir / "img1.tiff").write_bytes(b"1")
+    second: FakeCachedDataset = FakeCachedDataset(
+        [{"raw": str(copy_dir / f"img{i}.tiff")} for i in range(2)],
+        tmp_path / "exp2",
+    )
+    second.cache_dir.mkdir()
+
+    # Act
+    num_cached: int = warm_cache([second], 1, shared_cache=shared_cache)
+
+    # Assert
+    assert num_cached == 0
+    assert len(shared_cache.get_entries()) == 2
+    assert find_uncached_indices(second) == []
+    assert all(path.is_symlink() for path in second.cache_dir.glob("*.pt"))
+
+
+def test_find_unshared_indices_only_adopts_known_copies(
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    shared_cache: SharedCache = SharedCache(tmp_path / "shared")
+    images_dir: Path = tmp_path / "images"
+    images_dir.mkdir()
+    (images_dir / "img0.tiff").write_bytes(b"0")
+    (images_dir / "img1.tiff").write_bytes(b"1")
+    dataset: FakeCachedDataset = FakeCachedDataset(
+        [{"raw": str(images_dir / f"img{i}.tiff")} for i in range(2)],
+        tmp_path / "exp",
+    )
+    dataset.cache_dir.mkdir()
+    keys: List[str] = [
+        shared_cache.get_key(item, dataset.transform_hash)
+        for item in dataset.data
+    ]
+    # item 0 is a copy of an evicted entry, item 1 was cached by training
+    # from images that may have changed since
+    dataset.cache(0)
+    dataset.cache(1)
+    cache_paths: List[Path] = [
+        dataset.cache_dir / f"{_hash(item).decode('utf-8')}abc.pt"
+        for item in dataset.data
+    ]
+    (tmp_path / "exp" / f"{cache_paths[0].name}.key").write_text(keys[0])
+
+    # Act
+    unshared: List[int] = _find_unshared_indices(dataset, shared_cache, keys)
+
+    # Assert
+    assert unshared == [1]
+    assert shared_cache.get_entry_path(keys[0]).is_file()
+    assert not shared_cache.get_entry_path(keys[1]).exists()
+    assert not cache_paths[1].exists()
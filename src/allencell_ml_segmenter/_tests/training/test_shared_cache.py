@@ -0,0 +1,180 @@
+import os
+from pathlib import Path
+from typing import List
+
+from allencell_ml_segmenter.training.shared_cache import (
+    DEFAULT_BUDGET_BYTES,
+    CacheEntry,
+    SharedCache,
+)
+from allencell_ml_segmenter.training.shared_cache_cli import main
+
+
+def _add_entry(
+    cache: SharedCache, tmp_path: Path, key: str, size: int, last_used: float
+) -> None:
+    cache_path: Path = tmp_path / f"{key}_exp.pt"
+    cache_path.write_bytes(b"x" * size)
+    cache.add(key, cache_path)
+    os.utime(cache.get_entry_path(key), (last_used, last_used))
+
+
+def test_get_key_depends_on_content_not_path(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache")
+    (tmp_path / "a.tiff").write_bytes(b"image")
+    (tmp_path / "b.tiff").write_bytes(b"image")
+    (tmp_path / "c.tiff").write_bytes(b"other image")
+
+    # Act
+    key_a: str = cache.get_key({"raw": str(tmp_path / "a.tiff")}, "t1")
+    key_b: str = cache.get_key({"raw": str(tmp_path / "b.tiff")}, "t1")
+    key_c: str = cache.get_key({"raw": str(tmp_path / "c.tiff")}, "t1")
+    key_a_t2: str = cache.get_key({"raw": str(tmp_path / "a.tiff")}, "t2")
+
+    # Assert
+    assert key_a == key_b
+    assert key_a != key_c
+    assert key_a != key_a_t2
+
+
+def test_get_file_hash_rehashes_changed_files(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache")
+    image: Path = tmp_path / "a.tiff"
+    image.write_bytes(b"image")
+    before: str = cache.get_file_hash(image)
+    cache.save_file_hashes()
+
+    # Act
+    image.write_bytes(b"changed image")
+    after: str = SharedCache(tmp_path / "cache").get_file_hash(image)
+
+    # Assert
+    assert before != after
+
+
+def test_add_and_link(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache")
+    exp1_path: Path = tmp_path / "exp1.pt"
+    exp1_path.write_bytes(b"tensor")
+    exp2_path: Path = tmp_path / "exp2.pt"
+
+    # Act
+    cache.add("key", exp1_path)
+    linked: bool = cache.link("key", exp2_path)
+
+    # Assert
+    assert linked
+    assert not cache.link("missing", tmp_path / "exp3.pt")
+    assert cache.get_entry_path("key").read_bytes() == b"tensor"
+    assert exp1_path.read_bytes() == b"tensor"
+    assert exp2_path.read_bytes() == b"tensor"
+    assert len(cache.get_entries()) == 1
+
+
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache", budget_bytes=25)
+    _add_entry(cache, tmp_path, "oldest", 10, 100)
+    _add_entry(cache, tmp_path, "old", 10, 200)
+    _add_entry(cache, tmp_path, "new", 10, 300)
+
+    # Act
+    evicted: List[CacheEntry] = cache.evict()
+
+    # Assert
+    assert [entry.key for entry in evicted] == ["oldest"]
+    assert [entry.key for entry in cache.get_entries()] == ["old", "new"]
+
+
+def test_evict_keeps_entries_in_use(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache", budget_bytes=15)
+    _add_entry(cache, tmp_path, "oldest", 10, 100)
+    _add_entry(cache, tmp_path, "old", 10, 200)
+    _add_entry(cache, tmp_path, "new", 10, 300)
+
+    # Act
+    evicted: List[CacheEntry] = cache.evict(keep=["oldest"])
+
+    # Assert
+    assert [entry.key for entry in evicted] == ["old", "new"]
+    assert [entry.key for entry in cache.get_entries()] == ["oldest"]
+
+
+def test_cli_inspect_and_evict(tmp_path: Path, capsys) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / ".training_cache")
+    _add_entry(cache, tmp_path, "a", 10, 100)
+    _add_entry(cache, tmp_path, "b", 10, 200)
+
+    # Act
+    inspect_code: int = main([str(tmp_path), "inspect", "--entries", "1"])
+    inspect_out: str = capsys.readouterr().out
+    evict_code: int = main([str(tmp_path), "--budget-gb", "0", "evict"])
+    evict_out: str = capsys.readouterr().out
+
+    # Assert
+    assert inspect_code == 0
+    assert "entries: 2" in inspect_out
+    assert "a " in inspect_out
+    assert evict_code == 0
+    assert "evicted 2 entries" in evict_out
+    assert cache.get_entries() == []
+    assert main([str(tmp_path / "missing"), "inspect"]) == 1
+
+
+def test_budget_is_saved_with_cache(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache")
+    default_budget: int = cache.get_budget_bytes()
+
+    # Act
+    cache.set_budget_bytes(1024)
+
+    # Assert
+    assert default_budget == DEFAULT_BUDGET_BYTES
+    assert SharedCache(tmp_path / "cache").get_budget_bytes() == 1024
+    assert SharedCache(tmp_path / "cache", 10).get_budget_bytes() == 10
+
+
+def test_cli_set_budget_is_used_by_evict(tmp_path: Path) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / ".training_cache")
+    _add_entry(cache, tmp_path, "a", 10, 100)
+
+    # Act
+    set_code: int = main([str(tmp_path), "set-budget", "0"])
+    evict_code: int = main([str(tmp_path), "evict"])
+
+    # Assert
+    assert set_code == 0
+    assert evict_code == 0
+    assert SharedCache(tmp_path / ".training_cache").get_budget_bytes() == 0
+    assert cache.get_entries() == []
+
+
+def test_link_saves_key_of_copies(tmp_path: Path, monkeypatch) -> None:
+    # Arrange
+    cache: SharedCache = SharedCache(tmp_path / "cache")
+    exp1_path: Path = tmp_path / "exp1.pt"
+    exp1_path.write_bytes(b"tensor")
+    cache.add("key", exp1_path)
+    exp2_path: Path = tmp_path / "exp2.pt"
+
+    def no_links(*args: object) -> None:
+        raise OSError("links are not supported")
+
+    monkeypatch.setattr(Path, "symlink_to", no_links)
+    monkeypatch.setattr(os, "link", no_links)
+
+    # Act
+    cache.link("key", exp2_path)
+
+    # Assert
+    assert not exp2_path.is_symlink()
+    assert exp2_path.read_bytes() == b"tensor"
+    assert SharedCache.get_copied_key(exp2_path) == "key"
+    assert SharedCache.get_copied_key(exp1_path) is None
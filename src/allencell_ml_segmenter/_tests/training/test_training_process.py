@@ -0,0 +1,98 @@
+import time
+from pathlib import Path
+from typing import Any, List
+
+from allencell_ml_segmenter.training.training_process import (
+    TrainingJob,
+    TrainingMessage,
+    TrainingMessageType,
+    TrainingProcess,
+)
+
+JOB: TrainingJob = TrainingJob(Path("train_config.yaml"), None, 1, None)
+
+
+# targets are module level, so that the training process can import them
+def _send_messages(job: TrainingJob, stop_event: Any, messages: Any) -> None:
+    messages.put(
+        TrainingMessage(TrainingMessageType.LOG, str(job.config_path))
+    )
+    messages.put(TrainingMessage(TrainingMessageType.METRICS, {"epoch": 0}))
+
+
+def _stop_when_requested(
+    job: TrainingJob, stop_event: Any, messages: Any
+) -> None:
+    stop_event.wait(60)
+    messages.put(TrainingMessage(TrainingMessageType.LOG, "stopped"))
+
+
+def _ignore_stop_request(
+    job: TrainingJob, stop_event: Any, messages: Any
+) -> None:
+    time.sleep(60)
+
+
+def _fail(job: TrainingJob, stop_event: Any, messages: Any) -> None:
+    raise RuntimeError("no config")
+
+
+def test_run_passes_messages_on() -> None:
+    # Arrange
+    received: List[TrainingMessage] = []
+    training_process: TrainingProcess = TrainingProcess(
+        JOB, received.append, target=_send_messages
+    )
+
+    # Act
+    exit_code: int = training_process.run()
+
+    # Assert
+    assert exit_code == 0
+    assert received == [
+        TrainingMessage(TrainingMessageType.LOG, "train_config.yaml"),
+        TrainingMessage(TrainingMessageType.METRICS, {"epoch": 0}),
+    ]
+
+
+def test_request_stop_stops_job() -> None:
+    # Arrange
+    received: List[TrainingMessage] = []
+    training_process: TrainingProcess = TrainingProcess(
+        JOB, received.append, target=_stop_when_requested
+    )
+
+    # Act
+    training_process.request_stop()
+    exit_code: int = training_process.run()
+
+    # Assert
+    assert training_process.is_stop_requested()
+    assert exit_code == 0
+    assert received == [TrainingMessage(TrainingMessageType.LOG, "stopped")]
+
+
+def test_request_stop_kills_job_after_timeout() -> None:
+    # Arrange
+    training_process: TrainingProcess = TrainingProcess(
+        JOB, lambda _: None, stop_timeout=0, target=_ignore_stop_request
+    )
+
+    # Act
+    training_process.request_stop()
+    start: float = time.monotonic()
+    exit_code: int = training_process.run()
+
+    # Assert
+    assert exit_code < 0
+    assert time.monotonic() - start < 30
+
+
+def test_run_returns_error_exit_code() -> None:
+    # Arrange
+    training_process: TrainingProcess = TrainingProcess(
+        JOB, lambda _: None, target=_fail
+    )
+
+    # Act / Assert
+    assert training_process.run() != 0
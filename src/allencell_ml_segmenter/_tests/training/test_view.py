@@ -1,3 +1,5 @@
+import threading
+
 from allencell_ml_segmenter._tests.fakes.fake_viewer import FakeViewer
 from allencell_ml_segmenter._tests.fakes.fake_experiments_model import (
     FakeExperimentsModel,
@@ -10,6 +12,7 @@ from allencell_ml_segmenter.training.training_model import (
     ImageType,
 )
 from allencell_ml_segmenter.training.view import TrainingView
+from allencell_ml_segmenter.core.view import LongTaskThread
 from allencell_ml_segmenter.core.task_executor import SynchroTaskExecutor
 import pytest
 from pytestqt.qtbot import QtBot
@@ -140,6 +143,29 @@ def test_checkbox_slot(
     assert not training_view._max_time_in_minutes_input.isEnabled()
 
 
+def test_probe_dataloader_checkbox(
+    qtbot: QtBot, training_view: TrainingView, training_model: TrainingModel
+) -> None:
+    """
+    Test that the tune data loading checkbox sets whether the dataloader is
+    probed before training.
+    """
+    # ASSERT (not probed by default)
+    assert not training_model.is_probing_dataloader()
+
+    # ACT
+    training_view._probe_dataloader_checkbox.click()
+
+    # ASSERT
+    assert training_model.is_probing_dataloader()
+
+    # ACT
+    training_view._probe_dataloader_checkbox.click()
+
+    # ASSERT
+    assert not training_model.is_probing_dataloader()
+
+
 def test_set_model_size(
     training_view: TrainingView, training_model: TrainingModel
 ) -> None:
@@ -383,3 +409,42 @@ def test_model_size_combo_box(
 
     # ASSERT
     assert training_view._model_size_combo_box.isEnabled()
+
+
+def test_training_disabled_until_run_ends(
+    qtbot: QtBot, training_view: TrainingView, monkeypatch
+) -> None:
+    """
+    Tests that training cannot be started again while a run, e.g. one that
+    was cancelled but is still stopping, has not ended.
+    """
+    # ARRANGE
+    run_ended: threading.Event = threading.Event()
+
+    def start_long_task(_) -> None:
+        training_view.longTaskThread = LongTaskThread(do_work=run_ended.wait)
+        training_view.longTaskThread.start()
+
+    monkeypatch.setattr(training_view, "_patch_size_ok", lambda: True)
+    monkeypatch.setattr(training_view, "set_patch_size", lambda: None)
+    monkeypatch.setattr(
+        training_view._experiments_model,
+        "get_latest_metrics_csv_version",
+        lambda: 0,
+    )
+    monkeypatch.setattr(
+        training_view, "startLongTaskWithProgressBar", start_long_task
+    )
+
+    # ACT
+    training_view.train_btn_handler()
+
+    # ASSERT
+    assert not training_view._train_btn.isEnabled()
+
+    # ACT
+    training_view.cancelWork()
+    run_ended.set()
+
+    # ASSERT
+    qtbot.waitUntil(lambda: training_view._train_btn.isEnabled())
@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pytest
+
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+    RESERVED_CORES,
+    choose_cpu_compute_profile,
+    cpu_supports_bf16,
+)
+from allencell_ml_segmenter.utils.hardware_profile import HardwareInfo
+
+GIB: int = 1024**3
+
+
+def _write_cpuinfo(tmp_path: Path, flags: str) -> Path:
+    cpuinfo: Path = tmp_path / "cpuinfo"
+    cpuinfo.write_text(
+        f"processor\t: 0\nmodel name\t: Test CPU\nflags\t\t: {flags}\n"
+    )
+    return cpuinfo
+
+
+def test_cpu_supports_bf16(tmp_path: Path) -> None:
+    # Act / Assert
+    assert cpu_supports_bf16(_write_cpuinfo(tmp_path, "fpu sse avx512_bf16"))
+    assert not cpu_supports_bf16(_write_cpuinfo(tmp_path, "fpu sse avx2"))
+    assert not cpu_supports_bf16(tmp_path / "missing")
+
+
+def test_profile_leaves_cores_to_app_and_loaders(tmp_path: Path) -> None:
+    # Arrange
+    hardware: HardwareInfo = HardwareInfo(16, None, 64 * GIB, False, "Linux")
+
+    # Act
+    profile: CpuComputeProfile = choose_cpu_compute_profile(
+        hardware,
+        num_loader_workers=4,
+        use_bf16=True,
+        allowed_cpus=list(range(16)),
+        cpuinfo_path=_write_cpuinfo(tmp_path, "avx2"),
+    )
+
+    # Assert
+    assert profile.intra_op_threads == 16 - RESERVED_CORES - 4
+    assert profile.inter_op_threads == 1
+    # the run and its loaders get the last cores
+    assert profile.cpu_affinity == list(range(RESERVED_CORES, 16))
+    # not supported by the CPU
+    assert not profile.bf16
+    assert profile.get_overrides() == {}
+
+
+def test_profile_on_small_machine(tmp_path: Path) -> None:
+    # Arrange
+    hardware: HardwareInfo = HardwareInfo(2, None, 8 * GIB, False, "Linux")
+
+    # Act
+    profile: CpuComputeProfile = choose_cpu_compute_profile(
+        hardware,
+        use_bf16=True,
+        allowed_cpus=[0, 1],
+        cpuinfo_path=_write_cpuinfo(tmp_path, "amx_bf16"),
+    )
+
+    # Assert
+    assert profile.intra_op_threads == 1
+    assert profile.cpu_affinity == [1]
+    assert profile.bf16
+    assert profile.get_overrides() == {"trainer.precision": "bf16-mixed"}
+
+
+def test_profile_without_cores_to_spare() -> None:
+    # Arrange
+    # a quota of 4 cores spread over 4 allowed cores
+    hardware: HardwareInfo = HardwareInfo(4, 4.0, 8 * GIB, False, "Linux")
+
+    # Act
+    profile: CpuComputeProfile = choose_cpu_compute_profile(
+        hardware, num_loader_workers=3, allowed_cpus=[0, 1, 2, 3]
+    )
+
+    # Assert
+    assert profile.intra_op_threads == 1
+    # the run needs every allowed core
+    assert profile.cpu_affinity is None
+
+
+def test_applied_profile_is_restored() -> None:
+    # Arrange
+    torch = pytest.importorskip("torch")
+    num_threads: int = torch.get_num_threads()
+    profile: CpuComputeProfile = CpuComputeProfile(
+        num_threads + 1, 1, False, None
+    )
+
+    # Act
+    with profile.applied():
+        applied_threads: int = torch.get_num_threads()
+
+    # Assert
+    assert applied_threads == num_threads + 1
+    assert torch.get_num_threads() == num_threads
@@ -14,6 +14,10 @@ from allencell_ml_segmenter.training.training_model import (
 from allencell_ml_segmenter.utils.cyto_overrides_manager import (
     CytoDLOverridesManager,
 )
+from allencell_ml_segmenter.utils.hardware_profile import (
+    DataLoaderProfile,
+    HardwareInfo,
+)
 import allencell_ml_segmenter
 
 
@@ -223,3 +227,50 @@ def test_max_epochs_no_existing_ckpt(
         training_overrides["trainer.max_epochs"]
         == training_model.get_num_epochs()
     )
+
+
+def test_get_training_overrides_uses_dataloader_profile(
+    experiments_model: ExperimentsModel, training_model: TrainingModel
+):
+    experiments_model.apply_experiment_name("one_ckpt_exp")
+    training_model.set_dataloader_profile(
+        DataLoaderProfile(
+            6, 4, True, HardwareInfo(16, None, 64 * 1024**3, True, "Linux")
+        )
+    )
+    cyto_overrides_manager: CytoDLOverridesManager = CytoDLOverridesManager(
+        experiments_model, training_model
+    )
+
+    training_overrides: Dict[str, Union[str, int, float, bool, Dict]] = (
+        cyto_overrides_manager.get_training_overrides()
+    )
+
+    assert training_overrides["data.num_workers"] == 6
+    assert training_overrides["data.prefetch_factor"] == 4
+    assert training_overrides["data.persistent_workers"]
+
+
+def test_get_training_overrides_keeps_unset_prefetch_factor(
+    experiments_model: ExperimentsModel, training_model: TrainingModel
+):
+    # Arrange
+    experiments_model.apply_experiment_name("one_ckpt_exp")
+    training_model.set_dataloader_profile(
+        DataLoaderProfile(
+            6, None, True, HardwareInfo(16, None, 64 * 1024**3, True, "Linux")
+        )
+    )
+    cyto_overrides_manager: CytoDLOverridesManager = CytoDLOverridesManager(
+        experiments_model, training_model
+    )
+
+    # Act
+    training_overrides: Dict[str, Union[str, int, float, bool, Dict]] = (
+        cyto_overrides_manager.get_training_overrides()
+    )
+
+    # Assert
+    assert training_overrides["data.num_workers"] == 6
+    assert "data.prefetch_factor" not in training_overrides
+    assert training_overrides["data.persistent_workers"]
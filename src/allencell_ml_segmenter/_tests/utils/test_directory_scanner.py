@@ -0,0 +1,131 @@
+from pathlib import Path
+from typing import Any, Callable, Generator, List
+from unittest.mock import Mock
+
+import pytest
+
+import allencell_ml_segmenter.utils.directory_scanner
+from allencell_ml_segmenter.core.task_executor import (
+    SynchroTaskExecutor,
+    TaskHandle,
+)
+from allencell_ml_segmenter.utils.directory_scanner import (
+    iter_file_batches,
+    list_files,
+    scan_files_in_batches,
+)
+
+
+def _make_files(dir_path: Path, count: int) -> List[Path]:
+    paths: List[Path] = [dir_path / f"img_{i:03}.tiff" for i in range(count)]
+    for path in paths:
+        path.touch()
+    return paths
+
+
+def test_list_files_skips_hidden_files_and_dirs(tmp_path: Path) -> None:
+    # Arrange
+    for name in ["b.tiff", "a.tiff", ".DS_Store", "no_extension"]:
+        (tmp_path / name).touch()
+    (tmp_path / "dir.tiff").mkdir()
+
+    # Act
+    files: List[Path] = list_files(tmp_path)
+
+    # Assert
+    assert files == [tmp_path / "a.tiff", tmp_path / "b.tiff"]
+
+
+def test_iter_file_batches_sizes(tmp_path: Path) -> None:
+    # Arrange
+    paths: List[Path] = _make_files(tmp_path, 25)
+    (tmp_path / ".hidden.tiff").touch()
+
+    # Act
+    batches: List[List[Path]] = list(
+        iter_file_batches(tmp_path, first_batch_size=2, batch_size=10)
+    )
+
+    # Assert
+    assert [len(batch) for batch in batches] == [2, 10, 10, 3]
+    assert sorted(p for batch in batches for p in batch) == paths
+
+
+def test_scan_files_in_batches_calls_back_per_batch(tmp_path: Path) -> None:
+    # Arrange
+    paths: List[Path] = _make_files(tmp_path, 12)
+    found: List[List[Path]] = []
+    on_finish: Mock = Mock()
+
+    # Act
+    scan_files_in_batches(
+        SynchroTaskExecutor.global_instance(),
+        tmp_path,
+        found.append,
+        on_finish=on_finish,
+        first_batch_size=1,
+        batch_size=5,
+    )
+
+    # Assert
+    assert [len(batch) for batch in found] == [1, 5, 5, 1]
+    assert sorted(p for batch in found for p in batch) == paths
+    on_finish.assert_called_once()
+
+
+def test_scan_files_in_batches_reports_missing_dir(tmp_path: Path) -> None:
+    # Arrange
+    on_batch: Mock = Mock()
+    on_error: Mock = Mock()
+
+    # Act
+    scan_files_in_batches(
+        SynchroTaskExecutor.global_instance(),
+        tmp_path / "missing",
+        on_batch,
+        on_error=on_error,
+    )
+
+    # Assert
+    on_batch.assert_not_called()
+    assert isinstance(on_error.call_args.args[0], FileNotFoundError)
+
+
+def test_scan_files_in_batches_closes_cancelled_scan(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    closed: List[bool] = []
+
+    def fake_batches(*args: object) -> Generator[List[Path], None, None]:
+        try:
+            yield [tmp_path / "a.tiff"]
+            yield [tmp_path / "b.tiff"]
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(
+        allencell_ml_segmenter.utils.directory_scanner,
+        "iter_file_batches",
+        fake_batches,
+    )
+    # runs the first read only, so that the scan is cancelled midway
+    executor: Mock = Mock()
+    handles: List[TaskHandle] = []
+
+    def exec(task: Callable[[], Any], on_return: Callable, **kwargs: Any):
+        handles.append(TaskHandle())
+        if len(handles) == 1:
+            on_return(task())
+        return handles[-1]
+
+    executor.exec.side_effect = exec
+    found: List[List[Path]] = []
+    scan_files_in_batches(executor, tmp_path, found.append)
+
+    # Act
+    handles[-1].cancel()
+
+    # Assert
+    assert found == [[tmp_path / "a.tiff"]]
+    assert closed == [True]
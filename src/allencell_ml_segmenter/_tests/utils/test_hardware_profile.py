@@ -0,0 +1,199 @@
+from pathlib import Path
+from typing import Dict, List, Sequence
+from unittest.mock import Mock
+
+import pytest
+
+import allencell_ml_segmenter
+import allencell_ml_segmenter.utils.hardware_profile
+from allencell_ml_segmenter.core.image_data_extractor import (
+    AICSImageDataExtractor,
+)
+from allencell_ml_segmenter.utils.hardware_profile import (
+    _ImageReadDataset,
+    DataLoaderProfile,
+    HardwareInfo,
+    MAX_NUM_WORKERS,
+    WORKER_MEMORY_BYTES,
+    choose_dataloader_profile,
+    detect_hardware,
+    get_max_num_workers,
+    tune_dataloader_profile,
+)
+
+GIB: int = 1024**3
+IMG_PATH: Path = (
+    Path(allencell_ml_segmenter.__file__).parent
+    / "_tests"
+    / "test_files"
+    / "images"
+    / "test_3_channels.tiff"
+)
+
+
+def test_detect_hardware_reads_cgroup_v2_limits(tmp_path: Path) -> None:
+    # Arrange
+    (tmp_path / "cpu.max").write_text("400000 100000\n")
+    (tmp_path / "memory.max").write_text(f"{8 * GIB}\n")
+
+    # Act
+    hardware: HardwareInfo = detect_hardware(False, tmp_path)
+
+    # Assert
+    assert hardware.cpu_quota == 4
+    assert hardware.get_usable_cpus() == min(4, hardware.cpu_count)
+    assert hardware.memory_bytes <= 8 * GIB
+
+
+def test_detect_hardware_reads_cgroup_v1_limits(tmp_path: Path) -> None:
+    # Arrange
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("150000")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000")
+
+    # Act
+    hardware: HardwareInfo = detect_hardware(True, tmp_path)
+
+    # Assert
+    assert hardware.cpu_quota == 1.5
+    assert hardware.get_usable_cpus() == 1
+    assert hardware.gpu
+
+
+def test_detect_hardware_without_limits(tmp_path: Path) -> None:
+    # Arrange
+    (tmp_path / "cpu.max").write_text("max 100000")
+    (tmp_path / "memory.max").write_text("max")
+
+    # Act
+    hardware: HardwareInfo = detect_hardware(False, tmp_path)
+
+    # Assert
+    assert hardware.cpu_quota is None
+    assert hardware.get_usable_cpus() == hardware.cpu_count
+    assert hardware.memory_bytes > 0
+
+
+@pytest.mark.parametrize(
+    "hardware, max_num_workers",
+    [
+        # training on CPU keeps half of the cores
+        (HardwareInfo(64, None, 256 * GIB, False, "Linux"), 16),
+        (HardwareInfo(8, None, 256 * GIB, False, "Linux"), 4),
+        (HardwareInfo(8, None, 256 * GIB, True, "Linux"), 7),
+        # the quota limits the cores
+        (HardwareInfo(64, 6.0, 256 * GIB, True, "Linux"), 5),
+        # memory limits the workers
+        (HardwareInfo(64, None, 4 * WORKER_MEMORY_BYTES, True, "Linux"), 3),
+        (HardwareInfo(1, None, 256 * GIB, False, "Linux"), 0),
+        (HardwareInfo(64, None, 256 * GIB, True, "Darwin"), 0),
+    ],
+)
+def test_get_max_num_workers(
+    hardware: HardwareInfo, max_num_workers: int
+) -> None:
+    # Act/Assert
+    assert get_max_num_workers(hardware) == max_num_workers
+    assert get_max_num_workers(hardware) <= MAX_NUM_WORKERS
+
+
+@pytest.mark.parametrize(
+    "hardware, num_workers, prefetch_factor",
+    [
+        # without measuring, a single worker on GPU and none on CPU
+        (HardwareInfo(64, None, 256 * GIB, True, "Linux"), 1, 2),
+        (HardwareInfo(64, None, 256 * GIB, False, "Linux"), 0, None),
+        (HardwareInfo(1, None, 256 * GIB, True, "Linux"), 0, None),
+        (HardwareInfo(64, None, 256 * GIB, True, "Darwin"), 0, None),
+    ],
+)
+def test_choose_dataloader_profile(
+    hardware: HardwareInfo, num_workers: int, prefetch_factor: int
+) -> None:
+    # Act
+    profile: DataLoaderProfile = choose_dataloader_profile(hardware)
+
+    # Assert
+    assert profile.num_workers == num_workers
+    assert profile.prefetch_factor == prefetch_factor
+    assert not profile.persistent_workers
+
+
+def test_tune_dataloader_profile_prefers_fewer_workers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    profile: DataLoaderProfile = choose_dataloader_profile(
+        HardwareInfo(64, None, 256 * GIB, False, "Linux")
+    )
+    probed: List[Sequence[int]] = []
+
+    def fake_probe(
+        csv_path: Path, worker_counts: Sequence[int], *args: object
+    ) -> Dict[int, float]:
+        probed.append(worker_counts)
+        # 8 workers are within 10% of the fastest, 16
+        return {4: 50.0, 8: 95.0, 16: 100.0}
+
+    monkeypatch.setattr(
+        allencell_ml_segmenter.utils.hardware_profile,
+        "probe_dataloader_throughput",
+        fake_probe,
+    )
+
+    # Act
+    tuned: DataLoaderProfile = tune_dataloader_profile(
+        profile, Path("train.csv")
+    )
+
+    # Assert
+    assert probed == [[4, 8, 16]]
+    assert tuned.num_workers == 8
+    assert tuned.prefetch_factor == 4
+    assert tuned.persistent_workers
+    assert tuned.probe_images_per_second == {4: 50.0, 8: 95.0, 16: 100.0}
+
+
+def test_profile_dict_round_trip() -> None:
+    # Arrange
+    profile: DataLoaderProfile = DataLoaderProfile(
+        3,
+        2,
+        True,
+        HardwareInfo(8, 4.0, 16 * GIB, True, "Linux"),
+        {1: 10.0, 3: 25.5},
+    )
+
+    # Act
+    restored: DataLoaderProfile = DataLoaderProfile.from_dict(
+        profile.to_dict()
+    )
+
+    # Assert
+    assert restored == profile
+    assert profile.to_dict()["probe_images_per_second"] == {
+        "1": 10.0,
+        "3": 25.5,
+    }
+
+
+def test_probe_dataset_reads_without_app_extractor() -> None:
+    # Arrange
+    # dataloader workers inherit the app's extractor, whose decode executor
+    # cannot be used outside the napari process
+    decode_executor: Mock = Mock()
+    extractor: AICSImageDataExtractor = (
+        AICSImageDataExtractor.global_instance()
+    )
+    extractor.set_decode_executor(decode_executor)
+    dataset: _ImageReadDataset = _ImageReadDataset([IMG_PATH], 0)
+
+    # Act
+    try:
+        nbytes: int = dataset[0]
+    finally:
+        extractor.set_decode_executor(None)
+
+    # Assert
+    assert nbytes > 0
+    decode_executor.run.assert_not_called()
@@ -1,57 +1,93 @@
-from numpy import zeros, ones, ndarray
+import dask.array as da
+import pytest
+from numpy import zeros, ones, ndarray, int32, uint8, uint16
 
 from allencell_ml_segmenter.utils.image_processing import (
-    set_all_nonzero_values_to,
+    ONLY_SEG1_LABEL,
+    ONLY_SEG2_LABEL,
+    get_disagreement_labels,
+    load_label_image,
+    to_label_image,
 )
 
 
-def test_set_all_nonzero_values_to():
+def test_to_label_image_narrows_dtype():
     # ARRANGE
-    array: ndarray = zeros([3, 3, 3])
-    array[1, 1, 1] = 255
-    array[2, 1, 1] = 3
-    array[0, 1, 1] = 230
+    array: ndarray = zeros([3, 3, 3], dtype=int32)
+    array[1, 1, 1] = 70000
+    array[2, 1, 1] = -4
 
     # ACT
-    array = set_all_nonzero_values_to(array, 2)
+    labels: ndarray = to_label_image(array, 2)
 
     # ASSERT
-    assert array.max() == 2
-    assert array.shape == (3, 3, 3)
-    assert array[1, 1, 1] == 2
-    assert array[2, 1, 1] == 2
-    assert array[0, 1, 1] == 2
-    assert (
-        array.sum() == 6
-    )  # we set three non-zero values to 2, so we expect 6
+    assert labels.dtype == uint8
+    assert labels[1, 1, 1] == 2
+    # only positive values are labelled
+    assert labels[2, 1, 1] == 0
+    assert labels.sum() == 2
+    # the source image is left untouched
+    assert array[1, 1, 1] == 70000
 
 
-def test_set_all_nonzero_values_to_zero_array():
+def test_to_label_image_rejects_value_outside_uint8():
+    # ACT/ASSERT
+    with pytest.raises(ValueError):
+        to_label_image(ones([2, 2]), 256)
+
+
+def test_load_label_image_matches_eager_conversion():
     # ARRANGE
-    array: ndarray = zeros([3, 3, 3])
+    array: ndarray = zeros([4, 5, 5], dtype=uint16)
+    array[0, 0, 0] = 1
+    array[3, 4, 4] = 500
+    lazy: da.Array = da.from_array(array, chunks=(1, 5, 5))
 
     # ACT
-    array = set_all_nonzero_values_to(array, 1)
+    labels: ndarray = load_label_image(lazy, 1)
 
     # ASSERT
-    assert array.max() == 0
-    assert array.shape == (3, 3, 3)
-    assert (
-        array.sum() == 0
-    )  # all values in starting array are 0, so nothing should change
+    assert labels.dtype == uint8
+    assert (labels == (array > 0)).all()
 
 
-def test_set_all_nonzero_values_to_ones_array():
+def test_get_disagreement_labels():
     # ARRANGE
-    array: ndarray = ones([3, 3, 3])
+    seg1: ndarray = zeros([5, 4, 4], dtype=uint16)
+    seg1[:, 0, :2] = 300
+    seg2: ndarray = zeros([5, 4, 4], dtype=uint8)
+    seg2[:, 0, 1:3] = 2
 
     # ACT
-    array = set_all_nonzero_values_to(array, 2)
+    labels: ndarray = get_disagreement_labels(seg1, seg2, chunk_z=2)
 
     # ASSERT
-    assert array.max() == 2
-    assert array.min() == 2
-    assert array.shape == (3, 3, 3)
-    assert (
-        array.sum() == 54
-    )  # we set all values in a array of size 27 to 2, so we expect 54
+    assert labels.dtype == uint8
+    assert (labels[:, 0, 0] == ONLY_SEG1_LABEL).all()
+    # both segment this column
+    assert (labels[:, 0, 1] == 0).all()
+    assert (labels[:, 0, 2] == ONLY_SEG2_LABEL).all()
+    assert labels.sum() == 5 * (ONLY_SEG1_LABEL + ONLY_SEG2_LABEL)
+
+
+def test_get_disagreement_labels_of_dask_arrays_is_lazy():
+    # ARRANGE
+    seg1: ndarray = zeros([3, 4, 4], dtype=uint8)
+    seg1[1] = 1
+    seg2: ndarray = ones([3, 4, 4], dtype=uint8)
+
+    # ACT
+    labels = get_disagreement_labels(
+        da.from_array(seg1, chunks=(1, 4, 4)),
+        da.from_array(seg2, chunks=(1, 4, 4)),
+    )
+
+    # ASSERT
+    assert isinstance(labels, da.Array)
+    assert (labels.compute() == (1 - seg1) * ONLY_SEG2_LABEL).all()
+
+
+def test_get_disagreement_labels_rejects_different_shapes():
+    # ACT / ASSERT
+    with pytest.raises(ValueError):
+        get_disagreement_labels(zeros([2, 2]), zeros([2, 3]))
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import numpy as np
+
+from allencell_ml_segmenter.utils.mask_encoding import (
+    decode_mask,
+    encode_mask,
+)
+
+
+def test_polygon_mask_round_trips_without_pickle(tmp_path: Path) -> None:
+    # Arrange
+    # masks from shapes layers are object arrays of polygon vertices
+    mask: np.ndarray = np.asarray(
+        [np.zeros((4, 3)), np.arange(9.0).reshape(3, 3)], dtype=object
+    )
+    npy_path: Path = tmp_path / "mask.npy"
+
+    # Act
+    np.save(npy_path, encode_mask(mask), allow_pickle=False)
+    decoded: np.ndarray = decode_mask(np.load(npy_path, allow_pickle=False))
+
+    # Assert
+    assert decoded.dtype == object
+    assert len(decoded) == len(mask)
+    for decoded_polygon, polygon in zip(decoded, mask):
+        np.testing.assert_array_equal(decoded_polygon, polygon)
+
+
+def test_raster_mask_is_not_encoded() -> None:
+    # Arrange
+    mask: np.ndarray = np.ones((2, 5, 5), dtype=np.uint8)
+
+    # Act / Assert
+    assert encode_mask(mask) is mask
+    assert decode_mask(mask) is mask
+
+
+def test_empty_polygon_mask_round_trips() -> None:
+    # Act
+    decoded: np.ndarray = decode_mask(encode_mask(np.empty(0, dtype=object)))
+
+    # Assert
+    assert decoded.dtype == object
+    assert len(decoded) == 0
@@ -0,0 +1,66 @@
+from pathlib import Path
+from typing import List
+
+from allencell_ml_segmenter.utils.pairing_index import (
+    PairingIndex,
+    get_image_stem,
+)
+
+
+def test_get_image_stem() -> None:
+    # Act / Assert
+    assert get_image_stem("img.tiff") == "img"
+    assert get_image_stem("img.ome.tiff") == "img"
+    assert get_image_stem("img.1.tiff") == "img.1"
+
+
+def test_pairing_index_pairs_by_stem() -> None:
+    # Arrange
+    raw: List[Path] = [Path("r/a.tiff"), Path("r/b.tiff"), Path("r/c.tiff")]
+    seg: List[Path] = [Path("s/c.tiff"), Path("s/a.ome.tiff")]
+
+    # Act
+    index: PairingIndex[str] = PairingIndex({"raw": raw, "seg": seg})
+
+    # Assert
+    assert index.get_stems() == ["a", "c"]
+    assert index.get_paths("raw") == [Path("r/a.tiff"), Path("r/c.tiff")]
+    assert index.get_paths("seg") == [Path("s/a.ome.tiff"), Path("s/c.tiff")]
+    assert index.get_path("seg", "c") == Path("s/c.tiff")
+    assert index.get_path("raw", "b") is None
+    assert index.get_unmatched() == {"raw": [Path("r/b.tiff")], "seg": []}
+
+
+def test_pairing_index_does_not_pair_duplicate_stems() -> None:
+    # Arrange
+    raw: List[Path] = [Path("a.tiff"), Path("a.czi"), Path("b.tiff")]
+    seg: List[Path] = [Path("a.tiff"), Path("b.tiff")]
+
+    # Act
+    index: PairingIndex[str] = PairingIndex({"raw": raw, "seg": seg})
+
+    # Assert
+    assert index.get_stems() == ["b"]
+    assert sorted(index.get_unmatched()["raw"]) == [
+        Path("a.czi"),
+        Path("a.tiff"),
+    ]
+    assert index.get_unmatched()["seg"] == [Path("a.tiff")]
+
+
+def test_pairing_index_from_dirs(tmp_path: Path) -> None:
+    # Arrange
+    for name in ["raw/a.tiff", "raw/b.tiff", "seg/b.tiff", "seg/a.tiff"]:
+        (tmp_path / name).parent.mkdir(exist_ok=True)
+        (tmp_path / name).touch()
+
+    # Act
+    index: PairingIndex[str] = PairingIndex.from_dirs(
+        {"raw": tmp_path / "raw", "seg": tmp_path / "seg"}
+    )
+
+    # Assert
+    assert index.get_paths("seg") == [
+        tmp_path / "seg" / "a.tiff",
+        tmp_path / "seg" / "b.tiff",
+    ]
@@ -20,6 +20,38 @@ class IUserSettings(ABC):
     def set_user_experiments_path(self, path: Path) -> None:
         pass
 
+    @abstractmethod
+    def get_image_cache_max_bytes(self) -> int:
+        pass
+
+    @abstractmethod
+    def set_image_cache_max_bytes(self, max_bytes: int) -> None:
+        pass
+
+    @abstractmethod
+    def get_curation_prefetch_depth(self) -> int:
+        pass
+
+    @abstractmethod
+    def set_curation_prefetch_depth(self, depth: int) -> None:
+        pass
+
+    @abstractmethod
+    def get_curation_prefetch_budget_bytes(self) -> int:
+        pass
+
+    @abstractmethod
+    def set_curation_prefetch_budget_bytes(self, budget: int) -> None:
+        pass
+
+    @abstractmethod
+    def get_curation_history_size(self) -> int:
+        pass
+
+    @abstractmethod
+    def set_curation_history_size(self, size: int) -> None:
+        pass
+
     @abstractmethod
     def prompt_for_user_experiments_home(self, parent: QWidget) -> None:
         pass
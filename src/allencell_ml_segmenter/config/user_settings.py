@@ -6,9 +6,21 @@ from qtpy.QtWidgets import QWidget
 from typing import Optional
 
 from allencell_ml_segmenter.config.i_user_settings import IUserSettings
+from allencell_ml_segmenter.core.image_data_extractor.image_data_cache import (
+    DEFAULT_MAX_BYTES,
+)
+from allencell_ml_segmenter.curation.curation_model import (
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_PREFETCH_BUDGET_BYTES,
+    DEFAULT_PREFETCH_DEPTH,
+)
 
 CYTO_DL_HOME_PATH = "/Users/chrishu/dev/code/test2/cyto-dl"
 EXPERIMENTS_HOME_KEY = "experimentshome"
+IMAGE_CACHE_MAX_BYTES_KEY = "imagecachemaxbytes"
+CURATION_PREFETCH_DEPTH_KEY = "curationprefetchdepth"
+CURATION_PREFETCH_BUDGET_BYTES_KEY = "curationprefetchbudgetbytes"
+CURATION_HISTORY_SIZE_KEY = "curationhistorysize"
 
 
 class UserSettings(IUserSettings):
@@ -32,6 +44,59 @@ class UserSettings(IUserSettings):
     def set_user_experiments_path(self, path: Path) -> None:
         self.settings.setValue(EXPERIMENTS_HOME_KEY, path)
 
+    def get_image_cache_max_bytes(self) -> int:
+        """
+        Returns the memory budget of the cache of decoded images
+        """
+        return int(
+            self.settings.value(IMAGE_CACHE_MAX_BYTES_KEY, DEFAULT_MAX_BYTES)
+        )
+
+    def set_image_cache_max_bytes(self, max_bytes: int) -> None:
+        self.settings.setValue(IMAGE_CACHE_MAX_BYTES_KEY, max_bytes)
+
+    def get_curation_prefetch_depth(self) -> int:
+        """
+        Returns the number of images after the current one that curation loads
+        in the background
+        """
+        return int(
+            self.settings.value(
+                CURATION_PREFETCH_DEPTH_KEY, DEFAULT_PREFETCH_DEPTH
+            )
+        )
+
+    def set_curation_prefetch_depth(self, depth: int) -> None:
+        self.settings.setValue(CURATION_PREFETCH_DEPTH_KEY, depth)
+
+    def get_curation_prefetch_budget_bytes(self) -> int:
+        """
+        Returns the memory budget of the images curation loads ahead of the next
+        image
+        """
+        return int(
+            self.settings.value(
+                CURATION_PREFETCH_BUDGET_BYTES_KEY,
+                DEFAULT_PREFETCH_BUDGET_BYTES,
+            )
+        )
+
+    def set_curation_prefetch_budget_bytes(self, budget: int) -> None:
+        self.settings.setValue(CURATION_PREFETCH_BUDGET_BYTES_KEY, budget)
+
+    def get_curation_history_size(self) -> int:
+        """
+        Returns the number of recently viewed images that curation keeps loaded
+        """
+        return int(
+            self.settings.value(
+                CURATION_HISTORY_SIZE_KEY, DEFAULT_HISTORY_SIZE
+            )
+        )
+
+    def set_curation_history_size(self, size: int) -> None:
+        self.settings.setValue(CURATION_HISTORY_SIZE_KEY, size)
+
     def prompt_for_user_experiments_home(self, parent: QWidget) -> None:
         message_dialog = QMessageBox(
             QMessageBox.Icon.NoIcon,
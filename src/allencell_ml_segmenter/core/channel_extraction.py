@@ -3,19 +3,26 @@ from typing import Optional
 import csv
 
 from qtpy.QtCore import QObject, QThread, Signal
-from bioio import BioImage
+
+from allencell_ml_segmenter.core.image_metadata_index import (
+    ImageMetadataIndex,
+    ImageMetadata,
+)
 
 
 def extract_channels_from_image(img_path: Path) -> int:
     """
-    Returns number of channels in the given img_path.
+    Returns number of channels in the given img_path. Served from the
+    ImageMetadataIndex when the image has been indexed before.
     :param img_path: image to extract channels from
     """
-    img_data: BioImage = BioImage(str(img_path))
-    if img_data.dims.T > 1:
+    metadata: ImageMetadata = (
+        ImageMetadataIndex.global_instance().get_metadata(img_path)
+    )
+    if metadata.timepoints > 1:
         raise RuntimeError("Cannot load timeseries images")
 
-    return img_data.dims.C
+    return metadata.channels
 
 
 def get_img_path_from_csv(csv_path: Path, column: str = "raw") -> Path:
@@ -8,6 +8,7 @@ class Event(Enum):
 
     # Process events. This signals that a long-running process is active. Progress updates should be shown to the user.
     PROCESS_TRAINING = "training"
+    PROCESS_TRAINING_CANCEL = "training_cancel"
     PROCESS_TRAINING_PROGRESS = "training_progress"
     PROCESS_TRAINING_SHOW_ERROR = "training_error"
     PROCESS_TRAINING_CLEAR_ERROR = "training_clear_error"
@@ -1,4 +1,9 @@
-from .image_data import ImageData
+from .image_data import ImageData, ImageArray
+from .image_data_cache import ImageDataCache, ImageDataCacheStats
 from .i_image_data_extractor import IImageDataExtractor
-from .aics_image_data_extractor import AICSImageDataExtractor
+from .aics_image_data_extractor import (
+    AICSImageDataExtractor,
+    decode_image_data,
+)
 from .fake_image_data_extractor import FakeImageDataExtractor
+from .coalescing_image_data_extractor import CoalescingImageDataExtractor
@@ -1,23 +1,105 @@
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Union
+
+import dask.array as da
+import numpy as np
 
 from allencell_ml_segmenter.core.image_data_extractor import (
     IImageDataExtractor,
     ImageData,
+    ImageDataCache,
+)
+from allencell_ml_segmenter.core.image_data_extractor.image_data_cache import (
+    CacheKey,
+)
+from allencell_ml_segmenter.core.image_metadata_index import (
+    ImageMetadataIndex,
+    ImageMetadata,
 )
 from bioio.bio_image import BioImage
 
 from allencell_ml_segmenter.utils.image_processing import (
-    set_all_nonzero_values_to,
+    load_label_image,
+    to_label_image,
 )
 
+if TYPE_CHECKING:
+    # imported for annotations only, the executor module imports this one
+    from allencell_ml_segmenter.core.task_executor import (
+        ProcessPoolTaskExecutor,
+    )
+
+
+def _open_chunked_per_z(img_path: Path) -> BioImage:
+    try:
+        return BioImage(img_path, chunk_dims=["Y", "X"])
+    except TypeError:
+        # reader does not support custom chunking
+        return BioImage(img_path)
+
+
+def decode_image_data(
+    img_path: Path, channel: int, seg: Optional[int]
+) -> ImageData:
+    """
+    Reads and decodes the image at :param img_path: (see
+    AICSImageDataExtractor.extract_image_data), without the cache. Module level
+    so that it can be run in the worker processes of a ProcessPoolTaskExecutor.
+    """
+    aics_img: BioImage
+    img_data: np.ndarray
+    if seg:
+        # if this image is a segmentation, replace all values in image with 1 or 2,
+        # so it renders correctly as a napari labels layer. Each Z slice is
+        # converted to uint8 as it is read, so the source dtype is never held
+        # for the whole image.
+        aics_img = _open_chunked_per_z(img_path)
+        if aics_img.dims.T > 1:
+            raise RuntimeError("Cannot load timeseries images")
+        img_data = load_label_image(
+            aics_img.get_image_dask_data("ZYX", C=channel), seg
+        )
+    else:
+        aics_img = BioImage(img_path)
+        if aics_img.dims.T > 1:
+            raise RuntimeError("Cannot load timeseries images")
+        img_data = aics_img.get_image_dask_data("ZYX", C=channel).compute()
+
+    return ImageData(
+        aics_img.dims.X,
+        aics_img.dims.Y,
+        aics_img.dims.Z,
+        aics_img.dims.C,
+        img_data,
+        img_path,
+    )
+
 
 class AICSImageDataExtractor(IImageDataExtractor):
     """
-    Extracts image data using aicsimageio.
+    Extracts image data using aicsimageio. Decoded image data is kept in the
+    process-wide ImageDataCache unless requested with cache=False, so repeated
+    requests for an unchanged file skip the decode. Requests for dims only are
+    served by the ImageMetadataIndex.
+    Lazy requests return a dask array chunked per Z slice, which is not cached.
+    Decodes run in worker processes once a decode executor is set; the cache
+    lives in the calling process only.
     """
 
     _instance = None
+    # set with set_decode_executor
+    _decode_executor: Optional["ProcessPoolTaskExecutor"] = None
+
+    def set_decode_executor(
+        self, executor: Optional["ProcessPoolTaskExecutor"]
+    ) -> None:
+        """
+        Sets the executor whose worker processes decode images that are not
+        cached, so that decoding does not hold the GIL of this process, or None
+        to decode on the calling thread.
+        """
+        self._decode_executor = executor
 
     def extract_image_data(
         self,
@@ -26,19 +108,49 @@ class AICSImageDataExtractor(IImageDataExtractor):
         dims: bool = True,
         np_data: bool = True,
         seg: Optional[int] = None,
+        lazy: bool = False,
+        cache: bool = True,
     ) -> ImageData:
+        if not np_data:
+            return self._extract_metadata_only(img_path, dims)
+        if lazy:
+            return self._extract_lazy(img_path, channel, dims, seg)
 
-        aics_img: BioImage = BioImage(img_path)
+        image_cache: ImageDataCache = ImageDataCache.global_instance()
+        cache_key: Optional[CacheKey] = ImageDataCache.make_key(
+            img_path, channel, seg
+        )
+        if cache_key is not None:
+            cached: Optional[ImageData] = image_cache.get(cache_key)
+            if cached is not None:
+                return self._with_requested_fields(cached, img_path, dims)
+
+        extracted: ImageData = (
+            self._decode_executor.run(
+                partial(decode_image_data, img_path, channel, seg)
+            )
+            if self._decode_executor is not None
+            else decode_image_data(img_path, channel, seg)
+        )
+        if cache_key is not None and cache:
+            image_cache.put(cache_key, extracted)
+        return self._with_requested_fields(extracted, img_path, dims)
+
+    @staticmethod
+    def _extract_lazy(
+        img_path: Path, channel: int, dims: bool, seg: Optional[int]
+    ) -> ImageData:
+        # chunk per Z slice so that viewing a slice only reads that slice
+        aics_img: BioImage = _open_chunked_per_z(img_path)
         if aics_img.dims.T > 1:
             raise RuntimeError("Cannot load timeseries images")
 
-        img_data = None
-        if np_data:
-            img_data = aics_img.get_image_dask_data("ZYX", C=channel).compute()
-            if seg:
-                # if this image is a segmentation, replace all values in image with 1 or 2,
-                # so it renders correctly as a napari labels layer.
-                img_data = set_all_nonzero_values_to(img_data, seg)
+        img_data: Union[np.ndarray, da.Array] = aics_img.get_image_dask_data(
+            "ZYX", C=channel
+        )
+        if seg:
+            # relabel each chunk as it is read rather than the whole image up front
+            img_data = to_label_image(img_data, seg)
 
         return ImageData(
             aics_img.dims.X if dims else None,
@@ -49,8 +161,41 @@ class AICSImageDataExtractor(IImageDataExtractor):
             img_path,
         )
 
+    @staticmethod
+    def _extract_metadata_only(img_path: Path, dims: bool) -> ImageData:
+        metadata: ImageMetadata = (
+            ImageMetadataIndex.global_instance().get_metadata(img_path)
+        )
+        if metadata.timepoints > 1:
+            raise RuntimeError("Cannot load timeseries images")
+        return ImageData(
+            metadata.dim_x if dims else None,
+            metadata.dim_y if dims else None,
+            metadata.dim_z if dims else None,
+            metadata.channels if dims else None,
+            None,
+            img_path,
+        )
+
+    @staticmethod
+    def _with_requested_fields(
+        img_data: ImageData, img_path: Path, dims: bool
+    ) -> ImageData:
+        """
+        Returns a new ImageData sharing :param img_data:'s array, with dims dropped
+        if :param dims: is False and the path set to :param img_path:.
+        """
+        return ImageData(
+            img_data.dim_x if dims else None,
+            img_data.dim_y if dims else None,
+            img_data.dim_z if dims else None,
+            img_data.channels if dims else None,
+            img_data.np_data,
+            img_path,
+        )
+
     @classmethod
-    def global_instance(cls) -> IImageDataExtractor:
+    def global_instance(cls) -> "AICSImageDataExtractor":
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
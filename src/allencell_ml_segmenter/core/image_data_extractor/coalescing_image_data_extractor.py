@@ -0,0 +1,77 @@
+import dataclasses
+from pathlib import Path
+from typing import Hashable, Optional
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    IImageDataExtractor,
+    ImageData,
+)
+from allencell_ml_segmenter.core.image_data_extractor.aics_image_data_extractor import (
+    AICSImageDataExtractor,
+)
+from allencell_ml_segmenter.core.request_coalescer import (
+    RequestCoalescer,
+    RequestCoalescerStats,
+)
+
+
+class CoalescingImageDataExtractor(IImageDataExtractor):
+    """
+    Wraps another extractor so that concurrent requests for the same image (same
+    path and extraction arguments) share a single extraction. Every caller gets
+    its own ImageData, but the array in it is shared. Unlike the other extractors,
+    instances wrapping a specific extractor can be created directly; global_instance
+    wraps the AICSImageDataExtractor.
+    """
+
+    _instance = None
+
+    def __init__(self, extractor: IImageDataExtractor) -> None:
+        self._extractor: IImageDataExtractor = extractor
+        self._coalescer: RequestCoalescer[ImageData] = RequestCoalescer()
+
+    def extract_image_data(
+        self,
+        img_path: Path,
+        channel: int = 0,
+        dims: bool = True,
+        np_data: bool = True,
+        seg: Optional[int] = None,
+        lazy: bool = False,
+        cache: bool = True,
+    ) -> ImageData:
+        key: Hashable = (
+            str(img_path.resolve()),
+            channel,
+            dims,
+            np_data,
+            seg,
+            lazy,
+            cache,
+        )
+        img_data: ImageData = self._coalescer.run(
+            key,
+            lambda: self._extractor.extract_image_data(
+                img_path,
+                channel=channel,
+                dims=dims,
+                np_data=np_data,
+                seg=seg,
+                lazy=lazy,
+                cache=cache,
+            ),
+        )
+        return dataclasses.replace(img_data, path=img_path)
+
+    def get_stats(self) -> RequestCoalescerStats:
+        """
+        Returns counts of requests, extractions actually run, and requests that
+        were served by an extraction that was already running.
+        """
+        return self._coalescer.get_stats()
+
+    @classmethod
+    def global_instance(cls) -> IImageDataExtractor:
+        if cls._instance is None:
+            cls._instance = cls(AICSImageDataExtractor.global_instance())
+        return cls._instance
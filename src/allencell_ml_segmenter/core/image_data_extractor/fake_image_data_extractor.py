@@ -2,9 +2,11 @@ from pathlib import Path
 from typing import Optional
 
 import numpy as np
+import dask.array as da
 from allencell_ml_segmenter.core.image_data_extractor import (
     IImageDataExtractor,
     ImageData,
+    ImageArray,
 )
 
 
@@ -22,13 +24,18 @@ class FakeImageDataExtractor(IImageDataExtractor):
         dims: bool = True,
         np_data: bool = True,
         seg: Optional[int] = None,
+        lazy: bool = False,
+        cache: bool = True,
     ) -> ImageData:
+        data: Optional[ImageArray] = None
+        if np_data:
+            data = da.zeros((5, 5)) if lazy else np.zeros((5, 5))
         return ImageData(
             1 if dims else None,
             2 if dims else None,
             3 if dims else None,
             4 if dims else None,
-            np.zeros((5, 5)) if np_data else None,
+            data,
             img_path,
         )
 
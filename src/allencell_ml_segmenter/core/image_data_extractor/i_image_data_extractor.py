@@ -19,9 +19,28 @@ class IImageDataExtractor(ABC):
         dims: bool = True,
         np_data: bool = True,
         seg: Optional[int] = None,
+        lazy: bool = False,
+        cache: bool = True,
     ) -> ImageData:
+        """
+        Extracts image data from the image at :param img_path:.
+        :param channel: channel to extract
+        :param dims: whether to include dims and number of channels
+        :param np_data: whether to include image data (ZYX)
+        :param seg: if provided, all nonzero values in the image data are set to this value
+        and the data is returned as a uint8 label image
+        :param lazy: if True, image data is a chunked dask array that is only read
+        from disk as slices are requested (e.g. by napari)
+        :param cache: if False, decoded image data is not kept in the image data
+        cache, e.g. for images read once that would evict the images being viewed
+        """
         pass
 
+    def __reduce__(self) -> Any:
+        # unpickles to the singleton of the receiving process, so bound methods
+        # can be sent to ProcessPoolTaskExecutor workers
+        return (type(self).global_instance, ())
+
     @classmethod
     @abstractmethod
     def global_instance(cls) -> Any:
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
 from pathlib import Path
 import numpy as np
-from typing import Optional
+import dask.array as da
+from typing import Optional, Union
+
+# image arrays are numpy arrays, or chunked dask arrays when extracted lazily
+ImageArray = Union[np.ndarray, da.Array]
 
 
 @dataclass
@@ -10,5 +14,5 @@ class ImageData:
     dim_y: Optional[int]
     dim_z: Optional[int]
     channels: Optional[int]
-    np_data: Optional[np.ndarray]
+    np_data: Optional[ImageArray]
     path: Path
@@ -0,0 +1,151 @@
+import os
+import threading
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from allencell_ml_segmenter.core.image_data_extractor import ImageData
+
+# (resolved path, mtime in ns, size in bytes, channel, seg)
+CacheKey = Tuple[str, int, int, int, Optional[int]]
+
+# 2 GiB
+DEFAULT_MAX_BYTES: int = 2 * 1024**3
+
+
+@dataclass
+class ImageDataCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    num_entries: int
+    size_bytes: int
+    max_bytes: int
+
+
+class ImageDataCache:
+    """
+    Process-wide, thread-safe LRU cache of decoded ImageData. The total size of
+    the cached arrays is kept under a configurable byte budget; the least recently
+    used entries are evicted first. Cached arrays are shared between callers, so
+    they are made read-only when they enter the cache; callers that edit an
+    array, e.g. a labels layer, must copy it. The budget is a user setting
+    (IUserSettings.get_image_cache_max_bytes), applied when the app starts.
+    """
+
+    _instance = None
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, ImageData] = OrderedDict()
+        self._max_bytes: int = max_bytes
+        self._size_bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    @staticmethod
+    def make_key(
+        img_path: Path, channel: int = 0, seg: Optional[int] = None
+    ) -> Optional[CacheKey]:
+        """
+        Returns the cache key for the image at :param img_path:, or None if the
+        file cannot be stat'd. The key includes the file's mtime and size so that
+        entries are invalidated when the file changes on disk.
+        """
+        try:
+            resolved: Path = img_path.resolve()
+            stat: os.stat_result = resolved.stat()
+        except OSError:
+            return None
+        return (str(resolved), stat.st_mtime_ns, stat.st_size, channel, seg)
+
+    def get(self, key: CacheKey) -> Optional[ImageData]:
+        """
+        Returns the cached ImageData for :param key: and marks it as most recently
+        used, or None on a miss.
+        """
+        with self._lock:
+            img_data: Optional[ImageData] = self._entries.get(key)
+            if img_data is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return img_data
+
+    def put(self, key: CacheKey, img_data: ImageData) -> None:
+        """
+        Caches :param img_data: under :param key:, evicting least recently used
+        entries until the cache fits in its byte budget. Image data without a
+        decoded numpy array, or with an array larger than the whole budget, is
+        not cached.
+        """
+        if not isinstance(img_data.np_data, np.ndarray):
+            return
+        nbytes: int = img_data.np_data.nbytes
+        with self._lock:
+            if nbytes > self._max_bytes:
+                return
+            img_data.np_data.flags.writeable = False
+            self._remove(key)
+            self._entries[key] = img_data
+            self._size_bytes += nbytes
+            self._evict_to(self._max_bytes)
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """
+        Sets the byte budget of the cache, evicting entries as necessary.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative")
+        with self._lock:
+            self._max_bytes = max_bytes
+            self._evict_to(max_bytes)
+
+    def get_max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get_size_bytes(self) -> int:
+        return self._size_bytes
+
+    def get_stats(self) -> ImageDataCacheStats:
+        with self._lock:
+            return ImageDataCacheStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._entries),
+                self._size_bytes,
+                self._max_bytes,
+            )
+
+    def clear(self) -> None:
+        """
+        Drops all entries. Hit/miss/eviction counters are left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        # caller must hold self._lock
+        old: Optional[ImageData] = self._entries.pop(key, None)
+        if old is not None and old.np_data is not None:
+            self._size_bytes -= int(old.np_data.nbytes)
+
+    def _evict_to(self, max_bytes: int) -> None:
+        # caller must hold self._lock
+        while self._size_bytes > max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            if evicted.np_data is not None:
+                self._size_bytes -= int(evicted.np_data.nbytes)
+            self._evictions += 1
+
+    @classmethod
+    def global_instance(cls) -> "ImageDataCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
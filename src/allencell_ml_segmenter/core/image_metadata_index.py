@@ -0,0 +1,202 @@
+import atexit
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any
+
+from bioio import BioImage
+
+from allencell_ml_segmenter.core.request_coalescer import (
+    RequestCoalescer,
+    RequestCoalescerStats,
+)
+
+# file of the index within the experiments home; the leading dot keeps it out
+# of the experiments list
+INDEX_FILE_NAME: str = ".image_metadata_index.json"
+INDEX_VERSION: int = 2
+# new entries are written this long after the first one since the last write
+FLUSH_DELAY_SECONDS: float = 5.0
+
+
+@dataclass
+class ImageMetadata:
+    """
+    Metadata of a single image file, along with the fingerprint (mtime and size)
+    of the file it was read from.
+    """
+
+    dim_x: int
+    dim_y: int
+    dim_z: int
+    channels: int
+    timepoints: int
+    dtype: str
+    physical_pixel_sizes: List[Optional[float]]  # Z, Y, X
+    mtime_ns: int
+    size: int
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size
+
+
+def read_image_metadata(img_path: Path) -> ImageMetadata:
+    """
+    Reads metadata for the image at :param img_path: by opening it with bioio.
+    """
+    stat: os.stat_result = img_path.stat()
+    img: BioImage = BioImage(img_path)
+    return ImageMetadata(
+        img.dims.X,
+        img.dims.Y,
+        img.dims.Z,
+        img.dims.C,
+        img.dims.T,
+        str(img.dtype),
+        list(img.physical_pixel_sizes),
+        stat.st_mtime_ns,
+        stat.st_size,
+    )
+
+
+class ImageMetadataIndex:
+    """
+    Persistent index of image metadata, keyed by image path. Entries are
+    invalidated when the mtime or size of an image changes, so each image only
+    needs to be opened once. The index is kept in memory until it is given a
+    file to persist to (see set_index_path); new entries are then written to it
+    in batches, at most once every :param flush_delay: seconds, rather than
+    after every read.
+    """
+
+    _instance = None
+
+    def __init__(
+        self,
+        index_path: Optional[Path] = None,
+        read_metadata: Callable[[Path], ImageMetadata] = read_image_metadata,
+        flush_delay: float = FLUSH_DELAY_SECONDS,
+    ) -> None:
+        self._read_metadata: Callable[[Path], ImageMetadata] = read_metadata
+        self._flush_delay: float = flush_delay
+        self._lock: threading.Lock = threading.Lock()
+        # concurrent misses for the same image share a single read
+        self._reads: RequestCoalescer[ImageMetadata] = RequestCoalescer()
+        # {resolved image path: metadata}
+        self._entries: Dict[str, ImageMetadata] = {}
+        self._index_path: Optional[Path] = None
+        self._dirty: bool = False
+        self._flush_timer: Optional[threading.Timer] = None
+        if index_path is not None:
+            self.set_index_path(index_path)
+
+    def set_index_path(self, index_path: Optional[Path]) -> None:
+        """
+        Persists the index to :param index_path: from now on, adding the
+        entries already saved there, or keeps it in memory only if None.
+        """
+        loaded: Dict[str, ImageMetadata] = (
+            self._load(index_path) if index_path is not None else {}
+        )
+        with self._lock:
+            self._index_path = index_path
+            for path, metadata in loaded.items():
+                self._entries.setdefault(path, metadata)
+            # entries read before there was a file to save them to
+            self._dirty = self._dirty or len(self._entries) > len(loaded)
+        if self._dirty:
+            self._schedule_flush()
+
+    def get_metadata(self, img_path: Path) -> ImageMetadata:
+        """
+        Returns metadata for the image at :param img_path:, reading it from the
+        image (and persisting it) only if there is no up-to-date index entry.
+        """
+        img_path = img_path.resolve()
+        stat: os.stat_result = img_path.stat()
+        with self._lock:
+            cached: Optional[ImageMetadata] = self._entries.get(str(img_path))
+        if cached is not None and cached.matches(stat):
+            return cached
+
+        return self._reads.run(
+            (str(img_path), stat.st_mtime_ns, stat.st_size),
+            lambda: self._read_and_store(img_path),
+        )
+
+    def get_read_stats(self) -> RequestCoalescerStats:
+        """
+        Returns counts of metadata reads requested by get_metadata, reads actually
+        run, and requests that shared a read that was already running.
+        """
+        return self._reads.get_stats()
+
+    def _read_and_store(self, img_path: Path) -> ImageMetadata:
+        metadata: ImageMetadata = self._read_metadata(img_path)
+        with self._lock:
+            self._entries[str(img_path)] = metadata
+            self._dirty = True
+        self._schedule_flush()
+        return metadata
+
+    def _schedule_flush(self) -> None:
+        with self._lock:
+            if self._index_path is None or self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self._flush_delay, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Writes the index to its file if it has new entries.
+        """
+        with self._lock:
+            self._flush_timer = None
+            index_path: Optional[Path] = self._index_path
+            if index_path is None or not self._dirty:
+                return
+            self._dirty = False
+            snapshot: Dict[str, Any] = {
+                "version": INDEX_VERSION,
+                "entries": {
+                    path: asdict(md) for path, md in self._entries.items()
+                },
+            }
+
+        tmp: Path = index_path.with_name(
+            f"{index_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w") as fw:
+                json.dump(snapshot, fw)
+            os.replace(tmp, index_path)
+        except OSError:
+            # unwritable location, keep in memory only
+            tmp.unlink(missing_ok=True)
+
+    @staticmethod
+    def _load(index_path: Path) -> Dict[str, ImageMetadata]:
+        try:
+            with open(index_path) as fr:
+                contents: Dict[str, Any] = json.load(fr)
+            if contents.get("version") != INDEX_VERSION:
+                return {}
+            return {
+                path: ImageMetadata(**entry)
+                for path, entry in contents["entries"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError):
+            # missing or corrupt index, start from an empty one
+            return {}
+
+    @classmethod
+    def global_instance(cls) -> "ImageMetadataIndex":
+        if cls._instance is None:
+            cls._instance = cls()
+            # entries read since the last flush
+            atexit.register(cls._instance.flush)
+        return cls._instance
@@ -0,0 +1,75 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class RequestCoalescerStats:
+    requests: int
+    # requests that ran their function
+    executions: int
+    # requests that waited on an identical request instead of running
+    coalesced: int
+    in_flight: int
+
+
+class RequestCoalescer(Generic[T]):
+    """
+    Shares the work of concurrent requests with the same key: the first request
+    for a key runs its function, and requests for that key made while it is still
+    running wait for and return its result (or raise its exception). Results are
+    not kept once a request finishes, so this does not replace a cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._requests: int = 0
+        self._executions: int = 0
+        self._coalesced: int = 0
+
+    def run(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Returns the result of :param fn:, or of the function of an identical
+        request for :param key: that is already running.
+        """
+        with self._lock:
+            self._requests += 1
+            existing: Optional[Future] = self._in_flight.get(key)
+            is_leader: bool = existing is None
+            future: Future = Future() if existing is None else existing
+            if is_leader:
+                self._in_flight[key] = future
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not is_leader:
+            return future.result()
+
+        try:
+            result: T = fn()
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def get_stats(self) -> RequestCoalescerStats:
+        with self._lock:
+            return RequestCoalescerStats(
+                self._requests,
+                self._executions,
+                self._coalesced,
+                len(self._in_flight),
+            )
+
+    def _finish(self, key: Hashable) -> None:
+        # requests from here on start a new execution
+        with self._lock:
+            del self._in_flight[key]
@@ -1,3 +1,11 @@
+from .task_handle import (
+    TaskHandle,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    PRIORITY_HIGH,
+)
 from .i_task_executor import ITaskExecutor
 from .napari_thread_task_executor import NapariThreadTaskExecutor
 from .synchro_task_executor import SynchroTaskExecutor
+from .pooled_task_executor import PooledTaskExecutor, PooledTaskExecutorStats
+from .process_pool_task_executor import ProcessPoolTaskExecutor
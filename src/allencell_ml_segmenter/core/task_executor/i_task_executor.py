@@ -1,5 +1,11 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Callable, Optional, Any
+from typing import Callable, Dict, Optional, Any, Set
+
+from allencell_ml_segmenter.core.task_executor.task_handle import (
+    TaskHandle,
+    PRIORITY_NORMAL,
+)
 
 
 class ITaskExecutor(ABC):
@@ -7,6 +13,13 @@ class ITaskExecutor(ABC):
     A TaskExecutor will run the tasks provided to exec() at some point (may be sync or async).
     """
 
+    # {group: unfinished tasks in that group}, created on first use since
+    # singletons are constructed without calling __init__
+    _task_groups: Optional[Dict[str, Set[TaskHandle]]] = None
+    # tasks are added to and removed from groups on the threads they are
+    # started and finished on, so the groups are only touched under this lock
+    _task_groups_lock: threading.Lock = threading.Lock()
+
     def __init__(self) -> None:
         raise RuntimeError(
             "Cannot initialize new singleton, please use .global_instance() instead"
@@ -20,7 +33,9 @@ class ITaskExecutor(ABC):
         on_finish: Optional[Callable[[], None]] = None,
         on_return: Optional[Callable[[Any], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
-    ) -> None:
+        priority: int = PRIORITY_NORMAL,
+        group: Optional[str] = None,
+    ) -> TaskHandle:
         """
         Execute the provided task. Note that on_return must take the return type of task as a param.
         :param task: task to execute
@@ -28,9 +43,51 @@ class ITaskExecutor(ABC):
         :param on_finish: runs upon the task finishing
         :param on_return: runs upon the task returning, must take return type of task as its only param
         :param on_error: runs upon the task throwing an Exception, must take an Exception as its only param
+        :param priority: tasks with higher priority are started before queued tasks with lower priority
+        :param group: if provided, the task can be cancelled along with the rest of its group
+        using cancel_group
+        :return: handle that can be used to cancel the task
         """
         pass
 
+    def cancel_group(self, group: str) -> None:
+        """
+        Cancels every unfinished task that was started with :param group:.
+        """
+        with self._task_groups_lock:
+            handles: Set[TaskHandle] = self._get_task_groups().pop(
+                group, set()
+            )
+        # cancelled outside the lock, as cancel callbacks may finish tasks
+        for handle in handles:
+            handle.cancel()
+
+    def _add_to_group(self, handle: TaskHandle) -> None:
+        group: Optional[str] = handle.get_group()
+        if group is None:
+            return
+        with self._task_groups_lock:
+            if not handle.is_done():
+                self._get_task_groups().setdefault(group, set()).add(handle)
+
+    def _remove_from_group(self, handle: TaskHandle) -> None:
+        group: Optional[str] = handle.get_group()
+        if group is None:
+            return
+        with self._task_groups_lock:
+            task_groups: Dict[str, Set[TaskHandle]] = self._get_task_groups()
+            handles: Optional[Set[TaskHandle]] = task_groups.get(group)
+            if handles is not None:
+                handles.discard(handle)
+                if not handles:
+                    del task_groups[group]
+
+    def _get_task_groups(self) -> Dict[str, Set[TaskHandle]]:
+        # caller must hold self._task_groups_lock
+        if self._task_groups is None:
+            self._task_groups = {}
+        return self._task_groups
+
     @classmethod
     @abstractmethod
     def global_instance(cls):  # type: ignore
@@ -0,0 +1,22 @@
+from typing import Callable
+
+from qtpy.QtCore import QObject, Signal
+
+
+class MainThreadDispatcher(QObject):
+    """
+    Runs callables on the thread this object was created on (the Qt main thread).
+    """
+
+    _dispatch_requested: Signal = Signal(object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        # emitting from a worker thread queues the call on this object's thread
+        self._dispatch_requested.connect(self._run)
+
+    def dispatch(self, fn: Callable[[], None]) -> None:
+        self._dispatch_requested.emit(fn)
+
+    def _run(self, fn: Callable[[], None]) -> None:
+        fn()
@@ -1,11 +1,36 @@
 from allencell_ml_segmenter.core.task_executor import ITaskExecutor
-from typing import Callable, Optional, Any
+from allencell_ml_segmenter.core.task_executor.task_handle import (
+    TaskHandle,
+    PRIORITY_NORMAL,
+)
+from typing import Callable, Optional, Any, Set
 from napari.qt.threading import FunctionWorker, create_worker  # type: ignore
+from qtpy.QtCore import QThreadPool
+
+
+def _run_unless_cancelled(handle: TaskHandle, task: Callable[[], Any]) -> Any:
+    # tasks cancelled while queued are started by the pool, but skip the work
+    if handle.is_cancelled():
+        return None
+    return task()
+
+
+def _unless_cancelled(
+    handle: TaskHandle, callback: Callable[..., Any]
+) -> Callable[..., None]:
+    def wrapped(*args: Any) -> None:
+        if not handle.is_cancelled():
+            callback(*args)
+
+    return wrapped
 
 
 class NapariThreadTaskExecutor(ITaskExecutor):
 
     _instance = None
+    # workers are started on the thread pool directly so that they can be given
+    # a priority, so references are kept here until they finish
+    _workers: Set[FunctionWorker] = set()
 
     def exec(
         self,
@@ -14,17 +39,41 @@ class NapariThreadTaskExecutor(ITaskExecutor):
         on_finish: Optional[Callable[[], None]] = None,
         on_return: Optional[Callable[[Any], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
-    ) -> None:
-        worker: FunctionWorker = create_worker(task)
+        priority: int = PRIORITY_NORMAL,
+        group: Optional[str] = None,
+    ) -> TaskHandle:
+        handle: TaskHandle = TaskHandle(priority, group)
+        worker: FunctionWorker = create_worker(
+            _run_unless_cancelled, handle, task
+        )
         if on_start is not None:
-            worker.started.connect(on_start)
+            worker.started.connect(_unless_cancelled(handle, on_start))
         if on_finish is not None:
-            worker.finished.connect(on_finish)
+            worker.finished.connect(_unless_cancelled(handle, on_finish))
         if on_return is not None:
-            worker.returned.connect(on_return)
+            worker.returned.connect(_unless_cancelled(handle, on_return))
         if on_error is not None:
-            worker.errored.connect(on_error)
-        worker.start()
+            worker.errored.connect(_unless_cancelled(handle, on_error))
+        worker.finished.connect(
+            lambda: self._on_worker_finished(handle, worker)
+        )
+        # aborted workers do not emit returned
+        handle.add_cancel_callback(worker.quit)
+
+        self._add_to_group(handle)
+        self._workers.add(worker)
+        thread_pool: Optional[QThreadPool] = QThreadPool.globalInstance()
+        if thread_pool is None:
+            raise RuntimeError("Qt global thread pool is unavailable")
+        thread_pool.start(worker, priority)
+        return handle
+
+    def _on_worker_finished(
+        self, handle: TaskHandle, worker: FunctionWorker
+    ) -> None:
+        handle.set_done()
+        self._remove_from_group(handle)
+        self._workers.discard(worker)
 
     @classmethod
     def global_instance(cls) -> ITaskExecutor:
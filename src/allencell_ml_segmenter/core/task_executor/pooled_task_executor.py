@@ -0,0 +1,206 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from allencell_ml_segmenter.core.task_executor import ITaskExecutor
+from allencell_ml_segmenter.core.task_executor.main_thread_dispatcher import (
+    MainThreadDispatcher,
+)
+from allencell_ml_segmenter.core.task_executor.task_handle import (
+    TaskHandle,
+    PRIORITY_NORMAL,
+)
+
+DEFAULT_MAX_WORKERS: int = 4
+# number of most recent task wall times kept for stats
+WALL_TIME_HISTORY: int = 100
+
+
+@dataclass
+class PooledTaskExecutorStats:
+    max_workers: int
+    queue_depth: int
+    active_tasks: int
+    completed_tasks: int
+    cancelled_tasks: int
+    # wall times (seconds) of the most recently completed tasks, oldest first
+    recent_wall_times: List[float]
+
+
+@dataclass
+class _QueuedTask:
+    handle: TaskHandle
+    task: Callable[[], Any]
+    on_start: Optional[Callable[[], Any]]
+    on_finish: Optional[Callable[[], None]]
+    on_return: Optional[Callable[[Any], None]]
+    on_error: Optional[Callable[[Exception], None]]
+
+
+class PooledTaskExecutor(ITaskExecutor):
+    """
+    Runs tasks on a bounded pool of worker threads. Queued tasks are started in
+    priority order, and in submission order within a priority. Callbacks are
+    always run on the Qt main thread. Unlike the other executors, instances with
+    their own pool can be created directly; global_instance returns the shared pool.
+    """
+
+    _instance = None
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers: int = max_workers
+        self._dispatcher: MainThreadDispatcher = MainThreadDispatcher()
+        self._lock: threading.Condition = threading.Condition()
+        # heap of (-priority, submission order, task)
+        self._queue: List[Tuple[int, int, _QueuedTask]] = []
+        self._counter: itertools.count = itertools.count()
+        self._num_threads: int = 0
+        self._idle_threads: int = 0
+        self._active_tasks: int = 0
+        self._completed_tasks: int = 0
+        self._cancelled_tasks: int = 0
+        self._wall_times: Deque[float] = deque(maxlen=WALL_TIME_HISTORY)
+
+    def exec(
+        self,
+        task: Callable[[], Any],
+        on_start: Optional[Callable[[], Any]] = None,
+        on_finish: Optional[Callable[[], None]] = None,
+        on_return: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        priority: int = PRIORITY_NORMAL,
+        group: Optional[str] = None,
+    ) -> TaskHandle:
+        handle: TaskHandle = TaskHandle(priority, group)
+        self._add_to_group(handle)
+        queued: _QueuedTask = _QueuedTask(
+            handle, task, on_start, on_finish, on_return, on_error
+        )
+        with self._lock:
+            heapq.heappush(
+                self._queue, (-priority, next(self._counter), queued)
+            )
+            if (
+                self._num_threads < self._max_workers
+                and len(self._queue) > self._idle_threads
+            ):
+                self._start_thread()
+            self._lock.notify()
+        return handle
+
+    def set_max_workers(self, max_workers: int) -> None:
+        """
+        Sets the maximum number of tasks that run at once. Lowering it lets running
+        tasks finish; surplus threads exit once they are idle.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        with self._lock:
+            self._max_workers = max_workers
+            while (
+                self._num_threads < self._max_workers
+                and len(self._queue) > self._idle_threads
+            ):
+                self._start_thread()
+            self._lock.notify_all()
+
+    def get_max_workers(self) -> int:
+        return self._max_workers
+
+    def get_stats(self) -> PooledTaskExecutorStats:
+        with self._lock:
+            return PooledTaskExecutorStats(
+                self._max_workers,
+                len(self._queue),
+                self._active_tasks,
+                self._completed_tasks,
+                self._cancelled_tasks,
+                list(self._wall_times),
+            )
+
+    def _start_thread(self) -> None:
+        # must be called with self._lock held
+        self._num_threads += 1
+        threading.Thread(
+            target=self._work, name="pooled_task_executor", daemon=True
+        ).start()
+
+    def _work(self) -> None:
+        while True:
+            with self._lock:
+                self._idle_threads += 1
+                while (
+                    not self._queue and self._num_threads <= self._max_workers
+                ):
+                    self._lock.wait()
+                self._idle_threads -= 1
+                if self._num_threads > self._max_workers:
+                    self._num_threads -= 1
+                    return
+                queued: _QueuedTask = heapq.heappop(self._queue)[2]
+                if queued.handle.is_cancelled():
+                    self._cancelled_tasks += 1
+                    self._dispatcher.dispatch(partial(self._on_done, queued))
+                    continue
+                self._active_tasks += 1
+            self._run(queued)
+
+    def _run(self, queued: _QueuedTask) -> None:
+        if queued.on_start is not None:
+            self._dispatch_unless_cancelled(queued.handle, queued.on_start)
+
+        start: float = time.perf_counter()
+        result: Any = None
+        error: Optional[Exception] = None
+        try:
+            result = queued.task()
+        except Exception as e:
+            error = e
+        wall_time: float = time.perf_counter() - start
+
+        with self._lock:
+            self._active_tasks -= 1
+            self._completed_tasks += 1
+            self._wall_times.append(wall_time)
+
+        if error is None:
+            if queued.on_return is not None:
+                on_return: Callable[[Any], None] = queued.on_return
+                self._dispatch_unless_cancelled(
+                    queued.handle, lambda: on_return(result)
+                )
+        elif queued.on_error is not None:
+            on_error: Callable[[Exception], None] = queued.on_error
+            exception: Exception = error
+            self._dispatch_unless_cancelled(
+                queued.handle, lambda: on_error(exception)
+            )
+        if queued.on_finish is not None:
+            self._dispatch_unless_cancelled(queued.handle, queued.on_finish)
+        self._dispatcher.dispatch(lambda: self._on_done(queued))
+
+    def _dispatch_unless_cancelled(
+        self, handle: TaskHandle, fn: Callable[[], Any]
+    ) -> None:
+        def run() -> None:
+            if not handle.is_cancelled():
+                fn()
+
+        self._dispatcher.dispatch(run)
+
+    def _on_done(self, queued: _QueuedTask) -> None:
+        queued.handle.set_done()
+        self._remove_from_group(queued.handle)
+
+    @classmethod
+    def global_instance(cls) -> ITaskExecutor:
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
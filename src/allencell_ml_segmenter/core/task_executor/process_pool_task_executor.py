@@ -0,0 +1,174 @@
+import dataclasses
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional, Tuple
+
+import numpy as np
+
+from allencell_ml_segmenter.core.image_data_extractor import ImageData
+
+# leave a core free for the main thread and napari
+DEFAULT_MAX_WORKERS: int = max(1, (os.cpu_count() or 2) - 1)
+
+
+@dataclass(frozen=True)
+class _SharedArray:
+    """
+    Reference to an array that a worker process has copied into shared memory.
+    """
+
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+@dataclass(frozen=True)
+class _SharedImageData:
+    """
+    ImageData whose array a worker process has copied into shared memory.
+    """
+
+    image_data: ImageData
+    array: _SharedArray
+
+
+def _array_to_shared(array: np.ndarray) -> _SharedArray:
+    # shared memory blocks cannot be empty
+    shm: SharedMemory = SharedMemory(create=True, size=max(array.nbytes, 1))
+    try:
+        np.ndarray(array.shape, array.dtype, buffer=shm.buf)[...] = array
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    return _SharedArray(shm.name, array.shape, array.dtype.str)
+
+
+def _array_from_shared(shared: _SharedArray) -> np.ndarray:
+    shm: SharedMemory = SharedMemory(name=shared.name)
+    try:
+        return np.ndarray(
+            shared.shape, np.dtype(shared.dtype), buffer=shm.buf
+        ).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _to_shared(result: Any) -> Any:
+    """
+    Moves the array in :param result: (a numpy array, or ImageData holding one)
+    into shared memory. Any other result is returned as is and gets pickled.
+    """
+    if isinstance(result, np.ndarray):
+        return _array_to_shared(result)
+    if isinstance(result, ImageData) and isinstance(
+        result.np_data, np.ndarray
+    ):
+        return _SharedImageData(
+            dataclasses.replace(result, np_data=None),
+            _array_to_shared(result.np_data),
+        )
+    return result
+
+
+def _from_shared(result: Any) -> Any:
+    """
+    Inverse of _to_shared, also releases the shared memory.
+    """
+    if isinstance(result, _SharedArray):
+        return _array_from_shared(result)
+    if isinstance(result, _SharedImageData):
+        return dataclasses.replace(
+            result.image_data, np_data=_array_from_shared(result.array)
+        )
+    return result
+
+
+def _run_in_worker(task: Callable[[], Any]) -> Any:
+    # runs in the worker process
+    return _to_shared(task())
+
+
+class ProcessPoolTaskExecutor:
+    """
+    Runs tasks in a pool of worker processes, for CPU heavy work that holds the GIL
+    (e.g. decoding compressed images) and so does not scale on threads. Tasks and
+    their non-array results must be picklable, so use functools.partial of module
+    level functions or bound methods rather than lambdas. Numpy array results
+    (also as ImageData.np_data) are returned through shared memory instead of
+    being pickled through the result pipe.
+
+    Tasks are run from worker threads of another executor (see run), which
+    order them, so unlike the ITaskExecutors there is no queue or callbacks.
+    Instances with their own pool can be created directly. Worker processes
+    are started on first use.
+    """
+
+    _instance = None
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._max_workers: int = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def run(self, task: Callable[[], Any]) -> Any:
+        """
+        Runs :param task: in a worker process and returns its result, blocking
+        the calling thread until it is done. For callers already on a worker
+        thread, e.g. a task of PooledTaskExecutor, that want CPU heavy work off
+        the GIL of this process.
+        """
+        with self._lock:
+            future: Future
+            try:
+                future = self._get_pool().submit(_run_in_worker, task)
+            except BrokenProcessPool:
+                # a worker died since the last task finished
+                self._pool = None
+                future = self._get_pool().submit(_run_in_worker, task)
+        try:
+            return _from_shared(future.result())
+        except BrokenProcessPool:
+            # a worker died, start a new pool for the next tasks
+            with self._lock:
+                self._pool = None
+            raise
+
+    def get_max_workers(self) -> int:
+        return self._max_workers
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes once running tasks are done. New processes
+        are started if more tasks are run.
+        """
+        with self._lock:
+            pool: Optional[ProcessPoolExecutor] = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        # must be called with self._lock held
+        if self._pool is None:
+            # fork is unsafe with Qt and the worker threads of this process
+            self._pool = ProcessPoolExecutor(
+                self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    @classmethod
+    def global_instance(cls) -> "ProcessPoolTaskExecutor":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
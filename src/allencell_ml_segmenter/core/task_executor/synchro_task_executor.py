@@ -1,8 +1,16 @@
 from allencell_ml_segmenter.core.task_executor import ITaskExecutor
+from allencell_ml_segmenter.core.task_executor.task_handle import (
+    TaskHandle,
+    PRIORITY_NORMAL,
+)
 from typing import Callable, Optional, Any
 
 
 class SynchroTaskExecutor(ITaskExecutor):
+    """
+    Runs tasks immediately on the calling thread. Returned handles are always done,
+    so priority and group have no effect.
+    """
 
     _instance = None
 
@@ -13,6 +21,23 @@ class SynchroTaskExecutor(ITaskExecutor):
         on_finish: Optional[Callable[[], None]] = None,
         on_return: Optional[Callable[[Any], None]] = None,
         on_error: Optional[Callable[[Exception], None]] = None,
+        priority: int = PRIORITY_NORMAL,
+        group: Optional[str] = None,
+    ) -> TaskHandle:
+        handle: TaskHandle = TaskHandle(priority, group)
+        try:
+            self._run(task, on_start, on_finish, on_return, on_error)
+        finally:
+            handle.set_done()
+        return handle
+
+    @staticmethod
+    def _run(
+        task: Callable[[], Any],
+        on_start: Optional[Callable[[], Any]],
+        on_finish: Optional[Callable[[], None]],
+        on_return: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[Exception], None]],
     ) -> None:
         if on_start is not None:
             on_start()
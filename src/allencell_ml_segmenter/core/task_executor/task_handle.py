@@ -0,0 +1,60 @@
+import threading
+from typing import Callable, List, Optional
+
+# priorities for ITaskExecutor.exec, tasks with higher priority are started first
+PRIORITY_LOW: int = -10
+PRIORITY_NORMAL: int = 0
+PRIORITY_HIGH: int = 10
+
+
+class TaskHandle:
+    """
+    Handle to a task passed to ITaskExecutor.exec. Cancelling a task that has not
+    started yet prevents it from running; cancelling a running task does not
+    interrupt it, but none of its callbacks will be run.
+    """
+
+    def __init__(
+        self, priority: int = PRIORITY_NORMAL, group: Optional[str] = None
+    ) -> None:
+        self._priority: int = priority
+        self._group: Optional[str] = group
+        self._cancelled: threading.Event = threading.Event()
+        self._done: threading.Event = threading.Event()
+        self._cancel_callbacks: List[Callable[[], None]] = []
+
+    def cancel(self) -> None:
+        """
+        Cancels this task. Has no effect if the task is already done.
+        """
+        if self._done.is_set() or self._cancelled.is_set():
+            return
+        self._cancelled.set()
+        for callback in self._cancel_callbacks:
+            callback()
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def is_done(self) -> bool:
+        """
+        Returns True once the task has finished running or has been skipped
+        because it was cancelled.
+        """
+        return self._done.is_set()
+
+    def get_priority(self) -> int:
+        return self._priority
+
+    def get_group(self) -> Optional[str]:
+        return self._group
+
+    def add_cancel_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Registers :param callback: to be run when this task is cancelled. Used by
+        executors to abort the underlying worker.
+        """
+        self._cancel_callbacks.append(callback)
+
+    def set_done(self) -> None:
+        self._done.set()
@@ -0,0 +1,222 @@
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    AICSImageDataExtractor,
+    IImageDataExtractor,
+    ImageArray,
+)
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.curation_model import ImageType
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+    compute_agreement,
+)
+from allencell_ml_segmenter.utils.pairing_index import PairingIndex
+
+DEFAULT_MAX_WORKERS: int = os.cpu_count() or 1
+
+
+class BaseImageRule(Enum):
+    """
+    How the base segmentation of each image is chosen when seg2 is given.
+    """
+
+    SEG1 = "seg1"
+    SEG2 = "seg2"
+    # the segmentation with the larger foreground
+    MORE_FOREGROUND = "more_foreground"
+    # the segmentation with the smaller foreground
+    LESS_FOREGROUND = "less_foreground"
+
+
+@dataclass(frozen=True)
+class CurationRules:
+    # images whose base segmentation has a smaller fraction of foreground
+    # voxels are not used
+    min_foreground_fraction: float = 0.0
+    # images whose seg1 and seg2 Dice score is lower are not used; needs seg2
+    min_agreement: Optional[float] = None
+    base_image_rule: BaseImageRule = BaseImageRule.SEG1
+
+
+@dataclass(frozen=True)
+class SegmentationStats:
+    seg1_foreground_fraction: float
+    # None when there is no seg2
+    seg2_foreground_fraction: Optional[float]
+    agreement: Optional[AgreementScore]
+
+
+def _read_foreground(
+    img_data_extractor: IImageDataExtractor, path: Path, channel: int
+) -> np.ndarray:
+    data: Optional[ImageArray] = img_data_extractor.extract_image_data(
+        path, channel=channel, dims=False, seg=1
+    ).np_data
+    if data is None:
+        raise RuntimeError(f"Could not read segmentation {path}")
+    return np.asarray(data)
+
+
+def compute_segmentation_stats(
+    img_data_extractor: IImageDataExtractor,
+    seg1_path: Path,
+    seg2_path: Optional[Path],
+    seg1_channel: int,
+    seg2_channel: int,
+) -> SegmentationStats:
+    """
+    Reads the segmentations of an image and returns what curation rules are
+    applied to. Module level so that it can be run in worker processes.
+    """
+    seg1: np.ndarray = _read_foreground(
+        img_data_extractor, seg1_path, seg1_channel
+    )
+    seg1_fraction: float = np.count_nonzero(seg1) / max(seg1.size, 1)
+    if seg2_path is None:
+        return SegmentationStats(seg1_fraction, None, None)
+    seg2: np.ndarray = _read_foreground(
+        img_data_extractor, seg2_path, seg2_channel
+    )
+    seg2_fraction: float = np.count_nonzero(seg2) / max(seg2.size, 1)
+    return SegmentationStats(
+        seg1_fraction, seg2_fraction, compute_agreement(seg1, seg2)
+    )
+
+
+def apply_curation_rules(
+    raw_path: Path,
+    seg1_path: Path,
+    seg2_path: Optional[Path],
+    stats: Optional[SegmentationStats],
+    rules: CurationRules,
+) -> CurationRecord:
+    """
+    Returns the curation record of an image given the :param stats: of its
+    segmentations. Images without stats (e.g. that could not be read) are not
+    used.
+    """
+    if stats is None:
+        return CurationRecord(
+            raw_path, seg1_path, seg2_path, None, None, "seg1", False
+        )
+
+    base_image: str = "seg1"
+    base_fraction: float = stats.seg1_foreground_fraction
+    if seg2_path is not None and stats.seg2_foreground_fraction is not None:
+        seg2_fraction: float = stats.seg2_foreground_fraction
+        use_seg2: bool = (
+            rules.base_image_rule == BaseImageRule.SEG2
+            or (
+                rules.base_image_rule == BaseImageRule.MORE_FOREGROUND
+                and seg2_fraction > base_fraction
+            )
+            or (
+                rules.base_image_rule == BaseImageRule.LESS_FOREGROUND
+                and seg2_fraction < base_fraction
+            )
+        )
+        if use_seg2:
+            base_image = "seg2"
+            base_fraction = seg2_fraction
+
+    to_use: bool = base_fraction >= rules.min_foreground_fraction
+    if rules.min_agreement is not None and stats.agreement is not None:
+        to_use = to_use and stats.agreement.dice >= rules.min_agreement
+    return CurationRecord(
+        raw_path, seg1_path, seg2_path, None, None, base_image, to_use
+    )
+
+
+class BulkCurator:
+    """
+    Curates whole directories without review: images are paired by file stem,
+    their segmentations are read and measured in parallel worker processes, and
+    CurationRules decide which images to use and which segmentation is the base.
+    """
+
+    def __init__(
+        self,
+        rules: CurationRules,
+        seg1_channel: int = 0,
+        seg2_channel: int = 0,
+        img_data_extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance(),
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._rules: CurationRules = rules
+        self._seg1_channel: int = seg1_channel
+        self._seg2_channel: int = seg2_channel
+        self._img_data_extractor: IImageDataExtractor = img_data_extractor
+        self._max_workers: int = max_workers
+
+    def curate(
+        self,
+        raw_dir: Path,
+        seg1_dir: Path,
+        seg2_dir: Optional[Path] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        on_error: Optional[Callable[[Path, Exception], None]] = None,
+    ) -> List[CurationRecord]:
+        """
+        Returns a curation record for every image paired across :param raw_dir:,
+        :param seg1_dir: and, if given, :param seg2_dir:, in pairing order.
+        :param on_progress: called with (images done, total images) as images
+        are measured
+        :param on_error: called with the raw path of each image that could not
+        be measured, and the error; those images are not used
+        """
+        dirs: Dict[ImageType, Path] = {
+            ImageType.RAW: raw_dir,
+            ImageType.SEG1: seg1_dir,
+        }
+        if seg2_dir is not None:
+            dirs[ImageType.SEG2] = seg2_dir
+        index: PairingIndex[ImageType] = PairingIndex.from_dirs(dirs)
+        raw_paths: List[Path] = index.get_paths(ImageType.RAW)
+        seg1_paths: List[Path] = index.get_paths(ImageType.SEG1)
+        seg2_paths: List[Optional[Path]] = (
+            list(index.get_paths(ImageType.SEG2))
+            if seg2_dir is not None
+            else [None] * len(raw_paths)
+        )
+
+        stats: List[Optional[SegmentationStats]] = [None] * len(raw_paths)
+        measure: Callable[..., SegmentationStats] = partial(
+            compute_segmentation_stats,
+            self._img_data_extractor,
+            seg1_channel=self._seg1_channel,
+            seg2_channel=self._seg2_channel,
+        )
+        # fork is unsafe with the threads that image readers start
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures: List[Future] = [
+                pool.submit(measure, seg1_path, seg2_path)
+                for seg1_path, seg2_path in zip(seg1_paths, seg2_paths)
+            ]
+            for i, future in enumerate(futures):
+                try:
+                    stats[i] = future.result()
+                except Exception as e:
+                    if on_error is not None:
+                        on_error(raw_paths[i], e)
+                if on_progress is not None:
+                    on_progress(i + 1, len(futures))
+
+        return [
+            apply_curation_rules(raw, seg1, seg2, img_stats, self._rules)
+            for raw, seg1, seg2, img_stats in zip(
+                raw_paths, seg1_paths, seg2_paths, stats
+            )
+        ]
@@ -0,0 +1,115 @@
+# Curates raw/seg1/seg2 directories by rule, without the napari plugin, and
+# writes the train/test/val csvs that training reads.
+# usage: allencell-segmenter-ml-curate RAW_DIR SEG1_DIR OUTPUT_DIR [options]
+# (or python -m allencell_ml_segmenter.curation.bulk_curation_cli)
+import argparse
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from allencell_ml_segmenter.curation.bulk_curation import (
+    DEFAULT_MAX_WORKERS,
+    BaseImageRule,
+    BulkCurator,
+    CurationRules,
+)
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.main.main_model import MIN_DATASET_SIZE
+from allencell_ml_segmenter.utils.file_utils import FileUtils
+from allencell_ml_segmenter.utils.file_writer import FileWriter
+
+# progress is printed each time this many more images are measured
+PROGRESS_INTERVAL: int = 100
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="allencell-segmenter-ml-curate",
+        description="Curate images by rule and write the train, test and "
+        "val csvs used for training. Images are paired across directories "
+        "by file name.",
+    )
+    parser.add_argument("raw_dir", type=Path, help="raw image directory")
+    parser.add_argument("seg1_dir", type=Path, help="seg1 directory")
+    parser.add_argument(
+        "output_dir",
+        type=Path,
+        help="directory to write the csvs to, e.g. the data directory of "
+        "an experiment",
+    )
+    parser.add_argument("--seg2-dir", type=Path, help="seg2 directory")
+    parser.add_argument("--seg1-channel", type=int, default=0)
+    parser.add_argument("--seg2-channel", type=int, default=0)
+    parser.add_argument(
+        "--min-foreground-fraction",
+        type=float,
+        default=0.0,
+        help="leave out images whose base segmentation has a smaller "
+        "fraction of foreground voxels",
+    )
+    parser.add_argument(
+        "--min-agreement",
+        type=float,
+        help="leave out images whose seg1 and seg2 Dice score is lower "
+        "(needs --seg2-dir)",
+    )
+    parser.add_argument(
+        "--base-image",
+        choices=[rule.value for rule in BaseImageRule],
+        default=BaseImageRule.SEG1.value,
+        help="segmentation to train on when --seg2-dir is given",
+    )
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS)
+    return parser
+
+
+def _print_progress(done: int, total: int) -> None:
+    if done % PROGRESS_INTERVAL == 0 or done == total:
+        print(f"measured {done}/{total} images", file=sys.stderr)
+
+
+def _print_error(raw_path: Path, e: Exception) -> None:
+    print(f"skipping {raw_path}: {e}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args: argparse.Namespace = _make_parser().parse_args(argv)
+    if args.min_agreement is not None and args.seg2_dir is None:
+        print("--min-agreement needs --seg2-dir", file=sys.stderr)
+        return 2
+
+    rules: CurationRules = CurationRules(
+        min_foreground_fraction=args.min_foreground_fraction,
+        min_agreement=args.min_agreement,
+        base_image_rule=BaseImageRule(args.base_image),
+    )
+    records: List[CurationRecord] = BulkCurator(
+        rules,
+        args.seg1_channel,
+        args.seg2_channel,
+        max_workers=args.workers,
+    ).curate(
+        args.raw_dir,
+        args.seg1_dir,
+        args.seg2_dir,
+        on_progress=_print_progress,
+        on_error=_print_error,
+    )
+    num_used: int = sum(1 for r in records if r.to_use)
+    print(f"using {num_used} of {len(records)} images", file=sys.stderr)
+    if num_used < MIN_DATASET_SIZE:
+        print(
+            f"At least {MIN_DATASET_SIZE} images must be selected for use",
+            file=sys.stderr,
+        )
+        return 1
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    FileUtils(FileWriter.global_instance()).write_curation_record(
+        records, args.output_dir, args.output_dir
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
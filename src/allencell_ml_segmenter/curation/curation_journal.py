@@ -0,0 +1,371 @@
+import hashlib
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.curation_record_store import (
+    CurationRecordStore,
+)
+from allencell_ml_segmenter.main.main_model import ImageType
+from allencell_ml_segmenter.utils.file_writer import IFileWriter
+from allencell_ml_segmenter.utils.mask_encoding import (
+    decode_mask,
+    encode_mask,
+)
+
+JOURNAL_NAME: str = "curation_journal.jsonl"
+JOURNAL_VERSION: int = 1
+# masks referenced by the journal are saved here, next to the journal
+JOURNAL_MASKS_DIR: str = "journal_masks"
+
+# (to_use, base_image, excluding mask file, merging mask file)
+_RecordState = Tuple[bool, Optional[str], Optional[str], Optional[str]]
+
+
+@dataclass
+class CurationSession:
+    """
+    State of a curation session as recorded in a CurationJournal.
+    """
+
+    raw_paths: List[Path]
+    seg1_paths: List[Path]
+    seg2_paths: Optional[List[Path]]
+    channels: Dict[ImageType, Optional[int]]
+    records: CurationRecordStore
+    # indices of images with a recorded decision
+    visited: Set[int]
+    cursor: int
+    # True if the session was curated to its end (see CurationJournal.finish)
+    finished: bool = False
+
+
+class CurationJournal:
+    """
+    Append-only log of curation decisions, so that a session survives a crash and
+    can be resumed. The journal starts with the image paths and channels of the
+    session, and each record is appended as the cursor moves past it. Records that
+    have not changed since they were last written are skipped, and masks are saved
+    once per distinct mask (named by a hash of their contents). When the images
+    are put in a new order, the move is appended rather than the journal being
+    rewritten. When loading, entries are replayed in order and the last entry for
+    each image wins. A session curated to its end is marked finished, so that it
+    is not offered for resuming.
+
+    Writes happen in order on a background thread; use wait() to block until
+    they are on disk, and close() once the journal is no longer written to.
+    """
+
+    def __init__(self, path: Path, file_writer: IFileWriter) -> None:
+        self._path: Path = path
+        self._file_writer: IFileWriter = file_writer
+        # a single thread keeps entries in the order they were submitted
+        self._writer: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="curation_journal"
+        )
+        # only accessed from the writer thread
+        self._written_records: Dict[int, _RecordState] = {}
+        self._written_masks: Set[str] = set()
+        self._written_cursor: Optional[int] = None
+
+    def get_path(self) -> Path:
+        return self._path
+
+    def start_session(
+        self,
+        raw_paths: List[Path],
+        seg1_paths: List[Path],
+        seg2_paths: Optional[List[Path]],
+        channels: Dict[ImageType, Optional[int]],
+    ) -> Future:
+        """
+        Replaces any existing journal with a new session for the given images.
+        """
+        header: Dict[str, Any] = {
+            "type": "session",
+            "version": JOURNAL_VERSION,
+            "raw": [str(p) for p in raw_paths],
+            "seg1": [str(p) for p in seg1_paths],
+            "seg2": (
+                [str(p) for p in seg2_paths]
+                if seg2_paths is not None
+                else None
+            ),
+            "channels": {t.value: c for t, c in channels.items()},
+        }
+        return self._writer.submit(self._start_session, json.dumps(header))
+
+    def resume_session(self, session: CurationSession) -> Future:
+        """
+        Continues the journal that :param session: was loaded from. Records of
+        :param session: that are unchanged will not be written again.
+        """
+        return self._writer.submit(self._resume_session, session)
+
+    def record(self, img_idx: int, record: CurationRecord) -> Future:
+        """
+        Appends :param record: for the image at :param img_idx: if it changed
+        since it was last written.
+        """
+        # masks are replaced rather than modified, so a shallow copy is a
+        # snapshot of the record
+        return self._writer.submit(self._record, img_idx, replace(record))
+
+    def move_cursor(self, cursor: int) -> Future:
+        """
+        Records that the user is now reviewing the image at :param cursor:.
+        """
+        return self._writer.submit(self._move_cursor, cursor)
+
+    def reorder(
+        self, positions: Sequence[int], order: Sequence[int]
+    ) -> Future:
+        """
+        Records that the image at index order[i] moved to index positions[i] for
+        every i, as in CurationRecordStore.reorder.
+        """
+        return self._writer.submit(self._reorder, list(positions), list(order))
+
+    def finish(self) -> Future:
+        """
+        Records that the session was curated to its end.
+        """
+        return self._writer.submit(self._finish)
+
+    def wait(self) -> None:
+        """
+        Blocks until all submitted entries have been written.
+        """
+        self._writer.submit(lambda: None).result()
+
+    def close(self) -> None:
+        """
+        Blocks until all submitted entries have been written, and stops the
+        writer thread. No entries can be submitted afterwards.
+        """
+        self._writer.shutdown(wait=True)
+
+    @staticmethod
+    def load(path: Path) -> Optional[CurationSession]:
+        """
+        Returns the session recorded in the journal at :param path:, or None if
+        there is no readable journal there. A partially written last line (from
+        a crash) is ignored.
+        """
+        if not path.exists():
+            return None
+        with open(path) as fr:
+            lines: List[str] = fr.read().splitlines()
+
+        entries: List[Dict[str, Any]] = []
+        for i, line in enumerate(lines):
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                if i == len(lines) - 1:
+                    break
+                raise
+        if (
+            not entries
+            or entries[0].get("type") != "session"
+            or entries[0].get("version") != JOURNAL_VERSION
+        ):
+            return None
+
+        header: Dict[str, Any] = entries[0]
+        raw_paths: List[Path] = [Path(p) for p in header["raw"]]
+        seg1_paths: List[Path] = [Path(p) for p in header["seg1"]]
+        seg2_paths: Optional[List[Path]] = (
+            [Path(p) for p in header["seg2"]]
+            if header["seg2"] is not None
+            else None
+        )
+        records: CurationRecordStore = CurationRecordStore(
+            raw_paths, seg1_paths, seg2_paths
+        )
+        visited: Set[int] = set()
+        cursor: int = 0
+        finished: bool = False
+        for entry in entries[1:]:
+            # entries after the finish mean the session was continued
+            finished = entry["type"] == "finished"
+            if entry["type"] == "cursor":
+                cursor = entry["index"]
+            elif entry["type"] == "reorder":
+                records.reorder(entry["positions"], entry["order"])
+                visited = CurationJournal._reorder_indices(
+                    visited, entry["positions"], entry["order"]
+                )
+            elif entry["type"] == "record":
+                idx: int = entry["index"]
+                visited.add(idx)
+                records.mark_visited(idx)
+                records.set_to_use(idx, entry["to_use"])
+                records.set_base_image(idx, entry["base_image"])
+                records.set_excluding_mask(
+                    idx,
+                    CurationJournal._load_mask(
+                        path.parent, entry["excluding_mask"]
+                    ),
+                )
+                records.set_merging_mask(
+                    idx,
+                    CurationJournal._load_mask(
+                        path.parent, entry["merging_mask"]
+                    ),
+                )
+
+        return CurationSession(
+            raw_paths,
+            seg1_paths,
+            seg2_paths,
+            {t: header["channels"].get(t.value) for t in ImageType},
+            records,
+            visited,
+            cursor,
+            finished,
+        )
+
+    @staticmethod
+    def _load_mask(
+        journal_dir: Path, mask_file: Optional[str]
+    ) -> Optional[np.ndarray]:
+        if not mask_file:
+            return None
+        return decode_mask(
+            np.load(journal_dir / mask_file, allow_pickle=False)
+        )
+
+    @staticmethod
+    def _reorder_indices(
+        indices: Set[int], positions: Sequence[int], order: Sequence[int]
+    ) -> Set[int]:
+        # the indices that :param indices: are at once the images at order[i]
+        # are moved to positions[i]
+        moved_to: Dict[int, int] = dict(zip(order, positions))
+        return {moved_to.get(idx, idx) for idx in indices}
+
+    def _start_session(self, header: str) -> None:
+        self._written_records.clear()
+        self._written_cursor = None
+        self._file_writer.write_lines(self._path, [header])
+
+    def _resume_session(self, session: CurationSession) -> None:
+        self._written_records.clear()
+        for idx in session.visited:
+            record: CurationRecord = session.records[idx]
+            self._written_records[idx] = (
+                record.to_use,
+                record.base_image,
+                self._get_mask_file(
+                    self._encode_mask(record.excluding_mask), "excluding"
+                ),
+                self._get_mask_file(
+                    self._encode_mask(record.merging_mask), "merging"
+                ),
+            )
+        self._written_masks.update(
+            mask_file
+            for state in self._written_records.values()
+            for mask_file in state[2:]
+            if mask_file is not None
+        )
+        self._written_cursor = session.cursor
+
+    def _record(self, img_idx: int, record: CurationRecord) -> None:
+        excluding_file: Optional[str] = self._save_mask(
+            record.excluding_mask, "excluding"
+        )
+        merging_file: Optional[str] = self._save_mask(
+            record.merging_mask, "merging"
+        )
+        state: _RecordState = (
+            record.to_use,
+            record.base_image,
+            excluding_file,
+            merging_file,
+        )
+        if self._written_records.get(img_idx) == state:
+            return
+        entry: Dict[str, Any] = {
+            "type": "record",
+            "index": img_idx,
+            "to_use": record.to_use,
+            "base_image": record.base_image,
+            "excluding_mask": excluding_file,
+            "merging_mask": merging_file,
+        }
+        self._file_writer.append_lines(self._path, [json.dumps(entry)])
+        self._written_records[img_idx] = state
+
+    def _reorder(self, positions: List[int], order: List[int]) -> None:
+        self._file_writer.append_lines(
+            self._path,
+            [
+                json.dumps(
+                    {"type": "reorder", "positions": positions, "order": order}
+                )
+            ],
+        )
+        moved_to: Dict[int, int] = dict(zip(order, positions))
+        self._written_records = {
+            moved_to.get(idx, idx): state
+            for idx, state in self._written_records.items()
+        }
+
+    def _finish(self) -> None:
+        self._file_writer.append_lines(
+            self._path, [json.dumps({"type": "finished"})]
+        )
+
+    def _move_cursor(self, cursor: int) -> None:
+        if self._written_cursor == cursor:
+            return
+        self._file_writer.append_lines(
+            self._path, [json.dumps({"type": "cursor", "index": cursor})]
+        )
+        self._written_cursor = cursor
+
+    def _save_mask(
+        self, mask: Optional[np.ndarray], kind: str
+    ) -> Optional[str]:
+        """
+        Saves :param mask: if an identical mask has not been saved yet, and returns
+        its file name relative to the journal's directory.
+        """
+        encoded: Optional[np.ndarray] = self._encode_mask(mask)
+        mask_file: Optional[str] = self._get_mask_file(encoded, kind)
+        if encoded is not None and mask_file is not None:
+            if mask_file not in self._written_masks:
+                self._file_writer.np_save(
+                    self._path.parent / mask_file, encoded
+                )
+                self._written_masks.add(mask_file)
+        return mask_file
+
+    @staticmethod
+    def _encode_mask(mask: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        # masks from shapes layers are object arrays, which would need pickle
+        # to be loaded
+        return (
+            np.ascontiguousarray(encode_mask(mask))
+            if mask is not None
+            else None
+        )
+
+    @staticmethod
+    def _get_mask_file(
+        encoded: Optional[np.ndarray], kind: str
+    ) -> Optional[str]:
+        if encoded is None:
+            return None
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{encoded.dtype.descr}{encoded.shape}".encode())
+        hasher.update(encoded.data)
+        digest: str = hasher.hexdigest()
+        return f"{JOURNAL_MASKS_DIR}/{kind}_{digest}.npy"
@@ -1,14 +1,43 @@
+import dask.array as da
 import numpy as np
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
 from qtpy.QtCore import Signal, QObject
 
 from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.curation_record_store import (
+    CurationRecordStore,
+)
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+)
+from allencell_ml_segmenter.curation.curation_journal import (
+    CurationJournal,
+    CurationSession,
+    JOURNAL_NAME,
+)
 from allencell_ml_segmenter.main.experiments_model import ExperimentsModel
 from allencell_ml_segmenter.main.main_model import MainModel, ImageType
-from allencell_ml_segmenter.core.image_data_extractor import ImageData
+from allencell_ml_segmenter.core.image_data_extractor import (
+    ImageData,
+    ImageArray,
+)
+from allencell_ml_segmenter.utils.pairing_index import (
+    PairingIndex,
+    StemNormalizer,
+    get_image_stem,
+)
+
+# number of images after the current one to keep loaded
+DEFAULT_PREFETCH_DEPTH: int = 2
+# memory available to images loaded ahead of the next image
+DEFAULT_PREFETCH_BUDGET_BYTES: int = 2 * 1024**3
+# number of recently viewed images before the current one to keep loaded
+DEFAULT_HISTORY_SIZE: int = 2
+# raw image file size from which images are read lazily rather than decoded
+DEFAULT_LAZY_LOADING_MIN_BYTES: int = 1024**3
 
 
 class CurationView(Enum):
@@ -16,6 +45,12 @@ class CurationView(Enum):
     MAIN_VIEW = "main_view"
 
 
+class ImageSlotState(Enum):
+    NOT_LOADED = "not_loaded"
+    LOADING = "loading"
+    READY = "ready"
+
+
 class CurationModel(QObject):
     """
     Stores state relevant to prediction processes.
@@ -23,10 +58,33 @@ class CurationModel(QObject):
 
     current_view_changed: Signal = Signal()
     image_directory_set: Signal = Signal(ImageType)
+    # emitted as files are found while an image directory is being scanned
+    image_file_count_changed: Signal = Signal(ImageType)
     channel_count_set: Signal = Signal(ImageType)
 
+    # emitted when a new curation session starts, before the first cursor_moved
+    session_started: Signal = Signal()
+    # emitted with the CurationSession when a half-finished session is resumed,
+    # before the first cursor_moved
+    session_resumed: Signal = Signal(object)
+    # emitted when the session has been curated to its end and loading stops
+    session_finished: Signal = Signal()
     cursor_moved: Signal = Signal()
     image_loading_finished: Signal = Signal()
+    # emitted with the image index when all image data for that index is loaded
+    image_slot_ready: Signal = Signal(int)
+    prefetch_settings_changed: Signal = Signal()
+    # emitted when the images after the cursor have been put in a new order,
+    # with the (positions, order) passed to CurationRecordStore.reorder
+    queue_reordered: Signal = Signal(list, list)
+    # emitted with the image index when its seg1/seg2 disagreement is computed
+    disagreement_ready: Signal = Signal(int)
+    show_disagreement_changed: Signal = Signal()
+    # emitted when the merging mask being drawn for the current image, or the
+    # base image it is merged into, changes
+    merging_mask_draft_changed: Signal = Signal()
+    # emitted when the merge preview of the current image is updated or removed
+    merge_preview_updated: Signal = Signal()
 
     save_to_disk_requested: Signal = Signal()
     saved_to_disk: Signal = Signal(bool)
@@ -49,6 +107,11 @@ class CurationModel(QObject):
             self._get_placeholder_dict()
         )
 
+        # number of files found so far in each image directory
+        self._image_file_counts: Dict[ImageType, Optional[int]] = (
+            self._get_placeholder_dict()
+        )
+
         # These are what the user has selected in the input view
         self._selected_channels: Dict[ImageType, Optional[int]] = (
             self._get_placeholder_dict()
@@ -58,66 +121,136 @@ class CurationModel(QObject):
             self._get_placeholder_dict()
         )
 
-        self._curation_record: Optional[List[CurationRecord]] = None
+        # also tracks which images the cursor has been on
+        self._curation_record: Optional[CurationRecordStore] = None
         # None until start_image_loading is called
         self._cursor: Optional[int] = None
         # True when images have been dropped from memory
         self._image_loading_stopped: bool = False
-        # private invariant: _next_img_data will only have < self._get_num_data_dict_keys() keys if
-        # a thread is currently updating _next_img_data. Same goes for curr
-        self._curr_img_data: Optional[dict[ImageType, Optional[ImageData]]] = (
-            None
-        )
-        self._next_img_data: Optional[dict[ImageType, Optional[ImageData]]] = (
-            None
-        )
+        # image data for the images in the prefetch window, keyed by image index.
+        # private invariant: a slot will only have < self._get_num_data_dict_keys() keys
+        # if a thread is currently loading image data for that index
+        self._img_data_slots: Optional[
+            Dict[int, Dict[ImageType, Optional[ImageData]]]
+        ] = None
+        # labels of where seg1 and seg2 differ, for the images in
+        # self._img_data_slots that have seg2, keyed by image index
+        self._disagreement_slots: Dict[int, ImageArray] = {}
+        # whether the disagreement is shown as an overlay layer
+        self._show_disagreement: bool = False
+        # polygons of the merging mask being drawn for the current image, and
+        # the labels that merging them would give
+        self._merging_mask_draft: Optional[np.ndarray] = None
+        self._merge_preview: Optional[np.ndarray] = None
+        self._prefetch_depth: int = DEFAULT_PREFETCH_DEPTH
+        self._prefetch_budget_bytes: int = DEFAULT_PREFETCH_BUDGET_BYTES
+        self._history_size: int = DEFAULT_HISTORY_SIZE
+        # images whose raw file is at least this large are extracted as chunked
+        # dask arrays that napari reads slice by slice instead of fully decoded
+        # numpy arrays
+        self._lazy_loading_min_bytes: int = DEFAULT_LAZY_LOADING_MIN_BYTES
+        # when True, and seg2 is given, images are scored on how well seg1 and
+        # seg2 agree and the images yet to review are reordered worst first
+        self._order_by_disagreement: bool = False
+        # {raw image path: agreement of its seg1 and seg2}
+        self._agreement_scores: Dict[Path, AgreementScore] = {}
+        # file names are reduced to this key to pair raw and seg images
+        self._stem_normalizer: StemNormalizer = get_image_stem
+        # files left out of the current session because they could not be paired
+        self._unmatched_paths: Dict[ImageType, List[Path]] = {}
 
     def get_merging_mask(self) -> Optional[np.ndarray]:
         return (
-            self._curation_record[self._cursor].merging_mask
+            self._curation_record.get_merging_mask(self._cursor)
             if self._curation_record is not None and self._cursor is not None
             else None
         )
 
     def set_merging_mask(self, mask: Optional[np.ndarray]) -> None:
         if self._curation_record is not None and self._cursor is not None:
-            self._curation_record[self._cursor].merging_mask = mask
+            self._curation_record.set_merging_mask(self._cursor, mask)
 
     def get_excluding_mask(self) -> Optional[np.ndarray]:
         return (
-            self._curation_record[self._cursor].excluding_mask
+            self._curation_record.get_excluding_mask(self._cursor)
             if self._curation_record is not None and self._cursor is not None
             else None
         )
 
     def set_excluding_mask(self, mask: Optional[np.ndarray]) -> None:
         if self._curation_record is not None and self._cursor is not None:
-            self._curation_record[self._cursor].excluding_mask = mask
+            self._curation_record.set_excluding_mask(self._cursor, mask)
 
     def get_base_image(self) -> Optional[str]:
         return (
-            self._curation_record[self._cursor].base_image
+            self._curation_record.get_base_image(self._cursor)
             if self._curation_record is not None and self._cursor is not None
             else None
         )
 
     def set_base_image(self, base: Optional[str]) -> None:
+        """
+        Signals emitted:
+        immediate: merging_mask_draft_changed if a merging mask is being drawn
+        """
         if self._curation_record is not None and self._cursor is not None:
-            self._curation_record[self._cursor].base_image = base
+            self._curation_record.set_base_image(self._cursor, base)
+            if self._merging_mask_draft is not None:
+                self.merging_mask_draft_changed.emit()
+
+    def get_merging_mask_draft(self) -> Optional[np.ndarray]:
+        return self._merging_mask_draft
+
+    def set_merging_mask_draft(self, polygons: Optional[np.ndarray]) -> None:
+        """
+        Sets the :param polygons: of the merging mask being drawn for the current
+        image, not yet saved; None if no merging mask is being drawn, which also
+        removes the merge preview.
+        Signals emitted:
+        immediate: merging_mask_draft_changed, merge_preview_updated if the
+        merge preview is removed
+        """
+        self._merging_mask_draft = polygons
+        self.merging_mask_draft_changed.emit()
+        if polygons is None and self._merge_preview is not None:
+            self._merge_preview = None
+            self.merge_preview_updated.emit()
+
+    def get_merge_preview(self) -> Optional[np.ndarray]:
+        return self._merge_preview
+
+    def set_merge_preview(
+        self, img_idx: int, labels: Optional[np.ndarray]
+    ) -> None:
+        """
+        Sets the :param labels: that merging the merging mask draft of the image
+        at :param img_idx: gives. Ignored if the cursor has moved on from
+        :param img_idx:.
+        Signals emitted:
+        immediate: merge_preview_updated if :param labels: are set
+        """
+        if img_idx != self._cursor:
+            return
+        self._merge_preview = labels
+        self.merge_preview_updated.emit()
 
     def get_use_image(self) -> Optional[bool]:
         return (
-            self._curation_record[self._cursor].to_use
+            self._curation_record.get_to_use(self._cursor)
             if self._curation_record is not None and self._cursor is not None
             else None
         )
 
     def set_use_image(self, use: bool) -> None:
         if self._curation_record is not None and self._cursor is not None:
-            self._curation_record[self._cursor].to_use = use
+            self._curation_record.set_to_use(self._cursor, use)
 
     def set_image_directory(self, img_type: ImageType, dir: Path) -> None:
         self._img_dirs[img_type] = dir
+        # paths of the previous directory no longer apply; they are set again
+        # once the new directory has been scanned
+        self._img_dir_paths[img_type] = None
+        self._image_file_counts[img_type] = None
         self.image_directory_set.emit(img_type)
 
     def get_image_directory(self, img_type: ImageType) -> Optional[Path]:
@@ -131,14 +264,96 @@ class CurationModel(QObject):
     def get_image_directory_paths(
         self, img_type: ImageType
     ) -> Optional[List[Path]]:
+        """
+        Returns the files of the image directory of :param img_type:, or None
+        while the directory is being scanned.
+        """
         return self._img_dir_paths[img_type]
 
+    def set_image_file_count(self, img_type: ImageType, count: int) -> None:
+        self._image_file_counts[img_type] = count
+        self.image_file_count_changed.emit(img_type)
+
+    def get_image_file_count(self, img_type: ImageType) -> Optional[int]:
+        """
+        Returns the number of files found so far in the image directory of
+        :param img_type:.
+        """
+        return self._image_file_counts[img_type]
+
     def set_selected_channel(self, img_type: ImageType, channel: int) -> None:
         self._selected_channels[img_type] = channel
 
     def get_selected_channel(self, img_type: ImageType) -> Optional[int]:
         return self._selected_channels[img_type]
 
+    def set_lazy_loading_min_bytes(self, min_bytes: int) -> None:
+        """
+        Sets the raw image file size from which images are read lazily, slice
+        by slice, instead of being fully decoded when loaded.
+        """
+        if min_bytes < 0:
+            raise ValueError("Lazy loading size must not be negative")
+        self._lazy_loading_min_bytes = min_bytes
+
+    def get_lazy_loading_min_bytes(self) -> int:
+        return self._lazy_loading_min_bytes
+
+    def set_stem_normalizer(self, normalize: StemNormalizer) -> None:
+        """
+        Sets the function that reduces a file name to the key that raw and
+        segmentation images are paired on (by default, the name without its
+        extension). Takes effect for the next session.
+        """
+        self._stem_normalizer = normalize
+
+    def get_unmatched_paths(self) -> Dict[ImageType, List[Path]]:
+        """
+        Returns the files of each directory that were left out of the current
+        session because no matching file was found in the other directories.
+        """
+        return self._unmatched_paths
+
+    def set_prefetch_depth(self, depth: int) -> None:
+        """
+        Sets the number of images after the current image to load in the
+        background. Must be at least 1 (the next image).
+        """
+        if depth < 1:
+            raise ValueError("Prefetch depth must be at least 1")
+        self._prefetch_depth = depth
+        self._drop_slots_outside_window()
+        self.prefetch_settings_changed.emit()
+
+    def get_prefetch_depth(self) -> int:
+        return self._prefetch_depth
+
+    def set_prefetch_budget_bytes(self, budget: int) -> None:
+        """
+        Sets the memory budget for images loaded beyond the next image. The
+        current and next images are always loaded regardless of the budget.
+        """
+        if budget < 0:
+            raise ValueError("Prefetch budget must not be negative")
+        self._prefetch_budget_bytes = budget
+        self.prefetch_settings_changed.emit()
+
+    def get_prefetch_budget_bytes(self) -> int:
+        return self._prefetch_budget_bytes
+
+    def set_history_size(self, size: int) -> None:
+        """
+        Sets the number of recently viewed images before the current image to keep
+        in memory, so that moving back to them does not reload them.
+        """
+        if size < 0:
+            raise ValueError("History size must not be negative")
+        self._history_size = size
+        self._drop_slots_outside_window()
+
+    def get_history_size(self) -> int:
+        return self._history_size
+
     def set_current_view(self, view: CurationView) -> None:
         """
         Set current curation view
@@ -148,22 +363,15 @@ class CurationModel(QObject):
         if view != self._current_view:
             if view == CurationView.MAIN_VIEW:
                 self._curation_record = self._generate_new_curation_record()
-                seg2_exists: bool = (
-                    self._img_dir_paths[ImageType.SEG2] is not None
-                )
-                self._curr_img_data = self._get_placeholder_dict(
-                    incl_seg2=seg2_exists
-                )
-                self._next_img_data = self._get_placeholder_dict(
-                    incl_seg2=seg2_exists
-                )
+                self._img_data_slots = {}
+                self._disagreement_slots.clear()
                 self._curation_record_saved_to_disk = False
                 # set the central selected channels for the app once the user clicks 'start curation'
                 self._main_model.set_selected_channels(self._selected_channels)
             else:
                 self._curation_record = None
-                self._curr_img_data = None
-                self._next_img_data = None
+                self._img_data_slots = None
+                self._disagreement_slots.clear()
             self._current_view = view
             self.current_view_changed.emit()
 
@@ -191,34 +399,228 @@ class CurationModel(QObject):
             else None
         )
 
-    def get_curation_record(self) -> Optional[list[CurationRecord]]:
+    def get_journal_path(self) -> Optional[Path]:
+        save_path: Optional[Path] = self.get_save_masks_path()
+        return save_path / JOURNAL_NAME if save_path is not None else None
+
+    def load_unfinished_session(self) -> Optional[CurationSession]:
+        """
+        Returns the session recorded in the current experiment's journal if it
+        was not curated to its end and is of the selected image directories and
+        channels, or None otherwise. Sessions are journaled until they are
+        replaced by a new one, so this is the last session curated in the
+        experiment.
+        """
+        journal_path: Optional[Path] = self.get_journal_path()
+        session: Optional[CurationSession] = (
+            CurationJournal.load(journal_path)
+            if journal_path is not None
+            else None
+        )
+        if (
+            session is None
+            or session.finished
+            or not self._is_selected_session(session)
+        ):
+            return None
+        return session
+
+    def _is_selected_session(self, session: CurationSession) -> bool:
+        """
+        Returns True if :param session: is of the image directories and channels
+        currently selected.
+        """
+        session_paths: Dict[ImageType, Optional[List[Path]]] = {
+            ImageType.RAW: session.raw_paths,
+            ImageType.SEG1: session.seg1_paths,
+            ImageType.SEG2: session.seg2_paths,
+        }
+        for img_type, paths in session_paths.items():
+            session_dir: Optional[Path] = paths[0].parent if paths else None
+            if session_dir != self._img_dirs[img_type]:
+                return False
+            if (
+                session_dir is not None
+                and session.channels[img_type]
+                != self._selected_channels[img_type]
+            ):
+                return False
+        return True
+
+    def get_curation_record(self) -> Optional[CurationRecordStore]:
         return self._curation_record
 
     # WARNING: methods that access data dicts must only be called from the main thread
+    def set_image_data(
+        self, img_idx: int, img_type: ImageType, img_data: ImageData
+    ) -> None:
+        """
+        Stores :param img_data: for the image at :param img_idx:. Data for images that
+        are no longer in the prefetch window (e.g. because the cursor has moved past
+        them) is dropped.
+        Signals emitted:
+        image_slot_ready when all data for :param img_idx: is loaded
+        image_loading_finished when the current and next images are loaded
+        """
+        if self._img_data_slots is None:
+            raise RuntimeError("Image data is uninitialized")
+        if not self._is_in_window(img_idx):
+            return
+        slot: Dict[ImageType, Optional[ImageData]] = (
+            self._img_data_slots.setdefault(img_idx, {})
+        )
+        slot[img_type] = img_data
+        if self.get_slot_state(img_idx) == ImageSlotState.READY:
+            self.image_slot_ready.emit(img_idx)
+        if (
+            self._cursor is not None
+            and self._cursor <= img_idx <= self._cursor + 1
+            and not self.is_waiting_for_images()
+        ):
+            self.image_loading_finished.emit()
+
     def set_curr_image_data(
         self, img_type: ImageType, img_data: ImageData
     ) -> None:
-        if self._curr_img_data is None:
+        if self._img_data_slots is None or self._cursor is None:
             raise RuntimeError("Current image data is uninitialized")
-        self._curr_img_data[img_type] = img_data
-        if not self.is_waiting_for_images():
-            self.image_loading_finished.emit()
+        self.set_image_data(self._cursor, img_type, img_data)
 
     def get_curr_image_data(self, img_type: ImageType) -> Optional[ImageData]:
-        return (
-            self._curr_img_data[img_type]
-            if self._curr_img_data is not None
-            else None
+        if self._cursor is None:
+            return None
+        return self.get_image_data(self._cursor, img_type)
+
+    def get_image_data(
+        self, img_idx: int, img_type: ImageType
+    ) -> Optional[ImageData]:
+        if self._img_data_slots is None:
+            return None
+        return self._img_data_slots.get(img_idx, {}).get(img_type)
+
+    def set_disagreement_data(
+        self, img_idx: int, seg1_path: Path, labels: ImageArray
+    ) -> None:
+        """
+        Stores the :param labels: of where seg1 and seg2 differ for the image at
+        :param img_idx:, computed from the seg1 data of :param seg1_path:. Labels
+        computed for data that is no longer loaded at :param img_idx: (e.g. it was
+        dropped or the images were reordered) are ignored.
+        Signals emitted:
+        disagreement_ready if :param labels: are stored
+        """
+        seg1_data: Optional[ImageData] = self.get_image_data(
+            img_idx, ImageType.SEG1
         )
+        if seg1_data is None or seg1_data.path != seg1_path:
+            return
+        self._disagreement_slots[img_idx] = labels
+        self.disagreement_ready.emit(img_idx)
+
+    def get_curr_disagreement_data(self) -> Optional[ImageArray]:
+        if self._cursor is None:
+            return None
+        return self._disagreement_slots.get(self._cursor)
+
+    def set_show_disagreement(self, show: bool) -> None:
+        """
+        Sets whether where seg1 and seg2 differ is shown as an overlay.
+        Signals emitted:
+        immediate: show_disagreement_changed
+        """
+        self._show_disagreement = show
+        self.show_disagreement_changed.emit()
+
+    def is_showing_disagreement(self) -> bool:
+        return self._show_disagreement
 
     def set_next_image_data(
         self, img_type: ImageType, img_data: ImageData
     ) -> None:
-        if self._next_img_data is None:
+        if self._img_data_slots is None or self._cursor is None:
             raise RuntimeError("Next image data is uninitialized")
-        self._next_img_data[img_type] = img_data
-        if not self.is_waiting_for_images():
-            self.image_loading_finished.emit()
+        self.set_image_data(self._cursor + 1, img_type, img_data)
+
+    def get_slot_state(self, img_idx: int) -> ImageSlotState:
+        """
+        Returns how much of the image data for :param img_idx: has been loaded.
+        """
+        if self._img_data_slots is None or img_idx not in self._img_data_slots:
+            return ImageSlotState.NOT_LOADED
+        if (
+            len(self._img_data_slots[img_idx])
+            == self._get_num_data_dict_keys()
+        ):
+            return ImageSlotState.READY
+        return ImageSlotState.LOADING
+
+    def start_loading_slot(self, img_idx: int) -> None:
+        """
+        Marks the image at :param img_idx: as loading, so that it is not
+        returned by get_slots_to_load again.
+        """
+        if self._img_data_slots is None:
+            raise RuntimeError("Image data is uninitialized")
+        self._img_data_slots.setdefault(img_idx, {})
+
+    def get_prefetch_window(self) -> List[int]:
+        """
+        Returns the indices of the current image and the images prefetched after it,
+        in the order they should be loaded.
+        """
+        return list(self._get_window())
+
+    def get_slots_to_load(self) -> List[int]:
+        """
+        Returns indices of images in the prefetch window that have not started
+        loading. The current and next images are always included; images further
+        ahead are only included while the memory used by loaded images, plus an
+        estimate for each additional image, fits within the prefetch budget.
+        """
+        if (
+            self._img_data_slots is None
+            or self._cursor is None
+            or self._image_loading_stopped
+        ):
+            return []
+
+        # lazily read images are only counted once they are read into memory
+        used_bytes: int = 0
+        # bytes and count of ready slots held fully in memory, for the estimate
+        in_memory_bytes: int = 0
+        in_memory_slots: int = 0
+        for slot in self._img_data_slots.values():
+            slot_bytes: int = sum(
+                int(img_data.np_data.nbytes)
+                for img_data in slot.values()
+                if img_data is not None
+                and isinstance(img_data.np_data, np.ndarray)
+            )
+            used_bytes += slot_bytes
+            if len(slot) == self._get_num_data_dict_keys() and all(
+                img_data is None or not isinstance(img_data.np_data, da.Array)
+                for img_data in slot.values()
+            ):
+                in_memory_bytes += slot_bytes
+                in_memory_slots += 1
+        estimate: Optional[int] = (
+            in_memory_bytes // in_memory_slots if in_memory_slots > 0 else None
+        )
+
+        to_load: List[int] = []
+        for img_idx in self._get_window():
+            if img_idx in self._img_data_slots:
+                continue
+            if img_idx > self._cursor + 1:
+                # size of images is unknown until one has loaded
+                if (
+                    estimate is None
+                    or used_bytes + estimate > self._prefetch_budget_bytes
+                ):
+                    break
+                used_bytes += estimate
+            to_load.append(img_idx)
+        return to_load
 
     # note: I don't see a reason why we would need to get the next image data instead of
     # calling next_image, so leaving that out
@@ -240,20 +642,100 @@ class CurationModel(QObject):
     def get_curr_image_index(self) -> Optional[int]:
         return self._cursor
 
+    def set_order_by_disagreement(self, order: bool) -> None:
+        """
+        Sets whether images are reordered so that those whose seg1 and seg2 agree
+        least are reviewed first. Takes effect for the next session.
+        """
+        self._order_by_disagreement = order
+
+    def is_ordering_by_disagreement(self) -> bool:
+        return self._order_by_disagreement
+
+    def set_agreement_score(
+        self, raw_path: Path, score: AgreementScore
+    ) -> None:
+        """
+        Sets the agreement of the segmentations of the raw image at
+        :param raw_path:. Scores are keyed by path since reordering changes
+        image indices.
+        """
+        self._agreement_scores[raw_path] = score
+
+    def get_agreement_score(self, img_idx: int) -> Optional[AgreementScore]:
+        if self._curation_record is None:
+            return None
+        return self._agreement_scores.get(
+            self._curation_record.get_raw_path(img_idx)
+        )
+
+    def reorder_by_disagreement(self) -> None:
+        """
+        Reorders the images after the cursor that have not been visited so that
+        the images with the worst agreement scores come first; images without a
+        score go last. Visited images keep their index, so decisions already
+        made are unaffected. The next image, and any image that has started
+        loading, also keep their index, so that no loaded data is dropped.
+        Signals emitted:
+        immediate: queue_reordered
+        """
+        store: Optional[CurationRecordStore] = self._curation_record
+        if store is None or self._cursor is None:
+            raise RuntimeError("Curation session has not started")
+        # the next image must stay put for next_image not to wait on a load
+        positions: List[int] = [
+            i
+            for i in range(self._cursor + 2, len(store))
+            if not store.is_visited(i)
+            and self.get_slot_state(i) == ImageSlotState.NOT_LOADED
+        ]
+
+        def sort_key(img_idx: int) -> Tuple[Any, ...]:
+            score: Optional[AgreementScore] = self._agreement_scores.get(
+                store.get_raw_path(img_idx)
+            )
+            return (0, *score.sort_key()) if score is not None else (1,)
+
+        # python's sort is stable, so images with equal scores keep their order
+        order: List[int] = sorted(positions, key=sort_key)
+        store.reorder(positions, order)
+        self._set_img_dir_paths_from_store(store)
+        self.queue_reordered.emit(positions, order)
+
+    def _set_img_dir_paths_from_store(
+        self, store: CurationRecordStore
+    ) -> None:
+        # images are loaded by index into these lists, so they must line up
+        # with the records
+        self._img_dir_paths = {
+            ImageType.RAW: store.get_raw_paths(),
+            ImageType.SEG1: store.get_seg1_paths(),
+            ImageType.SEG2: store.get_seg2_paths(),
+        }
+
     def has_next_image(self) -> bool:
         if self._cursor is None:
             return False
         return self._cursor + 1 < self.get_num_images()
 
+    def has_previous_image(self) -> bool:
+        if self._cursor is None:
+            return False
+        return self._cursor > 0
+
     def is_waiting_for_curr_images(self) -> bool:
-        if self._curr_img_data is None:
+        if self._img_data_slots is None or self._cursor is None:
             return False
-        return len(self._curr_img_data) != self._get_num_data_dict_keys()
+        return self.get_slot_state(self._cursor) != ImageSlotState.READY
 
     def is_waiting_for_next_images(self) -> bool:
-        if self._next_img_data is None:
+        if (
+            self._img_data_slots is None
+            or self._cursor is None
+            or not self.has_next_image()
+        ):
             return False
-        return len(self._next_img_data) != self._get_num_data_dict_keys()
+        return self.get_slot_state(self._cursor + 1) != ImageSlotState.READY
 
     def is_waiting_for_images(self) -> bool:
         return (
@@ -271,36 +753,74 @@ class CurationModel(QObject):
         immediate: cursor_moved
         at some point: image_loading_finished
         """
-        if self._curr_img_data is None or self._next_img_data is None:
+        if self._img_data_slots is None or self._curation_record is None:
             raise RuntimeError(
                 "Cannot start loading when image data dict is uninitialized"
             )
 
         self._cursor = 0
+        self._clear_merging_mask_draft()
+        self._curation_record.mark_visited(0)
         # need to set use image to true since we want this to be the default
         self.set_use_image(True)
-        self._curr_img_data.clear()
-        if self.has_next_image():
-            self._next_img_data.clear()
+        self._img_data_slots.clear()
+        self._disagreement_slots.clear()
+        self._agreement_scores.clear()
+        self.session_started.emit()
+        self.cursor_moved.emit()
+
+    def resume_session(self, session: CurationSession) -> None:
+        """
+        Restores the images, channels and decisions of a half-finished session (e.g.
+        loaded from a CurationJournal) and continues from its cursor. The image
+        directories are not scanned again, and only the images around the cursor
+        are loaded.
+        Signals emitted:
+        immediate: current_view_changed, session_resumed, cursor_moved
+        at some point: image_loading_finished
+        """
+        self._set_img_dir_paths_from_store(session.records)
+        self._img_dirs = {
+            img_type: paths[0].parent if paths else None
+            for img_type, paths in self._img_dir_paths.items()
+        }
+        self._selected_channels = dict(session.channels)
+        self._main_model.set_selected_channels(self._selected_channels)
+        self._curation_record = session.records
+        self._img_data_slots = {}
+        self._disagreement_slots.clear()
+        self._image_loading_stopped = False
+        self._current_view = CurationView.MAIN_VIEW
+        self.current_view_changed.emit()
+
+        self._cursor = session.cursor
+        self._clear_merging_mask_draft()
+        if self._curation_record.mark_visited(session.cursor):
+            self.set_use_image(True)
+        self.session_resumed.emit(session)
         self.cursor_moved.emit()
 
     def stop_loading_images(self) -> None:
         """
         Drops pre-loaded images from memory and prevents further
-        image loading from occurring in curation.
+        image loading from occurring in curation, at the end of the session.
+        Signals emitted:
+        immediate: session_finished
         """
-        if self._curr_img_data is None or self._next_img_data is None:
+        if self._img_data_slots is None:
             raise RuntimeError(
                 "Cannot stop loading when image data dict is uninitialized"
             )
 
         self._image_loading_stopped = True
-        self._curr_img_data.clear()
-        self._next_img_data.clear()
+        self._img_data_slots.clear()
+        self._disagreement_slots.clear()
+        self.session_finished.emit()
 
     def next_image(self) -> None:
         """
-        Move to the next image for curation.
+        Move to the next image for curation. Only the current and next images need
+        to be loaded; images further ahead keep loading in the background.
         Signals emitted:
         immediate: cursor_moved
         at some point: image_loading_finished
@@ -314,19 +834,39 @@ class CurationModel(QObject):
         if not self.has_next_image() or self._cursor is None:
             raise RuntimeError("No next image available")
 
-        self._curr_img_data = self._next_img_data
-        self._cursor += 1
-        self._next_img_data = (
-            {}
-            if self.has_next_image()
-            else self._get_placeholder_dict(incl_seg2=self.has_seg2_data())
-        )
-        # need to set use image to true since we want this to be the default
-        self.set_use_image(True)
-        self.cursor_moved.emit()
-        # client expects that calling next will eventually result in a image_loading_finished signal
-        if not self.has_next_image():
-            self.image_loading_finished.emit()
+        self._move_cursor(self._cursor + 1)
+
+    def previous_image(self) -> None:
+        """
+        Move to the previous image for curation. Recently viewed images are kept in
+        memory, so this usually does not need to reload anything.
+        Signals emitted:
+        immediate: cursor_moved
+        at some point: image_loading_finished
+        """
+        if not self.has_previous_image() or self._cursor is None:
+            raise RuntimeError("No previous image available")
+        self.go_to(self._cursor - 1)
+
+    def go_to(self, img_idx: int) -> None:
+        """
+        Move to the image at :param img_idx:. Unlike next_image, this does not require
+        any images to be loaded; images no longer near the cursor are dropped and
+        the image at :param img_idx: is loaded first.
+        Signals emitted:
+        immediate: cursor_moved
+        at some point: image_loading_finished
+        """
+        if self.get_image_loading_stopped():
+            raise RuntimeError("Image loader is stopped.")
+        if self._cursor is None:
+            raise RuntimeError(
+                "Cannot move before images have started loading"
+            )
+        if not 0 <= img_idx < self.get_num_images():
+            raise ValueError(f"Image index {img_idx} is out of range")
+
+        self._move_cursor(img_idx)
 
     def set_curation_record_saved_to_disk(self, saved: bool) -> None:
         self.saved_to_disk.emit(saved)
@@ -356,11 +896,11 @@ class CurationModel(QObject):
                 "Cannot calculate with undefined cursor or curation record"
             )
 
-        possible: int = self.get_num_images()
-        for i in range(self._cursor):
-            if not self._curation_record[i].to_use:
-                possible -= 1
-        return possible
+        # the cursor is always visited
+        not_used: int = self._curation_record.get_num_visited_not_used()
+        if not self._curation_record.get_to_use(self._cursor):
+            not_used -= 1
+        return self.get_num_images() - not_used
 
     def get_num_images_selected_to_use(self) -> int:
         """
@@ -368,15 +908,18 @@ class CurationModel(QObject):
         'to_use' selection is included.
         """
         return (
-            sum([1 if rec.to_use else 0 for rec in self._curation_record])
+            self._curation_record.get_num_to_use()
             if self._curation_record is not None
             else 0
         )
 
-    def _generate_new_curation_record(self) -> List[CurationRecord]:
+    def _generate_new_curation_record(self) -> CurationRecordStore:
         """
-        Returns a list of curation records populated with the file paths in self._img_dir_paths. See
-        CurationRecord constructor below for the default values.
+        Returns a store of curation records populated with the file paths in self._img_dir_paths. See
+        CurationRecordStore for the default values. Images are paired by file stem
+        (see PairingIndex); files that cannot be paired are left out of the image directory paths
+        and reported by get_unmatched_paths. If no stems match at all (e.g. segmentations named differently from
+        their raw images), images are paired by position in their sorted directories.
         """
         raw_paths: Optional[list[Path]] = self._img_dir_paths[ImageType.RAW]
         seg1_paths: Optional[list[Path]] = self._img_dir_paths[ImageType.SEG1]
@@ -384,25 +927,89 @@ class CurationModel(QObject):
             raise RuntimeError("Expected values for raw and seg1 images")
 
         seg2_paths: Optional[list[Path]] = self._img_dir_paths[ImageType.SEG2]
-        if len(raw_paths) != len(seg1_paths) or (
+        sources: Dict[ImageType, List[Path]] = {
+            ImageType.RAW: raw_paths,
+            ImageType.SEG1: seg1_paths,
+        }
+        if seg2_paths is not None:
+            sources[ImageType.SEG2] = seg2_paths
+        index: PairingIndex[ImageType] = PairingIndex(
+            sources, self._stem_normalizer
+        )
+
+        if len(index) > 0:
+            self._unmatched_paths = index.get_unmatched()
+            raw_paths = index.get_paths(ImageType.RAW)
+            seg1_paths = index.get_paths(ImageType.SEG1)
+            if seg2_paths is not None:
+                seg2_paths = index.get_paths(ImageType.SEG2)
+        elif len(raw_paths) != len(seg1_paths) or (
             seg2_paths is not None and len(seg1_paths) != len(seg2_paths)
         ):
             raise ValueError("provided image dirs must be of same length")
-        elif len(raw_paths) < 1:
+        else:
+            self._unmatched_paths = {img_type: [] for img_type in sources}
+        if len(raw_paths) < 1:
             raise ValueError("cannot load images from empty image dir")
 
-        return [
-            CurationRecord(
-                raw_paths[i],
-                seg1_paths[i],
-                (seg2_paths[i] if seg2_paths is not None else None),
-                None,
-                None,
-                "seg1",
-                False,
-            )
-            for i in range(len(raw_paths))
-        ]
+        store: CurationRecordStore = CurationRecordStore(
+            raw_paths, seg1_paths, seg2_paths
+        )
+        self._set_img_dir_paths_from_store(store)
+        return store
+
+    def _move_cursor(self, img_idx: int) -> None:
+        self._cursor = img_idx
+        self._clear_merging_mask_draft()
+        self._drop_slots_outside_window()
+        if (
+            self._curation_record is not None
+            and self._curation_record.mark_visited(img_idx)
+        ):
+            # need to set use image to true since we want this to be the default
+            self.set_use_image(True)
+        self.cursor_moved.emit()
+        # client expects that moving the cursor will eventually result in a image_loading_finished signal,
+        # the images may already have been prefetched
+        if not self.is_waiting_for_images():
+            self.image_loading_finished.emit()
+
+    def _clear_merging_mask_draft(self) -> None:
+        self._merging_mask_draft = None
+        self._merge_preview = None
+
+    def _get_window(self) -> range:
+        """
+        Returns the indices of the current image and the images prefetched after it.
+        """
+        if self._cursor is None:
+            return range(0)
+        return range(
+            self._cursor,
+            min(
+                self._cursor + self._prefetch_depth + 1, self.get_num_images()
+            ),
+        )
+
+    def _is_in_window(self, img_idx: int) -> bool:
+        """
+        Returns True if image data for :param img_idx: should be kept in memory, i.e.
+        it is in the prefetch window or is a recently viewed image.
+        """
+        if self._image_loading_stopped or self._cursor is None:
+            return False
+        return (
+            img_idx in self._get_window()
+            or self._cursor - self._history_size <= img_idx < self._cursor
+        )
+
+    def _drop_slots_outside_window(self) -> None:
+        if self._img_data_slots is None:
+            return
+        for img_idx in list(self._img_data_slots):
+            if not self._is_in_window(img_idx):
+                del self._img_data_slots[img_idx]
+                self._disagreement_slots.pop(img_idx, None)
 
     def _get_num_data_dict_keys(self) -> int:
         """
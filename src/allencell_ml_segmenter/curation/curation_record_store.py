@@ -0,0 +1,236 @@
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+import numpy as np
+
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+
+# values of the base image column, by code
+BASE_IMAGES: List[Optional[str]] = [None, "seg1", "seg2"]
+_BASE_IMAGE_CODES: Dict[Optional[str], int] = {
+    base: code for code, base in enumerate(BASE_IMAGES)
+}
+
+
+class CurationRecordStore:
+    """
+    Curation records of a session, stored by column: a flag array for use and
+    visited, a code array for the base image, the path lists as given and masks
+    by reference for the images that have them. The number of images selected
+    for use, and of visited images not selected, are kept as running counts so
+    that the counters shown while curating do not depend on dataset size.
+
+    Indexing returns a new CurationRecord built from the columns; changes to it
+    are not written back, use the setters instead.
+    """
+
+    def __init__(
+        self,
+        raw_paths: List[Path],
+        seg1_paths: List[Path],
+        seg2_paths: Optional[List[Path]] = None,
+    ) -> None:
+        """
+        Creates a store of unvisited records that are not selected for use and use
+        seg1 as base image. The path lists are held, not copied, and must not be
+        modified afterwards.
+        """
+        if len(raw_paths) != len(seg1_paths) or (
+            seg2_paths is not None and len(seg2_paths) != len(raw_paths)
+        ):
+            raise ValueError("provided image paths must be of same length")
+        self._raw_paths: List[Path] = raw_paths
+        self._seg1_paths: List[Path] = seg1_paths
+        self._seg2_paths: Optional[List[Path]] = seg2_paths
+        num_images: int = len(raw_paths)
+        self._to_use: np.ndarray = np.zeros(num_images, dtype=bool)
+        self._visited: np.ndarray = np.zeros(num_images, dtype=bool)
+        self._base_image: np.ndarray = np.full(
+            num_images, _BASE_IMAGE_CODES["seg1"], dtype=np.int8
+        )
+        self._excluding_masks: Dict[int, np.ndarray] = {}
+        self._merging_masks: Dict[int, np.ndarray] = {}
+        self._num_to_use: int = 0
+        self._num_visited_not_used: int = 0
+
+    @classmethod
+    def from_records(
+        cls, records: Sequence[CurationRecord], visited: Iterable[int] = ()
+    ) -> "CurationRecordStore":
+        """
+        Returns a store holding :param records:, with the images at
+        :param visited: marked as visited.
+        """
+        seg2_paths: List[Optional[Path]] = [r.seg2 for r in records]
+        store: CurationRecordStore = cls(
+            [r.raw_file for r in records],
+            [r.seg1 for r in records],
+            (
+                [p for p in seg2_paths if p is not None]
+                if records and all(p is not None for p in seg2_paths)
+                else None
+            ),
+        )
+        for img_idx, record in enumerate(records):
+            store.set_to_use(img_idx, record.to_use)
+            store.set_base_image(img_idx, record.base_image)
+            store.set_excluding_mask(img_idx, record.excluding_mask)
+            store.set_merging_mask(img_idx, record.merging_mask)
+        for img_idx in visited:
+            store.mark_visited(img_idx)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._raw_paths)
+
+    def __getitem__(self, img_idx: int) -> CurationRecord:
+        return CurationRecord(
+            self._raw_paths[img_idx],
+            self._seg1_paths[img_idx],
+            (
+                self._seg2_paths[img_idx]
+                if self._seg2_paths is not None
+                else None
+            ),
+            self._excluding_masks.get(img_idx),
+            self._merging_masks.get(img_idx),
+            BASE_IMAGES[self._base_image[img_idx]],
+            bool(self._to_use[img_idx]),
+        )
+
+    def __iter__(self) -> Iterator[CurationRecord]:
+        return (self[i] for i in range(len(self)))
+
+    def get_raw_paths(self) -> List[Path]:
+        return self._raw_paths
+
+    def get_seg1_paths(self) -> List[Path]:
+        return self._seg1_paths
+
+    def get_seg2_paths(self) -> Optional[List[Path]]:
+        return self._seg2_paths
+
+    def get_raw_path(self, img_idx: int) -> Path:
+        return self._raw_paths[img_idx]
+
+    def get_to_use(self, img_idx: int) -> bool:
+        return bool(self._to_use[img_idx])
+
+    def set_to_use(self, img_idx: int, use: bool) -> None:
+        if self._to_use[img_idx] == use:
+            return
+        self._to_use[img_idx] = use
+        change: int = 1 if use else -1
+        self._num_to_use += change
+        if self._visited[img_idx]:
+            self._num_visited_not_used -= change
+
+    def get_base_image(self, img_idx: int) -> Optional[str]:
+        return BASE_IMAGES[self._base_image[img_idx]]
+
+    def set_base_image(self, img_idx: int, base: Optional[str]) -> None:
+        self._base_image[img_idx] = _BASE_IMAGE_CODES[base]
+
+    def get_excluding_mask(self, img_idx: int) -> Optional[np.ndarray]:
+        return self._excluding_masks.get(img_idx)
+
+    def set_excluding_mask(
+        self, img_idx: int, mask: Optional[np.ndarray]
+    ) -> None:
+        self._set_mask(self._excluding_masks, img_idx, mask)
+
+    def get_merging_mask(self, img_idx: int) -> Optional[np.ndarray]:
+        return self._merging_masks.get(img_idx)
+
+    def set_merging_mask(
+        self, img_idx: int, mask: Optional[np.ndarray]
+    ) -> None:
+        self._set_mask(self._merging_masks, img_idx, mask)
+
+    def is_visited(self, img_idx: int) -> bool:
+        return bool(self._visited[img_idx])
+
+    def mark_visited(self, img_idx: int) -> bool:
+        """
+        Marks the image at :param img_idx: as visited, and returns True if it was
+        not visited before.
+        """
+        if self._visited[img_idx]:
+            return False
+        self._visited[img_idx] = True
+        if not self._to_use[img_idx]:
+            self._num_visited_not_used += 1
+        return True
+
+    def get_visited_indices(self) -> Set[int]:
+        return set(np.flatnonzero(self._visited).tolist())
+
+    def get_num_to_use(self) -> int:
+        """
+        Returns the number of images selected for use, in constant time.
+        """
+        return self._num_to_use
+
+    def get_num_visited_not_used(self) -> int:
+        """
+        Returns the number of visited images not selected for use, in constant
+        time.
+        """
+        return self._num_visited_not_used
+
+    def reorder(self, positions: Sequence[int], order: Sequence[int]) -> None:
+        """
+        Moves the record at index order[i] to index positions[i] for every i.
+        :param order: must be a permutation of :param positions:. The path lists
+        are replaced rather than modified, so lists returned before are unchanged.
+        """
+        dst: np.ndarray = np.asarray(positions, dtype=np.intp)
+        src: np.ndarray = np.asarray(order, dtype=np.intp)
+        # the right hand side is a copy, so overlapping moves are safe
+        for column in [self._to_use, self._visited, self._base_image]:
+            column[dst] = column[src]
+        self._raw_paths = self._reorder_list(self._raw_paths, dst, src)
+        self._seg1_paths = self._reorder_list(self._seg1_paths, dst, src)
+        if self._seg2_paths is not None:
+            self._seg2_paths = self._reorder_list(self._seg2_paths, dst, src)
+        self._excluding_masks = self._reorder_masks(
+            self._excluding_masks, positions, order
+        )
+        self._merging_masks = self._reorder_masks(
+            self._merging_masks, positions, order
+        )
+
+    @staticmethod
+    def _reorder_list(
+        paths: List[Path], dst: np.ndarray, src: np.ndarray
+    ) -> List[Path]:
+        reordered: List[Path] = list(paths)
+        for d, s in zip(dst.tolist(), src.tolist()):
+            reordered[d] = paths[s]
+        return reordered
+
+    @staticmethod
+    def _reorder_masks(
+        masks: Dict[int, np.ndarray],
+        positions: Sequence[int],
+        order: Sequence[int],
+    ) -> Dict[int, np.ndarray]:
+        moved: Set[int] = set(positions)
+        reordered: Dict[int, np.ndarray] = {
+            i: mask for i, mask in masks.items() if i not in moved
+        }
+        for d, s in zip(positions, order):
+            if s in masks:
+                reordered[d] = masks[s]
+        return reordered
+
+    @staticmethod
+    def _set_mask(
+        masks: Dict[int, np.ndarray],
+        img_idx: int,
+        mask: Optional[np.ndarray],
+    ) -> None:
+        if mask is None:
+            masks.pop(img_idx, None)
+        else:
+            masks[img_idx] = mask
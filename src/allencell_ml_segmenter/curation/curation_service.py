@@ -2,30 +2,53 @@ from allencell_ml_segmenter.main.i_experiments_model import IExperimentsModel
 from allencell_ml_segmenter.curation.curation_model import (
     CurationModel,
     CurationRecord,
+    ImageSlotState,
     ImageType,
     CurationView,
 )
+from allencell_ml_segmenter.curation.curation_record_store import (
+    CurationRecordStore,
+)
+from allencell_ml_segmenter.curation.curation_journal import (
+    CurationJournal,
+    CurationSession,
+)
 from allencell_ml_segmenter.core.image_data_extractor import (
     IImageDataExtractor,
-    AICSImageDataExtractor,
+    CoalescingImageDataExtractor,
     ImageData,
 )
 from allencell_ml_segmenter.core.task_executor import (
     ITaskExecutor,
-    NapariThreadTaskExecutor,
+    PooledTaskExecutor,
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
 )
+from allencell_ml_segmenter.curation.segmentation_agreement import (
+    AgreementScore,
+    score_segmentation_agreement,
+)
+from allencell_ml_segmenter.curation.merge_preview import MergePreview
 from allencell_ml_segmenter.utils.file_utils import FileUtils
+from allencell_ml_segmenter.utils.image_processing import (
+    get_disagreement_labels,
+)
+from allencell_ml_segmenter.utils.directory_scanner import (
+    scan_files_in_batches,
+)
 from allencell_ml_segmenter.utils.file_writer import IFileWriter, FileWriter
 from allencell_ml_segmenter.main.main_model import MIN_DATASET_SIZE
 
 from pathlib import Path
 from qtpy.QtCore import QObject
-from typing import List, Optional, Callable
-from copy import deepcopy
-from collections import namedtuple
-
+from typing import List, Optional, Set, Tuple
+from functools import partial
+import numpy as np
 
-DirectoryData = namedtuple("DirectoryData", ["fpaths", "channels"])
+# task group of the agreement scoring tasks of a curation session
+AGREEMENT_TASK_GROUP: str = "curation_agreement"
+# the images yet to review are reordered each time this many more are scored
+AGREEMENT_REORDER_INTERVAL: int = 500
 
 
 # Important note: we do not want to access the model in any of the threads because model state may change
@@ -36,53 +59,109 @@ class CurationService(QObject):
         self,
         curation_model: CurationModel,
         experiments_model: IExperimentsModel,
-        img_data_extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance(),
-        task_executor: ITaskExecutor = NapariThreadTaskExecutor.global_instance(),
+        img_data_extractor: IImageDataExtractor = CoalescingImageDataExtractor.global_instance(),
+        task_executor: Optional[ITaskExecutor] = None,
         file_writer: IFileWriter = FileWriter.global_instance(),
     ) -> None:
         super().__init__()
         self._curation_model: CurationModel = curation_model
         self._experiments_model: IExperimentsModel = experiments_model
         self._img_data_extractor: IImageDataExtractor = img_data_extractor
-        self._task_executor: ITaskExecutor = task_executor
+        self._task_executor: ITaskExecutor = (
+            task_executor
+            if task_executor is not None
+            else PooledTaskExecutor.global_instance()
+        )
         self._file_writer: IFileWriter = file_writer
         self._file_utils: FileUtils = FileUtils(file_writer)
+        # indices of images with extraction tasks that have not finished
+        self._loading_indices: Set[int] = set()
+        # journal of the current curation session, and the cursor it last recorded
+        self._journal: Optional[CurationJournal] = None
+        self._journal_cursor: Optional[int] = None
+        # number of agreement scoring tasks of the current session not yet done
+        self._agreement_remaining: int = 0
+        self._agreement_scored: int = 0
+        # merge preview of the current image's merging mask draft, with the
+        # (image index, seg1 path, base image) it was made for
+        self._merge_preview: Optional[MergePreview] = None
+        self._merge_preview_key: Optional[Tuple[int, Path, str]] = None
+        # at most one preview update runs at a time; drafts changed meanwhile
+        # are coalesced into one update after it
+        self._merge_preview_running: bool = False
+        self._merge_preview_pending: bool = False
 
         self._curation_model.image_directory_set.connect(
             self._on_image_dir_set
         )
-        self._curation_model.cursor_moved.connect(self._on_cursor_moved)
+        self._curation_model.session_started.connect(self._start_journal)
+        self._curation_model.session_resumed.connect(self._resume_journal)
+        self._curation_model.session_finished.connect(self._finish_journal)
+        self._curation_model.session_started.connect(
+            self._start_agreement_scoring
+        )
+        self._curation_model.queue_reordered.connect(self._on_queue_reordered)
+        self._curation_model.cursor_moved.connect(self._update_journal)
+        self._curation_model.cursor_moved.connect(self._load_prefetch_window)
+        self._curation_model.image_slot_ready.connect(
+            lambda _: self._load_prefetch_window()
+        )
+        self._curation_model.image_slot_ready.connect(
+            self._compute_disagreement
+        )
+        self._curation_model.prefetch_settings_changed.connect(
+            self._load_prefetch_window
+        )
+        self._curation_model.merging_mask_draft_changed.connect(
+            self._update_merge_preview
+        )
         self._curation_model.save_to_disk_requested.connect(
             self._on_save_to_disk
         )
 
-    def _get_dir_data(self, dir: Path) -> DirectoryData:
-        files: List[Path] = (
-            self._file_utils.get_all_files_in_dir_ignore_hidden(dir)
-        )
-
-        if len(files) < MIN_DATASET_SIZE:
-            raise RuntimeError(
-                f"Curation requires at least {MIN_DATASET_SIZE} images and their segmentations"
+    def _on_dir_batch_found(
+        self, img_type: ImageType, files: List[Path], batch: List[Path]
+    ) -> None:
+        if not files:
+            # any image tells us the channel count, so the channel selection
+            # can be shown while the rest of the directory is still scanned
+            self._task_executor.exec(
+                lambda: self._img_data_extractor.extract_image_data(
+                    batch[0], np_data=False
+                ),
+                on_return=lambda img_data: self._curation_model.set_channel_count(
+                    img_type, img_data.channels
+                ),
+                on_error=lambda e: self._on_dir_data_errored(img_type, e),
+                group=self._get_dir_task_group(img_type),
             )
+        files.extend(batch)
+        self._curation_model.set_image_file_count(img_type, len(files))
 
-        img_data: ImageData = self._img_data_extractor.extract_image_data(
-            files[0], np_data=False
-        )
-        return DirectoryData(files, img_data.channels)
-
-    def _on_dir_data_extracted(
-        self, img_type: ImageType, dir_data: DirectoryData
+    def _on_dir_scan_finished(
+        self, img_type: ImageType, files: List[Path]
     ) -> None:
-        self._curation_model.set_image_directory_paths(
-            img_type, dir_data.fpaths
-        )
-        self._curation_model.set_channel_count(img_type, dir_data.channels)
+        if len(files) < MIN_DATASET_SIZE:
+            self._on_dir_data_errored(
+                img_type,
+                RuntimeError(
+                    f"Curation requires at least {MIN_DATASET_SIZE} images and their segmentations"
+                ),
+            )
+        # files are all in the same directory, and names compare faster than paths
+        files.sort(key=lambda path: path.name)
+        self._curation_model.set_image_directory_paths(img_type, files)
 
     def _on_dir_data_errored(self, img_type: ImageType, e: Exception) -> None:
+        # a channel count from a task still running would hide the error
+        self._task_executor.cancel_group(self._get_dir_task_group(img_type))
         self._curation_model.set_channel_count(img_type, 0)
         raise e
 
+    @staticmethod
+    def _get_dir_task_group(img_type: ImageType) -> str:
+        return f"curation_dir_{img_type.value}"
+
     def _on_image_dir_set(self, img_type: ImageType) -> None:
         # paths are immutable, so no need to explicitly copy
         dir: Optional[Path] = self._curation_model.get_image_directory(
@@ -90,24 +169,26 @@ class CurationService(QObject):
         )
         if dir is None:
             raise RuntimeError("Image dir not allowed to be None")
-        self._task_executor.exec(
-            lambda: self._get_dir_data(dir),
-            on_return=lambda dir_data: self._on_dir_data_extracted(
-                img_type, dir_data
-            ),
+        # results for a previously selected directory are no longer needed
+        group: str = self._get_dir_task_group(img_type)
+        self._task_executor.cancel_group(group)
+        # directories can hold hundreds of thousands of files, so they are
+        # scanned in batches and the model is updated as files are found
+        files: List[Path] = []
+        scan_files_in_batches(
+            self._task_executor,
+            dir,
+            lambda batch: self._on_dir_batch_found(img_type, files, batch),
+            on_finish=lambda: self._on_dir_scan_finished(img_type, files),
             on_error=lambda e: self._on_dir_data_errored(img_type, e),
+            group=group,
         )
 
-    def _extract_images(
-        self,
-        img_idx: int,
-        setter_fn: Callable[[ImageType, ImageData], None],
-        err_str: str,
-    ) -> None:
+    def _extract_images(self, img_idx: int, priority: int) -> None:
         """
-        Uses TaskExecutor to extract data for images at :param img_idx:, saves extracted data using
-        :param setter_fn: to set model state. Provides :param err_str: ('curr' or 'next') to the error
-        handler for additional debugging info.
+        Uses TaskExecutor to extract data for images at :param img_idx: and saves extracted
+        data to the model's slot for :param img_idx:. Tasks are started with :param priority:
+        and can be cancelled with the group from _get_image_task_group.
         """
         raw_paths: Optional[list[Path]] = (
             self._curation_model.get_image_directory_paths(ImageType.RAW)
@@ -136,69 +217,411 @@ class CurationService(QObject):
             or seg1_channel is None
         ):
             raise RuntimeError("Must select raw and seg1 paths and channels")
+        lazy: bool = self._is_large_image(raw_paths[img_idx])
 
+        def setter_fn(img_type: ImageType, img_data: ImageData) -> None:
+            self._curation_model.set_image_data(img_idx, img_type, img_data)
+
+        group: str = self._get_image_task_group(img_idx)
+        self._curation_model.start_loading_slot(img_idx)
+        self._loading_indices.add(img_idx)
+        # the extractor checks its cache and coalesces identical requests on
+        # these threads, and decodes in worker processes if it is set to (see
+        # AICSImageDataExtractor.set_decode_executor)
         self._task_executor.exec(
-            lambda: self._img_data_extractor.extract_image_data(
+            partial(
+                self._img_data_extractor.extract_image_data,
                 raw_paths[img_idx],
                 channel=raw_channel,
+                lazy=lazy,
             ),
             on_return=lambda img_data: setter_fn(ImageType.RAW, img_data),
             on_error=lambda e: self._on_cursor_moved_error(
-                ImageType.RAW, err_str, e
+                ImageType.RAW, img_idx, e
             ),
+            priority=priority,
+            group=group,
         )
         self._task_executor.exec(
-            lambda: self._img_data_extractor.extract_image_data(
-                seg1_paths[img_idx], channel=seg1_channel, seg=1
+            partial(
+                self._img_data_extractor.extract_image_data,
+                seg1_paths[img_idx],
+                channel=seg1_channel,
+                seg=1,
+                lazy=lazy,
             ),
             on_return=lambda img_data: setter_fn(ImageType.SEG1, img_data),
             on_error=lambda e: self._on_cursor_moved_error(
-                ImageType.SEG1, err_str, e
+                ImageType.SEG1, img_idx, e
             ),
+            priority=priority,
+            group=group,
         )
         if seg2_paths is not None and seg2_channel is not None:
             self._task_executor.exec(
-                lambda: self._img_data_extractor.extract_image_data(
-                    seg2_paths[img_idx], channel=seg2_channel, seg=2
+                partial(
+                    self._img_data_extractor.extract_image_data,
+                    seg2_paths[img_idx],
+                    channel=seg2_channel,
+                    seg=2,
+                    lazy=lazy,
                 ),
                 on_return=lambda img_data: setter_fn(ImageType.SEG2, img_data),
                 on_error=lambda e: self._on_cursor_moved_error(
-                    ImageType.SEG2, err_str, e
+                    ImageType.SEG2, img_idx, e
                 ),
+                priority=priority,
+                group=group,
+            )
+
+    def _is_large_image(self, raw_path: Path) -> bool:
+        """
+        True if the image with raw file :param raw_path: is large enough to be
+        read lazily. The file size is a lower bound on the decoded size of
+        compressed images, so large images are never decoded by mistake.
+        """
+        try:
+            size: int = raw_path.stat().st_size
+        except OSError:
+            # reported by the extraction
+            return False
+        return size >= self._curation_model.get_lazy_loading_min_bytes()
+
+    def _compute_disagreement(self, img_idx: int) -> None:
+        """
+        Computes where seg1 and seg2 differ for the loaded image at
+        :param img_idx:, from the data already in memory, on a worker thread.
+        """
+        seg1_data: Optional[ImageData] = self._curation_model.get_image_data(
+            img_idx, ImageType.SEG1
+        )
+        seg2_data: Optional[ImageData] = self._curation_model.get_image_data(
+            img_idx, ImageType.SEG2
+        )
+        if (
+            seg1_data is None
+            or seg2_data is None
+            or seg1_data.np_data is None
+            or seg2_data.np_data is None
+        ):
+            return
+        cursor: Optional[int] = self._curation_model.get_curr_image_index()
+        seg1_path: Path = seg1_data.path
+        # threads rather than the decode executor, so the arrays are not copied
+        # to another process; numpy releases the GIL while comparing
+        self._task_executor.exec(
+            partial(
+                get_disagreement_labels, seg1_data.np_data, seg2_data.np_data
+            ),
+            on_return=lambda labels: self._curation_model.set_disagreement_data(
+                img_idx, seg1_path, labels
+            ),
+            priority=(
+                PRIORITY_HIGH
+                if cursor is None
+                else self._get_image_priority(img_idx, cursor)
+            ),
+            group=self._get_image_task_group(img_idx),
+        )
+
+    def _update_merge_preview(self) -> None:
+        """
+        Updates the merge preview of the current image to its merging mask
+        draft on a worker thread, or removes it if there is no draft. Only the
+        region around the polygons that changed is recomposited.
+        """
+        cursor: Optional[int] = self._curation_model.get_curr_image_index()
+        polygons: Optional[np.ndarray] = (
+            self._curation_model.get_merging_mask_draft()
+        )
+        base_image: Optional[str] = self._curation_model.get_base_image()
+        seg1_data: Optional[ImageData] = (
+            self._curation_model.get_curr_image_data(ImageType.SEG1)
+        )
+        seg2_data: Optional[ImageData] = (
+            self._curation_model.get_curr_image_data(ImageType.SEG2)
+        )
+        if (
+            cursor is None
+            or polygons is None
+            or base_image is None
+            or seg1_data is None
+            or seg2_data is None
+            # lazily loaded images would have to be read in full
+            or not isinstance(seg1_data.np_data, np.ndarray)
+            or not isinstance(seg2_data.np_data, np.ndarray)
+        ):
+            self._merge_preview = None
+            self._merge_preview_key = None
+            if (
+                cursor is not None
+                and self._curation_model.get_merge_preview() is not None
+            ):
+                self._curation_model.set_merge_preview(cursor, None)
+            return
+        if self._merge_preview_running:
+            self._merge_preview_pending = True
+            return
+
+        key: Tuple[int, Path, str] = (cursor, seg1_data.path, base_image)
+        # a new preview must be shown even if its first update changes nothing
+        fresh: bool = self._curation_model.get_merge_preview() is None
+        if self._merge_preview is None or self._merge_preview_key != key:
+            fresh = True
+            base, other = (
+                (seg1_data.np_data, seg2_data.np_data)
+                if base_image == "seg1"
+                else (seg2_data.np_data, seg1_data.np_data)
             )
+            self._merge_preview = MergePreview(base, other)
+            self._merge_preview_key = key
+        preview: MergePreview = self._merge_preview
+
+        def on_return(box: Optional[Tuple[int, int, int, int]]) -> None:
+            if preview is self._merge_preview and (box is not None or fresh):
+                self._curation_model.set_merge_preview(
+                    cursor, preview.get_labels()
+                )
+
+        self._merge_preview_running = True
+        self._task_executor.exec(
+            partial(preview.update, list(polygons)),
+            on_return=on_return,
+            on_finish=self._on_merge_preview_finished,
+            priority=PRIORITY_HIGH,
+        )
+
+    def _on_merge_preview_finished(self) -> None:
+        self._merge_preview_running = False
+        if self._merge_preview_pending:
+            self._merge_preview_pending = False
+            self._update_merge_preview()
+
+    @staticmethod
+    def _get_image_task_group(img_idx: int) -> str:
+        return f"curation_image_{img_idx}"
+
+    def _get_image_priority(self, img_idx: int, cursor: int) -> int:
+        """
+        Returns the task priority for work on the image at :param img_idx:. The
+        current image gets top priority, then upcoming images by distance, and
+        then images behind :param cursor:, so history never delays prefetch.
+        """
+        if img_idx == cursor:
+            return PRIORITY_HIGH
+        if img_idx > cursor:
+            return cursor - img_idx
+        return img_idx - cursor - self._curation_model.get_prefetch_depth()
 
     def _on_cursor_moved_error(
-        self, img_type: ImageType, curr_or_next: str, e: Exception
+        self, img_type: ImageType, img_idx: int, e: Exception
     ) -> None:
         raise RuntimeError(
-            f"There was a problem loading {img_type} for the {curr_or_next} images"
+            f"There was a problem loading {img_type} for image {img_idx}"
         )
 
-    def _on_cursor_moved(self) -> None:
+    def _load_prefetch_window(self) -> None:
+        """
+        Starts extraction tasks for every image in the model's prefetch window that
+        is not loaded or loading yet. Called whenever the cursor moves, a slot
+        finishes loading (giving a size estimate for images further ahead), or the
+        prefetch settings change.
+        """
         cursor: Optional[int] = self._curation_model.get_curr_image_index()
         if cursor is None:
-            raise RuntimeError("Cursor must not be None")
+            return
 
-        if self._curation_model.is_waiting_for_curr_images():
-            # start extraction tasks for curr images (paths at cursor)
-            self._extract_images(
-                cursor, self._curation_model.set_curr_image_data, "curr"
+        # cancel stale decodes for images the model has dropped, and forget
+        # images that have finished loading
+        for img_idx in list(self._loading_indices):
+            state: ImageSlotState = self._curation_model.get_slot_state(
+                img_idx
             )
+            if state == ImageSlotState.NOT_LOADED:
+                group: str = self._get_image_task_group(img_idx)
+                self._task_executor.cancel_group(group)
+            if state != ImageSlotState.LOADING:
+                self._loading_indices.discard(img_idx)
 
-        if self._curation_model.is_waiting_for_next_images():
-            # start extraction tasks for next images (paths at cursor + 1)
+        for img_idx in self._curation_model.get_slots_to_load():
             self._extract_images(
-                cursor + 1, self._curation_model.set_next_image_data, "next"
+                img_idx, self._get_image_priority(img_idx, cursor)
             )
 
+    def _resume_journal(self, session: CurationSession) -> None:
+        self._close_journal()
+        journal_path: Optional[Path] = self._curation_model.get_journal_path()
+        if journal_path is None:
+            return
+
+        # the journal :param session: was loaded from is continued, not replaced
+        self._journal = CurationJournal(journal_path, self._file_writer)
+        self._journal.resume_session(session)
+        self._journal_cursor = None
+
+    def _start_journal(self) -> None:
+        journal_path: Optional[Path] = self._curation_model.get_journal_path()
+        raw_paths: Optional[List[Path]] = (
+            self._curation_model.get_image_directory_paths(ImageType.RAW)
+        )
+        seg1_paths: Optional[List[Path]] = (
+            self._curation_model.get_image_directory_paths(ImageType.SEG1)
+        )
+        self._close_journal()
+        if journal_path is None or raw_paths is None or seg1_paths is None:
+            return
+
+        self._journal = CurationJournal(journal_path, self._file_writer)
+        self._journal.start_session(
+            raw_paths,
+            seg1_paths,
+            self._curation_model.get_image_directory_paths(ImageType.SEG2),
+            {
+                img_type: self._curation_model.get_selected_channel(img_type)
+                for img_type in ImageType
+            },
+        )
+        self._journal_cursor = None
+
+    def _finish_journal(self) -> None:
+        """
+        Marks the journal of the session that was curated to its end as
+        finished, so that the session is not offered for resuming, and closes it.
+        """
+        if self._journal is None:
+            return
+        if self._journal_cursor is not None:
+            self._journal_record(self._journal_cursor)
+        self._journal.finish()
+        self._close_journal()
+
+    def _close_journal(self) -> None:
+        # entries still queued for the journal are written before it closes, so
+        # none are appended to the journal that replaces it
+        if self._journal is not None:
+            self._journal.close()
+        self._journal = None
+        self._journal_cursor = None
+
+    def _start_agreement_scoring(self) -> None:
+        """
+        If the model orders images by disagreement, scores how well seg1 and seg2
+        agree for every image on the task executor, below the priority of any
+        image load. The images yet to review are reordered every
+        AGREEMENT_REORDER_INTERVAL scores and once scoring is done.
+        """
+        self._task_executor.cancel_group(AGREEMENT_TASK_GROUP)
+        self._agreement_remaining = 0
+        self._agreement_scored = 0
+        seg1_paths: Optional[List[Path]] = (
+            self._curation_model.get_image_directory_paths(ImageType.SEG1)
+        )
+        seg2_paths: Optional[List[Path]] = (
+            self._curation_model.get_image_directory_paths(ImageType.SEG2)
+        )
+        raw_paths: Optional[List[Path]] = (
+            self._curation_model.get_image_directory_paths(ImageType.RAW)
+        )
+        if (
+            not self._curation_model.is_ordering_by_disagreement()
+            or raw_paths is None
+            or seg1_paths is None
+            or seg2_paths is None
+        ):
+            return
+
+        seg1_channel: int = (
+            self._curation_model.get_selected_channel(ImageType.SEG1) or 0
+        )
+        seg2_channel: int = (
+            self._curation_model.get_selected_channel(ImageType.SEG2) or 0
+        )
+        # prefetched images are loaded with priorities down to -prefetch depth
+        priority: int = min(
+            PRIORITY_LOW, -self._curation_model.get_prefetch_depth() - 1
+        )
+        self._agreement_remaining = len(raw_paths)
+        for raw_path, seg1_path, seg2_path in zip(
+            raw_paths, seg1_paths, seg2_paths
+        ):
+            self._task_executor.exec(
+                partial(
+                    score_segmentation_agreement,
+                    self._img_data_extractor,
+                    seg1_path,
+                    seg2_path,
+                    seg1_channel,
+                    seg2_channel,
+                ),
+                on_return=partial(self._on_agreement_scored, raw_path),
+                on_error=self._on_agreement_errored,
+                priority=priority,
+                group=AGREEMENT_TASK_GROUP,
+            )
+
+    def _on_agreement_scored(
+        self, raw_path: Path, score: AgreementScore
+    ) -> None:
+        self._curation_model.set_agreement_score(raw_path, score)
+        self._agreement_scored += 1
+        self._on_agreement_task_done(
+            self._agreement_scored % AGREEMENT_REORDER_INTERVAL == 0
+        )
+
+    def _on_agreement_errored(self, _: Exception) -> None:
+        # images that cannot be scored are reviewed after the others
+        self._on_agreement_task_done(False)
+
+    def _on_agreement_task_done(self, reorder: bool) -> None:
+        self._agreement_remaining -= 1
+        if (
+            reorder or self._agreement_remaining == 0
+        ) and self._curation_model.get_curr_image_index() is not None:
+            self._curation_model.reorder_by_disagreement()
+
+    def _on_queue_reordered(
+        self, positions: List[int], order: List[int]
+    ) -> None:
+        if self._journal is not None:
+            self._journal.reorder(positions, order)
+        self._load_prefetch_window()
+
+    def _update_journal(self) -> None:
+        """
+        Records the decision for the image the cursor just left, which the user has
+        finished reviewing, and the new cursor position.
+        """
+        cursor: Optional[int] = self._curation_model.get_curr_image_index()
+        if self._journal is None or cursor is None:
+            return
+        if self._journal_cursor is not None:
+            self._journal_record(self._journal_cursor)
+        self._journal.move_cursor(cursor)
+        self._journal_cursor = cursor
+
+    def _journal_record(self, img_idx: int) -> None:
+        record: Optional[CurationRecordStore] = (
+            self._curation_model.get_curation_record()
+        )
+        if self._journal is not None and record is not None:
+            self._journal.record(img_idx, record[img_idx])
+
     def _on_save_to_disk_error(self, err: Exception) -> None:
         self._curation_model.set_curation_record_saved_to_disk(False)
         raise err
 
     def _on_save_to_disk(self) -> None:
-        record: Optional[list[CurationRecord]] = deepcopy(
+        curr_record: Optional[CurationRecordStore] = (
             self._curation_model.get_curation_record()
         )
+        # masks are replaced rather than modified by the model, so records built
+        # from the store snapshot it without copying every mask
+        record: Optional[list[CurationRecord]] = (
+            list(curr_record) if curr_record is not None else None
+        )
+        cursor: Optional[int] = self._curation_model.get_curr_image_index()
+        if cursor is not None:
+            self._journal_record(cursor)
         csv_path: Optional[Path] = self._curation_model.get_csv_path()
         save_path: Optional[Path] = self._curation_model.get_save_masks_path()
         if record is None or csv_path is None or save_path is None:
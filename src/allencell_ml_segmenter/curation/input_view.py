@@ -1,3 +1,5 @@
+from allencell_ml_segmenter.core.dialog_box import DialogBox
+from allencell_ml_segmenter.curation.curation_journal import CurationSession
 from allencell_ml_segmenter.curation.stacked_spinner import StackedSpinner
 from allencell_ml_segmenter.widgets.input_button_widget import (
     InputButton,
@@ -16,13 +18,18 @@ from qtpy.QtWidgets import (
     QFrame,
     QGridLayout,
     QVBoxLayout,
+    QCheckBox,
     QComboBox,
+    QDialog,
     QPushButton,
     QWidget,
 )
 from pathlib import Path
-from napari.utils.notifications import show_info  # type: ignore
-from typing import Optional
+from napari.utils.notifications import show_info, show_warning  # type: ignore
+from typing import Dict, List, Optional
+
+# file names listed in the warning about files that could not be paired
+MAX_UNMATCHED_NAMES_SHOWN: int = 5
 
 
 class CurationInputView(QWidget):
@@ -59,6 +66,8 @@ class CurationInputView(QWidget):
         frame_layout.addWidget(input_images_label)
         frame_layout.setSpacing(30)
 
+        self._file_count_labels: Dict[ImageType, QLabel] = {}
+
         raw_grid_layout: QGridLayout = QGridLayout()
         raw_grid_layout.setVerticalSpacing(10)
 
@@ -107,6 +116,15 @@ class CurationInputView(QWidget):
             alignment=Qt.AlignmentFlag.AlignLeft,
         )
 
+        # number of images found while the directory is scanned
+        self._file_count_labels[ImageType.RAW] = QLabel()
+        raw_grid_layout.addWidget(
+            self._file_count_labels[ImageType.RAW],
+            1,
+            0,
+            alignment=Qt.AlignmentFlag.AlignLeft,
+        )
+
         # add grid to frame
         frame_layout.addLayout(raw_grid_layout)
 
@@ -159,6 +177,15 @@ class CurationInputView(QWidget):
             alignment=Qt.AlignmentFlag.AlignLeft,
         )
 
+        # number of images found while the directory is scanned
+        self._file_count_labels[ImageType.SEG1] = QLabel()
+        seg1_grid_layout.addWidget(
+            self._file_count_labels[ImageType.SEG1],
+            1,
+            0,
+            alignment=Qt.AlignmentFlag.AlignLeft,
+        )
+
         # add grid to frame
         frame_layout.addLayout(seg1_grid_layout)
 
@@ -211,15 +238,42 @@ class CurationInputView(QWidget):
             alignment=Qt.AlignmentFlag.AlignLeft,
         )
 
+        # number of images found while the directory is scanned
+        self._file_count_labels[ImageType.SEG2] = QLabel()
+        seg2_grid_layout.addWidget(
+            self._file_count_labels[ImageType.SEG2],
+            1,
+            0,
+            alignment=Qt.AlignmentFlag.AlignLeft,
+        )
+
         # add grid to frame
         frame_layout.addLayout(seg2_grid_layout)
 
+        self.disagreement_order_checkbox: QCheckBox = QCheckBox(
+            "Review images where Seg 1 and Seg 2 disagree most first"
+        )
+        self.disagreement_order_checkbox.setToolTip(
+            "Requires Seg 2. Images are scored in the background during curation, and the "
+            "images yet to review are reordered as scores come in"
+        )
+        self.disagreement_order_checkbox.setChecked(
+            self._curation_model.is_ordering_by_disagreement()
+        )
+        self.disagreement_order_checkbox.toggled.connect(
+            self._curation_model.set_order_by_disagreement
+        )
+        frame_layout.addWidget(self.disagreement_order_checkbox)
+
         self.start_btn: QPushButton = QPushButton("Start")
         self.start_btn.clicked.connect(self._on_start)
         frame_layout.addWidget(self.start_btn)
 
         # subscribers
         self._curation_model.channel_count_set.connect(self.update_channels)
+        self._curation_model.image_file_count_changed.connect(
+            self.update_file_count
+        )
 
     def _on_start(self) -> None:
         if any(
@@ -247,9 +301,76 @@ class CurationInputView(QWidget):
             show_info("Please select a channel for seg2.")
             return
 
+        if any(
+            self._curation_model.get_image_directory(img_type) is not None
+            and self._curation_model.get_image_directory_paths(img_type)
+            is None
+            for img_type in ImageType
+        ):
+            show_info("Please wait until all directories have been scanned.")
+            return
+
+        if self._resume_unfinished_session():
+            return
+
         self._curation_model.set_current_view(CurationView.MAIN_VIEW)
+        self._warn_unmatched_paths()
         self._curation_model.start_loading_images()
 
+    def _resume_unfinished_session(self) -> bool:
+        """
+        Offers to resume the session last curated in the experiment if it was
+        journaled, left unfinished, and is of the selected directories and
+        channels, and returns True if it was resumed. The journal is only
+        replaced once a new session starts.
+        """
+        session: Optional[CurationSession] = (
+            self._curation_model.load_unfinished_session()
+        )
+        if session is None:
+            return False
+        resume_prompt: DialogBox = DialogBox(
+            "These images have a curation session in progress "
+            f"({len(session.visited)} of {len(session.raw_paths)} images "
+            "reviewed). Would you like to resume it?"
+        )
+        selection: QDialog.DialogCode = QDialog.DialogCode(
+            resume_prompt.exec()
+        )
+        if selection != QDialog.DialogCode.Accepted:
+            return False
+        self._curation_model.resume_session(session)
+        return True
+
+    def _warn_unmatched_paths(self) -> None:
+        """
+        Warns about the files left out of the session because no file in the
+        other directories has the same name.
+        """
+        unmatched: Dict[ImageType, List[Path]] = (
+            self._curation_model.get_unmatched_paths()
+        )
+        paths: List[Path] = [
+            path
+            for img_type in ImageType
+            for path in unmatched.get(img_type, [])
+        ]
+        if not paths:
+            return
+        counts: str = ", ".join(
+            f"{len(unmatched[img_type])} {img_type.value}"
+            for img_type in ImageType
+            if unmatched.get(img_type)
+        )
+        names: str = ", ".join(
+            path.name for path in paths[:MAX_UNMATCHED_NAMES_SHOWN]
+        )
+        if len(paths) > MAX_UNMATCHED_NAMES_SHOWN:
+            names += ", ..."
+        show_warning(
+            f"Left out {counts} image(s) with no matching file in the other directories: {names}"
+        )
+
     def _set_to_loading(
         self, combobox: QComboBox, stacked_spinner: StackedSpinner
     ) -> None:
@@ -302,6 +423,18 @@ class CurationInputView(QWidget):
             channel_combo.setPlaceholderText("")
             channel_combo.setEnabled(False)
 
+    def update_file_count(self, img_type: ImageType) -> None:
+        """
+        Event handler when more files are found in an image directory that is
+        being scanned. Shows the number of images found so far.
+        """
+        count: Optional[int] = self._curation_model.get_image_file_count(
+            img_type
+        )
+        self._file_count_labels[img_type].setText(
+            f"{count} images" if count is not None else ""
+        )
+
     def update_channels(self, img_type: ImageType) -> None:
         if img_type == ImageType.RAW:
             self.update_raw_channels()
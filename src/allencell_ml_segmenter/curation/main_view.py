@@ -14,6 +14,8 @@ from qtpy.QtWidgets import (
     QProgressBar,
     QRadioButton,
     QDialog,
+    QCheckBox,
+    QSpinBox,
 )
 from allencell_ml_segmenter.core.dialog_box import DialogBox
 from allencell_ml_segmenter._style import Style
@@ -22,7 +24,10 @@ from allencell_ml_segmenter.curation.curation_model import (
     CurationModel,
     ImageType,
 )
-from allencell_ml_segmenter.core.image_data_extractor import ImageData
+from allencell_ml_segmenter.core.image_data_extractor import (
+    ImageData,
+    ImageArray,
+)
 from allencell_ml_segmenter.widgets.label_with_hint_widget import LabelWithHint
 from allencell_ml_segmenter.curation.stacked_spinner import StackedSpinner
 from allencell_ml_segmenter.main.segmenter_layer import ShapesLayer
@@ -36,6 +41,19 @@ import numpy as np
 
 MERGING_MASK_LAYER_NAME: str = "Merging Mask"
 EXCLUDING_MASK_LAYER_NAME: str = "Excluding Mask"
+DISAGREEMENT_LAYER_NAME: str = "Seg 1 / Seg 2 Differences"
+MERGE_PREVIEW_LAYER_NAME: str = "Merge Preview"
+
+
+def _masks_equal(mask: np.ndarray, other: np.ndarray) -> bool:
+    # masks from shapes layers are object arrays of polygons, which cannot be
+    # compared as a whole
+    if mask.dtype.hasobject or other.dtype.hasobject:
+        return len(mask) == len(other) and all(
+            np.array_equal(polygon, other_polygon)
+            for polygon, other_polygon in zip(mask, other)
+        )
+    return np.array_equal(mask, other)
 
 
 class CurationMainView(QWidget):
@@ -74,10 +92,13 @@ class CurationMainView(QWidget):
         )
 
         progress_bar_layout: QHBoxLayout = QHBoxLayout()
-        # Button and progress bar on top row
-        # self.back_button: QPushButton = QPushButton("◄ Back")
-        # self.back_button.setObjectName("big_blue_btn")
-        # progress_bar_layout.addWidget(self.back_button, alignment=Qt.AlignLeft)
+        # Buttons and progress bar on top row
+        self.previous_button: QPushButton = QPushButton("◄ Previous")
+        self.previous_button.setObjectName("big_blue_btn")
+        self.previous_button.clicked.connect(self._on_previous)
+        progress_bar_layout.addWidget(
+            self.previous_button, alignment=Qt.AlignmentFlag.AlignLeft
+        )
 
         # inner progress bar frame and layout
         inner_progress_frame: QFrame = QFrame()
@@ -100,6 +121,17 @@ class CurationMainView(QWidget):
         )
         layout.addLayout(progress_bar_layout)
 
+        go_to_layout: QHBoxLayout = QHBoxLayout()
+        go_to_layout.addWidget(QLabel("Go to image"))
+        # numbered from 1, as in the progress bar
+        self.go_to_spinbox: QSpinBox = QSpinBox()
+        self.go_to_spinbox.setMinimum(1)
+        go_to_layout.addWidget(self.go_to_spinbox)
+        self.go_to_button: QPushButton = QPushButton("Go")
+        self.go_to_button.clicked.connect(self._on_go_to)
+        go_to_layout.addWidget(self.go_to_button)
+        layout.addLayout(go_to_layout)
+
         self.save_csv_button: QPushButton = QPushButton(
             "Save Curation Progress"
         )
@@ -140,6 +172,22 @@ class CurationMainView(QWidget):
             alignment=Qt.AlignmentFlag.AlignHCenter,
         )
 
+        self.disagreement_checkbox: QCheckBox = QCheckBox(
+            "Show where Seg 1 and Seg 2 differ"
+        )
+        self.disagreement_checkbox.setToolTip(
+            "Adds a layer labeling areas that only Seg 1 or only Seg 2 segments"
+        )
+        self.disagreement_checkbox.setChecked(
+            self._curation_model.is_showing_disagreement()
+        )
+        self.disagreement_checkbox.toggled.connect(
+            self._curation_model.set_show_disagreement
+        )
+        layout.addWidget(
+            self.disagreement_checkbox, alignment=Qt.AlignmentFlag.AlignHCenter
+        )
+
         optional_text: QLabel = QLabel("OPTIONAL", self)
         optional_text.setObjectName("text_with_vert_padding")
         layout.addWidget(
@@ -247,30 +295,49 @@ class CurationMainView(QWidget):
         excluding_mask_buttons.addWidget(self.excluding_save_button)
         layout.addLayout(excluding_mask_buttons)
 
+        # True while the view waits for the images at the cursor to load, after
+        # moving to an image that was not prefetched
+        self._waiting_to_show_curr_images: bool = False
         self._curation_model.image_loading_finished.connect(
             self._on_first_image_loading_finished
         )
+        self._curation_model.image_slot_ready.connect(
+            self._on_image_slot_ready
+        )
 
         self._curation_model.saved_to_disk.connect(self._on_saved_to_disk)
+        self._curation_model.disagreement_ready.connect(
+            self._on_disagreement_ready
+        )
+        self._curation_model.show_disagreement_changed.connect(
+            self._update_disagreement_layer
+        )
+        self._curation_model.merge_preview_updated.connect(
+            self._update_merge_preview_layer
+        )
         self._set_to_initial_state()
 
     def _set_to_initial_state(self) -> None:
+        # only known once the input view is done
+        self.disagreement_checkbox.setVisible(False)
         self.save_csv_button.setEnabled(False)
-        self._set_next_button_to_loading()
+        self._set_navigation_to_loading()
         self.disable_all_masks()
         self.disable_radio_buttons()
         self.use_img_stacked_spinner.start()
 
     def _on_image_loading_finished(self) -> None:
-        self._enable_next_button()
+        self._enable_navigation()
 
     def _on_first_image_loading_finished(self) -> None:
         self.use_img_stacked_spinner.stop()
-        self.update_save_csv_button_enabled_state()
+        self.disagreement_checkbox.setVisible(
+            self._curation_model.has_seg2_data()
+        )
+        self.go_to_spinbox.setMaximum(self._curation_model.get_num_images())
         self._update_progress_bar()
-        self.add_curr_images_to_widget()
-        self._enable_next_button()
-        self.update_radio_buttons_enabled_state()
+        self._show_curr_images()
+        self._enable_navigation()
         self._curation_model.image_loading_finished.disconnect(
             self._on_first_image_loading_finished
         )
@@ -278,16 +345,95 @@ class CurationMainView(QWidget):
             self._on_image_loading_finished
         )
 
-    def _enable_next_button(self) -> None:
+    def _on_image_slot_ready(self, img_idx: int) -> None:
+        if (
+            self._waiting_to_show_curr_images
+            and img_idx == self._curation_model.get_curr_image_index()
+        ):
+            self._show_curr_images()
+
+    def _enable_navigation(self) -> None:
         self.next_button.setEnabled(True)
         if self._curation_model.has_next_image():
             self.next_button.setText("Next ►")
         else:
             self.next_button.setText("Finish ►")
+        self.previous_button.setEnabled(
+            self._curation_model.has_previous_image()
+        )
+        self.go_to_spinbox.setEnabled(True)
+        self.go_to_button.setEnabled(True)
 
-    def _set_next_button_to_loading(self) -> None:
+    def _set_navigation_to_loading(self) -> None:
         self.next_button.setEnabled(False)
         self.next_button.setText("Loading next...")
+        self.disable_navigation()
+
+    def disable_navigation(self) -> None:
+        self.previous_button.setEnabled(False)
+        self.go_to_spinbox.setEnabled(False)
+        self.go_to_button.setEnabled(False)
+
+    def _show_curr_images(self) -> None:
+        """
+        Shows the images at the cursor, with the use decision, base image and
+        masks saved in their curation record, e.g. as left when the images were
+        last shown.
+        """
+        self._waiting_to_show_curr_images = False
+        self.add_curr_images_to_widget()
+        self._restore_curation_record()
+        self.update_radio_buttons_enabled_state()
+        self.update_save_csv_button_enabled_state()
+
+    def _show_curr_images_when_loaded(self) -> None:
+        if self._curation_model.is_waiting_for_curr_images():
+            # shown by _on_image_slot_ready
+            self._waiting_to_show_curr_images = True
+            self.file_name.setText("Loading...")
+            self.disable_all_masks()
+            self.disable_radio_buttons()
+        else:
+            self._show_curr_images()
+
+    def _restore_curation_record(self) -> None:
+        use_image: bool = bool(self._curation_model.get_use_image())
+        # set without clicking, the record already holds these values
+        self.yes_radio.setChecked(use_image)
+        self.no_radio.setChecked(not use_image)
+        base_image: Optional[str] = self._curation_model.get_base_image()
+        self.merging_base_combo.setCurrentIndex(
+            self.merging_base_combo.findText(base_image)
+            if base_image is not None
+            else -1
+        )
+
+        excluding_mask: Optional[np.ndarray] = (
+            self._curation_model.get_excluding_mask()
+        )
+        if excluding_mask is not None:
+            self._viewer.add_shapes(
+                EXCLUDING_MASK_LAYER_NAME, "coral", "pan_zoom", excluding_mask
+            )
+            self.excluding_mask_status.setText("Excluding mask saved")
+        merging_mask: Optional[np.ndarray] = (
+            self._curation_model.get_merging_mask()
+        )
+        if merging_mask is not None and self._curation_model.has_seg2_data():
+            self._viewer.add_shapes(
+                MERGING_MASK_LAYER_NAME, "royalblue", "pan_zoom", merging_mask
+            )
+            self._viewer.subscribe_shapes_change_event(
+                MERGING_MASK_LAYER_NAME, self._on_merging_mask_edited
+            )
+            # previews the merge as when the mask was drawn
+            self._on_merging_mask_edited()
+            self.merging_mask_status.setText("Merging mask saved")
+
+        if use_image:
+            self.enable_valid_masks()
+        else:
+            self.disable_all_masks()
 
     def add_curr_images_to_widget(self) -> None:
         raw_img_data: Optional[ImageData] = (
@@ -312,6 +458,7 @@ class CurationMainView(QWidget):
                 self._viewer.add_labels(
                     seg2_img_data.np_data, f"[seg2] {seg2_img_data.path.name}"
                 )
+            self._update_disagreement_layer()
 
         self.enable_valid_masks()
         if raw_img_data is not None and raw_img_data.path is not None:
@@ -319,10 +466,38 @@ class CurationMainView(QWidget):
         self.merging_mask_status.setText("Create and draw mask")
         self.excluding_mask_status.setText("Create and draw mask")
 
-    def _on_next(self) -> None:
+    def _on_disagreement_ready(self, img_idx: int) -> None:
+        # the current image may be shown before its disagreement is computed
+        seg2_img_data: Optional[ImageData] = (
+            self._curation_model.get_curr_image_data(ImageType.SEG2)
+        )
+        if (
+            img_idx == self._curation_model.get_curr_image_index()
+            and seg2_img_data is not None
+            and self._viewer.contains_layer(
+                f"[seg2] {seg2_img_data.path.name}"
+            )
+        ):
+            self._update_disagreement_layer()
+
+    def _update_disagreement_layer(self) -> None:
         """
-        Advance to next image set.
+        Shows the disagreement of the current image as a labels layer if it is
+        computed and the model is set to show it, and removes the layer otherwise.
         """
+        labels: Optional[ImageArray] = (
+            self._curation_model.get_curr_disagreement_data()
+        )
+        if (
+            self._curation_model.is_showing_disagreement()
+            and labels is not None
+        ):
+            if not self._viewer.contains_layer(DISAGREEMENT_LAYER_NAME):
+                self._viewer.add_labels(labels, DISAGREEMENT_LAYER_NAME)
+        else:
+            self._viewer.remove_layer(DISAGREEMENT_LAYER_NAME)
+
+    def _leave_curr_images(self) -> None:
         if self.yes_radio.isChecked():
             # prompt and conditionally save unsaved masks
             self._check_unsaved_excluding_mask()
@@ -330,20 +505,22 @@ class CurationMainView(QWidget):
 
         self._viewer.clear_layers()
 
+    def _on_next(self) -> None:
+        """
+        Advance to next image set.
+        """
+        self._leave_curr_images()
+
         if self._curation_model.has_next_image():
-            self._set_next_button_to_loading()
+            self._set_navigation_to_loading()
+            # the next images are loaded before the next button is enabled
             self._curation_model.next_image()
-            self.add_curr_images_to_widget()
-            # these lines will update UI and model state, must go after
-            # a call to next image
-            self.yes_radio.click()
-            self.update_radio_buttons_enabled_state()
-            self.update_save_csv_button_enabled_state()
-            self.merging_base_combo.setCurrentIndex(0)
+            self._show_curr_images()
         else:
             self._on_save_curation_csv()
             self.disable_all_masks()
             self.disable_radio_buttons()
+            self.disable_navigation()
             self.file_name.setText("None")
             self.next_button.setEnabled(False)
             self.next_button.setText("No more images")
@@ -354,6 +531,29 @@ class CurationMainView(QWidget):
 
         self._update_progress_bar()
 
+    def _on_previous(self) -> None:
+        """
+        Go back to the previous image set, e.g. to correct its curation.
+        """
+        self._leave_curr_images()
+        self._set_navigation_to_loading()
+        self._curation_model.previous_image()
+        self._show_curr_images_when_loaded()
+        self._update_progress_bar()
+
+    def _on_go_to(self) -> None:
+        """
+        Jump to the image set selected in the go to spin box.
+        """
+        img_idx: int = self.go_to_spinbox.value() - 1
+        if img_idx == self._curation_model.get_curr_image_index():
+            return
+        self._leave_curr_images()
+        self._set_navigation_to_loading()
+        self._curation_model.go_to(img_idx)
+        self._show_curr_images_when_loaded()
+        self._update_progress_bar()
+
     def _should_prompt_to_save_mask(
         self,
         mask_layer: Optional[ShapesLayer],
@@ -363,7 +563,7 @@ class CurationMainView(QWidget):
             return (
                 len(mask_layer.data) > 0
                 if saved_mask is None
-                else not np.array_equal(saved_mask, mask_layer.data)
+                else not _masks_equal(saved_mask, mask_layer.data)
             )
         return False
 
@@ -498,6 +698,7 @@ class CurationMainView(QWidget):
         self.progress_bar.setValue(curr_val)
         # set progress bar hint
         self.progress_bar_image_count.setText(f"{curr_val}/{num_images}")
+        self.go_to_spinbox.setValue(curr_val)
 
     def _discard_layer_prompt(self, layer: str) -> bool:
         discard_layer_prompt = DialogBox(
@@ -526,6 +727,10 @@ class CurationMainView(QWidget):
         self._viewer.add_shapes(
             MERGING_MASK_LAYER_NAME, "royalblue", "add_polygon"
         )
+        self._curation_model.set_merging_mask_draft(None)
+        self._viewer.subscribe_shapes_change_event(
+            MERGING_MASK_LAYER_NAME, self._on_merging_mask_edited
+        )
         self.merging_save_button.setEnabled(True)
         self.merging_delete_button.setEnabled(True)
         self.merging_mask_status.setText("Draw mask")
@@ -558,10 +763,35 @@ class CurationMainView(QWidget):
         if merging_mask is not None:
             self._viewer.remove_layer(MERGING_MASK_LAYER_NAME)
         self._curation_model.set_merging_mask(None)
+        self._curation_model.set_merging_mask_draft(None)
         self.merging_save_button.setEnabled(False)
         self.merging_delete_button.setEnabled(False)
         self.merging_mask_status.setText("Merging mask deleted")
 
+    def _on_merging_mask_edited(self) -> None:
+        merging_mask: Optional[ShapesLayer] = self._viewer.get_shapes(
+            MERGING_MASK_LAYER_NAME
+        )
+        self._curation_model.set_merging_mask_draft(
+            merging_mask.data
+            if merging_mask is not None and len(merging_mask.data) > 0
+            else None
+        )
+
+    def _update_merge_preview_layer(self) -> None:
+        """
+        Shows the merge preview of the current image in a single labels layer,
+        which is reused as the preview is updated, and removes the layer if
+        there is no preview.
+        """
+        labels: Optional[np.ndarray] = self._curation_model.get_merge_preview()
+        if labels is None:
+            self._viewer.remove_layer(MERGE_PREVIEW_LAYER_NAME)
+        elif not self._viewer.set_labels_data(
+            MERGE_PREVIEW_LAYER_NAME, labels
+        ):
+            self._viewer.add_labels(labels, MERGE_PREVIEW_LAYER_NAME)
+
     def _create_excluding_mask(self) -> None:
         excluding_mask: Optional[ShapesLayer] = self._viewer.get_shapes(
             EXCLUDING_MASK_LAYER_NAME
@@ -0,0 +1,131 @@
+from collections import Counter
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from skimage.draw import polygon2mask
+
+# YX region of an image as (y start, y stop, x start, x stop)
+Box = Tuple[int, int, int, int]
+
+
+def rasterize_polygons(
+    polygons: Iterable[np.ndarray],
+    shape_yx: Tuple[int, int],
+    origin_yx: Tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    """
+    Returns a boolean YX mask of :param shape_yx: that is True inside any of
+    :param polygons:. Each polygon is an array of vertices, as drawn in a shapes
+    layer; only the last two (Y, X) coordinates are used, so polygons drawn on a
+    Z slice of a 3D image cover that area on every slice.
+    :param origin_yx: image pixel that the mask's first pixel is at, to rasterize
+    a region of an image only
+    """
+    mask: np.ndarray = np.zeros(shape_yx, dtype=bool)
+    for polygon in polygons:
+        vertices: np.ndarray = np.asarray(polygon, dtype=float)
+        mask |= polygon2mask(shape_yx, vertices[:, -2:] - origin_yx)
+    return mask
+
+
+def _polygon_key(polygon: np.ndarray) -> Tuple[Tuple[int, ...], bytes]:
+    return polygon.shape, polygon.tobytes()
+
+
+def _bounding_box(
+    polygons: Sequence[np.ndarray], shape_yx: Tuple[int, int]
+) -> Optional[Box]:
+    """
+    Returns the region of an image of :param shape_yx: that rasterizing
+    :param polygons: can change, or None if it is outside the image.
+    """
+    vertices: np.ndarray = np.concatenate(polygons)
+    y0, x0 = np.maximum(np.floor(vertices.min(axis=0)).astype(int), 0)
+    y1, x1 = np.minimum(
+        np.ceil(vertices.max(axis=0)).astype(int) + 1, shape_yx
+    )
+    if y0 >= y1 or x0 >= x1:
+        return None
+    return int(y0), int(y1), int(x0), int(x1)
+
+
+def _overlaps(polygon: np.ndarray, box: Box) -> bool:
+    y0, y1, x0, x1 = box
+    low: np.ndarray = polygon.min(axis=0)
+    high: np.ndarray = polygon.max(axis=0)
+    return bool(
+        low[0] < y1 and high[0] >= y0 - 1 and low[1] < x1 and high[1] >= x0 - 1
+    )
+
+
+class MergePreview:
+    """
+    The target that training derives from a merging mask, as a label image: the
+    base segmentation, with the areas covered by the mask's polygons taken from
+    the other segmentation on every Z slice.
+
+    The label image is kept between updates; an update only rasterizes and
+    recomposites the YX region around the polygons that were added, removed or
+    changed since the last one, so editing one polygon costs in proportion to
+    that polygon rather than to the image. Not thread safe: updates must not
+    run concurrently.
+    """
+
+    def __init__(self, base: np.ndarray, other: np.ndarray) -> None:
+        """
+        :param base: base segmentation, YX or ZYX
+        :param other: segmentation merged into the base, of the same shape
+        """
+        if base.shape != other.shape:
+            raise ValueError("segmentations must be of the same shape")
+        self._base: np.ndarray = base
+        self._other: np.ndarray = other
+        self._labels: np.ndarray = base.copy()
+        self._shape_yx: Tuple[int, int] = base.shape[-2:]
+        # YX vertices of the polygons of the last update
+        self._polygons: List[np.ndarray] = []
+
+    def get_labels(self) -> np.ndarray:
+        """
+        Returns the label image. It is updated in place by update().
+        """
+        return self._labels
+
+    def update(self, polygons: Sequence[np.ndarray]) -> Optional[Box]:
+        """
+        Updates the label image to :param polygons:, the merging mask as drawn in
+        a shapes layer, and returns the YX region that was recomposited, or None
+        if nothing changed.
+        """
+        new_polygons: List[np.ndarray] = [
+            np.asarray(polygon, dtype=float)[:, -2:]
+            for polygon in polygons
+            if len(polygon) > 0
+        ]
+        # polygons that are in both lists, counting duplicates, are unchanged
+        old_keys: Counter = Counter(_polygon_key(p) for p in self._polygons)
+        new_keys: Counter = Counter(_polygon_key(p) for p in new_polygons)
+        removed: Counter = old_keys - new_keys
+        added: Counter = new_keys - old_keys
+        changed: List[np.ndarray] = [
+            p for p in self._polygons if removed[_polygon_key(p)] > 0
+        ] + [p for p in new_polygons if added[_polygon_key(p)] > 0]
+        self._polygons = new_polygons
+        if not changed:
+            return None
+        box: Optional[Box] = _bounding_box(changed, self._shape_yx)
+        if box is None:
+            return None
+
+        y0, y1, x0, x1 = box
+        # polygons outside the region cannot cover any of it
+        mask: np.ndarray = rasterize_polygons(
+            [p for p in new_polygons if _overlaps(p, box)],
+            (y1 - y0, x1 - x0),
+            (y0, x0),
+        )
+        region: Tuple = (..., slice(y0, y1), slice(x0, x1))
+        np.copyto(self._labels[region], self._base[region])
+        # the YX mask broadcasts over Z
+        np.copyto(self._labels[region], self._other[region], where=mask)
+        return box
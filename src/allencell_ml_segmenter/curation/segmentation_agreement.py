@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy import ndimage
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    IImageDataExtractor,
+    ImageArray,
+)
+
+
+@dataclass(frozen=True)
+class AgreementScore:
+    """
+    How closely two segmentations of the same image agree.
+    """
+
+    # 2|A and B| / (|A| + |B|) of the foreground voxels; 1 if both are empty
+    dice: float
+    # absolute difference in number of foreground voxels
+    voxel_count_delta: int
+    # absolute difference in number of connected objects
+    object_count_delta: int
+
+    def sort_key(self) -> Tuple[float, int, int]:
+        """
+        Returns a key that sorts the worst agreeing segmentations first.
+        """
+        return (
+            self.dice,
+            -self.object_count_delta,
+            -self.voxel_count_delta,
+        )
+
+
+def compute_agreement(seg1: np.ndarray, seg2: np.ndarray) -> AgreementScore:
+    """
+    Returns the agreement between the foregrounds (all positive voxels) of
+    :param seg1: and :param seg2:, which must have the same shape.
+    """
+    if seg1.shape != seg2.shape:
+        raise ValueError(
+            f"Segmentations have different shapes: {seg1.shape}, {seg2.shape}"
+        )
+    fg1: np.ndarray = seg1 > 0
+    fg2: np.ndarray = seg2 > 0
+    count1: int = int(np.count_nonzero(fg1))
+    count2: int = int(np.count_nonzero(fg2))
+    objects1: int = ndimage.label(fg1)[1]
+    objects2: int = ndimage.label(fg2)[1]
+    # reuse fg2's buffer for the intersection
+    np.logical_and(fg1, fg2, out=fg2)
+    overlap: int = int(np.count_nonzero(fg2))
+    total: int = count1 + count2
+    return AgreementScore(
+        dice=2 * overlap / total if total > 0 else 1.0,
+        voxel_count_delta=abs(count1 - count2),
+        object_count_delta=abs(objects1 - objects2),
+    )
+
+
+def score_segmentation_agreement(
+    img_data_extractor: IImageDataExtractor,
+    seg1_path: Path,
+    seg2_path: Path,
+    seg1_channel: int,
+    seg2_channel: int,
+) -> AgreementScore:
+    """
+    Reads the segmentations at :param seg1_path: and :param seg2_path: and returns
+    their agreement. Every image is scored once, so the segmentations are not kept
+    in the image data cache, where they would evict the images being reviewed.
+    Module level so that it can be run by process based executors.
+    """
+    seg1: Optional[ImageArray] = img_data_extractor.extract_image_data(
+        seg1_path, channel=seg1_channel, dims=False, seg=1, cache=False
+    ).np_data
+    seg2: Optional[ImageArray] = img_data_extractor.extract_image_data(
+        seg2_path, channel=seg2_channel, dims=False, seg=1, cache=False
+    ).np_data
+    if seg1 is None or seg2 is None:
+        raise RuntimeError(
+            f"Could not read segmentations {seg1_path}, {seg2_path}"
+        )
+    return compute_agreement(np.asarray(seg1), np.asarray(seg2))
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Optional
 from allencell_ml_segmenter.config.i_user_settings import IUserSettings
 from allencell_ml_segmenter.utils.experiment_utils import ExperimentUtils
+from allencell_ml_segmenter.training.shared_cache import SHARED_CACHE_DIR_NAME
 
 import copy
 
@@ -92,6 +93,19 @@ class ExperimentsModel(IExperimentsModel):
     def get_cache_dir(self) -> Path:
         return self._get_exp_path() / "cache"
 
+    def get_shared_cache_dir(self) -> Path:
+        """
+        Returns the directory of the training cache shared by the experiments
+        in the experiments home
+        """
+        user_exp_path: Optional[Path] = self.get_user_experiments_path()
+        if user_exp_path is None:
+            raise ValueError("User experiments path cannot be None")
+        return user_exp_path / SHARED_CACHE_DIR_NAME
+
+    def get_hardware_profile_path(self) -> Path:
+        return self._get_exp_path() / "hardware_profile.json"
+
     def get_latest_metrics_csv_version(self) -> int:
         """
         Returns version number of the most recent version directory within
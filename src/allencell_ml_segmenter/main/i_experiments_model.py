@@ -74,6 +74,10 @@ class IExperimentsModel(Publisher):
     def get_cache_dir(self) -> Path:
         pass
 
+    @abstractmethod
+    def get_shared_cache_dir(self) -> Path:
+        pass
+
     @abstractmethod
     def get_channel_selection_path(self) -> Optional[Path]:
         pass
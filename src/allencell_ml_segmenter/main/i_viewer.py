@@ -1,11 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Callable
+import numpy as np
 from allencell_ml_segmenter.main.segmenter_layer import (
     ShapesLayer,
     ImageLayer,
     LabelsLayer,
 )
-import numpy as np
+from allencell_ml_segmenter.core.image_data_extractor import ImageArray
 from napari.layers import Layer  # type: ignore
 from napari.utils.events import Event as NapariEvent  # type: ignore
 
@@ -15,7 +16,7 @@ class IViewer(ABC):
         super().__init__()
 
     @abstractmethod
-    def add_image(self, image: np.ndarray, name: str) -> None:
+    def add_image(self, image: ImageArray, name: str) -> None:
         pass
 
     @abstractmethod
@@ -27,7 +28,16 @@ class IViewer(ABC):
         pass
 
     @abstractmethod
-    def add_shapes(self, name: str, face_color: str, mode: str) -> None:
+    def add_shapes(
+        self,
+        name: str,
+        face_color: str,
+        mode: str,
+        data: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Adds a shapes layer, holding the polygons in :param data: if given.
+        """
         pass
 
     @abstractmethod
@@ -39,7 +49,16 @@ class IViewer(ABC):
         pass
 
     @abstractmethod
-    def add_labels(self, data: np.ndarray, name: str) -> None:
+    def add_labels(self, data: ImageArray, name: str) -> None:
+        pass
+
+    @abstractmethod
+    def set_labels_data(self, name: str, data: ImageArray) -> bool:
+        """
+        Replaces the data of the labels layer named :param name:, and redraws it
+        even if :param data: is the array it already shows. Returns False if
+        there is no such layer.
+        """
         pass
 
     @abstractmethod
@@ -72,3 +91,14 @@ class IViewer(ABC):
         self, function: Callable[[NapariEvent], None]
     ) -> None:
         pass
+
+    @abstractmethod
+    def subscribe_shapes_change_event(
+        self, name: str, function: Callable[[], None]
+    ) -> bool:
+        """
+        Calls :param function: whenever the shapes of the shapes layer named
+        :param name: are added, removed or edited. Returns False if there is no
+        such layer.
+        """
+        pass
@@ -2,7 +2,7 @@ from allencell_ml_segmenter.main.main_model import MainModel, ImageType
 from allencell_ml_segmenter.main.i_experiments_model import IExperimentsModel
 from allencell_ml_segmenter.core.task_executor import (
     ITaskExecutor,
-    NapariThreadTaskExecutor,
+    PooledTaskExecutor,
 )
 from allencell_ml_segmenter.utils.file_writer import IFileWriter, FileWriter
 import json
@@ -16,12 +16,16 @@ class MainService:
         self,
         main_model: MainModel,
         experiments_model: IExperimentsModel,
-        task_executor: ITaskExecutor = NapariThreadTaskExecutor.global_instance(),
+        task_executor: Optional[ITaskExecutor] = None,
         file_writer: IFileWriter = FileWriter.global_instance(),
     ):
         self._main_model: MainModel = main_model
         self._experiments_model: IExperimentsModel = experiments_model
-        self._task_executor: ITaskExecutor = task_executor
+        self._task_executor: ITaskExecutor = (
+            task_executor
+            if task_executor is not None
+            else PooledTaskExecutor.global_instance()
+        )
         self._file_writer: IFileWriter = file_writer
 
         self._main_model.signals.selected_channels_changed.connect(
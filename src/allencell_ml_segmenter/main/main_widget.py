@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Optional, Dict
 from allencell_ml_segmenter.config.i_user_settings import IUserSettings
 
@@ -36,6 +37,17 @@ from allencell_ml_segmenter.training.view import TrainingView
 from allencell_ml_segmenter.curation.curation_model import CurationModel
 from allencell_ml_segmenter._style import Style
 from allencell_ml_segmenter.curation.curation_service import CurationService
+from allencell_ml_segmenter.core.task_executor import (
+    ProcessPoolTaskExecutor,
+)
+from allencell_ml_segmenter.core.image_data_extractor import (
+    AICSImageDataExtractor,
+    ImageDataCache,
+)
+from allencell_ml_segmenter.core.image_metadata_index import (
+    INDEX_FILE_NAME,
+    ImageMetadataIndex,
+)
 
 
 class MainWidget(AicsWidget):
@@ -54,6 +66,15 @@ class MainWidget(AicsWidget):
             self.user_settings = settings
 
         self.viewer: IViewer = Viewer(viewer)
+        ImageDataCache.global_instance().set_max_bytes(
+            self.user_settings.get_image_cache_max_bytes()
+        )
+        # decoding images holds the GIL, so it runs in worker processes to keep
+        # napari responsive while prefetching. The cache and the coalescing of
+        # identical requests stay in this process
+        AICSImageDataExtractor.global_instance().set_decode_executor(
+            ProcessPoolTaskExecutor.global_instance()
+        )
 
         # basic styling
         self.setSizePolicy(
@@ -76,6 +97,13 @@ class MainWidget(AicsWidget):
 
         # init models
         self._experiments_model = ExperimentsModel(self.user_settings)
+        experiments_home: Optional[Path] = (
+            self.user_settings.get_user_experiments_path()
+        )
+        if experiments_home is not None:
+            ImageMetadataIndex.global_instance().set_index_path(
+                experiments_home / INDEX_FILE_NAME
+            )
 
         self._training_model: TrainingModel = TrainingModel(
             main_model=self._model, experiments_model=self._experiments_model
@@ -86,6 +114,15 @@ class MainWidget(AicsWidget):
             self._experiments_model,
             self._model,
         )
+        self._curation_model.set_prefetch_depth(
+            self.user_settings.get_curation_prefetch_depth()
+        )
+        self._curation_model.set_prefetch_budget_bytes(
+            self.user_settings.get_curation_prefetch_budget_bytes()
+        )
+        self._curation_model.set_history_size(
+            self.user_settings.get_curation_history_size()
+        )
 
         # init services
         self._main_service: MainService = MainService(
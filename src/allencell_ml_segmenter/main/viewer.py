@@ -13,6 +13,15 @@ from allencell_ml_segmenter.main.segmenter_layer import (
 import napari  # type: ignore
 from typing import Callable, Optional
 import numpy as np
+from allencell_ml_segmenter.core.image_data_extractor import ImageArray
+
+
+def _editable(data: ImageArray) -> ImageArray:
+    # labels can be painted on, but arrays shared through the ImageDataCache
+    # are read-only
+    if isinstance(data, np.ndarray) and not data.flags.writeable:
+        return data.copy()
+    return data
 
 
 class Viewer(IViewer):
@@ -23,7 +32,7 @@ class Viewer(IViewer):
         super().__init__()
         self.viewer: napari.Viewer = viewer
 
-    def add_image(self, image: np.ndarray, name: str) -> None:
+    def add_image(self, image: ImageArray, name: str) -> None:
         self.viewer.add_image(image, name=name)
 
     def get_image(self, name: str) -> Optional[ImageLayer]:
@@ -41,9 +50,22 @@ class Viewer(IViewer):
                 imgs.append(ImageLayer(l.name, None))
         return imgs
 
-    def add_shapes(self, name: str, face_color: str, mode: Mode) -> None:
+    def add_shapes(
+        self,
+        name: str,
+        face_color: str,
+        mode: Mode,
+        data: Optional[np.ndarray] = None,
+    ) -> None:
         shapes: Shapes = self.viewer.add_shapes(
-            None, name=name, face_color=face_color
+            (
+                [np.asarray(polygon, dtype=float) for polygon in data]
+                if data is not None
+                else None
+            ),
+            shape_type="polygon",
+            name=name,
+            face_color=face_color,
         )
         shapes.mode = mode
 
@@ -60,8 +82,17 @@ class Viewer(IViewer):
             if isinstance(l, Shapes)
         ]
 
-    def add_labels(self, data: np.ndarray, name: str) -> None:
-        self.viewer.add_labels(data, name=name)
+    def add_labels(self, data: ImageArray, name: str) -> None:
+        self.viewer.add_labels(_editable(data), name=name)
+
+    def set_labels_data(self, name: str, data: ImageArray) -> bool:
+        layer: Optional[Layer] = self._get_layer_by_name(name)
+        if not isinstance(layer, Labels):
+            return False
+        layer.data = _editable(data)
+        # setting the same array does not redraw it
+        layer.refresh()
+        return True
 
     def get_labels(self, name: str) -> Optional[LabelsLayer]:
         for labels in self.get_all_labels():
@@ -99,6 +130,15 @@ class Viewer(IViewer):
     ) -> None:
         self.viewer.events.layers_change.connect(function)
 
+    def subscribe_shapes_change_event(
+        self, name: str, function: Callable[[], None]
+    ) -> bool:
+        layer: Optional[Layer] = self._get_layer_by_name(name)
+        if not isinstance(layer, Shapes):
+            return False
+        layer.events.data.connect(lambda _: function())
+        return True
+
     def _get_layer_by_name(self, name: str) -> Optional[Layer]:
         layers: list[Layer] = self.get_layers()
         for l in layers:
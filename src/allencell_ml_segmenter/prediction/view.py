@@ -1,6 +1,5 @@
 from pathlib import Path
 from typing import Optional
-import numpy as np
 from qtpy.QtCore import Qt
 
 from allencell_ml_segmenter._style import Style
@@ -23,6 +22,8 @@ from allencell_ml_segmenter.prediction.prediction_folder_progress_tracker import
     PredictionFolderProgressTracker,
 )
 from allencell_ml_segmenter.utils.file_utils import FileUtils
+from allencell_ml_segmenter.utils.directory_scanner import list_files
+from allencell_ml_segmenter.utils.pairing_index import PairingIndex
 from qtpy.QtWidgets import (
     QVBoxLayout,
     QSizePolicy,
@@ -33,7 +34,8 @@ from qtpy.QtWidgets import (
 from allencell_ml_segmenter.main.i_viewer import IViewer
 from allencell_ml_segmenter.core.image_data_extractor import (
     IImageDataExtractor,
-    AICSImageDataExtractor,
+    CoalescingImageDataExtractor,
+    ImageArray,
 )
 
 
@@ -47,7 +49,7 @@ class PredictionView(View, MainWindow):
         main_model: MainModel,
         prediction_model: PredictionModel,
         viewer: IViewer,
-        img_data_extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance(),
+        img_data_extractor: IImageDataExtractor = CoalescingImageDataExtractor.global_instance(),
     ):
         super().__init__()
         self._main_model: MainModel = main_model
@@ -156,45 +158,42 @@ class PredictionView(View, MainWindow):
             raw_imgs: Optional[list[Path]] = (
                 self._prediction_model.get_selected_paths()
             )
-            segmentations: list[Path] = (
-                FileUtils.get_all_files_in_dir_ignore_hidden(output_path)
-            )
             channel: Optional[int] = (
                 self._prediction_model.get_image_input_channel_index()
             )
             if raw_imgs is None or channel is None:
                 raise RuntimeError("Insufficient data to show results")
 
-            # here, we will pair raw images and segmentations based on the stem component of their paths
-            stem_to_data: dict[str, dict[str, Path]] = {
-                raw_img.stem: {"raw": raw_img} for raw_img in raw_imgs
-            }
-            for seg in segmentations:
-                # ignore files in the folder that aren't from most recent predictions
-                if seg.stem in stem_to_data:
-                    stem_to_data[seg.stem]["seg"] = seg
+            # here, we will pair raw images and segmentations based on the stem component of their paths.
+            # files in the folder that aren't from most recent predictions are not paired
+            index: PairingIndex[str] = PairingIndex(
+                {"raw": raw_imgs, "seg": list_files(output_path)}
+            )
 
             self._viewer.clear_layers()
-            for data in stem_to_data.values():
-                raw_np_data: Optional[np.ndarray] = (
+            for raw_img, seg in zip(
+                index.get_paths("raw"), index.get_paths("seg")
+            ):
+                # extract lazily so that napari only reads the slices being viewed
+                raw_np_data: Optional[ImageArray] = (
                     self._img_data_extractor.extract_image_data(
-                        data["raw"], channel=channel
+                        raw_img, channel=channel, lazy=True
                     ).np_data
                 )
-                seg_np_data: Optional[np.ndarray] = (
+                seg_np_data: Optional[ImageArray] = (
                     self._img_data_extractor.extract_image_data(
-                        data["seg"], seg=1
+                        seg, seg=1, lazy=True
                     ).np_data
                 )
                 if raw_np_data is not None:
                     self._viewer.add_image(
                         raw_np_data,
-                        f"[raw] {data['raw'].name}",
+                        f"[raw] {raw_img.name}",
                     )
                 if seg_np_data is not None:
                     self._viewer.add_labels(
                         seg_np_data,
-                        name=f"[seg] {data['seg'].name}",
+                        name=f"[seg] {seg.name}",
                     )
         # Display popup with saved images path if prediction inputs are from a directory
         else:
@@ -0,0 +1,122 @@
+# Benchmark of CPU training epoch time under different CPU compute profiles:
+#   defaults:  torch's own thread counts, no affinity (previous path)
+#   profile:   thread counts and affinity from choose_cpu_compute_profile
+#   bf16:      the profile with bf16 autocast, if the CPU supports it natively
+# An epoch is a fixed number of training steps of a small 3D conv net on random
+# patches. Each profile runs in its own process, since torch's inter-op thread
+# count can only be set once. Background threads stand in for napari and the
+# task executor competing for the cores while training.
+# usage: python -m allencell_ml_segmenter.scripts.benchmark_cpu_profiles [STEPS [BACKGROUND_THREADS]]
+import multiprocessing
+import statistics
+import sys
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+    choose_cpu_compute_profile,
+    cpu_supports_bf16,
+)
+from allencell_ml_segmenter.utils.hardware_profile import (
+    HardwareInfo,
+    detect_hardware,
+)
+
+EPOCHS: int = 3
+PATCH_SHAPE: Tuple[int, int, int] = (16, 64, 64)
+BATCH_SIZE: int = 2
+
+
+def _background_load(stop: threading.Event) -> None:
+    # numpy releases the GIL while multiplying, so this uses a whole core
+    a: np.ndarray = np.random.rand(256, 256)
+    while not stop.is_set():
+        a @ a
+
+
+def _run_epochs(
+    profile: Optional[CpuComputeProfile], steps: int, background: int
+) -> List[float]:
+    import torch  # type: ignore
+
+    if profile is not None:
+        profile.apply()
+    stop: threading.Event = threading.Event()
+    for _ in range(background):
+        threading.Thread(target=_background_load, args=(stop,)).start()
+
+    model: torch.nn.Module = torch.nn.Sequential(
+        torch.nn.Conv3d(1, 16, 3, padding=1),
+        torch.nn.ReLU(),
+        torch.nn.Conv3d(16, 32, 3, padding=1),
+        torch.nn.ReLU(),
+        torch.nn.Conv3d(32, 1, 1),
+    )
+    optimizer: torch.optim.Optimizer = torch.optim.SGD(
+        model.parameters(), lr=0.01
+    )
+    x: torch.Tensor = torch.rand(BATCH_SIZE, 1, *PATCH_SHAPE)
+    y: torch.Tensor = (torch.rand(BATCH_SIZE, 1, *PATCH_SHAPE) > 0.5).float()
+    bf16: bool = profile is not None and profile.bf16
+
+    epoch_times: List[float] = []
+    try:
+        for _ in range(EPOCHS):
+            start: float = time.perf_counter()
+            for _ in range(steps):
+                optimizer.zero_grad()
+                with torch.autocast("cpu", torch.bfloat16, enabled=bf16):
+                    loss: torch.Tensor = (
+                        torch.nn.functional.binary_cross_entropy_with_logits(
+                            model(x), y
+                        )
+                    )
+                loss.backward()
+                optimizer.step()
+            epoch_times.append(time.perf_counter() - start)
+    finally:
+        stop.set()
+    return epoch_times
+
+
+def main() -> None:
+    steps: int = int(sys.argv[1]) if len(sys.argv) >= 2 else 20
+    background: int = int(sys.argv[2]) if len(sys.argv) >= 3 else 2
+    hardware: HardwareInfo = detect_hardware(False)
+    profiles: List[Tuple[str, Optional[CpuComputeProfile]]] = [
+        ("defaults", None),
+        ("profile", choose_cpu_compute_profile(hardware)),
+    ]
+    if cpu_supports_bf16():
+        profiles.append(
+            ("bf16", choose_cpu_compute_profile(hardware, use_bf16=True))
+        )
+    else:
+        print("CPU has no native bf16 support, skipping the bf16 profile")
+
+    print(
+        f"{hardware.get_usable_cpus()} usable cores, {background} background"
+        f" threads, {steps} steps per epoch"
+    )
+    print(f"{'profile':>10} {'threads':>8} {'median s/epoch':>15}")
+    context = multiprocessing.get_context("spawn")
+    for name, profile in profiles:
+        with context.Pool(1) as pool:
+            epoch_times: List[float] = pool.apply(
+                _run_epochs, (profile, steps, background)
+            )
+        threads: str = (
+            str(profile.intra_op_threads) if profile is not None else "-"
+        )
+        print(
+            f"{name:>10} {threads:>8}"
+            f" {statistics.median(epoch_times):>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# Microbenchmark of the per-click cost of curation bookkeeping as datasets grow.
+# Each click sets the current image's use flag, moves to the next image and
+# reads the two counters shown in the main view, for:
+#   list:  a list of CurationRecords and a visited set, counting by looping
+#          (previous path)
+#   store: a CurationRecordStore with running counters
+# usage: python -m allencell_ml_segmenter.scripts.benchmark_curation_counters [CLICKS]
+import sys
+import time
+from pathlib import Path
+from typing import List, Set
+
+from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
+from allencell_ml_segmenter.curation.curation_record_store import (
+    CurationRecordStore,
+)
+
+SIZES: List[int] = [1_000, 10_000, 50_000, 200_000]
+
+
+def _paths(prefix: str, n: int) -> List[Path]:
+    return [Path(f"/data/{prefix}/img_{i}.tiff") for i in range(n)]
+
+
+def _time_list(n: int, clicks: int) -> float:
+    records: List[CurationRecord] = [
+        CurationRecord(raw, seg1, None, None, None, "seg1", False)
+        for raw, seg1 in zip(_paths("raw", n), _paths("seg1", n))
+    ]
+    visited: Set[int] = set()
+    start: float = time.perf_counter()
+    for cursor in range(clicks):
+        visited.add(cursor)
+        records[cursor].to_use = cursor % 3 != 0
+        possible: int = n
+        for i in visited:
+            if i != cursor and not records[i].to_use:
+                possible -= 1
+        sum([1 if rec.to_use else 0 for rec in records])
+    return (time.perf_counter() - start) / clicks
+
+
+def _time_store(n: int, clicks: int) -> float:
+    store: CurationRecordStore = CurationRecordStore(
+        _paths("raw", n), _paths("seg1", n)
+    )
+    start: float = time.perf_counter()
+    for cursor in range(clicks):
+        store.mark_visited(cursor)
+        store.set_to_use(cursor, cursor % 3 != 0)
+        not_used: int = store.get_num_visited_not_used()
+        if not store.get_to_use(cursor):
+            not_used -= 1
+        n - not_used
+        store.get_num_to_use()
+    return (time.perf_counter() - start) / clicks
+
+
+def main() -> None:
+    clicks: int = int(sys.argv[1]) if len(sys.argv) >= 2 else 500
+    print(f"{'images':>8} {'list us/click':>14} {'store us/click':>15}")
+    for n in SIZES:
+        list_cost: float = _time_list(n, clicks)
+        store_cost: float = _time_store(n, clicks)
+        print(f"{n:>8} {list_cost * 1e6:>14.1f} {store_cost * 1e6:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Microbenchmark comparing peak memory and time of the segmentation loading paths:
+#   copy:  decode the full image, then set positive values in a copy of it
+#          (previous path)
+#   label: convert each Z slice to uint8 as it is read (load_label_image)
+# usage: python -m allencell_ml_segmenter.scripts.benchmark_label_conversion [Z Y X]
+import sys
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import dask.array as da
+import numpy as np
+
+from allencell_ml_segmenter.utils.image_processing import load_label_image
+
+
+def _copy_labels(image: np.ndarray, value: int) -> np.ndarray:
+    copy: np.ndarray = np.copy(image)
+    copy[copy > 0] = value
+    return copy
+
+
+def _measure(fn: Callable[[], np.ndarray]) -> Tuple[float, int]:
+    tracemalloc.start()
+    start: float = time.perf_counter()
+    result: np.ndarray = fn()
+    elapsed: float = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, peak
+
+
+def main() -> None:
+    shape: Tuple[int, ...] = (
+        tuple(int(dim) for dim in sys.argv[1:4])
+        if len(sys.argv) >= 4
+        else (64, 1024, 1024)
+    )
+    # stand-in for a segmentation on disk: slices are only generated when read
+    seg: da.Array = da.random.randint(
+        0, 3, size=shape, chunks=(1,) + shape[1:], dtype=np.uint16
+    )
+
+    copy_time, copy_peak = _measure(lambda: _copy_labels(seg.compute(), 2))
+    label_time, label_peak = _measure(lambda: load_label_image(seg, 2))
+
+    print(f"shape {shape}, source dtype {seg.dtype}")
+    print(f"copy:  {copy_time:.3f}s, peak {copy_peak / 2**20:.1f} MiB")
+    print(f"label: {label_time:.3f}s, peak {label_peak / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,15 @@ from allencell_ml_segmenter.prediction.model import (
 )
 
 from allencell_ml_segmenter.utils.cuda_util import CUDAUtils
+from allencell_ml_segmenter.utils.hardware_profile import (
+    HardwareInfo,
+    choose_dataloader_profile,
+    detect_hardware,
+)
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+    choose_cpu_compute_profile,
+)
 from allencell_ml_segmenter.utils.file_utils import FileUtils
 
 from pathlib import Path
@@ -59,7 +68,13 @@ class PredictionService(Subscriber):
         if ckpt is None:
             raise RuntimeError("No checkpoint. Cannot predict")
         cyto_api.override_config(self.build_overrides(ckpt))
-        cyto_api.predict()
+        if CUDAUtils.cuda_available():
+            cyto_api.predict()
+        else:
+            # prediction runs in the app's process, which must get its threads
+            # and cores back afterwards
+            with self._get_cpu_compute_profile().applied():
+                cyto_api.predict()
 
     def _prediction_setup(self, _: Event) -> None:
         if self._able_to_continue_prediction():
@@ -168,9 +183,19 @@ class PredictionService(Subscriber):
             overrides["trainer.accelerator"] = "gpu"
         else:
             overrides["trainer.accelerator"] = "cpu"
+            overrides.update(self._get_cpu_compute_profile().get_overrides())
 
         return overrides
 
+    def _get_cpu_compute_profile(self) -> CpuComputeProfile:
+        hardware: HardwareInfo = detect_hardware(False)
+        # the loaded config keeps the dataloader workers chosen for training,
+        # which was likely on this machine
+        return choose_cpu_compute_profile(
+            hardware,
+            choose_dataloader_profile(hardware).num_workers,
+        )
+
     def write_csv_for_inputs(self, list_images: List[Path]) -> None:
         """
         write csv for inputs and return the total number of images
@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 
 from allencell_ml_segmenter.core.channel_extraction import (
@@ -5,31 +6,63 @@ from allencell_ml_segmenter.core.channel_extraction import (
 )
 from allencell_ml_segmenter.core.image_data_extractor import (
     IImageDataExtractor,
-    AICSImageDataExtractor,
+    CoalescingImageDataExtractor,
     ImageData,
 )
 from allencell_ml_segmenter.core.subscriber import Subscriber
 from allencell_ml_segmenter.core.event import Event
 
 from cyto_dl.api.model import CytoDLModel  # type: ignore
+from omegaconf import open_dict  # type: ignore
 from allencell_ml_segmenter.main.experiments_model import ExperimentsModel
 from allencell_ml_segmenter.training.training_model import (
     TrainingModel,
     ImageType,
 )
 from typing import Optional
-from napari.utils.notifications import show_warning, show_error  # type: ignore
+from napari.utils.notifications import (  # type: ignore
+    show_info,
+    show_warning,
+    show_error,
+)
 from allencell_ml_segmenter.utils.cyto_overrides_manager import (
     CytoDLOverridesManager,
 )
 from allencell_ml_segmenter.utils.file_utils import FileUtils
+from allencell_ml_segmenter.utils.file_writer import IFileWriter, FileWriter
+from allencell_ml_segmenter.utils.cuda_util import CUDAUtils
+from allencell_ml_segmenter.utils.hardware_profile import (
+    DataLoaderProfile,
+    HardwareInfo,
+    choose_dataloader_profile,
+    detect_hardware,
+    tune_dataloader_profile,
+)
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+    choose_cpu_compute_profile,
+)
+from allencell_ml_segmenter.training.cache_warmup import (
+    get_cache_warmup_workers,
+)
+from allencell_ml_segmenter.training.training_process import (
+    TrainingJob,
+    TrainingMessage,
+    TrainingMessageType,
+    TrainingProcess,
+)
+from dataclasses import asdict
 from allencell_ml_segmenter.core.task_executor import (
     ITaskExecutor,
-    NapariThreadTaskExecutor,
+    PooledTaskExecutor,
 )
 from collections import namedtuple
 from allencell_ml_segmenter.main.main_model import MIN_DATASET_SIZE
 
+TRAINING_DIR_TASK_GROUP: str = "training_dir"
+
+logger: logging.Logger = logging.getLogger(__name__)
+
 
 DirectoryData = namedtuple(
     "DirectoryData",
@@ -52,18 +85,31 @@ class TrainingService(Subscriber):
         self,
         training_model: TrainingModel,
         experiments_model: ExperimentsModel,
-        img_data_extractor: IImageDataExtractor = AICSImageDataExtractor.global_instance(),
-        task_executor: ITaskExecutor = NapariThreadTaskExecutor.global_instance(),
+        img_data_extractor: IImageDataExtractor = CoalescingImageDataExtractor.global_instance(),
+        task_executor: Optional[ITaskExecutor] = None,
+        file_writer: IFileWriter = FileWriter.global_instance(),
     ):
         super().__init__()
         self._training_model: TrainingModel = training_model
         self._experiments_model: ExperimentsModel = experiments_model
-        self._task_executor: ITaskExecutor = task_executor
+        self._task_executor: ITaskExecutor = (
+            task_executor
+            if task_executor is not None
+            else PooledTaskExecutor.global_instance()
+        )
+        self._file_writer: IFileWriter = file_writer
         self._training_model.subscribe(
             Event.PROCESS_TRAINING,
             self,
             self._train_model_handler,
         )
+        self._training_model.subscribe(
+            Event.PROCESS_TRAINING_CANCEL,
+            self,
+            self._cancel_training_handler,
+        )
+        # the run in progress, if any
+        self._training_process: Optional[TrainingProcess] = None
         self._img_data_extractor: IImageDataExtractor = img_data_extractor
         self._training_model.signals.images_directory_set.connect(
             self._training_image_directory_selected
@@ -94,19 +140,133 @@ class TrainingService(Subscriber):
                     self._training_model.get_experiment_type(),
                     output_dir=f"{self._experiments_model.get_user_experiments_path()}/{self._experiments_model.get_experiment_name()}",
                 )
+            self._prepare_hardware_profiles()
             cyto_overrides_manager: CytoDLOverridesManager = (
                 CytoDLOverridesManager(
                     self._experiments_model, self._training_model
                 )
             )
-            cyto_dl_model.override_config(
-                cyto_overrides_manager.get_training_overrides()
-            )
+            # dataloader settings such as prefetch_factor are not in every
+            # experiment config, so overrides may add keys
+            with open_dict(cyto_dl_model.cfg):
+                cyto_dl_model.override_config(
+                    cyto_overrides_manager.get_training_overrides()
+                )
             cyto_dl_model.print_config()
             cyto_dl_model.save_config(
                 self._experiments_model.get_train_config_path()
             )
-            cyto_dl_model.train()
+            self._save_hardware_profiles()
+            self._run_training_process()
+
+    def _run_training_process(self) -> None:
+        """
+        Trains with the saved config in a child process, which also caches the
+        images ahead of training (see run_training_job), and waits for it to
+        end. The run's memory and file handles are released with the process.
+        """
+        profile: Optional[DataLoaderProfile] = (
+            self._training_model.get_dataloader_profile()
+        )
+        hardware: HardwareInfo = (
+            profile.hardware
+            if profile is not None
+            else detect_hardware(CUDAUtils.cuda_available())
+        )
+        self._training_process = TrainingProcess(
+            TrainingJob(
+                self._experiments_model.get_train_config_path(),
+                self._experiments_model.get_shared_cache_dir(),
+                get_cache_warmup_workers(hardware),
+                self._training_model.get_cpu_compute_profile(),
+            ),
+            self._on_training_message,
+        )
+        try:
+            exit_code: Optional[int] = self._training_process.run()
+            if exit_code is not None and exit_code < 0:
+                show_warning("Training did not stop in time and was killed.")
+        finally:
+            self._training_process = None
+
+    def _on_training_message(self, message: TrainingMessage) -> None:
+        if message.type == TrainingMessageType.WARNING:
+            show_warning(message.payload)
+        elif message.type == TrainingMessageType.ERROR:
+            show_error(f"Training failed: {message.payload}")
+        elif message.type == TrainingMessageType.METRICS:
+            logger.info("Training metrics: %s", message.payload)
+        else:
+            logger.info("Training: %s", message.payload)
+
+    def _cancel_training_handler(self, _: Event) -> None:
+        """
+        Asks the training run in progress to stop after its current step
+        """
+        training_process: Optional[TrainingProcess] = self._training_process
+        if training_process is not None:
+            training_process.request_stop()
+            show_info("Stopping training...")
+
+    def _prepare_hardware_profiles(self) -> None:
+        """
+        Chooses the dataloader settings for this machine, measuring throughput
+        on the training CSV if the training model is set to, and on CPU how
+        torch shares the cores with the dataloader workers and the app.
+        """
+        gpu: bool = CUDAUtils.cuda_available()
+        profile: DataLoaderProfile = choose_dataloader_profile(
+            detect_hardware(gpu)
+        )
+        images_dir: Optional[Path] = (
+            self._training_model.get_images_directory()
+        )
+        if (
+            self._training_model.is_probing_dataloader()
+            and images_dir is not None
+        ):
+            raw_channel: Optional[int] = (
+                self._training_model.get_selected_channel(ImageType.RAW)
+            )
+            try:
+                profile = tune_dataloader_profile(
+                    profile,
+                    images_dir / "train.csv",
+                    raw_channel if raw_channel is not None else 0,
+                )
+            except Exception as e:
+                show_warning(
+                    f"Could not measure dataloader throughput, using defaults: {e}"
+                )
+        self._training_model.set_dataloader_profile(profile)
+        self._training_model.set_cpu_compute_profile(
+            None
+            if gpu
+            else choose_cpu_compute_profile(
+                profile.hardware,
+                profile.num_workers,
+            )
+        )
+
+    def _save_hardware_profiles(self) -> None:
+        profile: Optional[DataLoaderProfile] = (
+            self._training_model.get_dataloader_profile()
+        )
+        cpu_profile: Optional[CpuComputeProfile] = (
+            self._training_model.get_cpu_compute_profile()
+        )
+        if profile is not None:
+            self._file_writer.write_json(
+                {
+                    **profile.to_dict(),
+                    "cpu_compute": (
+                        asdict(cpu_profile)
+                        if cpu_profile is not None
+                        else None
+                    ),
+                },
+                self._experiments_model.get_hardware_profile_path(),
+            )
 
     def _able_to_continue_training(self) -> bool:
         # TODO: refactor- these checks should be in the View before we start a thread for training.
@@ -214,8 +374,11 @@ class TrainingService(Subscriber):
             self._training_model.get_images_directory()
         )
         if training_dir is not None:
+            # results for a previously selected directory are no longer needed
+            self._task_executor.cancel_group(TRAINING_DIR_TASK_GROUP)
             self._task_executor.exec(
                 lambda: self._extract_data_from_training_dir(training_dir),
                 on_return=self._on_training_dir_data_extracted,
                 on_error=self._on_training_dir_data_error,
+                group=TRAINING_DIR_TASK_GROUP,
             )
@@ -1,24 +1,32 @@
+from pathlib import Path
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
-from typing import Callable
+from typing import Callable, Iterable, Set
+
+# suffix of the files cyto-dl caches training items to
+CACHE_FILE_SUFFIX: str = ".pt"
 
 
 class CacheDirEventHandler(FileSystemEventHandler):
     """
     A CacheDirEventHandler calls :param progress_callback: when a .pt file
-    is created in the watched directory with the number of .pt files that have
-    been created.
+    is created in the watched directory with the number of distinct .pt files
+    that have been created, counting from :param cached_files:, the names of
+    files that already exist. A file created again under the same name, e.g.
+    when it is replaced by a link to the shared cache, is not counted again.
     """
 
     def __init__(
         self,
         progress_callback: Callable,
+        cached_files: Iterable[str] = (),
     ):
         super().__init__()
         self._progress_callback: Callable = progress_callback
-        self._num_files = 0
+        self._cached_files: Set[str] = set(cached_files)
 
     # override
     def on_created(self, event: FileSystemEvent) -> None:
-        if str(event.src_path).endswith(".pt"):
-            self._num_files += 1
-            self._progress_callback(self._num_files)
+        name: str = Path(str(event.src_path)).name
+        if name.endswith(CACHE_FILE_SUFFIX) and name not in self._cached_files:
+            self._cached_files.add(name)
+            self._progress_callback(len(self._cached_files))
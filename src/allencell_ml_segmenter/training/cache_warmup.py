@@ -0,0 +1,165 @@
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Sequence, Set
+
+from allencell_ml_segmenter.training.cache_dir_event_handler import (
+    CACHE_FILE_SUFFIX,
+)
+from allencell_ml_segmenter.training.shared_cache import SharedCache
+from allencell_ml_segmenter.utils.hardware_profile import (
+    HardwareInfo,
+    WORKER_MEMORY_BYTES,
+)
+from allencell_ml_segmenter.utils.cpu_compute_profile import RESERVED_CORES
+
+
+def list_cached_files(cache_dir: Path) -> Set[str]:
+    """
+    Returns the names of the cache files in :param cache_dir:, as counted by
+    the CacheDirEventHandler.
+    """
+    if not cache_dir.exists():
+        return set()
+    return {path.name for path in cache_dir.rglob(f"*{CACHE_FILE_SUFFIX}")}
+
+
+def get_cache_warmup_workers(hardware: HardwareInfo) -> int:
+    """
+    Returns the number of worker processes to warm the cache with on
+    :param hardware:. Training has not started yet, so every core not left to
+    the app is used, as far as memory allows.
+    """
+    cpu_workers: int = hardware.get_usable_cpus() - RESERVED_CORES
+    memory_workers: int = hardware.memory_bytes // WORKER_MEMORY_BYTES - 1
+    return max(1, min(cpu_workers, memory_workers))
+
+
+def _get_cache_path(dataset: Any, idx: int) -> Optional[Path]:
+    # the file a monai PersistentDataset caches the item at idx to
+    cache_dir: Optional[Path] = getattr(dataset, "cache_dir", None)
+    hash_func: Optional[Callable] = getattr(dataset, "hash_func", None)
+    if cache_dir is None or hash_func is None:
+        return None
+    key: str = hash_func(dataset.data[idx]).decode("utf-8")
+    key += getattr(dataset, "transform_hash", "")
+    return Path(cache_dir) / f"{key}{CACHE_FILE_SUFFIX}"
+
+
+def is_cached_dataset(dataset: Any) -> bool:
+    """
+    Returns True if :param dataset: caches its items to files, like the monai
+    PersistentDataset that cyto-dl trains from.
+    """
+    return (
+        getattr(dataset, "cache_dir", None) is not None
+        and getattr(dataset, "hash_func", None) is not None
+        and hasattr(dataset, "data")
+    )
+
+
+def _find_unshared_indices(
+    dataset: Any, shared_cache: SharedCache, keys: List[str]
+) -> List[int]:
+    # links the items of dataset with an entry in the shared cache, moves
+    # copies of evicted entries of the same images back into it, and returns
+    # the others
+    unshared: List[int] = []
+    for idx, key in enumerate(keys):
+        cache_path: Optional[Path] = _get_cache_path(dataset, idx)
+        if cache_path is None:
+            unshared.append(idx)
+        elif shared_cache.link(key, cache_path):
+            continue
+        elif (
+            cache_path.is_file()
+            and not cache_path.is_symlink()
+            and shared_cache.get_copied_key(cache_path) == key
+        ):
+            shared_cache.add(key, cache_path)
+        else:
+            # cyto-dl names cache files by image path, not content, so it
+            # would load a link to an evicted entry, or a file cached from
+            # images that may have changed since, as is
+            shared_cache.unlink(cache_path)
+            unshared.append(idx)
+    return unshared
+
+
+def find_uncached_indices(dataset: Any) -> List[int]:
+    """
+    Returns the indices of the items of the cached :param dataset: that have no
+    cache file yet.
+    """
+    uncached: List[int] = []
+    for idx in range(len(dataset)):
+        cache_path: Optional[Path] = _get_cache_path(dataset, idx)
+        if cache_path is None or not cache_path.exists():
+            uncached.append(idx)
+    return uncached
+
+
+def _discard(_: Any) -> None:
+    # module level so that it can be sent to worker processes
+    return None
+
+
+def warm_cache(
+    datasets: Sequence[Any],
+    num_workers: int,
+    on_item_cached: Optional[Callable[[], None]] = None,
+    shared_cache: Optional[SharedCache] = None,
+) -> int:
+    """
+    Loads every item of :param datasets: that is not cached yet with
+    :param num_workers: worker processes, which makes each dataset write its
+    cache file, and returns the number of items loaded. Datasets that do not
+    cache their items are left out.
+    :param on_item_cached: called after each item is loaded
+    :param shared_cache: if given, items are only loaded if the shared cache
+    has no entry for them, the experiment's cache files link to the shared
+    entries, and the least recently used entries of other items are evicted
+    once done
+    """
+    num_cached: int = 0
+    used_keys: Set[str] = set()
+    for dataset in datasets:
+        if not is_cached_dataset(dataset):
+            continue
+        keys: List[str] = []
+        uncached: List[int]
+        if shared_cache is not None:
+            transform_hash: str = getattr(dataset, "transform_hash", "")
+            keys = [
+                shared_cache.get_key(item, transform_hash)
+                for item in dataset.data
+            ]
+            used_keys.update(keys)
+            uncached = _find_unshared_indices(dataset, shared_cache, keys)
+        else:
+            uncached = find_uncached_indices(dataset)
+        if not uncached:
+            continue
+        # imported here so that the rest of this module can be used without
+        # torch
+        from torch.utils.data import DataLoader, Subset  # type: ignore
+
+        # items are only loaded for their cache files, so nothing is collated
+        # or sent back from the workers
+        loader: DataLoader = DataLoader(
+            Subset(dataset, uncached),
+            batch_size=None,
+            num_workers=num_workers,
+            collate_fn=_discard,
+        )
+        for _ in loader:
+            num_cached += 1
+            if on_item_cached is not None:
+                on_item_cached()
+        if shared_cache is not None:
+            for idx in uncached:
+                cache_path: Optional[Path] = _get_cache_path(dataset, idx)
+                if cache_path is not None and cache_path.is_file():
+                    shared_cache.add(keys[idx], cache_path)
+    if shared_cache is not None:
+        shared_cache.evict(keep=used_keys)
+        shared_cache.save_file_hashes()
+    return num_cached
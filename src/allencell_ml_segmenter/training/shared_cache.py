@@ -0,0 +1,298 @@
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from allencell_ml_segmenter.training.cache_dir_event_handler import (
+    CACHE_FILE_SUFFIX,
+)
+
+# directory of the shared cache within the experiments home; the leading dot
+# keeps it out of the experiments list
+SHARED_CACHE_DIR_NAME: str = ".training_cache"
+# disk space the shared cache may use before the least recently used entries
+# are evicted, unless a budget is set for the cache (see set_budget_bytes)
+DEFAULT_BUDGET_BYTES: int = 50 * 1024**3
+OBJECTS_DIR_NAME: str = "objects"
+# content hashes of the image files seen so far, by path
+FILE_HASHES_NAME: str = "file_hashes.json"
+# settings of the cache, read by training runs and the cache CLI alike
+SETTINGS_NAME: str = "settings.json"
+# experiment cache files that are copies of an entry rather than links have
+# the entry's key saved next to them, with this suffix
+KEY_FILE_SUFFIX: str = ".key"
+HASH_CHUNK_BYTES: int = 1024**2
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    # content hash of the cached item and of the transforms applied to it
+    key: str
+    size_bytes: int
+    # time the entry was last used by a training run, in seconds since epoch
+    last_used: float
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    # written aside and moved, so that a process reading it never sees part of
+    # it
+    tmp_path: Path = path.with_name(f"{path.name}.{os.getpid()}")
+    tmp_path.write_text(text)
+    os.replace(tmp_path, path)
+
+
+def _get_key_path(cache_path: Path) -> Path:
+    return cache_path.with_name(f"{cache_path.name}{KEY_FILE_SUFFIX}")
+
+
+def _link(target: Path, link_path: Path) -> None:
+    # symlinks need extra privileges on windows, hard links need the same
+    # volume; a copy is the last resort
+    try:
+        link_path.symlink_to(target)
+    except OSError:
+        try:
+            os.link(target, link_path)
+        except OSError:
+            shutil.copyfile(target, link_path)
+
+
+class SharedCache:
+    """
+    Cache of transformed training items shared by every experiment, keyed by
+    the content of an item's image files and the hash of the transforms
+    applied to them, so that an item is only cached once however many
+    experiments train on it and wherever its files are.
+
+    Experiments keep their own cache directory, with the file names cyto-dl
+    expects, but its files link to entries in the shared cache. The least
+    recently used entries are evicted when the cache is over its disk budget;
+    an experiment linking to an evicted entry has it cached again by training.
+    """
+
+    def __init__(self, root: Path, budget_bytes: Optional[int] = None) -> None:
+        """
+        :param root: directory of the shared cache
+        :param budget_bytes: disk space entries may use, defaults to the budget
+        set for the cache
+        """
+        self._root: Path = root
+        self._objects_dir: Path = root / OBJECTS_DIR_NAME
+        self._budget_bytes: int = (
+            budget_bytes
+            if budget_bytes is not None
+            else self._load_budget_bytes()
+        )
+        # {path: [size, modification time, content hash]}
+        self._file_hashes: Optional[Dict[str, List[Any]]] = None
+
+    def get_root(self) -> Path:
+        return self._root
+
+    def get_budget_bytes(self) -> int:
+        return self._budget_bytes
+
+    def set_budget_bytes(self, budget_bytes: int) -> None:
+        """
+        Sets the disk space entries may use, and saves it with the cache so
+        that training runs and the cache CLI use it from now on.
+        """
+        if budget_bytes < 0:
+            raise ValueError("Cache budget must not be negative")
+        self._root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(
+            self._root / SETTINGS_NAME,
+            json.dumps({"budget_bytes": budget_bytes}),
+        )
+        self._budget_bytes = budget_bytes
+
+    def _load_budget_bytes(self) -> int:
+        try:
+            with open(self._root / SETTINGS_NAME) as file:
+                return int(json.load(file)["budget_bytes"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return DEFAULT_BUDGET_BYTES
+
+    def get_entry_path(self, key: str) -> Path:
+        return self._objects_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _get_file_hashes(self) -> Dict[str, List[Any]]:
+        if self._file_hashes is None:
+            try:
+                with open(self._root / FILE_HASHES_NAME) as file:
+                    self._file_hashes = json.load(file)
+            except (OSError, ValueError):
+                self._file_hashes = {}
+        return self._file_hashes
+
+    def save_file_hashes(self) -> None:
+        """
+        Saves the content hashes computed so far, so that files that have not
+        changed are not read again by the next training run.
+        """
+        if self._file_hashes is None:
+            return
+        self._root.mkdir(parents=True, exist_ok=True)
+        _write_atomic(
+            self._root / FILE_HASHES_NAME, json.dumps(self._file_hashes)
+        )
+
+    def get_file_hash(self, path: Path) -> str:
+        """
+        Returns the content hash of the file at :param path:. Hashes are kept
+        by path, size and modification time, so a file is only read again
+        after it changes.
+        """
+        stat: os.stat_result = path.stat()
+        file_hashes: Dict[str, List[Any]] = self._get_file_hashes()
+        known: Optional[List[Any]] = file_hashes.get(str(path))
+        if known is not None and known[:2] == [stat.st_size, stat.st_mtime_ns]:
+            return known[2]
+        digest: str = _hash_file(path)
+        file_hashes[str(path)] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+
+    def get_key(self, item: Dict[str, Any], transform_hash: str) -> str:
+        """
+        Returns the key of a dataset :param item:, a row of the training CSV,
+        once transformed by transforms with :param transform_hash:. Values
+        that are paths to files are keyed by the files' content, so the key
+        does not depend on where the images are.
+        """
+        digest = hashlib.sha256()
+        for column in sorted(item):
+            value: Any = item[column]
+            path: Optional[Path] = (
+                Path(value) if isinstance(value, (str, Path)) else None
+            )
+            content: str = (
+                self.get_file_hash(path)
+                if path is not None and path.is_file()
+                else repr(value)
+            )
+            digest.update(f"{column}={content};".encode("utf-8"))
+        digest.update(transform_hash.encode("utf-8"))
+        return digest.hexdigest()
+
+    def link(self, key: str, cache_path: Path) -> bool:
+        """
+        Makes the experiment cache file at :param cache_path: refer to the
+        entry with :param key:, replacing whatever is there, and returns True,
+        or returns False if there is no such entry.
+        """
+        entry_path: Path = self.get_entry_path(key)
+        if not entry_path.is_file():
+            return False
+        # used now, for the least recently used eviction
+        os.utime(entry_path)
+        if (
+            cache_path.is_symlink()
+            and cache_path.resolve() == entry_path.resolve()
+        ):
+            return True
+        self.unlink(cache_path)
+        _link(entry_path, cache_path)
+        if not cache_path.is_symlink():
+            # a copy, or a hard link that outlives the entry, is no longer
+            # known to be the entry once that is evicted
+            _get_key_path(cache_path).write_text(key)
+        return True
+
+    @staticmethod
+    def get_copied_key(cache_path: Path) -> Optional[str]:
+        """
+        Returns the key of the entry that the experiment cache file at
+        :param cache_path: is a copy of, or None if it is not known, e.g. for
+        files cached by training rather than from the shared cache.
+        """
+        try:
+            return _get_key_path(cache_path).read_text()
+        except OSError:
+            return None
+
+    @staticmethod
+    def unlink(cache_path: Path) -> None:
+        """
+        Removes the experiment cache file at :param cache_path:, and the key
+        saved next to it.
+        """
+        cache_path.unlink(missing_ok=True)
+        _get_key_path(cache_path).unlink(missing_ok=True)
+
+    def add(self, key: str, cache_path: Path) -> None:
+        """
+        Moves the experiment cache file at :param cache_path: into the shared
+        cache as the entry with :param key:, and leaves a link to it in its
+        place.
+        """
+        entry_path: Path = self.get_entry_path(key)
+        if not entry_path.is_file():
+            self._objects_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                os.replace(cache_path, entry_path)
+            except OSError:
+                # on another volume than the experiment
+                shutil.copyfile(cache_path, entry_path)
+        self.link(key, cache_path)
+
+    def get_entries(self) -> List[CacheEntry]:
+        """
+        Returns the entries of the cache, least recently used first.
+        """
+        if not self._objects_dir.exists():
+            return []
+        entries: List[CacheEntry] = []
+        for entry_path in self._objects_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat: os.stat_result = entry_path.stat()
+            except FileNotFoundError:
+                # evicted by another run
+                continue
+            entries.append(
+                CacheEntry(
+                    entry_path.name[: -len(CACHE_FILE_SUFFIX)],
+                    stat.st_size,
+                    stat.st_mtime,
+                )
+            )
+        entries.sort(key=lambda entry: entry.last_used)
+        return entries
+
+    def evict(
+        self,
+        keep: Iterable[str] = (),
+        budget_bytes: Optional[int] = None,
+    ) -> List[CacheEntry]:
+        """
+        Removes the least recently used entries until the cache fits in its
+        budget, and returns the entries removed.
+        :param keep: keys of entries not to remove, e.g. those the current run
+        trains on
+        :param budget_bytes: budget to fit in, defaults to the cache's
+        """
+        if budget_bytes is None:
+            budget_bytes = self._budget_bytes
+        kept: frozenset = frozenset(keep)
+        entries: List[CacheEntry] = self.get_entries()
+        size: int = sum(entry.size_bytes for entry in entries)
+        evicted: List[CacheEntry] = []
+        for entry in entries:
+            if size <= budget_bytes:
+                break
+            if entry.key in kept:
+                continue
+            self.get_entry_path(entry.key).unlink(missing_ok=True)
+            size -= entry.size_bytes
+            evicted.append(entry)
+        return evicted
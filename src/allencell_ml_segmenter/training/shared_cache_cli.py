@@ -0,0 +1,117 @@
+# Inspects the training cache shared by the experiments in an experiments home,
+# evicts its least recently used entries, and sets its budget, which training
+# runs evict to as well.
+# usage: allencell-segmenter-ml-cache EXPERIMENTS_HOME
+#        {inspect,evict,set-budget} [options]
+# (or python -m allencell_ml_segmenter.training.shared_cache_cli)
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from allencell_ml_segmenter.training.shared_cache import (
+    SHARED_CACHE_DIR_NAME,
+    CacheEntry,
+    SharedCache,
+)
+
+GIB: int = 1024**3
+SECONDS_PER_DAY: int = 24 * 60 * 60
+
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="allencell-segmenter-ml-cache",
+        description="Inspect or evict the training cache shared by the "
+        "experiments in an experiments home.",
+    )
+    parser.add_argument(
+        "experiments_home", type=Path, help="experiments home directory"
+    )
+    parser.add_argument(
+        "--budget-gb",
+        type=float,
+        default=None,
+        help="disk space the cache may use, for this command only; defaults "
+        "to the budget set for the cache",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    inspect: argparse.ArgumentParser = commands.add_parser(
+        "inspect", help="print the size and use of the cache"
+    )
+    inspect.add_argument(
+        "--entries",
+        type=int,
+        default=0,
+        help="also list this many least recently used entries",
+    )
+    commands.add_parser(
+        "evict",
+        help="remove the least recently used entries until the cache fits "
+        "in its budget",
+    )
+    set_budget: argparse.ArgumentParser = commands.add_parser(
+        "set-budget",
+        help="set the disk space the cache may use, for training runs and "
+        "this command",
+    )
+    set_budget.add_argument("gb", type=float, help="budget in GiB")
+    return parser
+
+
+def _format_entry(entry: CacheEntry, now: float) -> str:
+    return (
+        f"{entry.key}  {entry.size_bytes / GIB:8.3f} GiB"
+        f"  {(now - entry.last_used) / SECONDS_PER_DAY:6.1f} days ago"
+    )
+
+
+def _inspect(cache: SharedCache, num_entries: int) -> None:
+    entries: List[CacheEntry] = cache.get_entries()
+    size: int = sum(entry.size_bytes for entry in entries)
+    now: float = time.time()
+    print(f"cache:   {cache.get_root()}")
+    print(f"entries: {len(entries)}")
+    print(
+        f"size:    {size / GIB:.2f} GiB of {cache.get_budget_bytes() / GIB:.2f}"
+        " GiB budget"
+    )
+    if entries:
+        print(
+            "last used between "
+            f"{(now - entries[-1].last_used) / SECONDS_PER_DAY:.1f} and "
+            f"{(now - entries[0].last_used) / SECONDS_PER_DAY:.1f} days ago"
+        )
+    for entry in entries[:num_entries]:
+        print(_format_entry(entry, now))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args: argparse.Namespace = _make_parser().parse_args(argv)
+    cache_dir: Path = args.experiments_home / SHARED_CACHE_DIR_NAME
+    # a budget can be set before the first training run creates the cache
+    if not cache_dir.exists() and args.command != "set-budget":
+        print(f"no shared cache in {args.experiments_home}", file=sys.stderr)
+        return 1
+    cache: SharedCache = SharedCache(
+        cache_dir,
+        int(args.budget_gb * GIB) if args.budget_gb is not None else None,
+    )
+    if args.command == "inspect":
+        _inspect(cache, args.entries)
+    elif args.command == "set-budget":
+        if args.gb < 0:
+            print("the budget must not be negative", file=sys.stderr)
+            return 2
+        cache.set_budget_bytes(int(args.gb * GIB))
+        print(f"budget set to {args.gb:.2f} GiB")
+    else:
+        evicted: List[CacheEntry] = cache.evict()
+        freed: int = sum(entry.size_bytes for entry in evicted)
+        print(f"evicted {len(evicted)} entries, {freed / GIB:.2f} GiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
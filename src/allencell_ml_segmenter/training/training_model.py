@@ -7,6 +7,10 @@ from allencell_ml_segmenter.main.experiments_model import ExperimentsModel
 from allencell_ml_segmenter.main.main_model import MainModel, ImageType
 from qtpy.QtCore import QObject, Signal
 from allencell_ml_segmenter.utils.experiment_utils import ExperimentUtils
+from allencell_ml_segmenter.utils.hardware_profile import DataLoaderProfile
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+)
 
 
 class TrainingType(Enum):
@@ -71,6 +75,12 @@ class TrainingModel(Publisher):
         self._model_size: Optional[ModelSize] = None
         # the total number of images used for training/test/validation for this model
         self._total_num_images: int = 0
+        # whether dataloader workers are chosen by measuring throughput on the
+        # training data, and the dataloader settings of the last training run
+        self._probe_dataloader: bool = False
+        self._dataloader_profile: Optional[DataLoaderProfile] = None
+        # the CPU settings of the last training run (None on GPU)
+        self._cpu_compute_profile: Optional[CpuComputeProfile] = None
 
         # Whether to use an existing model, and the existing model to use if one is selected
         # If is_using_existing_model is False, the existing_model_to_use will be None
@@ -202,6 +212,12 @@ class TrainingModel(Publisher):
         """
         self.dispatch(Event.PROCESS_TRAINING)
 
+    def cancel_training(self) -> None:
+        """
+        Dispatches event to stop the training run in progress
+        """
+        self.dispatch(Event.PROCESS_TRAINING_CANCEL)
+
     def use_max_time(self) -> bool:
         """
         Will training run will be based off of max time
@@ -235,6 +251,32 @@ class TrainingModel(Publisher):
     def get_total_num_images(self) -> int:
         return self._total_num_images
 
+    def set_probe_dataloader(self, probe: bool) -> None:
+        """
+        Set if the number of dataloader workers is chosen by measuring how fast
+        the training images are read, rather than from the hardware alone
+        """
+        self._probe_dataloader = probe
+
+    def is_probing_dataloader(self) -> bool:
+        return self._probe_dataloader
+
+    def set_dataloader_profile(
+        self, profile: Optional[DataLoaderProfile]
+    ) -> None:
+        self._dataloader_profile = profile
+
+    def get_dataloader_profile(self) -> Optional[DataLoaderProfile]:
+        return self._dataloader_profile
+
+    def set_cpu_compute_profile(
+        self, profile: Optional[CpuComputeProfile]
+    ) -> None:
+        self._cpu_compute_profile = profile
+
+    def get_cpu_compute_profile(self) -> Optional[CpuComputeProfile]:
+        return self._cpu_compute_profile
+
     def get_selected_channels(self) -> dict[ImageType, Optional[int]]:
         return self._main_model.get_selected_channels()
 
@@ -0,0 +1,256 @@
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass
+from enum import Enum
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+)
+
+# how long a run may take to stop after a stop request, e.g. to finish writing
+# a checkpoint, before it is killed
+STOP_TIMEOUT_SECONDS: float = 120.0
+# how long a terminated run may take to exit before it is killed
+TERMINATE_TIMEOUT_SECONDS: float = 5.0
+# how often the parent checks on the run while there are no messages
+POLL_SECONDS: float = 0.5
+
+
+class TrainingMessageType(Enum):
+    """
+    Kinds of messages sent by a training run to the app
+    """
+
+    # payload: str, a stage of the run
+    LOG = "log"
+    # payload: str, something the user should know that did not stop the run
+    WARNING = "warning"
+    # payload: {metric name: value}, logged at the end of each epoch
+    METRICS = "metrics"
+    # payload: str, the error that stopped the run
+    ERROR = "error"
+
+
+@dataclass(frozen=True)
+class TrainingMessage:
+    type: TrainingMessageType
+    payload: Any
+
+
+@dataclass(frozen=True)
+class TrainingJob:
+    """
+    What a training run needs, sent to the process it runs in.
+    """
+
+    # cyto-dl config the run trains with, overrides included
+    config_path: Path
+    # cache the run's items are linked from, None to cache in the experiment
+    # alone
+    shared_cache_dir: Optional[Path]
+    cache_warmup_workers: int
+    # how torch uses the CPU, None when training on GPU
+    cpu_compute_profile: Optional[CpuComputeProfile]
+
+
+class _StopRequested(Exception):
+    pass
+
+
+# set in the training process, for the callback that cyto-dl instantiates
+_stop_event: Optional[Any] = None
+_messages: Optional[Any] = None
+
+
+def _send(message_type: TrainingMessageType, payload: Any) -> None:
+    if _messages is not None:
+        _messages.put(TrainingMessage(message_type, payload))
+
+
+def make_stop_request_callback() -> Any:
+    """
+    Returns a Lightning callback that stops training after the current batch
+    once a stop is requested, and sends the metrics of each epoch to the app.
+    Referenced from the config of a training run, so that cyto-dl adds it to
+    the trainer.
+    """
+    # imported here so that the app does not need lightning to start a run
+    from lightning.pytorch.callbacks import Callback  # type: ignore
+
+    class StopRequestCallback(Callback):
+        def on_train_batch_end(
+            self, trainer: Any, *args: Any, **kwargs: Any
+        ) -> None:
+            # lightning finishes the step, and any checkpoint being written,
+            # before it stops
+            if _stop_event is not None and _stop_event.is_set():
+                trainer.should_stop = True
+
+        def on_train_epoch_end(
+            self, trainer: Any, *args: Any, **kwargs: Any
+        ) -> None:
+            metrics: Dict[str, float] = {
+                name: float(value)
+                for name, value in trainer.callback_metrics.items()
+            }
+            _send(
+                TrainingMessageType.METRICS,
+                {"epoch": trainer.current_epoch, **metrics},
+            )
+
+    return StopRequestCallback()
+
+
+def _check_stop_requested() -> None:
+    if _stop_event is not None and _stop_event.is_set():
+        raise _StopRequested()
+
+
+def _warm_cache(cfg: Any, job: TrainingJob) -> None:
+    # imported here, the training process imports what the app does not need
+    from hydra.utils import instantiate  # type: ignore
+    from allencell_ml_segmenter.training.cache_warmup import warm_cache
+    from allencell_ml_segmenter.training.shared_cache import SharedCache
+
+    try:
+        datamodule = instantiate(cfg.data)
+        datamodule.setup("fit")
+        warm_cache(
+            [
+                datamodule.train_dataloader().dataset,
+                datamodule.val_dataloader().dataset,
+            ],
+            job.cache_warmup_workers,
+            on_item_cached=_check_stop_requested,
+            shared_cache=(
+                SharedCache(job.shared_cache_dir)
+                if job.shared_cache_dir is not None
+                else None
+            ),
+        )
+    except _StopRequested:
+        raise
+    except Exception as e:
+        # training caches whatever is missing itself
+        _send(
+            TrainingMessageType.WARNING,
+            f"Could not cache images before training: {e}",
+        )
+
+
+def run_training_job(job: TrainingJob, stop_event: Any, messages: Any) -> None:
+    """
+    Runs :param job: in the calling process: caches its images ahead of
+    training, then trains with cyto-dl until done or until
+    :param stop_event: is set. Messages for the app are put on
+    :param messages:.
+    """
+    global _stop_event, _messages
+    _stop_event = stop_event
+    _messages = messages
+    try:
+        from cyto_dl.api.model import CytoDLModel  # type: ignore
+        from omegaconf import open_dict  # type: ignore
+
+        cyto_dl_model: CytoDLModel = CytoDLModel()
+        cyto_dl_model.load_config_from_file(str(job.config_path))
+        _send(TrainingMessageType.LOG, "Caching images")
+        _warm_cache(cyto_dl_model.cfg, job)
+        _check_stop_requested()
+        with open_dict(cyto_dl_model.cfg):
+            if cyto_dl_model.cfg.get("callbacks") is None:
+                cyto_dl_model.cfg.callbacks = {}
+            cyto_dl_model.cfg.callbacks.stop_request = {
+                "_target_": f"{__name__}.make_stop_request_callback"
+            }
+        if job.cpu_compute_profile is not None:
+            job.cpu_compute_profile.apply()
+        _send(TrainingMessageType.LOG, "Training")
+        cyto_dl_model.train()
+    except _StopRequested:
+        _send(TrainingMessageType.LOG, "Stopped before training")
+    except Exception as e:
+        _send(TrainingMessageType.ERROR, str(e))
+        raise
+
+
+class TrainingProcess:
+    """
+    Runs a training job in a child process, so that the memory, GPU context and
+    file handles of the run are released when it ends, and so that a run can
+    be stopped without stopping a thread of the app midway.
+
+    run() blocks until the job ends, passing the messages the job sends to
+    :param on_message:. request_stop() may be called from any thread: the job
+    stops after its current training step, and is killed if it has not within
+    :param stop_timeout: seconds.
+    """
+
+    def __init__(
+        self,
+        job: TrainingJob,
+        on_message: Callable[[TrainingMessage], None],
+        stop_timeout: float = STOP_TIMEOUT_SECONDS,
+        target: Callable[[TrainingJob, Any, Any], None] = run_training_job,
+    ) -> None:
+        self._job: TrainingJob = job
+        self._on_message: Callable[[TrainingMessage], None] = on_message
+        self._stop_timeout: float = stop_timeout
+        self._target: Callable[[TrainingJob, Any, Any], None] = target
+        # CUDA cannot be used in a forked process
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._stop_deadline: Optional[float] = None
+
+    def request_stop(self) -> None:
+        """
+        Asks the job to stop, and sets the time it is killed at if it has not.
+        """
+        if self._stop_deadline is None:
+            self._stop_deadline = time.monotonic() + self._stop_timeout
+        self._stop_event.set()
+
+    def is_stop_requested(self) -> bool:
+        return self._stop_event.is_set()
+
+    def _receive(self, messages: Any, timeout: float) -> bool:
+        try:
+            message: TrainingMessage = messages.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        self._on_message(message)
+        return True
+
+    def run(self) -> Optional[int]:
+        """
+        Runs the job and returns the exit code of its process, which is
+        negative if it had to be killed.
+        """
+        messages = self._context.Queue()
+        process: BaseProcess = self._context.Process(
+            target=self._target,
+            # not a daemon, the job starts dataloader workers of its own
+            args=(self._job, self._stop_event, messages),
+        )
+        process.start()
+        while process.is_alive():
+            self._receive(messages, POLL_SECONDS)
+            if (
+                self._stop_deadline is not None
+                and time.monotonic() > self._stop_deadline
+            ):
+                process.terminate()
+                process.join(TERMINATE_TIMEOUT_SECONDS)
+                if process.is_alive():
+                    process.kill()
+                break
+        process.join()
+        # messages sent just before the process exited
+        while self._receive(messages, 0):
+            pass
+        messages.close()
+        return process.exitcode
@@ -8,7 +8,8 @@ from allencell_ml_segmenter.training.metrics_csv_event_handler import (
 from allencell_ml_segmenter.training.cache_dir_event_handler import (
     CacheDirEventHandler,
 )
-from typing import Optional
+from allencell_ml_segmenter.training.cache_warmup import list_cached_files
+from typing import Optional, Set
 
 
 class TrainingProgressTracker(ProgressTracker):
@@ -75,9 +76,14 @@ class TrainingProgressTracker(ProgressTracker):
         self._observer.schedule(
             csv_handler, path=str(self._csv_path.resolve()), recursive=True
         )
+        # files cached by an earlier run, or already found by the cache
+        # warmup, are not created again
+        cached_files: Set[str] = list_cached_files(self._cache_path)
         cache_handler: CacheDirEventHandler = CacheDirEventHandler(
-            self._set_cache_progress_text
+            self._set_cache_progress_text, cached_files
         )
+        if cached_files:
+            self._set_cache_progress_text(len(cached_files))
         self._observer.schedule(
             cache_handler, path=str(self._cache_path.resolve()), recursive=True
         )
@@ -240,6 +240,30 @@ class TrainingView(View, MainWindow):
         )
         max_time_layout.addStretch()
         bottom_grid_layout.addLayout(max_time_layout, 4, 1)
+
+        probe_dataloader_layout: QHBoxLayout = QHBoxLayout()
+        probe_dataloader_layout.setSpacing(0)
+
+        self._probe_dataloader_checkbox: QCheckBox = QCheckBox()
+        self._probe_dataloader_checkbox.setObjectName(
+            "probeDataloaderCheckbox"
+        )
+        self._probe_dataloader_checkbox.toggled.connect(
+            self._training_model.set_probe_dataloader
+        )
+        probe_dataloader_layout.addWidget(self._probe_dataloader_checkbox)
+
+        probe_dataloader_text: LabelWithHint = LabelWithHint(
+            "Tune data loading"
+        )
+        probe_dataloader_text.set_hint(
+            "(Optional) Measure how fast the training images are read before training starts, and load them with more worker processes if that is faster. Takes up to a few minutes."
+        )
+        probe_dataloader_layout.addWidget(
+            probe_dataloader_text, alignment=Qt.AlignmentFlag.AlignLeft
+        )
+        probe_dataloader_layout.addStretch()
+        bottom_grid_layout.addLayout(probe_dataloader_layout, 5, 1)
         bottom_grid_layout.setColumnStretch(1, 8)
         bottom_grid_layout.setColumnStretch(0, 3)
 
@@ -280,7 +304,13 @@ class TrainingView(View, MainWindow):
                     + 1,
                 )
             )
+            # a cancelled run can take a while to stop, and a new one must not
+            # start until it has
+            self._train_btn.setEnabled(False)
             self.startLongTaskWithProgressBar(progress_tracker)
+            self.longTaskThread.finished.connect(
+                lambda: self._train_btn.setEnabled(True)
+            )
 
     # Abstract methods from View implementations #######################
 
@@ -290,6 +320,13 @@ class TrainingView(View, MainWindow):
         """
         self._training_model.dispatch_training()
 
+    def cancelWork(self) -> None:
+        """
+        Stops the training run after its current step; doWork returns once
+        it has, and training cannot be started again until then
+        """
+        self._training_model.cancel_training()
+
     def getTypeOfWork(self) -> str:
         """
         Returns string representation of training process
@@ -0,0 +1,141 @@
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set
+
+from allencell_ml_segmenter.utils.hardware_profile import HardwareInfo
+
+# cores left to napari, the file watchers and the task executor threads
+RESERVED_CORES: int = 2
+# CPU flags of instruction sets that run bf16 math natively
+BF16_CPU_FLAGS: List[str] = ["avx512_bf16", "amx_bf16"]
+CPUINFO_PATH: Path = Path("/proc/cpuinfo")
+
+
+@dataclass(frozen=True)
+class CpuComputeProfile:
+    """
+    How torch uses the CPU for a training or prediction run, so that it does
+    not compete for cores with the rest of the app and its dataloader workers.
+    """
+
+    # threads used within an op (e.g. a convolution)
+    intra_op_threads: int
+    # threads used to run independent ops in parallel
+    inter_op_threads: int
+    # run with bf16 autocast
+    bf16: bool
+    # cores the run is pinned to, None to leave affinity as is
+    cpu_affinity: Optional[List[int]]
+
+    def get_overrides(self) -> Dict[str, Any]:
+        """
+        Returns the cyto-dl overrides that apply this profile. Thread counts
+        and affinity cannot be set through the config, see apply().
+        """
+        return {"trainer.precision": "bf16-mixed"} if self.bf16 else {}
+
+    def apply(self) -> None:
+        """
+        Sets the torch thread counts of this process, and pins the calling
+        thread to the profile's cores. Threads it starts afterwards, such as
+        torch's intra-op pool, inherit the affinity. Call from the thread the
+        run starts on, in a process that only runs it; see applied() for runs
+        within the app's process.
+        """
+        import torch  # type: ignore
+
+        torch.set_num_threads(self.intra_op_threads)
+        try:
+            torch.set_num_interop_threads(self.inter_op_threads)
+        except RuntimeError:
+            # can only be set before any inter-op work, e.g. an earlier run
+            pass
+        if self.cpu_affinity is not None and hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, self.cpu_affinity)
+
+    @contextmanager
+    def applied(self) -> Iterator[None]:
+        """
+        Sets the torch intra-op thread count and the affinity of the calling
+        thread for the duration of the block, and restores them afterwards.
+        The inter-op thread count is left as is, torch cannot change it back.
+        """
+        import torch  # type: ignore
+
+        num_threads: int = torch.get_num_threads()
+        cpu_affinity: Optional[List[int]] = (
+            self.cpu_affinity if hasattr(os, "sched_setaffinity") else None
+        )
+        affinity: Optional[Set[int]] = (
+            os.sched_getaffinity(0) if cpu_affinity is not None else None
+        )
+        torch.set_num_threads(self.intra_op_threads)
+        if cpu_affinity is not None:
+            os.sched_setaffinity(0, cpu_affinity)
+        try:
+            yield
+        finally:
+            torch.set_num_threads(num_threads)
+            if affinity is not None:
+                os.sched_setaffinity(0, affinity)
+
+
+def cpu_supports_bf16(cpuinfo_path: Path = CPUINFO_PATH) -> bool:
+    """
+    Returns True if the CPU has instructions for bf16 math. Other CPUs emulate
+    it, which is slower than float32.
+    """
+    try:
+        cpuinfo: str = cpuinfo_path.read_text()
+    except OSError:
+        return False
+    for line in cpuinfo.splitlines():
+        if line.startswith("flags"):
+            flags: List[str] = line.partition(":")[2].split()
+            return any(flag in flags for flag in BF16_CPU_FLAGS)
+    return False
+
+
+def _get_allowed_cpus() -> List[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def choose_cpu_compute_profile(
+    hardware: HardwareInfo,
+    num_loader_workers: int = 0,
+    use_bf16: bool = False,
+    allowed_cpus: Optional[Sequence[int]] = None,
+    cpuinfo_path: Path = CPUINFO_PATH,
+) -> CpuComputeProfile:
+    """
+    Returns a profile that gives torch the cores of :param hardware: left after
+    the app and :param num_loader_workers: dataloader workers are served.
+    :param use_bf16: run with bf16 autocast if the CPU supports it natively
+    :param allowed_cpus: ids of the cores the process may run on, defaults to
+    its current affinity
+    """
+    if allowed_cpus is None:
+        allowed_cpus = _get_allowed_cpus()
+    intra_op_threads: int = max(
+        1, hardware.get_usable_cpus() - RESERVED_CORES - num_loader_workers
+    )
+    # dataloader workers are started by the run, so inherit its affinity
+    run_cores: int = intra_op_threads + num_loader_workers
+    # the last cores are used, leaving the first ones to the app; there is no
+    # affinity to set when the run needs every core it may use
+    cpu_affinity: Optional[List[int]] = (
+        list(allowed_cpus[-run_cores:])
+        if run_cores < len(allowed_cpus)
+        else None
+    )
+    return CpuComputeProfile(
+        intra_op_threads,
+        # the segmentation networks run their ops one after the other
+        1,
+        use_bf16 and cpu_supports_bf16(cpuinfo_path),
+        cpu_affinity,
+    )
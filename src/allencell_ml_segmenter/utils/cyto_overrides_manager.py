@@ -7,6 +7,15 @@ from allencell_ml_segmenter.training.training_model import (
     ModelSize,
 )
 from allencell_ml_segmenter.utils.cuda_util import CUDAUtils
+from allencell_ml_segmenter.utils.hardware_profile import (
+    DataLoaderProfile,
+    choose_dataloader_profile,
+    detect_hardware,
+)
+from allencell_ml_segmenter.utils.cpu_compute_profile import (
+    CpuComputeProfile,
+    choose_cpu_compute_profile,
+)
 
 
 class CytoDLOverridesManager:
@@ -68,7 +77,37 @@ class CytoDLOverridesManager:
             overrides_dict["trainer.accelerator"] = "gpu"
         else:
             overrides_dict["trainer.accelerator"] = "cpu"
-        overrides_dict["data.num_workers"] = CUDAUtils.get_num_workers()
+        # Dataloader (required), from the profile the training run was
+        # prepared with, or from the hardware alone
+        dataloader_profile: Optional[DataLoaderProfile] = (
+            self._training_model.get_dataloader_profile()
+        )
+        if dataloader_profile is None:
+            dataloader_profile = choose_dataloader_profile(
+                detect_hardware(CUDAUtils.cuda_available())
+            )
+        overrides_dict["data.num_workers"] = dataloader_profile.num_workers
+        if dataloader_profile.num_workers > 0:
+            # profiles saved by hand may leave the prefetch factor unset, in
+            # which case the config's value is kept
+            prefetch_factor: Optional[int] = dataloader_profile.prefetch_factor
+            if prefetch_factor is not None:
+                overrides_dict["data.prefetch_factor"] = prefetch_factor
+            overrides_dict["data.persistent_workers"] = (
+                dataloader_profile.persistent_workers
+            )
+        # CPU compute (optional), see CpuComputeProfile.apply for the settings
+        # that are not part of the config
+        if overrides_dict["trainer.accelerator"] == "cpu":
+            cpu_profile: Optional[CpuComputeProfile] = (
+                self._training_model.get_cpu_compute_profile()
+            )
+            if cpu_profile is None:
+                cpu_profile = choose_cpu_compute_profile(
+                    dataloader_profile.hardware,
+                    dataloader_profile.num_workers,
+                )
+            overrides_dict.update(cpu_profile.get_overrides())
 
         # Spatial Dims (required)
         dims: Optional[int] = self._training_model.get_spatial_dims()
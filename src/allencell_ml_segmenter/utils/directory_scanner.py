@@ -0,0 +1,144 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Generator, List, Optional
+
+from allencell_ml_segmenter.core.task_executor import (
+    ITaskExecutor,
+    TaskHandle,
+)
+
+# the first batch is small so that callers can show something right away
+DEFAULT_FIRST_BATCH_SIZE: int = 256
+DEFAULT_BATCH_SIZE: int = 4096
+
+
+def _is_listed(entry: os.DirEntry) -> bool:
+    # file types come from the scan, so no file is stat'ed separately on
+    # platforms that report them (Linux, macOS, Windows)
+    return (
+        not entry.name.startswith(".")
+        and "." in entry.name
+        and entry.is_file()
+    )
+
+
+def iter_file_batches(
+    dir_path: Path,
+    first_batch_size: int = DEFAULT_FIRST_BATCH_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Generator[List[Path], None, None]:
+    """
+    Yields the non-hidden files in :param dir_path: that have an extension, in
+    batches, as a single directory scan finds them. Files are in the order the
+    filesystem returns them, not sorted. The first batch holds up to
+    :param first_batch_size: files, later ones up to :param batch_size:.
+    """
+    batch: List[Path] = []
+    limit: int = first_batch_size
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if _is_listed(entry):
+                batch.append(dir_path / entry.name)
+                if len(batch) >= limit:
+                    yield batch
+                    batch = []
+                    limit = batch_size
+    if batch:
+        yield batch
+
+
+def list_files(dir_path: Path) -> List[Path]:
+    """
+    Returns the non-hidden files in :param dir_path: that have an extension,
+    sorted by name.
+    """
+    with os.scandir(dir_path) as entries:
+        names: List[str] = [
+            entry.name for entry in entries if _is_listed(entry)
+        ]
+    names.sort()
+    return [dir_path / name for name in names]
+
+
+class _BatchReader:
+    """
+    Reads the batches of a directory scan one task at a time, and closes the
+    scan, releasing its directory handle, when it is cancelled. A scan cannot
+    be closed while a batch is being read, so it is then closed by the read.
+    """
+
+    def __init__(self, batches: Generator[List[Path], None, None]) -> None:
+        self._batches: Generator[List[Path], None, None] = batches
+        self._lock: threading.Lock = threading.Lock()
+        self._reading: bool = False
+        self._closed: bool = False
+
+    def read(self) -> Optional[List[Path]]:
+        with self._lock:
+            if self._closed:
+                return None
+            self._reading = True
+        try:
+            return next(self._batches, None)
+        finally:
+            with self._lock:
+                self._reading = False
+                if self._closed:
+                    self._batches.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if not self._reading:
+                self._batches.close()
+
+
+def scan_files_in_batches(
+    task_executor: ITaskExecutor,
+    dir_path: Path,
+    on_batch: Callable[[List[Path]], None],
+    on_finish: Optional[Callable[[], None]] = None,
+    on_error: Optional[Callable[[Exception], None]] = None,
+    group: Optional[str] = None,
+    first_batch_size: int = DEFAULT_FIRST_BATCH_SIZE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> None:
+    """
+    Scans :param dir_path: (see iter_file_batches) on :param task_executor:, one
+    task per batch, and passes each batch to :param on_batch: as it is found.
+    Callbacks run wherever the executor runs on_return callbacks (the main thread
+    for the threaded executors), so they can update models and widgets directly.
+    Cancelling :param group: stops the scan after the batch being read, and
+    closes the directory.
+    :param on_finish: runs once every batch has been passed to on_batch
+    :param on_error: runs if the directory cannot be read
+    """
+    reader: _BatchReader = _BatchReader(
+        iter_file_batches(dir_path, first_batch_size, batch_size)
+    )
+
+    def on_return(batch: Optional[List[Path]]) -> None:
+        if batch is None:
+            if on_finish is not None:
+                on_finish()
+            return
+        on_batch(batch)
+        submit()
+
+    def on_read_error(e: Exception) -> None:
+        # the scan cannot be resumed after raising
+        reader.close()
+        if on_error is not None:
+            on_error(e)
+
+    def submit() -> None:
+        handle: TaskHandle = task_executor.exec(
+            reader.read,
+            on_return=on_return,
+            on_error=on_read_error,
+            group=group,
+        )
+        handle.add_cancel_callback(reader.close)
+
+    submit()
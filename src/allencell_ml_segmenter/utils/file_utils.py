@@ -9,6 +9,7 @@ from typing import List, Generator, Tuple, Optional
 from allencell_ml_segmenter.curation.curation_data_class import CurationRecord
 from allencell_ml_segmenter.utils.file_writer import IFileWriter
 from allencell_ml_segmenter.main.main_model import MIN_DATASET_SIZE
+from allencell_ml_segmenter.utils.directory_scanner import list_files
 
 LOSS_COLUMN: str = "val/loss_epoch"
 
@@ -24,11 +25,8 @@ class FileUtils:
 
     @staticmethod
     def get_all_files_in_dir_ignore_hidden(dir_path: Path) -> List[Path]:
-        # sort alphabetically- default sorting behavior for glob
-        all_files: List[Path] = list(sorted(dir_path.glob("*.*")))
-        # Ignore hidden files (such as .DS_Store on mac)
-        # There's no way to do this with Path.glob filtering or methods so using list comprehension
-        return [file for file in all_files if not file.name.startswith(".")]
+        # sorted alphabetically, ignoring hidden files (such as .DS_Store on mac)
+        return list_files(dir_path)
 
     @staticmethod
     def get_img_path_from_folder(folder: Path) -> Path:
@@ -17,6 +17,9 @@ class FakeFileWriter(IFileWriter):
         # {path: json-like-obj}
         self.json_state: dict[Path, Union[list, dict]] = {}
 
+        # {path: lines}
+        self.lines_state: Dict[Path, List[str]] = {}
+
     def np_save(self, path: Path, arr: np.ndarray) -> None:
         """
         Saves :param arr: to :param path:
@@ -55,3 +58,9 @@ class FakeFileWriter(IFileWriter):
 
     def write_json(self, json_like_obj: Union[list, dict], path: Path) -> None:
         self.json_state[path] = json_like_obj
+
+    def write_lines(self, path: Path, lines: List[str]) -> None:
+        self.lines_state[path] = list(lines)
+
+    def append_lines(self, path: Path, lines: List[str]) -> None:
+        self.lines_state.setdefault(path, []).extend(lines)
@@ -1,4 +1,5 @@
 from .i_file_writer import IFileWriter
+import os
 import numpy as np
 from pathlib import Path
 import csv
@@ -59,6 +60,22 @@ class FileWriter(IFileWriter):
         with open(path, "w") as fw:
             json.dump(json_like_obj, fw)
 
+    def write_lines(self, path: Path, lines: List[str]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path: Path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "w") as fw:
+            fw.writelines(f"{line}\n" for line in lines)
+            fw.flush()
+            os.fsync(fw.fileno())
+        os.replace(tmp_path, path)
+
+    def append_lines(self, path: Path, lines: List[str]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a") as fa:
+            fa.writelines(f"{line}\n" for line in lines)
+            fa.flush()
+            os.fsync(fa.fileno())
+
     @classmethod
     def global_instance(cls) -> IFileWriter:
         if cls._instance is None:
@@ -43,3 +43,20 @@ class IFileWriter(ABC):
     @abstractmethod
     def write_json(self, json_like_obj: Union[list, dict], path: Path) -> None:
         pass
+
+    @abstractmethod
+    def write_lines(self, path: Path, lines: List[str]) -> None:
+        """
+        Replaces the text file at :param path: with :param lines:. The file is
+        replaced atomically, so it is never left partially written. Creates
+        directories as necessary.
+        """
+        pass
+
+    @abstractmethod
+    def append_lines(self, path: Path, lines: List[str]) -> None:
+        """
+        Appends :param lines: to the text file at :param path:, creating it if
+        needed, and flushes them to disk before returning.
+        """
+        pass
@@ -0,0 +1,329 @@
+import csv
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from allencell_ml_segmenter.core.image_data_extractor import (
+    ImageArray,
+    decode_image_data,
+)
+
+# root of the cgroup filesystem, where container CPU and memory limits are set
+CGROUP_ROOT: Path = Path("/sys/fs/cgroup")
+# more workers rarely help, and each one holds its own copy of the dataset state
+MAX_NUM_WORKERS: int = 16
+# dataloader workers used on GPU when throughput is not measured
+DEFAULT_GPU_NUM_WORKERS: int = 1
+# batches loaded ahead by each worker, torch's default
+DEFAULT_PREFETCH_FACTOR: int = 2
+# memory set aside for each dataloader worker and for the training process
+WORKER_MEMORY_BYTES: int = 2 * 1024**3
+# the probe stops measuring a worker count after this many images or seconds
+PROBE_NUM_IMAGES: int = 32
+PROBE_MAX_SECONDS: float = 30.0
+# a worker count is preferred over a larger one if it is at least this fast,
+# relative to the larger one
+PROBE_TOLERANCE: float = 0.9
+
+
+@dataclass(frozen=True)
+class HardwareInfo:
+    # cores this process may run on
+    cpu_count: int
+    # cores allowed by the cgroup CPU quota, if there is one
+    cpu_quota: Optional[float]
+    # physical memory, or the cgroup memory limit if it is lower
+    memory_bytes: int
+    gpu: bool
+    system: str
+
+    def get_usable_cpus(self) -> int:
+        if self.cpu_quota is None:
+            return self.cpu_count
+        return max(1, min(self.cpu_count, int(self.cpu_quota)))
+
+
+@dataclass(frozen=True)
+class DataLoaderProfile:
+    """
+    Dataloader settings chosen for the machine training runs on, saved with the
+    experiment along with what they were chosen from.
+    """
+
+    num_workers: int
+    # batches loaded ahead by each worker; None when loading in the main process
+    prefetch_factor: Optional[int]
+    persistent_workers: bool
+    hardware: HardwareInfo
+    # {worker count: images per second} measured by the throughput probe
+    probe_images_per_second: Optional[Dict[int, float]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        profile: Dict[str, Any] = asdict(self)
+        if self.probe_images_per_second is not None:
+            # json keys are strings
+            profile["probe_images_per_second"] = {
+                str(k): v for k, v in self.probe_images_per_second.items()
+            }
+        return profile
+
+    @classmethod
+    def from_dict(cls, profile: Dict[str, Any]) -> "DataLoaderProfile":
+        probe: Optional[Dict[str, float]] = profile.get(
+            "probe_images_per_second"
+        )
+        return cls(
+            profile["num_workers"],
+            profile["prefetch_factor"],
+            profile["persistent_workers"],
+            HardwareInfo(**profile["hardware"]),
+            (
+                {int(k): v for k, v in probe.items()}
+                if probe is not None
+                else None
+            ),
+        )
+
+
+def _read_text(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _get_cgroup_cpu_quota(cgroup_root: Path) -> Optional[float]:
+    # cgroup v2: "<quota> <period>", or "max <period>" without a limit
+    cpu_max: Optional[str] = _read_text(cgroup_root / "cpu.max")
+    if cpu_max is not None:
+        quota, _, period = cpu_max.partition(" ")
+        if quota != "max" and period:
+            return int(quota) / int(period)
+        return None
+    # cgroup v1: a quota of -1 means no limit
+    quota_us: Optional[str] = _read_text(
+        cgroup_root / "cpu" / "cpu.cfs_quota_us"
+    )
+    period_us: Optional[str] = _read_text(
+        cgroup_root / "cpu" / "cpu.cfs_period_us"
+    )
+    if quota_us is not None and period_us is not None and int(quota_us) > 0:
+        return int(quota_us) / int(period_us)
+    return None
+
+
+def _get_cgroup_memory_limit(cgroup_root: Path) -> Optional[int]:
+    for limit_path in [
+        cgroup_root / "memory.max",
+        cgroup_root / "memory" / "memory.limit_in_bytes",
+    ]:
+        limit: Optional[str] = _read_text(limit_path)
+        if limit is not None and limit.isdigit():
+            return int(limit)
+    return None
+
+
+def _get_physical_memory() -> Optional[int]:
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        # not available on windows
+        return None
+
+
+def detect_hardware(
+    gpu: bool, cgroup_root: Path = CGROUP_ROOT
+) -> HardwareInfo:
+    """
+    Returns the cores and memory available to this process, taking container
+    (cgroup) limits into account.
+    :param gpu: whether training runs on a GPU
+    """
+    cpu_count: int = (
+        len(os.sched_getaffinity(0))
+        if hasattr(os, "sched_getaffinity")
+        else os.cpu_count() or 1
+    )
+    memory: Optional[int] = _get_physical_memory()
+    memory_limit: Optional[int] = _get_cgroup_memory_limit(cgroup_root)
+    if memory is None or (memory_limit is not None and memory_limit < memory):
+        memory = memory_limit
+    return HardwareInfo(
+        cpu_count,
+        _get_cgroup_cpu_quota(cgroup_root),
+        # without a known amount, assume enough for one worker
+        memory if memory is not None else 2 * WORKER_MEMORY_BYTES,
+        gpu,
+        platform.system(),
+    )
+
+
+def get_max_num_workers(hardware: HardwareInfo) -> int:
+    """
+    Returns the most dataloader workers :param hardware: can serve, which the
+    throughput probe chooses from.
+    """
+    # on MACOS we cannot set num_workers no matter what
+    if hardware.system == "Darwin":
+        return 0
+    cpus: int = hardware.get_usable_cpus()
+    # on GPU the workers only compete with the training process for cores,
+    # on CPU training needs half of them for itself
+    cpu_workers: int = cpus - 1 if hardware.gpu else cpus // 2
+    return max(
+        0, min(cpu_workers, _get_memory_workers(hardware), MAX_NUM_WORKERS)
+    )
+
+
+def _get_memory_workers(hardware: HardwareInfo) -> int:
+    # one share of memory is left for the training process
+    return hardware.memory_bytes // WORKER_MEMORY_BYTES - 1
+
+
+def choose_dataloader_profile(hardware: HardwareInfo) -> DataLoaderProfile:
+    """
+    Returns dataloader settings for :param hardware:, without measuring
+    anything. These are conservative: more workers are only used once the
+    throughput probe has shown that they help (see tune_dataloader_profile).
+    """
+    # On CPU, more workers offer no performance increase as dataloading is
+    # not the bottleneck. On GPU, a single worker supports most systems while
+    # providing a small speed benefit.
+    num_workers: int = (
+        min(DEFAULT_GPU_NUM_WORKERS, get_max_num_workers(hardware))
+        if hardware.gpu
+        else 0
+    )
+    if num_workers == 0:
+        return DataLoaderProfile(0, None, False, hardware)
+    return DataLoaderProfile(
+        num_workers, DEFAULT_PREFETCH_FACTOR, False, hardware
+    )
+
+
+class _ImageReadDataset:
+    """
+    Map-style dataset that reads one image per item, standing in for the
+    training dataset's loading and decoding. Images are decoded in the worker
+    itself, bypassing the app's extractor, whose cache and decode processes
+    belong to the napari process. Only paths are sent to workers.
+    """
+
+    def __init__(self, paths: List[Path], channel: int) -> None:
+        self._paths: List[Path] = paths
+        self._channel: int = channel
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __getitem__(self, idx: int) -> int:
+        data: Optional[ImageArray] = decode_image_data(
+            self._paths[idx], self._channel, None
+        ).np_data
+        # only the size is sent back, the training dataset sends patches
+        return int(np.asarray(data).nbytes)
+
+
+def _read_csv_column(csv_path: Path, column: str) -> List[Path]:
+    with open(csv_path) as csv_file:
+        reader: csv.DictReader = csv.DictReader(csv_file)
+        return [Path(row[column]) for row in reader if row.get(column)]
+
+
+def probe_dataloader_throughput(
+    csv_path: Path,
+    worker_counts: Sequence[int],
+    channel: int = 0,
+    num_images: int = PROBE_NUM_IMAGES,
+    max_seconds: float = PROBE_MAX_SECONDS,
+) -> Dict[int, float]:
+    """
+    Reads the raw images of the training CSV at :param csv_path: with a torch
+    DataLoader for each of :param worker_counts:, and returns the images read
+    per second for each. Worker startup is not measured, as persistent workers
+    only start once.
+    """
+    # imported here so that profiles can be chosen without torch
+    from torch.utils.data import DataLoader  # type: ignore
+
+    paths: List[Path] = _read_csv_column(csv_path, "raw")
+    if not paths:
+        raise ValueError(f"No images in {csv_path}")
+    # images are not repeated, a repeated image may be read from cache
+    dataset: _ImageReadDataset = _ImageReadDataset(
+        paths[: num_images + 1], channel
+    )
+    throughput: Dict[int, float] = {}
+    # most workers first: later counts read the images from the page cache,
+    # which favors the smaller counts the tuning prefers anyway
+    for num_workers in sorted(worker_counts, reverse=True):
+        # workers are spawned rather than forked from napari, which is unsafe
+        # with Qt and the threads of this process
+        loader: DataLoader = DataLoader(
+            dataset,
+            batch_size=1,
+            num_workers=num_workers,
+            multiprocessing_context="spawn" if num_workers > 0 else None,
+        )
+        start: Optional[float] = None
+        read: int = 0
+        for _ in loader:
+            if start is None:
+                # the first image waits for the workers to start
+                start = time.perf_counter()
+                continue
+            read += 1
+            if time.perf_counter() - start > max_seconds:
+                break
+        elapsed: float = (
+            time.perf_counter() - start if start is not None else 0.0
+        )
+        throughput[num_workers] = read / elapsed if elapsed > 0 else 0.0
+    return throughput
+
+
+def tune_dataloader_profile(
+    profile: DataLoaderProfile,
+    csv_path: Path,
+    channel: int = 0,
+    num_images: int = PROBE_NUM_IMAGES,
+    max_seconds: float = PROBE_MAX_SECONDS,
+) -> DataLoaderProfile:
+    """
+    Returns :param profile: with its number of workers chosen by probing the
+    throughput of a few worker counts up to the most its hardware can serve,
+    on the training CSV at :param csv_path:. The fewest workers that are
+    nearly as fast as the fastest count are chosen.
+    """
+    max_workers: int = get_max_num_workers(profile.hardware)
+    if max_workers == 0:
+        return profile
+    candidates: List[int] = sorted(
+        {
+            max(1, max_workers // 4),
+            max(1, max_workers // 2),
+            max_workers,
+        }
+    )
+    throughput: Dict[int, float] = probe_dataloader_throughput(
+        csv_path, candidates, channel, num_images, max_seconds
+    )
+    best: float = max(throughput.values())
+    num_workers: int = min(
+        k for k, v in throughput.items() if v >= PROBE_TOLERANCE * best
+    )
+    # the probed workers are kept for the whole run, and prefetch deeper when
+    # there is memory to spare for it
+    prefetch_factor: int = (
+        2 * DEFAULT_PREFETCH_FACTOR
+        if _get_memory_workers(profile.hardware) >= 2 * num_workers
+        else DEFAULT_PREFETCH_FACTOR
+    )
+    return DataLoaderProfile(
+        num_workers, prefetch_factor, True, profile.hardware, throughput
+    )
@@ -1,10 +1,100 @@
+from typing import Union
+
+import dask.array as da
 import numpy
 
+LABEL_DTYPE: type = numpy.uint8
+
+
+def _positive_to_label(block: numpy.ndarray, value: int) -> numpy.ndarray:
+    labels: numpy.ndarray = numpy.empty(block.shape, dtype=LABEL_DTYPE)
+    # bool and uint8 have the same layout, so the comparison can be written
+    # straight into the label buffer and then scaled in-place
+    numpy.greater(block, 0, out=labels.view(numpy.bool_))
+    if value != 1:
+        labels *= LABEL_DTYPE(value)
+    return labels
+
+
+def to_label_image(
+    image: Union[numpy.ndarray, da.Array], value: int
+) -> Union[numpy.ndarray, da.Array]:
+    """
+    Returns a uint8 label image with all positive values of :param image: set to
+    :param value: and everything else set to 0. No copy of :param image: in its
+    source dtype is made: numpy input is converted in a single pass, and dask
+    input is converted block by block.
+    """
+    if not 0 < value <= numpy.iinfo(LABEL_DTYPE).max:
+        raise ValueError(f"Label value {value} does not fit in {LABEL_DTYPE}")
+    if isinstance(image, da.Array):
+        return da.map_blocks(
+            _positive_to_label, image, value, dtype=LABEL_DTYPE
+        )
+    return _positive_to_label(image, value)
+
 
-def set_all_nonzero_values_to(
-    image: numpy.ndarray, value: int
+def load_label_image(image: da.Array, value: int) -> numpy.ndarray:
+    """
+    Computes :param image: into a uint8 label image (see to_label_image). Each
+    block is converted as soon as it is read and written into the output buffer,
+    and blocks are processed in parallel, so the full image is never held in its
+    source dtype. Chunk :param image: per Z slice for the lowest peak memory.
+    """
+    out: numpy.ndarray = numpy.empty(image.shape, dtype=LABEL_DTYPE)
+    da.store(to_label_image(image, value), out, lock=False)
+    return out
+
+
+# values of the label image returned by get_disagreement_labels; they match the
+# label values of seg1 and seg2 in curation so the overlay uses their colors
+ONLY_SEG1_LABEL: int = 1
+ONLY_SEG2_LABEL: int = 2
+# Z slices per block when comparing numpy segmentations, which bounds the size
+# of the temporary arrays
+DEFAULT_DISAGREEMENT_CHUNK_Z: int = 8
+
+
+def _disagreement_block(
+    seg1: numpy.ndarray, seg2: numpy.ndarray
 ) -> numpy.ndarray:
-    copy = numpy.copy(image)
-    # set all nonzero values in this :image to :value in-place
-    copy[copy > 0] = value
-    return copy
+    # 2 * fg2 + fg1 is 0 for background, 1 or 2 where only one segmentation has
+    # foreground, and 3 where both do, which % 3 maps back to 0
+    labels: numpy.ndarray = numpy.greater(seg2, 0).view(LABEL_DTYPE)
+    labels <<= 1
+    labels += numpy.greater(seg1, 0).view(LABEL_DTYPE)
+    labels %= 3
+    return labels
+
+
+def get_disagreement_labels(
+    seg1: Union[numpy.ndarray, da.Array],
+    seg2: Union[numpy.ndarray, da.Array],
+    chunk_z: int = DEFAULT_DISAGREEMENT_CHUNK_Z,
+) -> Union[numpy.ndarray, da.Array]:
+    """
+    Returns a uint8 label image of where the foregrounds of :param seg1: and
+    :param seg2: differ: ONLY_SEG1_LABEL where only seg1 has foreground,
+    ONLY_SEG2_LABEL where only seg2 does, and 0 where they agree. Numpy input is
+    compared :param chunk_z: Z slices at a time; if either input is a dask array
+    the result is a dask array computed block by block when read.
+    """
+    if seg1.shape != seg2.shape:
+        raise ValueError(
+            f"Segmentations have different shapes: {seg1.shape}, {seg2.shape}"
+        )
+    if isinstance(seg1, da.Array) or isinstance(seg2, da.Array):
+        return da.map_blocks(
+            _disagreement_block,
+            da.asarray(seg1),
+            da.asarray(seg2),
+            dtype=LABEL_DTYPE,
+        )
+    if seg1.ndim < 3:
+        return _disagreement_block(seg1, seg2)
+    out: numpy.ndarray = numpy.empty(seg1.shape, dtype=LABEL_DTYPE)
+    for z in range(0, seg1.shape[0], chunk_z):
+        out[z : z + chunk_z] = _disagreement_block(
+            seg1[z : z + chunk_z], seg2[z : z + chunk_z]
+        )
+    return out
@@ -0,0 +1,56 @@
+from typing import List
+
+import numpy as np
+
+# field names of an encoded polygon mask
+POLYGON_FIELD: str = "polygon"
+VERTEX_FIELD: str = "vertex"
+
+
+def encode_mask(mask: np.ndarray) -> np.ndarray:
+    """
+    Returns :param mask: as an array that can be saved and loaded without pickle.
+    Masks from shapes layers are object arrays of polygon vertices, which are
+    encoded as a structured array with one row per vertex, holding the index of
+    its polygon and its coordinates. Other masks are returned as is.
+    """
+    if not mask.dtype.hasobject:
+        return mask
+    polygons: List[np.ndarray] = [
+        np.asarray(polygon, dtype=np.float64) for polygon in mask
+    ]
+    ndim: int = polygons[0].shape[-1] if polygons else 0
+    encoded: np.ndarray = np.empty(
+        sum(len(polygon) for polygon in polygons),
+        dtype=[
+            (POLYGON_FIELD, np.int64),
+            (VERTEX_FIELD, np.float64, (ndim,)),
+        ],
+    )
+    start: int = 0
+    for i, polygon in enumerate(polygons):
+        encoded[POLYGON_FIELD][start : start + len(polygon)] = i
+        encoded[VERTEX_FIELD][start : start + len(polygon)] = polygon
+        start += len(polygon)
+    return encoded
+
+
+def decode_mask(encoded: np.ndarray) -> np.ndarray:
+    """
+    Returns the mask that :param encoded: was made from by encode_mask. Polygon
+    masks are returned as a 1D object array of vertex arrays.
+    """
+    if encoded.dtype.names is None:
+        return encoded
+    # vertices are encoded polygon by polygon, so each polygon is a run of rows
+    boundaries: np.ndarray = (
+        np.flatnonzero(np.diff(encoded[POLYGON_FIELD])) + 1
+    )
+    polygons: List[np.ndarray] = (
+        np.split(encoded[VERTEX_FIELD], boundaries) if len(encoded) else []
+    )
+    mask: np.ndarray = np.empty(len(polygons), dtype=object)
+    # assigned one by one, so polygons of equal size are not stacked
+    for i, polygon in enumerate(polygons):
+        mask[i] = polygon
+    return mask
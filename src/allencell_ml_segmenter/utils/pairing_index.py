@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+from allencell_ml_segmenter.utils.directory_scanner import list_files
+
+K = TypeVar("K", bound=Hashable)
+# maps a file name to the key it is paired on
+StemNormalizer = Callable[[str], str]
+
+
+def get_image_stem(name: str) -> str:
+    """
+    Returns :param name: without its extension. A ".ome" before the extension is
+    removed as well, so "img.ome.tiff" pairs with "img.tiff".
+    """
+    stem: str = name.rsplit(".", 1)[0] if "." in name[1:] else name
+    return stem[: -len(".ome")] if stem.lower().endswith(".ome") else stem
+
+
+class PairingIndex(Generic[K]):
+    """
+    Pairs files from several sources (e.g. the raw, seg1 and seg2 directories of
+    a curation session) by normalized file stem. Building the index is a single
+    pass over each source. Files whose stem is missing from any other source, or
+    that share their stem with another file of the same source, are not paired
+    and are reported by get_unmatched.
+    """
+
+    def __init__(
+        self,
+        paths: Mapping[K, Iterable[Path]],
+        normalize: StemNormalizer = get_image_stem,
+    ) -> None:
+        """
+        :param paths: files of each source, keyed by source. Pairs are ordered
+        as the files of the first source are.
+        :param normalize: returns the key to pair a file name on
+        """
+        self._by_stem: Dict[K, Dict[str, Path]] = {}
+        self._unmatched: Dict[K, List[Path]] = {}
+        for source, source_paths in paths.items():
+            by_stem: Dict[str, Path] = {}
+            duplicates: List[Path] = []
+            duplicate_stems: set[str] = set()
+            for path in source_paths:
+                stem: str = normalize(path.name)
+                if stem in by_stem or stem in duplicate_stems:
+                    duplicates.append(path)
+                    duplicate_stems.add(stem)
+                else:
+                    by_stem[stem] = path
+            # ambiguous stems cannot be paired
+            for stem in duplicate_stems:
+                duplicates.append(by_stem.pop(stem))
+            self._by_stem[source] = by_stem
+            self._unmatched[source] = duplicates
+
+        sources: List[K] = list(self._by_stem)
+        self._matched: set[str] = (
+            set(self._by_stem[sources[0]]).intersection(
+                *(self._by_stem[s].keys() for s in sources[1:])
+            )
+            if sources
+            else set()
+        )
+        self._stems: List[str] = (
+            [
+                stem
+                for stem in self._by_stem[sources[0]]
+                if stem in self._matched
+            ]
+            if sources
+            else []
+        )
+        for source, by_stem in self._by_stem.items():
+            self._unmatched[source].extend(
+                path
+                for stem, path in by_stem.items()
+                if stem not in self._matched
+            )
+
+    @classmethod
+    def from_dirs(
+        cls,
+        dirs: Mapping[K, Path],
+        normalize: StemNormalizer = get_image_stem,
+    ) -> "PairingIndex[K]":
+        """
+        Returns the index of the files (see list_files) in each of :param dirs:.
+        """
+        return cls(
+            {source: list_files(d) for source, d in dirs.items()}, normalize
+        )
+
+    def get_stems(self) -> List[str]:
+        """
+        Returns the normalized stems of all pairs, in pair order.
+        """
+        return list(self._stems)
+
+    def get_paths(self, source: K) -> List[Path]:
+        """
+        Returns the paired files of :param source:, in pair order.
+        """
+        by_stem: Dict[str, Path] = self._by_stem[source]
+        return [by_stem[stem] for stem in self._stems]
+
+    def get_path(self, source: K, stem: str) -> Optional[Path]:
+        """
+        Returns the file of :param source: paired on :param stem:, if any.
+        """
+        return self._by_stem[source][stem] if stem in self._matched else None
+
+    def get_unmatched(self) -> Dict[K, List[Path]]:
+        """
+        Returns the files of each source that could not be paired.
+        """
+        return {
+            source: list(paths) for source, paths in self._unmatched.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._stems)
+
+    def __contains__(self, stem: object) -> bool:
+        return stem in self._matched